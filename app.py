@@ -1,18 +1,33 @@
 import os
+import gzip
 import json
+import logging
+import heapq
+import bisect
+import hashlib
+import queue
 import shutil
+import sqlite3
+import tempfile
 import threading
+import unicodedata
+import click
 import schedule
 import time
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
+import zlib
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_file
+from flask import g, has_request_context, request_started, request_finished, before_render_template, template_rendered
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_migrate import Migrate
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from dotenv import load_dotenv
 from sqlalchemy import func # Added for func.date
 from sqlalchemy import text
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import validates
 
 # Firebase Authentication
 from firebase_config import (
@@ -22,11 +37,18 @@ from firebase_config import (
     FIREBASE_CONFIG
 )
 
+# 조회 결과 캐시
+from app_cache import AppCache, create_cache_backend
+
+# 포인트 시계열 계산 (pandas 의존성으로 함께 설치됨)
+import numpy as np
+
 # 백업 시스템을 위한 import
 try:
     import pandas as pd
     import openpyxl
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment
     BACKUP_EXCEL_AVAILABLE = True
 except ImportError as e:
@@ -34,6 +56,13 @@ except ImportError as e:
     print("   pip install pandas openpyxl 명령어로 설치하세요.")
     BACKUP_EXCEL_AVAILABLE = False
 
+# 백업 압축(zstd)은 선택 사항
+try:
+    import zstandard
+    BACKUP_ZSTD_AVAILABLE = True
+except ImportError:
+    BACKUP_ZSTD_AVAILABLE = False
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -51,6 +80,62 @@ else:
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# 실시간 백업 묶음 처리 간격 (초) - 이 시간 안에 들어온 포인트 입력은 한 번의 백업으로 처리
+app.config['REALTIME_BACKUP_WINDOW'] = int(os.environ.get('REALTIME_BACKUP_WINDOW', 60))
+# 실시간 백업 방식: 'full'(전체 JSON + Excel, 기본) 또는 'incremental'(변경분만 backups/incremental에 델타 저장)
+app.config['REALTIME_BACKUP_MODE'] = os.environ.get('REALTIME_BACKUP_MODE', 'full')
+# JSON 백업 압축 방식: 'gzip', 'zstd'(zstandard 패키지 필요), 'none'
+app.config['BACKUP_COMPRESSION'] = os.environ.get('BACKUP_COMPRESSION', 'gzip')
+# 대시보드 지표 캐시 유지 시간 (초)
+app.config['DASHBOARD_CACHE_TTL'] = int(os.environ.get('DASHBOARD_CACHE_TTL', 30))
+# 조회 결과 캐시: 'memory'(워커별 LRU), 'sqlite'(같은 서버의 워커들이 파일 공유), 'none'
+app.config['APP_CACHE_BACKEND'] = os.environ.get('APP_CACHE_BACKEND', 'memory')
+app.config['APP_CACHE_PATH'] = os.environ.get('APP_CACHE_PATH', os.path.join(app.instance_path, 'app_cache.db'))
+app.config['APP_CACHE_TTL'] = int(os.environ.get('APP_CACHE_TTL', 300))
+app.config['APP_CACHE_MAX_ENTRIES'] = int(os.environ.get('APP_CACHE_MAX_ENTRIES', 1024))
+app.config['APP_CACHE_MAX_MB'] = int(os.environ.get('APP_CACHE_MAX_MB', 32))
+# 포인트 큐브: 데이터 버전이 그대로여도 다른 워커의 변경을 확인하는 간격(초),
+# 삭제 확인용 행 수 비교 간격(초), 전체 다시 읽는 주기(초)
+app.config['POINTS_CUBE_CHECK_SECONDS'] = int(os.environ.get('POINTS_CUBE_CHECK_SECONDS', 30))
+app.config['POINTS_CUBE_COUNT_SECONDS'] = int(os.environ.get('POINTS_CUBE_COUNT_SECONDS', 300))
+app.config['POINTS_CUBE_MAX_AGE'] = int(os.environ.get('POINTS_CUBE_MAX_AGE', 6 * 3600))
+# DB 스냅샷 방식: 'backup'(SQLite 온라인 백업 API, 페이지 단위 복사) 또는 'vacuum'(VACUUM INTO, 압축된 사본)
+app.config['DB_BACKUP_METHOD'] = os.environ.get('DB_BACKUP_METHOD', 'backup')
+# 전체 백업 파일을 청크 단위 중복 제거 저장소(backups/store)에 보관할지 여부
+app.config['BACKUP_STORE_ENABLED'] = os.environ.get('BACKUP_STORE_ENABLED', 'true').lower() == 'true'
+# 실시간 스트림(/stream): 연결별 이벤트 큐 크기, 하트비트/다른 워커 변경 확인 간격(초),
+# 연결 최대 유지 시간(초, 지나면 끊고 브라우저가 다시 연결 - gevent/스레드 워커 필요)
+app.config['STREAM_QUEUE_SIZE'] = int(os.environ.get('STREAM_QUEUE_SIZE', 100))
+app.config['STREAM_HEARTBEAT_SECONDS'] = int(os.environ.get('STREAM_HEARTBEAT_SECONDS', 15))
+app.config['STREAM_MAX_SECONDS'] = int(os.environ.get('STREAM_MAX_SECONDS', 300))
+# 워커 프로세스당 최대 스트림 연결 수 - 연결마다 스레드 하나를 쓰므로 gunicorn --threads보다 작게
+# (넘으면 503, 브라우저는 주기적 조회로 전환)
+app.config['STREAM_MAX_CONNECTIONS'] = int(os.environ.get('STREAM_MAX_CONNECTIONS', 4))
+# 스트림 미연결 시 대시보드 카운터/알림 수 조회 간격 (초)
+app.config['STREAM_POLL_SECONDS'] = int(os.environ.get('STREAM_POLL_SECONDS', 30))
+# 알림 보관 기간 (일) - 이보다 오래된 시스템 알림(자동 만료/백업/복원)은 매일 정리 작업에서 삭제
+# (기본 0: 정리하지 않음, 직원이 작성한 알림은 flask purge-notifications나 일괄 처리 API로만 삭제)
+app.config['NOTIFICATION_RETENTION_DAYS'] = int(os.environ.get('NOTIFICATION_RETENTION_DAYS', 0))
+# 로그 레벨 (DEBUG로 두면 요청 처리 중 디버그 로그와 요청별 SQL/렌더 시간 로그 출력)
+app.config['LOG_LEVEL'] = os.environ.get('LOG_LEVEL', 'INFO').upper()
+# 요청 계측: 라우트별 쿼리 수/SQL 시간/렌더 시간/전체 지연 히스토그램 수집 (/metrics, 개발자 전용)
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+# /metrics 수집용 토큰 (Prometheus가 Authorization: Bearer <토큰>으로 조회, 비우면 개발자 로그인만 허용)
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN', '')
+# 느린 쿼리 기준 (밀리초) - 넘으면 SQL과 라우트를 경고 로그로 남김 (0이면 끔)
+app.config['SLOW_QUERY_MS'] = int(os.environ.get('SLOW_QUERY_MS', 200))
+# 백업 종류별 보관 개수 (초과분은 보관 정책 작업에서 삭제)
+app.config['BACKUP_RETENTION'] = {
+    'realtime': int(os.environ.get('BACKUP_KEEP_REALTIME', 24)),
+    'daily': int(os.environ.get('BACKUP_KEEP_DAILY', 14)),
+    'monthly': int(os.environ.get('BACKUP_KEEP_MONTHLY', 12)),
+    'manual': int(os.environ.get('BACKUP_KEEP_MANUAL', 10))
+}
+
+# 앱 로거 - 비활성 레벨의 logger.debug()는 인자 포맷 없이 바로 반환
+logger = app.logger
+logger.setLevel(app.config['LOG_LEVEL'])
+
 # 확장 프로그램 초기화
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
@@ -59,6 +144,17 @@ login_manager.init_app(app)
 login_manager.login_view = 'login'
 login_manager.login_message = '로그인이 필요합니다.'
 
+# 분석/리포트 조회 결과 캐시 - 쓰기 경로에서 app_cache.invalidate('points'/'learning'/'children') 호출
+app_cache = AppCache(
+    create_cache_backend(
+        app.config['APP_CACHE_BACKEND'],
+        path=app.config['APP_CACHE_PATH'],
+        max_entries=app.config['APP_CACHE_MAX_ENTRIES'],
+        max_bytes=app.config['APP_CACHE_MAX_MB'] * 1024 * 1024
+    ),
+    default_ttl=app.config['APP_CACHE_TTL']
+)
+
 # 컨텍스트 프로세서: 모든 템플릿에서 센터 정보 사용 가능
 @app.context_processor
 def inject_center_info():
@@ -85,6 +181,39 @@ class User(UserMixin, db.Model):
     # Firebase Auth 전용 필드들
     email = db.Column(db.String(120), unique=True, nullable=True)
     firebase_uid = db.Column(db.String(128), unique=True, nullable=True)
+    
+    # 읽지 않은 알림 수 (알림 배달/읽음/삭제 시 증감 - 내비게이션 배지용)
+    unread_notifications = db.Column(db.Integer, default=0, nullable=False, server_default='0')
+    
+    # 사용자 삭제 시 알림 수신 행도 함께 삭제
+    notification_receipts = db.relationship('NotificationRecipient', cascade='all, delete-orphan', lazy=True)
+    
+    @property
+    def unread_notification_count(self):
+        """만료됐지만 아직 정리되지 않은 알림을 뺀 읽지 않은 알림 수 (화면 표시용)"""
+        return get_unread_notification_count(self.id, self.unread_notifications)
+
+# ===== 이름 검색 정규화 =====
+# 아동 이름 검색은 공백/대소문자를 무시한 정규화 이름과 한글 초성(ㄱㄴㄷ) 문자열로 한다.
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_FIRST, HANGUL_LAST = ord('가'), ord('힣')
+
+def normalize_search_text(text):
+    """NFC 정규화 + 소문자 + 공백 제거 (조합 중인 첫소리 자모는 호환 자모로 바꿈 - 태블릿 입력기 대비)"""
+    normalized = unicodedata.normalize('NFC', text or '').casefold()
+    return ''.join(CHOSEONG[ord(char) - 0x1100] if 0x1100 <= ord(char) <= 0x1112 else char
+                   for char in normalized if not char.isspace())
+
+def to_choseong(text):
+    """정규화된 문자열의 한글 음절을 초성으로 바꿈 (한글이 아닌 문자는 그대로)"""
+    return ''.join(CHOSEONG[(ord(char) - HANGUL_FIRST) // 588] if HANGUL_FIRST <= ord(char) <= HANGUL_LAST else char
+                   for char in text)
+
+def build_name_search_keys(name):
+    """(정규화 이름, 초성 문자열) - Child.search_name/search_choseong 값"""
+    normalized = normalize_search_text(name)
+    return normalized, to_choseong(normalized)
 
 class Child(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -92,14 +221,31 @@ class Child(db.Model):
     grade = db.Column(db.Integer, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
-    # 누적 포인트 (전체 과목 합계)
+    # 누적 포인트 (전체 과목 합계) = 보정값 + 일일 포인트 합계
+    # 포인트 저장 시 변경분만 더하고, 정기 대사 작업이 합계와 어긋난 값을 바로잡는다.
     cumulative_points = db.Column(db.Integer, default=0)
+    # 누적 포인트 관리 화면에서 직접 입력한 값과 일일 포인트 합계의 차이 (시스템 도입 전 포인트 등)
+    cumulative_points_adjustment = db.Column(db.Integer, default=0)
+    
+    # 이름 검색용 정규화 이름/초성 (이름이 바뀌면 자동 갱신, 아동 이름 검색 섹션 참고)
+    search_name = db.Column(db.String(100))
+    search_choseong = db.Column(db.String(100))
     
     # 관계 설정
     learning_records = db.relationship('LearningRecord', backref='child', lazy=True, cascade='all, delete-orphan')
     notes = db.relationship('ChildNote', backref='child', lazy=True, cascade='all, delete-orphan')
     include_in_stats = db.Column(db.Boolean, default=True) # 통계에 포함할지 여부
 
+    __table_args__ = (
+        db.Index('ix_child_search_name', 'search_name'),
+        db.Index('ix_child_search_choseong', 'search_choseong'),
+    )
+
+    @validates('name')
+    def update_search_keys(self, key, name):
+        self.search_name, self.search_choseong = build_name_search_keys(name)
+        return name
+
 class LearningRecord(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     child_id = db.Column(db.Integer, db.ForeignKey('child.id'), nullable=False)
@@ -128,6 +274,12 @@ class LearningRecord(db.Model):
     created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 아동별 날짜당 1건만 허용 + 날짜 범위 조회용 인덱스
+    __table_args__ = (
+        db.Index('uq_learning_record_child_date', 'child_id', 'date', unique=True),
+        db.Index('ix_learning_record_date', 'date'),
+    )
 
 class ChildNote(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -163,6 +315,42 @@ class DailyPoints(db.Model):
     # 관계 설정
     child = db.relationship('Child', backref='daily_points', lazy=True)
     creator = db.relationship('User', backref='points_records', lazy=True)
+    
+    # 아동별 날짜당 1건만 허용 + 날짜 범위 조회용 인덱스 + 변경분 조회(증분 백업/포인트 큐브)용 인덱스
+    __table_args__ = (
+        db.Index('uq_daily_points_child_date', 'child_id', 'date', unique=True),
+        db.Index('ix_daily_points_date', 'date'),
+        db.Index('ix_daily_points_updated', 'updated_at'),
+    )
+
+# 포인트 집계 테이블 (일/주/월 단위 사전 합계)
+class PointsRollup(db.Model):
+    """아동별 일/주/월 포인트 합계 - DailyPoints 쓰기와 같은 트랜잭션에서 갱신
+
+    원본은 DailyPoints이고 이 테이블은 순위 조회용 파생 테이블이다 (매일 대사 작업이 어긋난 아동을 다시 만든다).
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    period_type = db.Column(db.String(10), nullable=False)  # 'day', 'week', 'month'
+    period_start = db.Column(db.Date, nullable=False)  # 일: 해당 날짜, 주: ISO 주의 월요일, 월: 1일
+    child_id = db.Column(db.Integer, db.ForeignKey('child.id'), nullable=False)
+    grade = db.Column(db.Integer, nullable=False)
+
+    # 과목별 합계
+    korean_points = db.Column(db.Integer, default=0)
+    math_points = db.Column(db.Integer, default=0)
+    ssen_points = db.Column(db.Integer, default=0)
+    reading_points = db.Column(db.Integer, default=0)
+    total_points = db.Column(db.Integer, default=0)
+
+    # 집계된 DailyPoints 기록 수
+    record_count = db.Column(db.Integer, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('uq_points_rollup_period_child', 'period_type', 'period_start', 'child_id', unique=True),
+        db.Index('ix_points_rollup_period_grade', 'period_type', 'grade', 'period_start'),
+    )
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -414,6 +602,7 @@ def login():
                     password_hash=''  # Firebase 사용자는 비밀번호 없음
                 )
                 db.session.add(user)
+                deliver_notifications_to_user(user)
                 db.session.commit()
                 print(f"✅ 새 Firebase 사용자 생성: {email}")
             
@@ -465,6 +654,7 @@ def firebase_login():
                     password_hash=''  # Firebase 사용자는 비밀번호 없음
                 )
                 db.session.add(user)
+                deliver_notifications_to_user(user)
                 db.session.commit()
                 print(f"✅ 새 Firebase 사용자 생성: {email}")
             
@@ -496,88 +686,430 @@ def logout():
     flash('로그아웃되었습니다.', 'info')
     return redirect(url_for('login'))
 
-@app.route('/dashboard')
-@login_required
-def dashboard():
-    today = datetime.now(timezone.utc).date()
+# ===== 대시보드 지표 =====
+# 로그인/새로고침마다 열리는 첫 화면이므로 지표를 두 번의 집계 쿼리로 계산하고
+# 센터별로 짧게 캐시한다 (포인트 입력/아동 변경 시 데이터 버전이 바뀌어 자동 무효화).
+
+def compute_dashboard_metrics(today):
+    """대시보드 지표 계산 (포인트 큐브 집계 + 최근 기록 조회 1번)"""
+    week_start = get_rollup_period_start('week', today)
+    week_end = week_start + timedelta(days=6)
     
-    # ====== [포인트 시스템 통계 계산] ======
-    # 오늘 포인트를 입력한 아동 수
-    today_points_children = db.session.query(DailyPoints.child_id).filter_by(date=today).distinct().count()
+    points_cube.refresh()
     
-    # 전체 등록 아동 수
-    total_children = Child.query.count()
+    # 1. 오늘 참여 아동 수 + 주간 합계/기록 수/참여 아동 수 + 전체 아동 수
+    today_points_children = len(points_cube.aggregate('child', start=today, end=today))
+    weekly_participants = len(points_cube.aggregate('child', start=week_start, end=week_end))
+    total_children = points_cube.total_children()
     
-    # 이번 주 평균 포인트 계산
-    week_start = today - timedelta(days=today.weekday())
-    week_end = week_start + timedelta(days=6)
+    weekly = points_cube.aggregate(start=week_start, end=week_end, nonzero=True).get(None, {})
+    total_weekly_points = weekly.get('total_points', 0)
+    weekly_points_count = weekly.get('count', 0)
     
-    weekly_points = DailyPoints.query.filter(
-        DailyPoints.date >= week_start,
-        DailyPoints.date <= week_end
-    ).all()
+    # 2. 0점(미입력)을 제외한 과목별 주간 평균 (포인트는 0 이상이므로 합계 / 0보다 큰 기록 수)
+    def nonzero_avg(subject):
+        nonzero_count = weekly.get(f'nonzero_{subject}', 0)
+        return round(weekly[subject] / nonzero_count, 0) if nonzero_count else 0
     
-    if weekly_points:
-        total_weekly_points = sum(record.total_points for record in weekly_points)
-        weekly_avg_points = int(round(total_weekly_points / len(weekly_points), 0))
-        weekly_points_count = len(weekly_points)
-    else:
-        weekly_avg_points = 0
-        total_weekly_points = 0
-        weekly_points_count = 0
-    
-    # 이번 주 포인트 참여율 계산
-    weekly_participants = db.session.query(DailyPoints.child_id).filter(
-        DailyPoints.date >= week_start,
-        DailyPoints.date <= week_end
-    ).distinct().count()
-    
-    if total_children > 0:
-        participation_rate = int(round((weekly_participants / total_children) * 100, 0))
-    else:
-        participation_rate = 0
+    weekly_korean_avg, weekly_math_avg, weekly_ssen_avg, weekly_reading_avg = (
+        nonzero_avg(subject) for subject in ('korean_points', 'math_points', 'ssen_points', 'reading_points')
+    )
     
-    # 최근 포인트 기록 (최근 10개)
-    recent_records = db.session.query(DailyPoints, Child).join(Child).order_by(DailyPoints.created_at.desc()).limit(10).all()
+    # 최근 포인트 기록 (최근 10개) - 캐시에 넣으므로 ORM 객체 대신 필요한 값만 보관
+    recent_records = [
+        ({'date': record_date, 'total_points': record_total}, {'id': record_child_id, 'name': child_name})
+        for record_date, record_total, record_child_id, child_name in db.session.query(
+            DailyPoints.date, DailyPoints.total_points, Child.id, Child.name
+        ).join(Child).order_by(DailyPoints.created_at.desc()).limit(10)
+    ]
     
-    # ====== [과목별 주간 평균 포인트 계산] ======
-    weekly_korean_avg = 0
-    weekly_math_avg = 0
-    weekly_ssen_avg = 0
-    weekly_reading_avg = 0
-    weekly_total_points = 0
+    return {
+        'today_points_children': today_points_children,
+        'total_children': total_children,
+        'weekly_avg_points': int(round(total_weekly_points / weekly_points_count, 0)) if weekly_points_count else 0,
+        'participation_rate': int(round((weekly_participants / total_children) * 100, 0)) if total_children else 0,
+        'recent_records': recent_records,
+        'weekly_korean_avg': weekly_korean_avg,
+        'weekly_math_avg': weekly_math_avg,
+        'weekly_ssen_avg': weekly_ssen_avg,
+        'weekly_reading_avg': weekly_reading_avg,
+        'weekly_total_points': total_weekly_points,
+        'weekly_points_count': weekly_points_count
+    }
+
+@app_cache.cached('dashboard', ttl=lambda: app.config['DASHBOARD_CACHE_TTL'], depends=('points', 'children'))
+def get_dashboard_metrics(center_name, today):
+    """센터별 대시보드 지표 (날짜가 바뀌면 키가 달라져 새로 계산)"""
+    return compute_dashboard_metrics(today)
+
+@app.route('/dashboard')
+@login_required
+def dashboard():
+    today = datetime.now(timezone.utc).date()
     
-    if weekly_points:
-        # 과목별 평균 계산
-        korean_points = [record.korean_points for record in weekly_points if record.korean_points > 0]
-        math_points = [record.math_points for record in weekly_points if record.math_points > 0]
-        ssen_points = [record.ssen_points for record in weekly_points if record.ssen_points > 0]
-        reading_points = [record.reading_points for record in weekly_points if record.reading_points > 0]
-        
-        weekly_korean_avg = round(sum(korean_points) / len(korean_points), 0) if korean_points else 0
-        weekly_math_avg = round(sum(math_points) / len(math_points), 0) if math_points else 0
-        weekly_ssen_avg = round(sum(ssen_points) / len(ssen_points), 0) if ssen_points else 0
-        weekly_reading_avg = round(sum(reading_points) / len(reading_points), 0) if reading_points else 0
-        
-        # 주간 총 포인트
-        weekly_total_points = sum(record.total_points for record in weekly_points)
+    # ====== [포인트 시스템 통계 계산] ======
+    metrics = get_dashboard_metrics(os.environ.get('CENTER_NAME', '지역아동센터'), today)
     
     # ====== [알림 시스템 활성화] ======
     notifications = get_user_notifications(current_user.id, limit=5)
     
-    return render_template('dashboard.html', 
-                         today_points_children=today_points_children,
-                         total_children=total_children,
-                         weekly_avg_points=weekly_avg_points,
-                         participation_rate=participation_rate,
-                         recent_records=recent_records,
-                         notifications=notifications,
-                         weekly_korean_avg=weekly_korean_avg,
-                         weekly_math_avg=weekly_math_avg,
-                         weekly_ssen_avg=weekly_ssen_avg,
-                         weekly_reading_avg=weekly_reading_avg,
-                         weekly_total_points=weekly_total_points,
-                         weekly_points_count=weekly_points_count)
+    return render_template('dashboard.html', notifications=notifications, **metrics)
+
+# ===== 실시간 스트림 (SSE) =====
+# 대시보드/알림 화면은 /stream에 연결해 두고 새 알림, 오늘 참여 아동 수, 주간 합계를 작은 이벤트로 받는다.
+# 이벤트는 프로세스 안의 EventBroker로 전달되고, 다른 워커에서 생긴 변경은 하트비트 때 데이터 버전/
+# 읽지 않은 알림 카운터를 확인해서 따라잡는다.
+
+class EventBroker:
+    """프로세스 내 pub/sub - 구독자(SSE 연결)마다 크기 제한 큐
+
+    느린 구독자의 큐가 가득 차면 가장 오래된 이벤트를 버린다 (카운터 이벤트는 최신 값만 의미 있음).
+    queue/threading 기반이라 gevent(monkey patch) 워커와 스레드 워커 모두에서 동작한다.
+    연결마다 워커 스레드를 하나씩 붙잡으므로 max_subscribers를 넘는 구독은 거절한다.
+    """
+
+    def __init__(self, queue_size, max_subscribers):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.lock = threading.Lock()
+        self.subscribers = {}  # 구독 큐 -> 사용자 id
+        self.published_count = 0
+        self.dropped_count = 0
+        self.rejected_count = 0
+
+    def subscribe(self, user_id):
+        """구독 큐 반환 (연결 수 한도를 넘으면 None)"""
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self.lock:
+            if len(self.subscribers) >= self.max_subscribers:
+                self.rejected_count += 1
+                return None
+            self.subscribers[subscriber] = user_id
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.pop(subscriber, None)
+
+    def has_subscribers(self):
+        return bool(self.subscribers)
+
+    def publish(self, event_name, data, user_ids=None):
+        """이벤트 발행 (user_ids가 있으면 해당 사용자의 연결에만) - 받은 연결 수"""
+        with self.lock:
+            targets = [subscriber for subscriber, user_id in self.subscribers.items()
+                       if user_ids is None or user_id in user_ids]
+            self.published_count += 1
+        for subscriber in targets:
+            while True:
+                try:
+                    subscriber.put_nowait((event_name, data))
+                    break
+                except queue.Full:
+                    try:
+                        subscriber.get_nowait()
+                        with self.lock:
+                            self.dropped_count += 1
+                    except queue.Empty:
+                        pass
+        return len(targets)
+
+    def status(self):
+        with self.lock:
+            return {
+                'subscribers': len(self.subscribers),
+                'max_subscribers': self.max_subscribers,
+                'published': self.published_count,
+                'dropped': self.dropped_count,
+                'rejected': self.rejected_count
+            }
+
+event_broker = EventBroker(app.config['STREAM_QUEUE_SIZE'], app.config['STREAM_MAX_CONNECTIONS'])
+
+def queue_stream_event(event_name, data, user_ids=None):
+    """현재 트랜잭션이 커밋되면 발행할 이벤트 등록 (롤백되면 버림)"""
+    db.session.info.setdefault('stream_events', []).append((event_name, data, user_ids))
+
+@event.listens_for(db.session, 'after_commit')
+def publish_stream_events(session):
+    for event_name, data, user_ids in session.info.pop('stream_events', []):
+        event_broker.publish(event_name, data, user_ids)
+
+@event.listens_for(db.session, 'after_soft_rollback')
+def discard_stream_events(session, previous_transaction):
+    session.info.pop('stream_events', None)
+
+@app_cache.cached('dashboard_counters', depends=('points', 'children'))
+def compute_dashboard_counters(today):
+    """대시보드 실시간 카운터 (포인트 큐브 집계 2번 - 오늘 참여 아동 수, 주간 합계/기록 수/평균/참여율)"""
+    week_start = get_rollup_period_start('week', today)
+    points_cube.refresh()
+    weekly_participants = len(points_cube.aggregate('child', start=week_start, end=week_start + timedelta(days=6)))
+    total_children = points_cube.total_children()
+    weekly = points_cube.aggregate(start=week_start, end=week_start + timedelta(days=6), nonzero=True).get(None, {})
+    total_weekly_points = weekly.get('total_points', 0)
+    weekly_points_count = weekly.get('count', 0)
+    return {
+        'today_points_children': len(points_cube.aggregate('child', start=today, end=today)),
+        'weekly_total_points': total_weekly_points,
+        'weekly_points_count': weekly_points_count,
+        'weekly_avg_points': int(round(total_weekly_points / weekly_points_count, 0)) if weekly_points_count else 0,
+        'participation_rate': int(round((weekly_participants / total_children) * 100, 0)) if total_children else 0
+    }
+
+DASHBOARD_COUNTER_WINDOW = 1.0  # 이 시간(초) 안에 들어온 포인트 저장은 카운터 계산 한 번으로 합침
+
+class DashboardCounterPublisher:
+    """대시보드 카운터 계산/발행을 단일 백그라운드 스레드에서 처리
+
+    포인트 저장 요청은 신호만 남기고 바로 반환한다 (카운터 계산은 큐브 갱신 + 집계라 요청 경로에서 빼냄).
+    신호를 받은 뒤 window초 동안 들어온 저장은 한 번의 계산으로 합친다.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.wakeup = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.requested_count = 0
+        self.published_count = 0
+
+    def start(self):
+        """워커 스레드 시작 (이미 실행 중이면 무시)"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='dashboard-counter-publisher', daemon=True)
+                self.thread.start()
+
+    def request(self):
+        """카운터 발행 요청 (즉시 반환, 연결된 클라이언트가 없으면 무시)"""
+        if not event_broker.has_subscribers():
+            return
+        self.start()
+        self.requested_count += 1
+        self.wakeup.set()
+
+    def run(self):
+        while True:
+            self.wakeup.wait()
+            time.sleep(self.window)
+            # 계산 중에 들어온 요청은 다시 set되어 한 번 더 계산됨
+            self.wakeup.clear()
+            if not event_broker.has_subscribers():
+                continue
+            try:
+                with app.app_context():
+                    counters = compute_dashboard_counters(datetime.now(timezone.utc).date())
+                    db.session.remove()
+                event_broker.publish('counters', counters)
+                self.published_count += 1
+            except Exception as e:
+                logger.warning("⚠️ 대시보드 카운터 발행 실패: %s", e)
+
+dashboard_counter_publisher = DashboardCounterPublisher(DASHBOARD_COUNTER_WINDOW)
+
+def publish_dashboard_counters():
+    """포인트 입력 커밋 후 호출 - 카운터 계산/발행은 백그라운드 스레드에 맡기고 바로 반환"""
+    dashboard_counter_publisher.request()
+
+def format_stream_event(event_name, data):
+    """SSE 메시지 형식 (event + data 한 줄 JSON)"""
+    return f"event: {event_name}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def generate_stream(user_id, subscriber):
+    """SSE 응답 본문 - 시작 시 현재 값, 이후 이벤트, 하트비트마다 다른 워커의 변경 확인"""
+    heartbeat = app.config['STREAM_HEARTBEAT_SECONDS']
+    deadline = time.monotonic() + app.config['STREAM_MAX_SECONDS']
+    last_versions = None
+    last_unread = None
+
+    def check_changes():
+        """데이터 버전/읽지 않은 알림 수가 바뀌었으면 새 값 이벤트 (DB 연결은 바로 반납)"""
+        nonlocal last_versions, last_unread
+        messages = []
+        with app.app_context():
+            try:
+                versions = app_cache.versions('points', 'children')
+                if last_versions is None or versions is None or versions != last_versions:
+                    last_versions = versions
+                    messages.append(format_stream_event('counters', compute_dashboard_counters(datetime.now(timezone.utc).date())))
+                unread = get_unread_notification_count(user_id)
+                if unread != last_unread:
+                    last_unread = unread
+                    messages.append(format_stream_event('unread', {'unread_count': unread}))
+            finally:
+                db.session.remove()
+        return messages
+
+    try:
+        yield f"retry: {heartbeat * 1000}\n\n"
+        yield from check_changes()
+        while time.monotonic() < deadline:
+            try:
+                event_name, data = subscriber.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ": ping\n\n"
+                yield from check_changes()
+                continue
+            if event_name == 'counters':
+                # 같은 워커의 포인트 입력 - 이미 계산된 값이므로 버전만 기록해서 하트비트 때 다시 계산하지 않음
+                last_versions = app_cache.versions('points', 'children')
+            yield format_stream_event(event_name, data)
+    finally:
+        event_broker.unsubscribe(subscriber)
+
+@app.route('/stream')
+@login_required
+def stream():
+    """실시간 알림/대시보드 카운터 스트림 (Server-Sent Events, 연결 수 한도를 넘으면 503)"""
+    subscriber = event_broker.subscribe(current_user.id)
+    if subscriber is None:
+        response = jsonify({'success': False, 'message': '실시간 연결이 많아 주기적 조회로 전환합니다.'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(app.config['STREAM_POLL_SECONDS'])
+        return response
+    
+    response = app.response_class(
+        generate_stream(current_user.id, subscriber),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    # 본문을 보내기 전에 연결이 끊겨도 구독이 남지 않도록
+    response.call_on_close(lambda: event_broker.unsubscribe(subscriber))
+    return response
+
+@app.route('/api/dashboard/counters')
+@login_required
+def dashboard_counters_api():
+    """대시보드 카운터 + 읽지 않은 알림 수 (스트림에 연결하지 못한 화면의 주기적 조회용)"""
+    try:
+        return jsonify({
+            'success': True,
+            'counters': compute_dashboard_counters(datetime.now(timezone.utc).date()),
+            'unread_count': get_unread_notification_count(current_user.id)
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'카운터 조회 실패: {str(e)}'}), 500
+
+# ===== 아동 이름 검색 =====
+# 정규화 이름/초성 컬럼(B-tree 인덱스)과, SQLite에 FTS5 trigram 토크나이저가 있으면 외부 콘텐츠 FTS 테이블
+# (child 테이블 트리거로 동기화)을 쓴다. 3글자 이상 부분 일치는 FTS, 그보다 짧거나 FTS가 없으면
+# 좁은 검색 컬럼 인덱스만 훑는 LIKE, 자동완성의 앞부분 일치는 인덱스 범위 조회로 처리한다.
+
+CHILD_SEARCH_FTS_TABLE = 'child_search_fts'
+CHILD_SEARCH_FTS_MIN = 3  # trigram 인덱스로 찾을 수 있는 최소 글자 수
+CHILD_SEARCH_LIMIT = 10
+child_search_fts_enabled = False
+
+def ensure_child_search_index(rebuild=False):
+    """검색 컬럼이 빈 아동을 채우고, 가능하면 FTS 테이블/동기화 트리거 생성 (시작 시, 복원 후 호출)
+
+    rebuild=True면 FTS 색인을 child 테이블에서 다시 만든다 (DB 파일 교체/테이블 재생성 후).
+    """
+    global child_search_fts_enabled
+    try:
+        missing = Child.query.filter(Child.search_name.is_(None)).all()
+        for child in missing:
+            child.search_name, child.search_choseong = build_name_search_keys(child.name)
+        db.session.commit()
+
+        if db.engine.dialect.name != 'sqlite':
+            return
+        connection = db.session.connection()
+        # 테이블이나 트리거가 없으면(batch 마이그레이션이 child 테이블을 다시 만들면 트리거가 사라짐) 색인 재생성
+        existing = connection.execute(text(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name IN (:name, :name || '_ai', :name || '_ad', :name || '_au')"
+        ), {'name': CHILD_SEARCH_FTS_TABLE}).scalar()
+        created = existing < 4
+        try:
+            connection.execute(text(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {CHILD_SEARCH_FTS_TABLE}
+                USING fts5(search_name, search_choseong, content='child', content_rowid='id', tokenize='trigram')
+            """))
+        except Exception as e:
+            db.session.rollback()
+            child_search_fts_enabled = False
+            print(f"⚠️ FTS5 trigram을 사용할 수 없어 인덱스 검색만 사용합니다: {e}")
+            return
+        columns = 'rowid, search_name, search_choseong'
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {CHILD_SEARCH_FTS_TABLE}_ai AFTER INSERT ON child BEGIN
+                INSERT INTO {CHILD_SEARCH_FTS_TABLE} ({columns}) VALUES (new.id, new.search_name, new.search_choseong);
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {CHILD_SEARCH_FTS_TABLE}_ad AFTER DELETE ON child BEGIN
+                INSERT INTO {CHILD_SEARCH_FTS_TABLE} ({CHILD_SEARCH_FTS_TABLE}, {columns})
+                VALUES ('delete', old.id, old.search_name, old.search_choseong);
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {CHILD_SEARCH_FTS_TABLE}_au AFTER UPDATE OF search_name, search_choseong ON child BEGIN
+                INSERT INTO {CHILD_SEARCH_FTS_TABLE} ({CHILD_SEARCH_FTS_TABLE}, {columns})
+                VALUES ('delete', old.id, old.search_name, old.search_choseong);
+                INSERT INTO {CHILD_SEARCH_FTS_TABLE} ({columns}) VALUES (new.id, new.search_name, new.search_choseong);
+            END
+        """))
+        if created or rebuild:
+            connection.execute(text(f"INSERT INTO {CHILD_SEARCH_FTS_TABLE} ({CHILD_SEARCH_FTS_TABLE}) VALUES ('rebuild')"))
+        db.session.commit()
+        child_search_fts_enabled = True
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ 아동 검색 인덱스 준비 실패 (마이그레이션 필요): {e}")
+
+def child_search_key(search):
+    """검색어 -> (검색 컬럼, 정규화 검색어) - 초성(ㄱㄴㄷ)이 섞여 있으면 초성 컬럼에서 찾음"""
+    normalized = normalize_search_text(search)
+    if any(char in CHOSEONG for char in normalized):
+        return Child.search_choseong, to_choseong(normalized)
+    return Child.search_name, normalized
+
+def child_search_filter(search):
+    """이름 부분 일치 조건 (Child 쿼리의 filter에 사용, 검색어가 비면 None)"""
+    column, key = child_search_key(search)
+    if not key:
+        return None
+    if child_search_fts_enabled and len(key) >= CHILD_SEARCH_FTS_MIN:
+        match = f'{column.key} : "{key.replace(chr(34), chr(34) * 2)}"'
+        return Child.id.in_(
+            text(f"SELECT rowid FROM {CHILD_SEARCH_FTS_TABLE} WHERE {CHILD_SEARCH_FTS_TABLE} MATCH :match")
+            .bindparams(match=match).columns(id=db.Integer)
+        )
+    return column.contains(key, autoescape=True)
+
+def search_children(search, limit=CHILD_SEARCH_LIMIT):
+    """이름 자동완성 - 앞부분 일치(인덱스 범위 조회)를 먼저, 모자라면 부분 일치로 채움"""
+    column, key = child_search_key(search)
+    if not key:
+        return []
+    fields = (Child.id, Child.name, Child.grade)
+    # 앞부분 일치: key <= 값 < key의 마지막 글자 + 1 (LIKE 'key%'와 같지만 인덱스 사용이 보장됨)
+    upper = key[:-1] + chr(ord(key[-1]) + 1)
+    rows = db.session.execute(
+        db.select(*fields).where(column >= key, column < upper).order_by(column, Child.id).limit(limit)
+    ).all()
+    if len(rows) < limit:
+        rows += db.session.execute(
+            db.select(*fields)
+            .where(child_search_filter(search), Child.id.notin_([row.id for row in rows]))
+            .order_by(column, Child.id).limit(limit - len(rows))
+        ).all()
+    return [{'id': row.id, 'name': row.name, 'grade': row.grade} for row in rows]
+
+@app.route('/api/children/search')
+@login_required
+def search_children_api():
+    """아동 이름 자동완성 (정규화 이름/초성)"""
+    limit = min(max(request.args.get('limit', CHILD_SEARCH_LIMIT, type=int), 1), 50)
+    return jsonify({'success': True, 'children': search_children(request.args.get('q', ''), limit)})
+
+@app.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """아동 이름 검색 컬럼/FTS 색인 재생성 (flask rebuild-search-index)"""
+    ensure_child_search_index(rebuild=True)
+    print(f"🔎 아동 이름 검색 색인 재생성 완료 (FTS: {'사용' if child_search_fts_enabled else '미사용'})")
 
 # 아동 관리 라우트
 @app.route('/children')
@@ -589,9 +1121,10 @@ def children_list():
     
     query = Child.query
     
-    # 검색 필터
-    if search:
-        query = query.filter(Child.name.contains(search))
+    # 검색 필터 (정규화 이름/초성)
+    search_condition = child_search_filter(search)
+    if search_condition is not None:
+        query = query.filter(search_condition)
     
     # 학년 필터
     if grade_filter:
@@ -638,6 +1171,7 @@ def add_child():
         child = Child(name=name, grade=int(grade))
         db.session.add(child)
         db.session.commit()
+        app_cache.invalidate('children')
         
         flash(f'{name} 아동이 성공적으로 등록되었습니다.', 'success')
         return redirect(url_for('children_list'))
@@ -671,7 +1205,13 @@ def edit_child(child_id):
         # 아동 정보 업데이트
         child.name = name
         child.grade = int(grade)
+        
+        # 학년 변경 시 집계 테이블의 학년도 함께 갱신
+        PointsRollup.query.filter_by(child_id=child_id).update(
+            {'grade': child.grade}, synchronize_session=False
+        )
         db.session.commit()
+        app_cache.invalidate('children')
         
         flash(f'{name} 아동 정보가 성공적으로 수정되었습니다.', 'success')
         return redirect(url_for('children_list'))
@@ -691,8 +1231,10 @@ def delete_child(child_id):
     
     try:
         # 관련 기록들도 함께 삭제됨 (cascade 설정)
+        PointsRollup.query.filter_by(child_id=child_id).delete(synchronize_session=False)
         db.session.delete(child)
         db.session.commit()
+        app_cache.invalidate('children', 'points', 'learning')
         
         flash(f'{child_name} 아동과 관련 기록이 모두 삭제되었습니다.', 'success')
     except Exception as e:
@@ -701,71 +1243,51 @@ def delete_child(child_id):
     
     return redirect(url_for('children_list'))
 
+# ===== 아동 포인트 기록 목록 (키셋 페이지네이션) =====
+# DailyPoints는 (child_id, date) 유니크 인덱스로 아동/날짜당 1건이므로 중복 제거 서브쿼리 없이
+# 인덱스를 날짜 역순으로 따라가며 커서(마지막으로 보여준 날짜) 이전 n건만 읽는다 (페이지 깊이와 무관).
+
+CHILD_POINTS_PAGE_SIZE = 20
+CHILD_POINTS_PAGE_MAX = 100
+
+def parse_history_cursor(value):
+    """페이지 커서(YYYY-MM-DD) 파싱 (없거나 잘못되면 None - 최신부터)"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+    except ValueError:
+        return None
+
+def get_child_points_page(child_id, before=None, limit=CHILD_POINTS_PAGE_SIZE):
+    """아동 포인트 기록 한 페이지 (날짜 역순) - (행 목록, 다음 커서) 반환
+
+    행은 ORM 객체 대신 SQLAlchemy Row (date, 과목별 포인트, created_at 속성)이고,
+    다음 커서는 마지막 행의 날짜 (더 없으면 None).
+    """
+    query = (db.select(DailyPoints.date, *[getattr(DailyPoints, subject) for subject in ROLLUP_SUBJECTS],
+                       DailyPoints.created_at)
+             .where(DailyPoints.child_id == child_id)
+             .order_by(DailyPoints.date.desc())
+             .limit(limit + 1))
+    if before is not None:
+        query = query.where(DailyPoints.date < before)
+    rows = db.session.execute(query).all()
+    next_cursor = rows[limit - 1].date if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+@app_cache.cached('child_point_days', depends=('points',))
+def count_child_point_days(child_id):
+    """아동의 포인트 기록 일수 (유니크 인덱스 범위 COUNT, 포인트 변경 시까지 캐시)"""
+    return db.session.query(func.count(DailyPoints.id)).filter(DailyPoints.child_id == child_id).scalar()
+
 @app.route('/children/<int:child_id>')
 @login_required
 def child_detail(child_id):
     child = Child.query.get_or_404(child_id)
     
-    # 페이지네이션 파라미터
-    page = request.args.get('page', 1, type=int)
-    per_page = 20  # 한 페이지당 20개 기록
-    
-    # 새로운 포인트 시스템 기록들 (중복 제거) - 페이지네이션 적용
-    from sqlalchemy import text
-    
-    # 전체 기록 수 계산
-    count_result = db.session.execute(text("""
-        SELECT COUNT(DISTINCT date) as total_count
-        FROM daily_points 
-        WHERE child_id = :child_id
-    """), {"child_id": child_id})
-    total_records = count_result.fetchone()[0]
-    
-    # 페이지네이션 계산
-    offset = (page - 1) * per_page
-    total_pages = (total_records + per_page - 1) // per_page
-    
-    # 페이지별 기록 조회
-    result = db.session.execute(text("""
-        SELECT id, date, korean_points, math_points, ssen_points, reading_points, total_points, created_at
-        FROM daily_points 
-        WHERE child_id = :child_id 
-        AND id IN (
-            SELECT MAX(id) 
-            FROM daily_points 
-            WHERE child_id = :child_id 
-            GROUP BY date
-        )
-        ORDER BY date DESC
-        LIMIT :per_page OFFSET :offset
-    """), {"child_id": child_id, "per_page": per_page, "offset": offset})
-    
-    # DailyPoints 객체로 변환
-    recent_records = []
-    for row in result:
-        # 날짜 타입 변환
-        date_value = row[1]
-        if isinstance(date_value, str):
-            from datetime import datetime
-            date_value = datetime.strptime(date_value, '%Y-%m-%d').date()
-        
-        created_at_value = row[7]
-        if isinstance(created_at_value, str):
-            from datetime import datetime
-            created_at_value = datetime.strptime(created_at_value, '%Y-%m-%d %H:%M:%S.%f')
-        
-        point_record = DailyPoints(
-            id=row[0],
-            date=date_value,
-            korean_points=row[2],
-            math_points=row[3],
-            ssen_points=row[4],
-            reading_points=row[5],
-            total_points=row[6]
-        )
-        # created_at을 별도로 설정 (템플릿에서 사용할 수 있도록)
-        point_record.created_at = created_at_value
-        recent_records.append(point_record)
+    # 키셋 페이지네이션 - before(날짜) 이전 기록부터 한 페이지 (없으면 최신부터)
+    before = parse_history_cursor(request.args.get('before'))
+    recent_records, next_cursor = get_child_points_page(child_id, before)
+    total_records = count_child_point_days(child_id)
     
     # 최근 특이사항들
     recent_notes = ChildNote.query.filter_by(child_id=child_id)\
@@ -794,10 +1316,26 @@ def child_detail(child_id):
                          latest_record=latest_record,
                          total_points=total_points,
                          # 페이지네이션 정보
-                         current_page=page,
-                         total_pages=total_pages,
+                         before=before,
+                         next_cursor=next_cursor,
                          total_records=total_records,
-                         per_page=per_page)
+                         per_page=CHILD_POINTS_PAGE_SIZE)
+
+@app.route('/api/children/<int:child_id>/points')
+@login_required
+def child_points_page_api(child_id):
+    """아동 포인트 기록 다음 페이지 (상세 페이지 무한 스크롤용)"""
+    if db.session.get(Child, child_id) is None:
+        return jsonify({'success': False, 'message': '아동을 찾을 수 없습니다.'}), 404
+    before = parse_history_cursor(request.args.get('before'))
+    limit = min(max(request.args.get('limit', CHILD_POINTS_PAGE_SIZE, type=int), 1), CHILD_POINTS_PAGE_MAX)
+    rows, next_cursor = get_child_points_page(child_id, before, limit)
+    return jsonify({
+        'success': True,
+        'records': [{'date': row.date.isoformat(), **{subject: getattr(row, subject) for subject in ROLLUP_SUBJECTS}}
+                    for row in rows],
+        'next_cursor': next_cursor.isoformat() if next_cursor else None
+    })
 
 # ===== 특이사항 관리 라우트 =====
 
@@ -825,7 +1363,7 @@ def add_child_note(child_id):
         flash(f'✅ {child.name} 아동의 특이사항이 추가되었습니다.', 'success')
         
         # 특이사항 추가 알림 생성
-        print(f"DEBUG: 특이사항 추가 알림 생성 시도 - {child.name}")
+        logger.debug("특이사항 추가 알림 생성 시도 - %s", child.name)
         notification = create_notification(
             title=f'📝 {child.name} 특이사항 추가',
             message=f'{current_user.name}님이 {child.name} 아동의 특이사항을 추가했습니다.',
@@ -836,7 +1374,7 @@ def add_child_note(child_id):
             auto_expire=True,
             expire_days=3
         )
-        print(f"DEBUG: 알림 생성 결과 - {notification}")
+        logger.debug("알림 생성 결과 - %s", notification)
         
     except Exception as e:
         db.session.rollback()
@@ -869,7 +1407,7 @@ def edit_child_note(child_id, note_id):
         flash(f'✅ {child.name} 아동의 특이사항이 수정되었습니다.', 'success')
         
         # 특이사항 수정 알림 생성
-        print(f"DEBUG: 특이사항 수정 알림 생성 시도 - {child.name}")
+        logger.debug("특이사항 수정 알림 생성 시도 - %s", child.name)
         notification = create_notification(
                 title=f'📝 {child.name} 특이사항 수정',
                 message=f'{current_user.name}님이 {child.name} 아동의 특이사항을 수정했습니다.',
@@ -880,7 +1418,7 @@ def edit_child_note(child_id, note_id):
             auto_expire=True,
             expire_days=3
         )
-        print(f"DEBUG: 수정 알림 생성 결과 - {notification}")
+        logger.debug("수정 알림 생성 결과 - %s", notification)
         
     except Exception as e:
         db.session.rollback()
@@ -1025,6 +1563,7 @@ def add_score():
             
             db.session.add(new_record)
             db.session.commit()
+            app_cache.invalidate('learning')
             
             child = Child.query.get(child_id)
             flash(f'{child.name} 아동의 {date_str} 학습 기록이 저장되었습니다.', 'success')
@@ -1077,6 +1616,15 @@ def edit_score(record_id):
             # 총점 계산
             total_score = korean_score + math_score + reading_score
             
+            # 같은 아동의 다른 기록이 이미 그 날짜에 있으면 (아동/날짜 고유 인덱스) 안내 후 폼으로
+            if date != record.date and LearningRecord.query.filter(
+                LearningRecord.child_id == record.child_id,
+                LearningRecord.date == date,
+                LearningRecord.id != record.id
+            ).first():
+                flash(f'{record.child.name} 아동의 {date_str} 학습 기록이 이미 있습니다. 해당 날짜의 기록을 수정해주세요.', 'error')
+                return render_template('scores/form.html', record=record, children=Child.query.all())
+            
             # 기록 업데이트
             record.date = date
             record.korean_problems_solved = korean_problems_solved
@@ -1093,6 +1641,7 @@ def edit_score(record_id):
             record.updated_at = datetime.utcnow()
             
             db.session.commit()
+            app_cache.invalidate('learning')
             
             flash(f'{record.child.name} 아동의 학습 기록이 수정되었습니다.', 'success')
             return redirect(url_for('child_detail', child_id=record.child_id))
@@ -1120,6 +1669,7 @@ def delete_score(record_id):
     try:
         db.session.delete(record)
         db.session.commit()
+        app_cache.invalidate('learning')
         flash(f'{child_name} 아동의 {record.date.strftime("%Y-%m-%d")} 학습 기록이 삭제되었습니다.', 'success')
     except Exception as e:
         db.session.rollback()
@@ -1132,7 +1682,7 @@ def delete_score(record_id):
 @login_required
 def toggle_child_stats(child_id):
     child = Child.query.get_or_404(child_id)
-    print(f"DEBUG: {child.name} - 이전 상태: {child.include_in_stats}")
+    logger.debug("%s - 이전 상태: %s", child.name, child.include_in_stats)
     
     # 명확한 토글 로직
     if child.include_in_stats:
@@ -1140,8 +1690,9 @@ def toggle_child_stats(child_id):
     else:
         child.include_in_stats = True
     
-    print(f"DEBUG: {child.name} - 변경 후 상태: {child.include_in_stats}")
+    logger.debug("%s - 변경 후 상태: %s", child.name, child.include_in_stats)
     db.session.commit()
+    app_cache.invalidate('children')
     
     status = "포함" if child.include_in_stats else "제외"
     flash(f'{child.name} 아이가 통계에서 {status}되었습니다.', 'success')
@@ -1158,9 +1709,10 @@ def reading_list():
     # 독서 기록 조회 (reading_score가 있는 기록만)
     query = db.session.query(LearningRecord, Child).join(Child).filter(LearningRecord.reading_score.isnot(None))
     
-    # 검색 필터
-    if search:
-        query = query.filter(Child.name.contains(search))
+    # 검색 필터 (정규화 이름/초성)
+    search_condition = child_search_filter(search)
+    if search_condition is not None:
+        query = query.filter(search_condition)
     
     # 학년 필터
     if grade_filter:
@@ -1184,15 +1736,201 @@ def reading_list():
                          grade_filter=grade_filter,
                          grade_list=grade_list)
 
+# ===== 학습 기록 조회 헬퍼 함수들 =====
+
+def get_stats_children_by_grade(grade=None):
+    """통계 포함 아동을 학년별로 묶어서 한 번에 조회 ({grade: [child, ...]})"""
+    query = Child.query.filter_by(include_in_stats=True)
+    if grade is not None:
+        query = query.filter_by(grade=grade)
+    
+    children_by_grade = {}
+    for child in query.order_by(Child.grade, Child.id).all():
+        children_by_grade.setdefault(child.grade, []).append(child)
+    return children_by_grade
+
+def get_latest_learning_records(grade=None, include_in_stats=True):
+    """아동별 최신 LearningRecord를 단일 쿼리(윈도우 함수)로 조회 ({child_id: record})"""
+    ranked = db.session.query(
+        LearningRecord.id.label('id'),
+        func.row_number().over(
+            partition_by=LearningRecord.child_id,
+            order_by=(LearningRecord.date.desc(), LearningRecord.id.desc())
+        ).label('row_number')
+    ).join(Child, Child.id == LearningRecord.child_id)
+    
+    if include_in_stats:
+        ranked = ranked.filter(Child.include_in_stats == True)
+    if grade is not None:
+        ranked = ranked.filter(Child.grade == grade)
+    ranked = ranked.subquery()
+    
+    records = LearningRecord.query.join(ranked, ranked.c.id == LearningRecord.id)\
+                                  .filter(ranked.c.row_number == 1).all()
+    return {record.child_id: record for record in records}
+
+def _average(total, count):
+    return round(total / count, 1) if count else 0
+
+def build_progress_chart_data(leaderboard_size=10):
+    """진도 차트 데이터를 LearningRecord 단일 스트리밍으로 계산
+
+    (학년, 아동, 날짜) 순으로 정렬된 행을 한 번만 읽으면서 아동 단위/학년 단위로 마감한다.
+    메모리에는 현재 학년의 중간 집계와 리더보드 상위 N명만 유지한다.
+    """
+    grade_progress_data = {}
+    page_comparison_data = {}
+    grade_average_progress = {}
+    leaderboard_heap = []  # (total_pages, -child_id, student) 최소 힙
+
+    rows = db.session.query(
+        Child.id.label('child_id'), Child.name, Child.grade,
+        LearningRecord.id.label('record_id'), LearningRecord.date,
+        LearningRecord.korean_last_page, LearningRecord.korean_score,
+        LearningRecord.korean_problems_correct, LearningRecord.korean_problems_solved,
+        LearningRecord.math_last_page, LearningRecord.math_score,
+        LearningRecord.math_problems_correct, LearningRecord.math_problems_solved,
+        LearningRecord.reading_score, LearningRecord.total_score
+    ).outerjoin(LearningRecord, LearningRecord.child_id == Child.id)\
+     .filter(Child.include_in_stats == True)\
+     .order_by(Child.grade, Child.id, LearningRecord.date, LearningRecord.id)\
+     .yield_per(5000)
+
+    grade_state = None
+    child_state = None
+
+    def new_grade_state(grade):
+        return {
+            'grade': grade, 'students': [],
+            'korean_pages': {}, 'math_pages': {},
+            'korean_score': [0, 0], 'math_score': [0, 0], 'reading_score': [0, 0]
+        }
+
+    def finish_child(state):
+        latest_date, korean_page, math_page = state['latest'] or (None, 0, 0)
+
+        grade_state['students'].append({
+            'name': state['name'],
+            'korean_page': korean_page,
+            'math_page': math_page,
+            'total_pages': korean_page + math_page
+        })
+
+        student = {
+            'name': state['name'],
+            'grade': state['grade'],
+            'korean_page': korean_page,
+            'math_page': math_page,
+            'total_pages': korean_page + math_page,
+            'avg_score': _average(state['total_score'], state['score_count']),
+            'last_study': latest_date.strftime('%m/%d') if latest_date else '-'
+        }
+        entry = (student['total_pages'], -state['child_id'], student)
+        if len(leaderboard_heap) < leaderboard_size:
+            heapq.heappush(leaderboard_heap, entry)
+        elif entry[:2] > leaderboard_heap[0][:2]:
+            heapq.heapreplace(leaderboard_heap, entry)
+
+    def finish_grade(state):
+        grade = state['grade']
+        students = state['students']
+        if grade not in range(1, 7) or not students:
+            return
+        key = str(grade)
+
+        # 총 진도순으로 정렬
+        students.sort(key=lambda x: x['total_pages'], reverse=True)
+        grade_progress_data[key] = students
+
+        # 2명 이상인 페이지만 남기고 점수순 정렬
+        page_comparison_data[key] = {'korean': {}, 'math': {}}
+        for subject in ('korean', 'math'):
+            for page, page_students in state[f'{subject}_pages'].items():
+                if len(page_students) >= 2:
+                    page_students.sort(key=lambda x: x['score'], reverse=True)
+                    page_comparison_data[key][subject][page] = page_students
+
+        grade_average_progress[key] = {
+            'korean_avg_page': round(sum(s['korean_page'] for s in students) / len(students), 1),
+            'math_avg_page': round(sum(s['math_page'] for s in students) / len(students), 1),
+            'korean_avg_score': _average(*state['korean_score']),
+            'math_avg_score': _average(*state['math_score']),
+            'reading_avg_score': _average(*state['reading_score'])
+        }
+
+    for (child_id, name, grade, record_id, record_date,
+         korean_page, korean_score, korean_correct, korean_solved,
+         math_page, math_score, math_correct, math_solved,
+         reading_score, total_score) in rows:
+        if child_state is None or child_id != child_state['child_id']:
+            if child_state is not None:
+                finish_child(child_state)
+            if grade_state is None or grade != grade_state['grade']:
+                if grade_state is not None:
+                    finish_grade(grade_state)
+                grade_state = new_grade_state(grade)
+            child_state = {
+                'child_id': child_id, 'name': name, 'grade': grade,
+                'latest': None, 'total_score': 0, 'score_count': 0
+            }
+
+        if record_id is None:
+            continue
+
+        # 날짜순으로 읽으므로 마지막 행이 최신 기록
+        child_state['latest'] = (record_date, korean_page or 0, math_page or 0)
+
+        if korean_page:
+            grade_state['korean_pages'].setdefault(korean_page, []).append({
+                'name': name, 'score': korean_score,
+                'correct': korean_correct, 'solved': korean_solved
+            })
+        if math_page:
+            grade_state['math_pages'].setdefault(math_page, []).append({
+                'name': name, 'score': math_score,
+                'correct': math_correct, 'solved': math_solved
+            })
+
+        for subject, score in (('korean', korean_score), ('math', math_score), ('reading', reading_score)):
+            if (score or 0) > 0:
+                grade_state[f'{subject}_score'][0] += score
+                grade_state[f'{subject}_score'][1] += 1
+
+        if (total_score or 0) > 0:
+            child_state['total_score'] += total_score
+            child_state['score_count'] += 1
+
+    if child_state is not None:
+        finish_child(child_state)
+        finish_grade(grade_state)
+
+    # 총 진도순(동점이면 먼저 등록된 아동 우선)으로 정렬
+    leaderboard_heap.sort(key=lambda entry: (-entry[0], -entry[1]))
+    progress_leaderboard = [entry[2] for entry in leaderboard_heap]
+
+    return {
+        'grade_progress_data': grade_progress_data,
+        'page_comparison_data': page_comparison_data,
+        'grade_average_progress': grade_average_progress,
+        'progress_leaderboard': progress_leaderboard
+    }
+
 # 과목별 비교 통계 페이지
 @app.route('/statistics')
 @login_required
 def statistics_overview():
-    # 학년별 현재 진도 현황
+    return render_template('statistics/overview.html', grade_progress=build_grade_progress())
+
+@app_cache.cached('statistics_overview', depends=('learning', 'children'))
+def build_grade_progress():
+    """학년별 현재 진도 현황 (과목별 최신 페이지에 있는 아동 목록)"""
     grade_progress = {}
     
+    children_by_grade = get_stats_children_by_grade()
+    latest_records = get_latest_learning_records()
+    
     for grade in range(1, 7):
-        children = Child.query.filter_by(grade=grade, include_in_stats=True).all()
+        children = children_by_grade.get(grade)
         if not children:
             continue
             
@@ -1204,23 +1942,26 @@ def statistics_overview():
         }
         
         for child in children:
-            latest_record = LearningRecord.query.filter_by(child_id=child.id).order_by(LearningRecord.date.desc()).first()
+            latest_record = latest_records.get(child.id)
             if latest_record:
+                # 캐시에 넣으므로 ORM 객체 대신 필요한 값만 보관
+                child_info = {'id': child.id, 'name': child.name}
+                
                 # 국어 페이지별 아이들 그룹화
                 if latest_record.korean_last_page:
                     page = latest_record.korean_last_page
                     if page not in grade_progress[grade]['korean_pages']:
                         grade_progress[grade]['korean_pages'][page] = []
-                    grade_progress[grade]['korean_pages'][page].append(child)
+                    grade_progress[grade]['korean_pages'][page].append(child_info)
                 
                 # 수학 페이지별 아이들 그룹화  
                 if latest_record.math_last_page:
                     page = latest_record.math_last_page
                     if page not in grade_progress[grade]['math_pages']:
                         grade_progress[grade]['math_pages'][page] = []
-                    grade_progress[grade]['math_pages'][page].append(child)
+                    grade_progress[grade]['math_pages'][page].append(child_info)
     
-    return render_template('statistics/overview.html', grade_progress=grade_progress)
+    return grade_progress
 
 # 특정 페이지별 상세 통계
 @app.route('/statistics/<int:grade>/<subject>/<int:page>')
@@ -1288,157 +2029,14 @@ def statistics_charts():
         func.date(LearningRecord.created_at) == today
     ).order_by(LearningRecord.created_at.desc()).all()
     
-    # 학년별로 아이들 그룹화
-    grade_progress_data = {}
-    page_comparison_data = {}
-    grade_average_progress = {}
-    
-    for grade in range(1, 7):
-        children = Child.query.filter_by(grade=grade, include_in_stats=True).all()
-        if not children:
-            continue
-        
-        # 각 아이의 최신 진도 정보 가져오기
-        grade_students = []
-        for child in children:
-            # 최신 기록 가져오기
-            latest_record = LearningRecord.query.filter_by(
-                child_id=child.id
-            ).order_by(LearningRecord.date.desc()).first()
-            
-            korean_page = latest_record.korean_last_page if latest_record else 0
-            math_page = latest_record.math_last_page if latest_record else 0
-
-            grade_students.append({
-                'name': child.name,
-                'korean_page': korean_page,
-                'math_page': math_page,
-                'total_pages': korean_page + math_page
-            })
-        
-        # 총 진도순으로 정렬
-        grade_students.sort(key=lambda x: x['total_pages'], reverse=True)
-        grade_progress_data[str(grade)] = grade_students
-        
-        # 같은 페이지 성적 비교 데이터
-        page_comparison_data[str(grade)] = {'korean': {}, 'math': {}}
-        
-        # 국어 페이지별 비교
-        korean_pages = {}
-        for child in children:
-            records = LearningRecord.query.filter_by(child_id=child.id).all()
-            for record in records:
-                if record.korean_last_page:
-                    page = record.korean_last_page
-                    if page not in korean_pages:
-                        korean_pages[page] = []
-                    korean_pages[page].append({
-                        'name': child.name,
-                        'score': record.korean_score,
-                        'correct': record.korean_problems_correct,
-                        'solved': record.korean_problems_solved
-                    })
-        
-        # 2명 이상인 페이지만 필터링하고 점수순 정렬
-        for page, students in korean_pages.items():
-            if len(students) >= 2:
-                students.sort(key=lambda x: x['score'], reverse=True)
-                page_comparison_data[str(grade)]['korean'][page] = students
-
-        # 수학 페이지별 비교
-        math_pages = {}
-        for child in children:
-            records = LearningRecord.query.filter_by(child_id=child.id).all()
-            for record in records:
-                if record.math_last_page:
-                    page = record.math_last_page
-                    if page not in math_pages:
-                        math_pages[page] = []
-                    math_pages[page].append({
-                        'name': child.name,
-                        'score': record.math_score,
-                        'correct': record.math_problems_correct,
-                        'solved': record.math_problems_solved
-                    })
-        
-        # 2명 이상인 페이지만 필터링하고 점수순 정렬
-        for page, students in math_pages.items():
-            if len(students) >= 2:
-                students.sort(key=lambda x: x['score'], reverse=True)
-                page_comparison_data[str(grade)]['math'][page] = students
-
-        # 학년별 평균 진도 계산
-        if grade_students:
-            korean_avg_page = sum(s['korean_page'] for s in grade_students) / len(grade_students)
-            math_avg_page = sum(s['math_page'] for s in grade_students) / len(grade_students)
-            
-            # 평균 점수 계산
-            korean_scores = []
-            math_scores = []
-            reading_scores = []
-            
-            for child in children:
-                records = LearningRecord.query.filter_by(child_id=child.id).all()
-                for record in records:
-                    if record.korean_score > 0:
-                        korean_scores.append(record.korean_score)
-                    if record.math_score > 0:
-                        math_scores.append(record.math_score)
-                    if record.reading_score > 0:
-                        reading_scores.append(record.reading_score)
-            
-            grade_average_progress[str(grade)] = {
-                'korean_avg_page': round(korean_avg_page, 1),
-                'math_avg_page': round(math_avg_page, 1),
-                'korean_avg_score': round(sum(korean_scores) / len(korean_scores), 1) if korean_scores else 0,
-                'math_avg_score': round(sum(math_scores) / len(math_scores), 1) if math_scores else 0,
-                'reading_avg_score': round(sum(reading_scores) / len(reading_scores), 1) if reading_scores else 0
-            }
-    
-    # 전체 진도 리더보드 (상위 10명)
-    all_children = Child.query.filter_by(include_in_stats=True).all()
-    all_students = []
-    
-    for child in all_children:
-        latest_record = LearningRecord.query.filter_by(
-            child_id=child.id
-        ).order_by(LearningRecord.date.desc()).first()
-        
-        korean_page = latest_record.korean_last_page if latest_record else 0
-        math_page = latest_record.math_last_page if latest_record else 0
-        
-        # 평균 점수 계산
-        all_records = LearningRecord.query.filter_by(child_id=child.id).all()
-        total_score = 0
-        record_count = 0
-        for record in all_records:
-            if record.total_score > 0:
-                total_score += record.total_score
-                record_count += 1
-        avg_score = round(total_score / record_count, 1) if record_count > 0 else 0
-        
-        # 최근 학습일
-        last_study = latest_record.date.strftime('%m/%d') if latest_record else '-'
-
-        all_students.append({
-            'name': child.name,
-            'grade': child.grade,
-            'korean_page': korean_page,
-            'math_page': math_page,
-            'total_pages': korean_page + math_page,
-            'avg_score': avg_score,
-            'last_study': last_study
-        })
-    
-    # 총 진도순으로 정렬하고 상위 10명만
-    all_students.sort(key=lambda x: x['total_pages'], reverse=True)
-    progress_leaderboard = all_students[:10]
+    # 학년별 진도/페이지 비교/평균/리더보드를 한 번의 스트리밍으로 계산
+    chart_data = build_progress_chart_data()
 
     return render_template('statistics/charts.html',
-                         grade_progress_data=json.dumps(grade_progress_data),
-                         page_comparison_data=json.dumps(page_comparison_data),
-                         grade_average_progress=json.dumps(grade_average_progress),
-                         progress_leaderboard=progress_leaderboard,
+                         grade_progress_data=json.dumps(chart_data['grade_progress_data']),
+                         page_comparison_data=json.dumps(chart_data['page_comparison_data']),
+                         grade_average_progress=json.dumps(chart_data['grade_average_progress']),
+                         progress_leaderboard=chart_data['progress_leaderboard'],
                          today_records=today_records)
 
 # 리포트 라우트들
@@ -1505,12 +2103,24 @@ def child_report(child_id):
 @login_required
 def grade_report(grade):
     """학년별 리포트"""
-    children = Child.query.filter_by(grade=grade, include_in_stats=True).all()
+    grade_stats = build_grade_report_stats(grade)
     
-    if not children:
+    if grade_stats is None:
         flash(f'{grade}학년에 등록된 아동이 없습니다.', 'warning')
         return redirect(url_for('reports_overview'))
     
+    return render_template('reports/grade_report.html',
+                         grade=grade,
+                         grade_stats=grade_stats)
+
+@app_cache.cached('grade_report', depends=('learning', 'children'))
+def build_grade_report_stats(grade):
+    """학년별 최신 진도/점수 통계 (통계 대상 아동이 없으면 None)"""
+    children = get_stats_children_by_grade(grade).get(grade, [])
+    
+    if not children:
+        return None
+    
     # 학년 통계 계산
     grade_stats = {
         'total_children': len(children),
@@ -1528,8 +2138,10 @@ def grade_report(grade):
     math_scores = []
     reading_scores = []
     
+    latest_records = get_latest_learning_records(grade=grade)
+    
     for child in children:
-        latest_record = LearningRecord.query.filter_by(child_id=child.id).order_by(LearningRecord.date.desc()).first()
+        latest_record = latest_records.get(child.id)
         
         if latest_record:
             korean_pages.append(latest_record.korean_last_page)
@@ -1567,9 +2179,7 @@ def grade_report(grade):
     if reading_scores:
         grade_stats['avg_reading_score'] = round(sum(reading_scores) / len(reading_scores), 1)
     
-    return render_template('reports/grade_report.html',
-                         grade=grade,
-                         grade_stats=grade_stats)
+    return grade_stats
 
 @app.route('/reports/period')
 @login_required
@@ -1588,6 +2198,17 @@ def period_report():
     start = datetime.strptime(start_date, '%Y-%m-%d').date()
     end = datetime.strptime(end_date, '%Y-%m-%d').date()
     
+    period_stats, records = build_period_report(start, end)
+    
+    return render_template('reports/period_report.html',
+                         start_date=start_date,
+                         end_date=end_date,
+                         period_stats=period_stats,
+                         records=records)
+
+@app_cache.cached('period_report', depends=('learning', 'children'))
+def build_period_report(start, end):
+    """기간별 통계와 최근 기록 20건 (화면에 표시하는 만큼만 캐시)"""
     # 기간 내 모든 기록 조회
     records = LearningRecord.query.filter(
         LearningRecord.date >= start,
@@ -1606,12 +2227,12 @@ def period_report():
     # 독서 참여 아동 수 (중복 제거)
     reading_children = len(set(r.child_id for r in reading_records))
     
-    # 디버깅용 로그
-    print(f"DEBUG: total_children = {total_children}")
-    print(f"DEBUG: reading_children = {reading_children}")
-    print(f"DEBUG: reading_records count = {len(reading_records)}")
-    print(f"DEBUG: all_children = {Child.query.count()}")
-    print(f"DEBUG: include_in_stats_children = {Child.query.filter_by(include_in_stats=True).count()}")
+    # 디버깅용 로그 (추가 COUNT 쿼리가 있어 DEBUG 레벨일 때만 실행)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("total_children = %s, reading_children = %s, reading_records count = %s",
+                     total_children, reading_children, len(reading_records))
+        logger.debug("all_children = %s, include_in_stats_children = %s",
+                     Child.query.count(), Child.query.filter_by(include_in_stats=True).count())
     
     period_stats = {
         'total_records': total_records,
@@ -1624,13 +2245,57 @@ def period_report():
         'avg_reading_score': round(sum(r.reading_score for r in reading_records) / len(reading_records), 1) if reading_records else 0
     }
     
-    return render_template('reports/period_report.html',
-                         start_date=start_date,
-                         end_date=end_date,
-                         period_stats=period_stats,
-                         records=records)
+    recent_records = [{
+        'date': r.date,
+        'child': {'id': r.child.id, 'name': r.child.name, 'grade': r.child.grade},
+        'korean_score': r.korean_score,
+        'korean_last_page': r.korean_last_page,
+        'math_score': r.math_score,
+        'math_last_page': r.math_last_page,
+        'reading_score': r.reading_score,
+        'total_score': r.total_score
+    } for r in records[:20]]
+    
+    return period_stats, recent_records
 
 
+@app.route('/reports/period/excel')
+@login_required
+def period_report_excel():
+    """기간별 리포트 Excel 다운로드 (학습 기록 + 포인트 기록)"""
+    if current_user.role == '테스트사용자':
+        flash('리포트 페이지에 접근할 권한이 없습니다.', 'error')
+        return redirect(url_for('dashboard'))
+    if not BACKUP_EXCEL_AVAILABLE:
+        flash('Excel 내보내기를 위한 패키지가 설치되지 않았습니다.', 'error')
+        return redirect(url_for('period_report'))
+    
+    try:
+        start = datetime.strptime(request.args.get('start_date', ''), '%Y-%m-%d').date()
+        end = datetime.strptime(request.args.get('end_date', ''), '%Y-%m-%d').date()
+    except ValueError:
+        flash('기간을 올바르게 선택해주세요.', 'error')
+        return redirect(url_for('period_report'))
+    
+    # 임시 파일에 스트리밍으로 작성한 뒤 전송하고, 응답이 끝나면 삭제
+    temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
+    temp_file.close()
+    try:
+        write_excel_workbook(temp_file.name, get_period_report_sheets(start, end))
+    except Exception as e:
+        os.remove(temp_file.name)
+        flash(f'Excel 내보내기 중 오류가 발생했습니다: {e}', 'error')
+        return redirect(url_for('period_report', start_date=start.isoformat(), end_date=end.isoformat()))
+    
+    response = send_file(
+        temp_file.name,
+        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        as_attachment=True,
+        download_name=f"period_report_{start.isoformat()}_{end.isoformat()}.xlsx"
+    )
+    response.call_on_close(lambda: os.remove(temp_file.name))
+    return response
+
 # 새로운 포인트 시스템 라우트들
 @app.route('/points')
 @login_required
@@ -1650,11 +2315,11 @@ def points_input(child_id):
         # 오늘 날짜
         today = datetime.utcnow().date()
         
-        # 기존 기록이 있는지 확인
+        # 기존 기록이 있는지 확인 (지원하는 DB에서는 행 잠금 - 동시 수정 시 이전 값 기준 변경분이 겹치지 않도록)
         existing_record = DailyPoints.query.filter_by(
             child_id=child_id, 
             date=today
-        ).first()
+        ).with_for_update().first()
         
         try:
             # 포인트 값 가져오기 및 검증
@@ -1717,26 +2382,31 @@ def points_input(child_id):
                     db.session.add(history_record)
                     
                     # 변경 이력 기록 (간단한 로그)
-                    print(f"📝 포인트 변경 이력 - {child.name}({child.grade}학년) - {today}")
-                    print(f"  국어: {old_korean} → {korean_points}")
-                    print(f"  수학: {old_math} → {math_points}")
-                    print(f"  쎈수학: {old_ssen} → {ssen_points}")
-                    print(f"  독서: {old_reading} → {reading_points}")
-                    print(f"  총점: {old_total} → {total_points}")
-                    print(f"  변경자: {current_user.username}")
+                    logger.info("📝 포인트 변경 이력 - %s(%s학년) - %s: 국어 %s→%s, 수학 %s→%s, 쎈수학 %s→%s, "
+                                "독서 %s→%s, 총점 %s→%s, 변경자 %s",
+                                child.name, child.grade, today, old_korean, korean_points, old_math, math_points,
+                                old_ssen, ssen_points, old_reading, reading_points, old_total, total_points,
+                                current_user.username)
+                
+                # 누적 포인트에 변경분만 반영 (커밋 없이)
+                apply_cumulative_points_deltas({child_id: total_points - (old_total or 0)})
                 
-                # 누적 포인트 자동 업데이트 (커밋 없이)
-                update_cumulative_points(child_id, commit=False)
+                # 일/주/월 집계 반영 (커밋 없이)
+                apply_points_rollup(
+                    child_id, child.grade, today,
+                    old_points={'korean_points': old_korean, 'math_points': old_math, 'ssen_points': old_ssen,
+                                'reading_points': old_reading, 'total_points': old_total},
+                    new_points={'korean_points': korean_points, 'math_points': math_points, 'ssen_points': ssen_points,
+                                'reading_points': reading_points, 'total_points': total_points}
+                )
                 
                 # 모든 변경사항을 한 번에 커밋
                 db.session.commit()
+                app_cache.invalidate('points')
+                publish_dashboard_counters()
                 
-                # 실시간 백업 호출 (백업 실패가 포인트 입력에 영향 주지 않도록)
-                try:
-                    realtime_backup(child_id, "update")
-                except Exception as backup_error:
-                    print(f"백업 실패: {backup_error}")
-                    # 백업 실패는 포인트 입력 성공에 영향을 주지 않음
+                # 실시간 백업 예약 (백그라운드 워커가 묶어서 처리하므로 응답을 지연시키지 않음)
+                realtime_backup_worker.enqueue(child_id, "update")
                 
                 flash(f'✅ {child.name} 아이의 포인트가 수정되었습니다. (총점: {total_points}점)', 'success')
                 return redirect(url_for('points_list'))
@@ -1774,18 +2444,23 @@ def points_input(child_id):
             )
             db.session.add(new_record)
             
-            # 누적 포인트 자동 업데이트 (커밋 없이)
-            update_cumulative_points(child_id, commit=False)
+            # 누적 포인트에 새 총점만큼 반영 (커밋 없이)
+            apply_cumulative_points_deltas({child_id: total_points})
+            
+            # 일/주/월 집계 반영 (커밋 없이)
+            apply_points_rollup(
+                child_id, child.grade, today,
+                new_points={'korean_points': korean_points, 'math_points': math_points, 'ssen_points': ssen_points,
+                            'reading_points': reading_points, 'total_points': total_points}
+            )
             
             # 모든 변경사항을 한 번에 커밋
             db.session.commit()
+            app_cache.invalidate('points')
+            publish_dashboard_counters()
             
-            # 실시간 백업 호출 (백업 실패가 포인트 입력에 영향 주지 않도록)
-            try:
-                realtime_backup(child_id, "create")
-            except Exception as backup_error:
-                print(f"백업 실패: {backup_error}")
-                # 백업 실패는 포인트 입력 성공에 영향을 주지 않음
+            # 실시간 백업 예약 (백그라운드 워커가 묶어서 처리하므로 응답을 지연시키지 않음)
+            realtime_backup_worker.enqueue(child_id, "create")
             
             flash(f'✅ {child.name} 아이의 포인트가 저장되었습니다. (총점: {total_points}점)', 'success')
             return redirect(url_for('points_list'))
@@ -1810,29 +2485,1032 @@ def points_input(child_id):
     
     return render_template('points/input.html', child=child, today_record=today_record, today_date=today_date)
 
+def apply_cumulative_points_deltas(deltas):
+    """누적 포인트에 변경분(새 총점 - 이전 총점)만 더함 (커밋은 호출자가 수행)
+
+    deltas: {child_id: 변경분}. 기록이 몇 년치든 아동당 UPDATE 한 행이라 비용이 일정하고,
+    SQL 증분이라 동시 입력에도 더한 값이 유실되지 않는다 (어긋난 값은 reconcile_cumulative_points가 수정).
+    """
+    params = [{'key_child_id': child_id, 'delta': delta} for child_id, delta in deltas.items() if delta]
+    if not params:
+        return
+    table = Child.__table__
+    db.session.execute(
+        table.update().where(table.c.id == db.bindparam('key_child_id')).values(
+            cumulative_points=db.func.coalesce(table.c.cumulative_points, 0) + db.bindparam('delta')
+        ),
+        params
+    )
+
+def set_cumulative_points(targets):
+    """누적 포인트를 직접 지정 (커밋은 호출자가 수행)
+
+    targets: {Child: 누적 포인트}. 지정값과 일일 포인트 합계의 차이를 보정값으로 저장해서
+    이후 포인트 입력은 지정값에 더해지고 대사 작업도 지정값을 기준으로 검증한다.
+    """
+    daily_totals = dict(db.session.execute(
+        db.select(DailyPoints.child_id, db.func.sum(DailyPoints.total_points))
+        .where(DailyPoints.child_id.in_([child.id for child in targets]))
+        .group_by(DailyPoints.child_id)
+    ).all())
+    for child, cumulative_points in targets.items():
+        child.cumulative_points = cumulative_points
+        child.cumulative_points_adjustment = cumulative_points - (daily_totals.get(child.id) or 0)
+
+def cumulative_points_expected():
+    """아동별 기대 누적 포인트 식 (보정값 + 일일 포인트 합계, child 테이블 행 기준 상관 서브쿼리)"""
+    daily_total = (db.select(db.func.coalesce(db.func.sum(DailyPoints.total_points), 0))
+                   .where(DailyPoints.child_id == Child.id).scalar_subquery())
+    return db.func.coalesce(Child.cumulative_points_adjustment, 0) + daily_total
+
 def update_cumulative_points(child_id, commit=True):
-    """아동의 누적 포인트를 자동으로 업데이트"""
+    """아동의 누적 포인트를 기록 전체로 다시 계산 (중복 정리 등 변경분을 알 수 없을 때만 사용)"""
     try:
-        # 해당 아동의 모든 일일 포인트 합계 계산
-        total_cumulative = db.session.query(
-            db.func.sum(DailyPoints.total_points)
-        ).filter_by(child_id=child_id).scalar() or 0
-        
-        # Child 모델의 cumulative_points 업데이트
-        child = Child.query.get(child_id)
-        if child:
-            child.cumulative_points = total_cumulative
-            if commit:
-                db.session.commit()
-            print(f"📊 {child.name}의 누적 포인트 업데이트: {total_cumulative}점")
-            return total_cumulative
-            
+        db.session.execute(
+            db.update(Child).where(Child.id == child_id)
+            .values(cumulative_points=cumulative_points_expected())
+            .execution_options(synchronize_session='fetch')
+        )
+        if commit:
+            db.session.commit()
+        total_cumulative = db.session.get(Child, child_id).cumulative_points
+        print(f"📊 아동 {child_id}의 누적 포인트 재계산: {total_cumulative}점")
+        return total_cumulative
+
     except Exception as e:
         print(f"❌ 누적 포인트 업데이트 오류: {e}")
         if commit:
             db.session.rollback()
         raise e
 
+def reconcile_cumulative_points():
+    """모든 아동의 누적 포인트를 GROUP BY 한 번으로 검증하고 어긋난 아동만 다시 계산
+
+    반환: 수정한 아동 목록 [(아동 ID, 이름, 이전 값, 기대 값)]
+    수정은 검증 시점 값이 아니라 UPDATE 시점의 합계로 하므로 그사이 입력된 포인트도 반영된다.
+    """
+    totals = (db.select(DailyPoints.child_id, db.func.sum(DailyPoints.total_points).label('total_points'))
+              .group_by(DailyPoints.child_id).subquery())
+    expected = (db.func.coalesce(Child.cumulative_points_adjustment, 0)
+                + db.func.coalesce(totals.c.total_points, 0))
+    drifted = db.session.execute(
+        db.select(Child.id, Child.name, Child.cumulative_points, expected.label('expected'))
+        .outerjoin(totals, totals.c.child_id == Child.id)
+        .where(db.or_(Child.cumulative_points.is_(None), Child.cumulative_points != expected))
+    ).all()
+    if drifted:
+        db.session.execute(
+            db.update(Child).where(Child.id.in_([row.id for row in drifted]))
+            .values(cumulative_points=cumulative_points_expected())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        app_cache.invalidate('points')
+    return [(row.id, row.name, row.cumulative_points, row.expected) for row in drifted]
+
+# ===== 포인트 집계(rollup) 헬퍼 함수들 =====
+
+ROLLUP_PERIODS = ('day', 'week', 'month')
+ROLLUP_SUBJECTS = ('korean_points', 'math_points', 'ssen_points', 'reading_points', 'total_points')
+
+def get_rollup_period_start(period_type, target_date):
+    """집계 단위별 시작일 계산 (주: ISO 주의 월요일, 월: 1일)"""
+    if period_type == 'week':
+        return target_date - timedelta(days=target_date.weekday())
+    if period_type == 'month':
+        return target_date.replace(day=1)
+    return target_date
+
+def apply_points_rollup(child_id, grade, target_date, old_points=None, new_points=None):
+    """DailyPoints 변경분(새 값 - 이전 값)을 일/주/월 집계에 반영 (커밋은 호출자가 수행)
+
+    old_points/new_points는 과목별 포인트 dict이며, None이면 기록이 없던(삭제된) 상태를 의미한다.
+    """
+    deltas = {
+        subject: (new_points or {}).get(subject, 0) - (old_points or {}).get(subject, 0)
+        for subject in ROLLUP_SUBJECTS
+    }
+    count_delta = (1 if new_points is not None else 0) - (1 if old_points is not None else 0)
+
+    if count_delta == 0 and not any(deltas.values()):
+        return
+
+    for period_type in ROLLUP_PERIODS:
+        period_start = get_rollup_period_start(period_type, target_date)
+
+        # 동시 입력에도 합계가 유실되지 않도록 SQL 증분 UPDATE 사용
+        values = {subject: getattr(PointsRollup, subject) + delta for subject, delta in deltas.items()}
+        values['record_count'] = PointsRollup.record_count + count_delta
+        values['updated_at'] = datetime.utcnow()
+        result = db.session.execute(
+            db.update(PointsRollup).where(
+                PointsRollup.period_type == period_type,
+                PointsRollup.period_start == period_start,
+                PointsRollup.child_id == child_id
+            ).values(**values).execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount == 0:
+            db.session.add(PointsRollup(
+                period_type=period_type,
+                period_start=period_start,
+                child_id=child_id,
+                grade=grade,
+                record_count=count_delta,
+                **deltas
+            ))
+            db.session.flush()
+
+def apply_points_rollup_many(target_date, changes):
+    """같은 날짜의 여러 아동 변경분을 일/주/월 집계에 한 번에 반영 (커밋은 호출자가 수행)
+
+    changes: [(child_id, grade, old_points, new_points)] - 값의 의미는 apply_points_rollup과 같다.
+    기존 집계 행은 한 번 조회해서 증분 UPDATE를 executemany로, 없는 행은 일괄 INSERT로 만든다.
+    """
+    deltas = {}
+    for child_id, grade, old_points, new_points in changes:
+        delta = {
+            subject: (new_points or {}).get(subject, 0) - (old_points or {}).get(subject, 0)
+            for subject in ROLLUP_SUBJECTS
+        }
+        delta['record_count'] = (1 if new_points is not None else 0) - (1 if old_points is not None else 0)
+        if any(delta.values()):
+            deltas[child_id] = (grade, delta)
+    if not deltas:
+        return
+
+    periods = [(period_type, get_rollup_period_start(period_type, target_date)) for period_type in ROLLUP_PERIODS]
+    existing = set(db.session.execute(
+        db.select(PointsRollup.period_type, PointsRollup.period_start, PointsRollup.child_id).where(
+            PointsRollup.child_id.in_(list(deltas)),
+            db.or_(*[db.and_(PointsRollup.period_type == period_type, PointsRollup.period_start == period_start)
+                     for period_type, period_start in periods])
+        )
+    ).all())
+
+    now = datetime.utcnow()
+    update_params, insert_rows = [], []
+    for child_id, (grade, delta) in deltas.items():
+        for period_type, period_start in periods:
+            if (period_type, period_start, child_id) in existing:
+                update_params.append({'key_period_type': period_type, 'key_period_start': period_start,
+                                      'key_child_id': child_id, 'updated_at': now,
+                                      **{f'delta_{name}': value for name, value in delta.items()}})
+            else:
+                insert_rows.append(dict(period_type=period_type, period_start=period_start, child_id=child_id,
+                                        grade=grade, updated_at=now, **delta))
+
+    if update_params:
+        # 동시 입력에도 합계가 유실되지 않도록 증분 UPDATE (executemany라 테이블 객체로 실행)
+        table = PointsRollup.__table__
+        db.session.execute(
+            table.update().where(
+                table.c.period_type == db.bindparam('key_period_type'),
+                table.c.period_start == db.bindparam('key_period_start'),
+                table.c.child_id == db.bindparam('key_child_id')
+            ).values(
+                updated_at=db.bindparam('updated_at'),
+                **{name: table.c[name] + db.bindparam(f'delta_{name}') for name in (*ROLLUP_SUBJECTS, 'record_count')}
+            ),
+            update_params
+        )
+    if insert_rows:
+        db.session.execute(db.insert(PointsRollup), insert_rows)
+
+def rebuild_points_rollup(child_id=None, commit=True):
+    """DailyPoints 원본으로부터 집계 테이블 재생성 (child_id 지정 시 해당 아동만)"""
+    try:
+        delete_query = PointsRollup.query
+        points_query = db.session.query(
+            DailyPoints.child_id, Child.grade, DailyPoints.date,
+            *[getattr(DailyPoints, subject) for subject in ROLLUP_SUBJECTS]
+        ).join(Child, Child.id == DailyPoints.child_id)
+
+        if child_id is not None:
+            delete_query = delete_query.filter_by(child_id=child_id)
+            points_query = points_query.filter(DailyPoints.child_id == child_id)
+
+        delete_query.delete(synchronize_session=False)
+
+        totals = {}
+        for row in points_query.yield_per(5000):
+            for period_type in ROLLUP_PERIODS:
+                key = (period_type, get_rollup_period_start(period_type, row.date), row.child_id)
+                entry = totals.get(key)
+                if entry is None:
+                    entry = totals[key] = dict.fromkeys(ROLLUP_SUBJECTS, 0)
+                    entry['grade'] = row.grade
+                    entry['record_count'] = 0
+                for subject in ROLLUP_SUBJECTS:
+                    entry[subject] += getattr(row, subject) or 0
+                entry['record_count'] += 1
+
+        rows = [
+            dict(period_type=period_type, period_start=period_start, child_id=key_child_id,
+                 updated_at=datetime.utcnow(), **entry)
+            for (period_type, period_start, key_child_id), entry in totals.items()
+        ]
+        for start in range(0, len(rows), 5000):
+            db.session.execute(db.insert(PointsRollup), rows[start:start + 5000])
+
+        if commit:
+            db.session.commit()
+        print(f"📊 포인트 집계 재생성 완료: {len(rows)}건")
+        return len(rows)
+
+    except Exception as e:
+        print(f"❌ 포인트 집계 재생성 오류: {e}")
+        if commit:
+            db.session.rollback()
+        raise e
+
+def reconcile_points_rollup():
+    """집계 테이블을 DailyPoints 원본과 GROUP BY 한 번씩으로 비교하고 어긋난 아동만 다시 만듦
+
+    아동마다 일/주/월 집계 각각의 과목별 합계/기록 수가 원본 합계와 같고, 학년이 현재 학년과 같아야 한다.
+    반환: 다시 만든 아동 ID 목록
+    """
+    columns = (*ROLLUP_SUBJECTS, 'record_count')
+    expected = {row[0]: (row[1], tuple(row[2:])) for row in db.session.execute(
+        db.select(Child.id, Child.grade,
+                  *[func.coalesce(func.sum(getattr(DailyPoints, subject)), 0) for subject in ROLLUP_SUBJECTS],
+                  func.count(DailyPoints.id))
+        .join(DailyPoints, DailyPoints.child_id == Child.id)
+        .group_by(Child.id, Child.grade)
+    )}
+    actual = {}
+    for row in db.session.execute(
+        db.select(PointsRollup.child_id, PointsRollup.period_type, func.min(PointsRollup.grade), func.max(PointsRollup.grade),
+                  *[func.coalesce(func.sum(getattr(PointsRollup, column)), 0) for column in columns])
+        .group_by(PointsRollup.child_id, PointsRollup.period_type)
+    ):
+        actual.setdefault(row[0], {})[row[1]] = (row[2], row[3], tuple(row[4:]))
+    
+    drifted = []
+    for child_id in set(expected) | set(actual):
+        grade, totals = expected.get(child_id, (None, None))
+        periods = actual.get(child_id, {})
+        if totals is None:
+            # 원본 기록이 없는데 남아 있는 집계 (삭제된 기록/아동)
+            drifted.append(child_id)
+        elif set(periods) != set(ROLLUP_PERIODS) or any(
+                values != (grade, grade, totals) for values in periods.values()):
+            drifted.append(child_id)
+    
+    for child_id in drifted:
+        rebuild_points_rollup(child_id, commit=False)
+    if drifted:
+        db.session.commit()
+        app_cache.invalidate('points')
+    return sorted(drifted)
+
+@app.cli.command('rebuild-rollups')
+def rebuild_rollups_command():
+    """포인트 집계 테이블 전체 재생성 (flask rebuild-rollups)"""
+    rebuild_points_rollup()
+
+# ===== 포인트 일괄 입력 API =====
+# 한 반의 하루치 포인트를 한 요청으로 받아 기존 기록 조회 1회, 일괄 INSERT/UPDATE, 이력 일괄 INSERT,
+# 누적 포인트 증분(변경분만큼 더함), 집계 반영을 한 트랜잭션에서 처리한다. 백업은 최대 한 번 예약된다.
+
+POINTS_BATCH_MAX_ROWS = 500
+POINTS_BATCH_FIELDS = ('korean_points', 'math_points', 'ssen_points', 'reading_points')
+# 지난 날짜 포인트 입력/수정 권한 (그 외 사용자는 포인트 입력 화면과 같이 오늘만)
+POINTS_BATCH_BACKDATE_ROLES = ('센터장', '개발자')
+
+def parse_points_batch_date(value):
+    """일괄 입력 날짜 파싱 (없으면 오늘, 미래 날짜 거부) - (날짜, 오류) 반환"""
+    today = datetime.utcnow().date()
+    if not value:
+        return today, None
+    try:
+        target_date = datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None, '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)'
+    if target_date > today:
+        return None, '미래 날짜에는 포인트를 입력할 수 없습니다.'
+    return target_date, None
+
+def parse_points_batch_record(item):
+    """일괄 입력 한 건 검증 - (아동 ID, 과목별 포인트 dict, 오류) 반환 (빠진 과목은 0점)"""
+    if not isinstance(item, dict):
+        return None, None, '기록 형식이 올바르지 않습니다.'
+    child_id = item.get('child_id')
+    if isinstance(child_id, bool) or not isinstance(child_id, int):
+        return None, None, '아동 ID가 올바르지 않습니다.'
+    points = {}
+    for field in POINTS_BATCH_FIELDS:
+        value = item.get(field, 0)
+        if isinstance(value, bool) or not isinstance(value, int):
+            return child_id, None, f'{field}: 숫자만 입력할 수 있습니다.'
+        if value < 0:
+            return child_id, None, f'{field}: 포인트는 음수일 수 없습니다.'
+        points[field] = value
+    points['total_points'] = sum(points.values())
+    return child_id, points, None
+
+@app.route('/api/points/batch', methods=['GET'])
+@login_required
+def get_points_batch():
+    """날짜별 전체 아동 포인트 조회 (일괄 입력 화면 초기값)"""
+    target_date, error = parse_points_batch_date(request.args.get('date'))
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+
+    records = {row.child_id: row for row in db.session.execute(
+        db.select(DailyPoints.child_id, *[getattr(DailyPoints, subject) for subject in ROLLUP_SUBJECTS])
+        .where(DailyPoints.date == target_date)
+    )}
+    children = []
+    for child in Child.query.order_by(Child.grade, Child.name).all():
+        record = records.get(child.id)
+        entry = {'child_id': child.id, 'name': child.name, 'grade': child.grade, 'has_record': record is not None}
+        entry.update({subject: (getattr(record, subject) or 0) if record else 0 for subject in ROLLUP_SUBJECTS})
+        children.append(entry)
+    return jsonify({'success': True, 'date': target_date.isoformat(), 'children': children})
+
+@app.route('/api/points/batch', methods=['POST'])
+@login_required
+def save_points_batch():
+    """하루치 포인트 일괄 저장 (아동별 생성/수정, 아동별 결과 반환)
+
+    요청: {"date": "YYYY-MM-DD"(생략 시 오늘), "records": [{"child_id": 1, "korean_points": 200, ...}]}
+    잘못된 기록은 결과에 error로 표시하고 건너뛰며, 나머지는 한 트랜잭션으로 저장한다.
+    지난 날짜는 센터장/개발자만 저장할 수 있다.
+    """
+    data = request.get_json(silent=True) or {}
+    target_date, error = parse_points_batch_date(data.get('date'))
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+    if target_date != datetime.utcnow().date() and current_user.role not in POINTS_BATCH_BACKDATE_ROLES:
+        return jsonify({'success': False, 'message': '지난 날짜의 포인트는 센터장/개발자만 입력할 수 있습니다.'}), 403
+    items = data.get('records')
+    if not isinstance(items, list) or not items:
+        return jsonify({'success': False, 'message': '입력할 데이터가 없습니다.'}), 400
+    if len(items) > POINTS_BATCH_MAX_ROWS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {POINTS_BATCH_MAX_ROWS}건까지 입력할 수 있습니다.'}), 400
+
+    results = []
+    entries = {}  # child_id -> (결과 dict, 새 포인트)
+    for item in items:
+        child_id, points, error = parse_points_batch_record(item)
+        if error is None and child_id in entries:
+            error = '같은 아동이 두 번 포함되어 있습니다.'
+        result = {'child_id': child_id, 'status': 'error' if error else None}
+        if error:
+            result['message'] = error
+        else:
+            entries[child_id] = (result, points)
+        results.append(result)
+
+    try:
+        children = {}
+        existing = {}
+        if entries:
+            children = {child.id: child for child in Child.query.filter(Child.id.in_(list(entries))).all()}
+            existing = {row.child_id: row for row in db.session.execute(
+                db.select(DailyPoints.id, DailyPoints.child_id,
+                          *[getattr(DailyPoints, subject) for subject in ROLLUP_SUBJECTS])
+                .where(DailyPoints.date == target_date, DailyPoints.child_id.in_(list(entries)))
+                .with_for_update()
+            )}
+
+        now = datetime.utcnow()
+        insert_rows, update_rows, history_rows, rollup_changes, cumulative_deltas = [], [], [], [], {}
+        for child_id, (result, points) in entries.items():
+            child = children.get(child_id)
+            if child is None:
+                result.update(status='error', message='아동을 찾을 수 없습니다.')
+                continue
+            result['total_points'] = points['total_points']
+            row = existing.get(child_id)
+            old_points = {subject: getattr(row, subject) or 0 for subject in ROLLUP_SUBJECTS} if row else None
+            if old_points == points:
+                result['status'] = 'unchanged'
+                continue
+
+            if row is None:
+                result['status'] = 'created'
+                insert_rows.append(dict(child_id=child_id, date=target_date, created_by=current_user.id,
+                                        created_at=now, updated_at=now, **points))
+            else:
+                result['status'] = 'updated'
+                update_rows.append(dict(id=row.id, updated_at=now, **points))
+            history_rows.append(dict(
+                child_id=child_id, date=target_date,
+                **{f'old_{subject}': (old_points or {}).get(subject, 0) for subject in ROLLUP_SUBJECTS},
+                **{f'new_{subject}': points[subject] for subject in ROLLUP_SUBJECTS},
+                change_type='create' if row is None else 'update',
+                changed_by=current_user.id, changed_at=now,
+                change_reason='일괄 입력 API를 통한 포인트 신규 입력' if row is None else '일괄 입력 API를 통한 포인트 수정'
+            ))
+            rollup_changes.append((child_id, child.grade, old_points, points))
+            cumulative_deltas[child_id] = points['total_points'] - (old_points or {}).get('total_points', 0)
+
+        if insert_rows:
+            db.session.execute(db.insert(DailyPoints), insert_rows)
+        if update_rows:
+            db.session.execute(db.update(DailyPoints), update_rows)
+        if history_rows:
+            db.session.execute(db.insert(PointsHistory), history_rows)
+        apply_cumulative_points_deltas(cumulative_deltas)
+        apply_points_rollup_many(target_date, rollup_changes)
+        db.session.commit()
+
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("❌ 포인트 일괄 입력 오류: %s", e)
+        return jsonify({'success': False, 'message': f'포인트 저장 중 오류가 발생했습니다: {str(e)}'}), 500
+
+    counts = {status: sum(1 for result in results if result['status'] == status)
+              for status in ('created', 'updated', 'unchanged', 'error')}
+    if history_rows:
+        app_cache.invalidate('points')
+        publish_dashboard_counters()
+        # 실시간 백업은 요청당 최대 한 번 (같은 묶음으로 예약)
+        realtime_backup_worker.enqueue_many([row['child_id'] for row in history_rows], 'batch')
+
+    logger.info("📝 포인트 일괄 입력 - %s: 신규 %s건, 수정 %s건, 변경 없음 %s건, 오류 %s건 (입력자: %s)",
+                target_date, counts['created'], counts['updated'], counts['unchanged'], counts['error'],
+                current_user.username)
+    message = f"신규 {counts['created']}건, 수정 {counts['updated']}건, 변경 없음 {counts['unchanged']}건"
+    if counts['error']:
+        message += f", 오류 {counts['error']}건"
+    return jsonify({
+        'success': counts['error'] == 0,
+        'message': message,
+        'date': target_date.isoformat(),
+        'counts': counts,
+        'results': results
+    }), 200 if counts['error'] < len(results) else 400
+
+# ===== 포인트 순위 =====
+# 모든 아동의 누적 합계/기록 수를 월 단위 집계에서 한 번의 GROUP BY로 구하고,
+# 전체/학년 순위와 백분위는 윈도 함수로 계산한다 (아동 수와 관계없이 쿼리 1회).
+# DailyPoints는 (child_id, date) 유니크 인덱스로 날짜당 1건이므로 집계 합계가 곧 중복 제거 합계다.
+# 기준 데이터는 DailyPoints이며, 집계가 어긋나면 매일 대사 작업(reconcile_points_rollup)이 다시 만든다.
+POINTS_RANKING_SQL = """
+    WITH totals AS (
+        SELECT c.id, c.name, c.grade,
+               COALESCE(r.total_points, 0) AS total_points,
+               COALESCE(r.record_count, 0) AS record_count
+        FROM child c
+        LEFT JOIN (
+            SELECT child_id, SUM(total_points) AS total_points, SUM(record_count) AS record_count
+            FROM points_rollup
+            WHERE period_type = 'month'
+            GROUP BY child_id
+        ) r ON r.child_id = c.id
+        WHERE c.include_in_stats = :in_stats
+    ),
+    ranked AS (
+        SELECT totals.*,
+               RANK() OVER (ORDER BY total_points DESC) AS rank,
+               RANK() OVER (PARTITION BY grade ORDER BY total_points DESC) AS grade_rank,
+               CUME_DIST() OVER (ORDER BY total_points) AS cume_dist,
+               COUNT(*) OVER () AS total_children,
+               COUNT(*) OVER (PARTITION BY grade) AS grade_children
+        FROM totals
+    )
+    SELECT * FROM ranked
+    {where}
+    ORDER BY total_points DESC, id
+"""
+
+def get_points_ranking(grade=None):
+    """통계 대상 아동의 포인트 순위 목록 (포인트 내림차순)
+    
+    각 항목: id, name, grade, total_points, record_count, avg_points,
+    rank(전체 순위), grade_rank(학년 순위), percentile(하위부터 누적 백분율), total_children, grade_children
+    grade를 지정해도 전체 순위는 모든 학년 기준으로 계산된다.
+    """
+    params = {'in_stats': True}
+    where = ''
+    if grade is not None:
+        where = 'WHERE grade = :grade'
+        params['grade'] = grade
+    
+    rows = db.session.execute(text(POINTS_RANKING_SQL.format(where=where)), params).mappings()
+    
+    ranking = []
+    for row in rows:
+        entry = {key: row[key] for key in ('id', 'name', 'grade', 'total_points', 'record_count',
+                                            'rank', 'grade_rank', 'total_children', 'grade_children')}
+        entry['avg_points'] = round(entry['total_points'] / entry['record_count'], 0) if entry['record_count'] else 0
+        entry['percentile'] = round(row['cume_dist'] * 100, 1)
+        ranking.append(entry)
+    return ranking
+
+# ===== 포인트 큐브 =====
+# DailyPoints를 워커 메모리의 열 단위 배열(아동 × 날짜 서수 × 과목, int32)로 들고 있으면서
+# 시각화/학년 비교/포인트 통계/대시보드의 그룹별 합계를 numpy로 계산한다.
+# 갱신은 마지막 동기화 시각 이후 updated_at이 바뀐 행만 읽어 변경분 구간에 붙이고, 행 수가 맞지 않으면(삭제) 전체를 다시 읽는다.
+
+POINTS_CUBE_OVERLAP = timedelta(seconds=30)  # 커밋 시각과 updated_at 기록 시각 차이 보정
+POINTS_CUBE_BATCH = 50000
+POINTS_CUBE_DELTA_MIN = 10000  # 변경분 구간이 이보다 크고 정렬 구간의 1/16을 넘으면 다시 정렬
+POINTS_CUBE_DEAD = np.iinfo(np.int32).max  # 변경분 구간으로 옮겨진 정렬 구간 행의 child_id (아동 필터에서 빠짐)
+POINTS_CUBE_EPOCH = date(1970, 1, 1).toordinal()  # datetime64[D] -> date.toordinal() 변환용
+# 전체 로드 때 새로 만들어 한 번에 바꿔 끼우는 배열 속성
+POINTS_CUBE_ARRAYS = (
+    'ids', 'child_ids', 'days', 'values', 'live_count', 'lookup_rows', 'lookup_ids',
+    'delta_ids', 'delta_child_ids', 'delta_days', 'delta_values', 'month_starts', 'month_cells',
+    'child_grades', 'child_in_stats', 'child_known', 'child_count'
+)
+
+class PointsCube:
+    """DailyPoints 열 배열 캐시 (워커 프로세스별)
+
+    행 배열: ids(int64), child_ids/days(int32, 날짜는 date.toordinal()), values(int32, 과목 × 행 - 과목별 열이 연속되도록)
+    - 정렬 구간(ids, child_ids, days, values): 날짜순이라 기간 조회가 이진 탐색 + 슬라이스
+    - 변경분 구간(delta_*): 마지막 정렬 이후 생기거나 바뀐 행 (ID당 하나, 작게 유지)
+      정렬 구간의 행이 바뀌면 child_id를 POINTS_CUBE_DEAD로 표시하고 새 값은 변경분 구간에 둔다.
+    월 부분합(month_cells): 정렬 구간의 면(기록 수/과목별 합계/0보다 큰 기록 수) × 아동 × 월 합계 -
+      기간 안에 통째로 들어가는 달은 행을 훑지 않고 여기서 더한다. 행이 변경분 구간으로 옮겨질 때 옛 값을 뺀다.
+    아동 배열: 아동 ID를 인덱스로 하는 학년/통계 포함/존재 여부 (학년별 집계는 현재 학년 기준)
+    """
+
+    def __init__(self, check_seconds, count_seconds, max_age):
+        self.check_seconds = check_seconds
+        self.count_seconds = count_seconds
+        self.max_age = max_age
+        self.lock = threading.RLock()
+        self._set_rows(*self._rows_to_arrays([]))
+        self.child_grades = np.zeros(0, dtype=np.int8)
+        self.child_in_stats = np.zeros(0, dtype=bool)
+        self.child_known = np.zeros(0, dtype=bool)
+        self.child_count = 0
+        self.high_water = None
+        self.versions = None
+        self.loaded_at = None
+        self.checked_at = None
+        self.counted_at = None
+        self.full_loads = 0
+        self.incremental_refreshes = 0
+        self.compactions = 0
+        self.last_load_seconds = None
+        self.load_synced_at = None  # 지금 배열을 만든 전체 로드의 조회 시작 시각
+        self.reloading = False
+        self.reload_done = threading.Event()
+        self.reload_done.set()
+
+    def _points_select(self):
+        # 날짜는 문자열로 받아 numpy에서 한 번에 변환 (행마다 date 객체를 만들지 않도록)
+        # ORM 속성 대신 테이블 열로 조회해서 ORM 행 처리를 건너뜀 (수백만 건 전체 로드가 크게 빨라짐)
+        table = DailyPoints.__table__
+        return db.select(
+            table.c.id, table.c.child_id, db.cast(table.c.date, db.String),
+            *[table.c[subject] for subject in ROLLUP_SUBJECTS]
+        )
+
+    def _rows_to_arrays(self, rows):
+        """조회 결과 행 목록 -> (ids, child_ids, days, values)"""
+        columns = list(zip(*rows)) if rows else [()] * (3 + len(ROLLUP_SUBJECTS))
+        ids = np.array(columns[0], dtype=np.int64)
+        child_ids = np.array(columns[1], dtype=np.int32)
+        days = (np.array(columns[2], dtype='datetime64[D]').astype(np.int64) + POINTS_CUBE_EPOCH).astype(np.int32)
+        # NULL 포인트는 0으로
+        values = np.nan_to_num(np.array(columns[3:], dtype=np.float64)).astype(np.int32)
+        return ids, child_ids, days, values
+
+    def _fetch_batches(self, statement):
+        """POINTS_CUBE_BATCH건씩 나눠 읽어 행 묶음으로 반환 (전체 결과를 한 번에 메모리에 올리지 않도록)
+
+        묶음은 받는 즉시 배열로 바뀌고 행은 버려지므로 GC는 켜 둔다 (끄면 같은 프로세스의 다른 요청 스레드까지 영향).
+        """
+        result = db.session.execute(statement.execution_options(yield_per=POINTS_CUBE_BATCH))
+        yield from result.partitions()
+
+    def _set_rows(self, ids, child_ids, days, values):
+        """표시된 행을 버리고 날짜순으로 정렬해서 정렬 구간을 만들고 변경분 구간은 비움"""
+        live_rows = np.flatnonzero(child_ids != POINTS_CUBE_DEAD)
+        order = live_rows[np.argsort(days[live_rows], kind='stable')]
+        del live_rows
+        self.ids, self.child_ids, self.days, self.values = ids[order], child_ids[order], days[order], values[:, order]
+        self.live_count = len(order)
+        # 정렬 구간의 ID -> 행 번호 조회용
+        self.lookup_rows = np.argsort(self.ids).astype(np.int32)
+        self.lookup_ids = self.ids[self.lookup_rows]
+        self.delta_ids, self.delta_child_ids, self.delta_days, self.delta_values = self._rows_to_arrays([])
+        self._build_month_cells()
+
+    @staticmethod
+    def _month_starts(first_day, last_day):
+        """first_day가 속한 달부터 last_day가 속한 달까지 각 달 1일의 서수 + 마지막 달 다음 달 1일"""
+        day = date.fromordinal(first_day).replace(day=1)
+        starts = []
+        while day.toordinal() <= last_day:
+            starts.append(day.toordinal())
+            day = (day + timedelta(days=32)).replace(day=1)
+        starts.append(day.toordinal())
+        return np.array(starts, dtype=np.int32)
+
+    def _build_month_cells(self):
+        """정렬 구간의 아동 × 월 부분합 (면: 기록 수, 과목별 합계, 과목별 0보다 큰 기록 수)"""
+        planes = 1 + 2 * len(ROLLUP_SUBJECTS)
+        if not len(self.days):
+            self.month_starts = np.zeros(1, dtype=np.int32)
+            self.month_cells = np.zeros((planes, 0, 0), dtype=np.int32)
+            return
+        self.month_starts = self._month_starts(int(self.days[0]), int(self.days[-1]))
+        months = len(self.month_starts) - 1
+        slots = int(self.child_ids.max()) + 1
+        keys = self.child_ids.astype(np.int64) * months + (np.searchsorted(self.month_starts, self.days, 'right') - 1)
+        size = slots * months
+        cells = np.empty((planes, size), dtype=np.int32)
+        cells[0] = np.bincount(keys, minlength=size)
+        for index, column in enumerate(self.values):
+            cells[1 + index] = np.bincount(keys, weights=column, minlength=size)
+            cells[1 + len(ROLLUP_SUBJECTS) + index] = np.bincount(keys, weights=column > 0, minlength=size)
+        self.month_cells = cells.reshape(planes, slots, months)
+
+    def _remove_from_month_cells(self, rows):
+        """정렬 구간 행을 변경분 구간으로 옮기기 전에 월 부분합에서 뺌"""
+        cell = (self.child_ids[rows], np.searchsorted(self.month_starts, self.days[rows], 'right') - 1)
+        np.subtract.at(self.month_cells[0], cell, 1)
+        for index, column in enumerate(self.values[:, rows]):
+            np.subtract.at(self.month_cells[1 + index], cell, column)
+            np.subtract.at(self.month_cells[1 + len(ROLLUP_SUBJECTS) + index], cell, (column > 0).astype(np.int32))
+
+    def _read_children(self):
+        """아동 배열을 새로 읽어 속성 dict로 반환 (self는 건드리지 않음)"""
+        children = db.session.query(Child.id, Child.grade, Child.include_in_stats).all()
+        size = max((child_id for child_id, _, _ in children), default=0) + 1
+        grades = np.zeros(size, dtype=np.int8)
+        in_stats = np.zeros(size, dtype=bool)
+        known = np.zeros(size, dtype=bool)
+        for child_id, grade, include_in_stats in children:
+            grades[child_id] = grade or 0
+            in_stats[child_id] = bool(include_in_stats)
+            known[child_id] = True
+        return {'child_grades': grades, 'child_in_stats': in_stats, 'child_known': known, 'child_count': len(children)}
+
+    def _load_children(self):
+        self.__dict__.update(self._read_children())
+
+    def _build(self):
+        """전체 행과 아동 배열을 새로 읽어 (조회 시작 시각, 배열 속성) 반환 - self의 배열은 건드리지 않음"""
+        # 조회 시작 시각이 다음 변경분 조회 기준 (updated_at과 같은 utcnow 시계)
+        synced_at = datetime.utcnow()
+        parts = ([], [], [], [])
+        for batch in self._fetch_batches(self._points_select()):
+            for column_parts, array in zip(parts, self._rows_to_arrays(batch)):
+                column_parts.append(array)
+        if not parts[0]:
+            for column_parts, array in zip(parts, self._rows_to_arrays([])):
+                column_parts.append(array)
+
+        # 열마다 합치고 바로 조각을 버려서 최대 메모리를 줄임
+        columns = []
+        for index, column_parts in enumerate(parts):
+            columns.append(np.concatenate(column_parts, axis=1 if index == 3 else 0))
+            column_parts.clear()
+        fresh = PointsCube(self.check_seconds, self.count_seconds, self.max_age)
+        fresh._set_rows(*columns)
+        del columns
+        fresh._load_children()
+        return synced_at, {name: getattr(fresh, name) for name in POINTS_CUBE_ARRAYS}
+
+    def load(self, catch_up=False, versions=None):
+        """전체 다시 읽기
+
+        배열은 잠금 밖에서 새로 만들고 바꿔 끼울 때만 잠그므로, 백그라운드 로드 중에도 기존 배열로 집계가 계속된다.
+        catch_up: 읽는 동안 생긴 변경을 다음 refresh()에서 바로 반영 (백그라운드 로드용)
+        versions: 읽기 전에 확인한 데이터 버전 (바꿔 끼울 때 함께 기록)
+        """
+        started = time.perf_counter()
+        synced_at, arrays = self._build()
+        with self.lock:
+            # 더 나중에 시작한 전체 로드가 먼저 끝났으면 (예: 복원 후 동기 로드) 이 결과는 버림
+            if self.load_synced_at is not None and self.load_synced_at > synced_at:
+                return
+            self.__dict__.update(arrays)
+            if versions is not None:
+                self.versions = versions
+            self.high_water = self.load_synced_at = synced_at
+            self.loaded_at = self.counted_at = time.time()
+            self.checked_at = 0 if catch_up else self.loaded_at
+            self.full_loads += 1
+            self.last_load_seconds = round(time.perf_counter() - started, 3)
+            logger.info("🧊 포인트 큐브 로드: %s건, %.1fMB, %s초", f"{self.live_count:,}",
+                        self.nbytes() / (1024 * 1024), self.last_load_seconds)
+
+    def _claim_reload(self):
+        """전체 로드를 맡음 - 다른 스레드가 이미 로드 중이면 False (끝나면 reload_done이 설정됨)"""
+        with self.lock:
+            if self.reloading:
+                return False
+            self.reloading = True
+            self.reload_done.clear()
+            return True
+
+    def _release_reload(self):
+        self.reloading = False
+        self.reload_done.set()
+
+    def reload_in_background(self):
+        """백그라운드 스레드에서 전체 다시 읽기 (이미 진행 중이면 무시)"""
+        if self._claim_reload():
+            threading.Thread(target=self._background_reload, name='points-cube-loader', daemon=True).start()
+
+    def _background_reload(self):
+        try:
+            with app.app_context():
+                self.load(catch_up=True)
+                db.session.remove()
+        except Exception as e:
+            logger.exception("❌ 포인트 큐브 백그라운드 로드 실패: %s", e)
+        finally:
+            self._release_reload()
+
+    def _find_rows(self, ids):
+        """각 ID의 현재 위치 (정렬 구간 행 번호, 변경분 구간 행 번호 - 없으면 -1)"""
+        main_rows = np.full(len(ids), -1, dtype=np.int64)
+        if len(self.lookup_ids):
+            positions = np.minimum(np.searchsorted(self.lookup_ids, ids), len(self.lookup_ids) - 1)
+            matched = self.lookup_ids[positions] == ids
+            main_rows[matched] = self.lookup_rows[positions[matched]]
+            main_rows[(main_rows >= 0) & (self.child_ids[np.maximum(main_rows, 0)] == POINTS_CUBE_DEAD)] = -1
+
+        delta_rows = np.full(len(ids), -1, dtype=np.int64)
+        if len(self.delta_ids):
+            order = np.argsort(self.delta_ids)
+            delta_ids = self.delta_ids[order]
+            positions = np.minimum(np.searchsorted(delta_ids, ids), len(delta_ids) - 1)
+            matched = delta_ids[positions] == ids
+            delta_rows[matched] = order[positions[matched]]
+        return main_rows, delta_rows
+
+    def _fetch_changes(self, high_water, verify_count):
+        """high_water 이후 바뀐 행과 (verify_count면) 전체 행 수 조회 - (조회 시작 시각, 행 목록, 행 수 또는 None)
+
+        DB만 읽고 배열은 건드리지 않으므로 잠금 밖에서 호출한다.
+        """
+        synced_at = datetime.utcnow()
+        # ORDER BY를 붙이면 SQLite가 updated_at 인덱스 대신 전체 스캔을 하므로 순서 없이 조회
+        rows = db.session.execute(self._points_select().where(
+            DailyPoints.__table__.c.updated_at > high_water - POINTS_CUBE_OVERLAP
+        )).all()
+
+        # 삭제된 행은 updated_at으로 알 수 없으므로 행 수로 확인 (인덱스 전체를 세므로 count_seconds마다)
+        # 앱에서 기록이 지워지는 경우는 아동 삭제(아동 배열에서 빠지므로 바로 집계 제외)와
+        # 초기화/복원(전체 무효화로 전체 다시 읽기)이라 이 확인은 다른 프로세스의 복원 대비용이다.
+        row_count = db.session.query(func.count(DailyPoints.id)).scalar() if verify_count else None
+        return synced_at, rows, row_count
+
+    def _apply_changes(self, synced_at, rows):
+        """_fetch_changes로 읽은 행을 배열에 반영 (잠금 안에서 호출, DB 접근 없음)"""
+        if rows:
+            ids, child_ids, days, values = self._rows_to_arrays(rows)
+            main_rows, delta_rows = self._find_rows(ids)
+            in_main, in_delta = main_rows >= 0, delta_rows >= 0
+
+            # 변경분 구간에 있던 행은 제자리에서 덮어씀
+            self.delta_child_ids[delta_rows[in_delta]] = child_ids[in_delta]
+            self.delta_days[delta_rows[in_delta]] = days[in_delta]
+            self.delta_values[:, delta_rows[in_delta]] = values[:, in_delta]
+
+            # 정렬 구간 행은 값이 바뀐 경우에만 변경분 구간으로 옮김 (겹치는 구간 때문에 다시 읽힌 행 제외)
+            moved = in_main.copy()
+            current = main_rows[in_main]
+            moved[in_main] = ~((self.child_ids[current] == child_ids[in_main])
+                               & (self.days[current] == days[in_main])
+                               & (self.values[:, current] == values[:, in_main]).all(axis=0))
+            self._remove_from_month_cells(main_rows[moved])
+            self.child_ids[main_rows[moved]] = POINTS_CUBE_DEAD
+            added = ~in_main & ~in_delta
+            appended = moved | added
+            if appended.any():
+                self.delta_ids = np.concatenate([self.delta_ids, ids[appended]])
+                self.delta_child_ids = np.concatenate([self.delta_child_ids, child_ids[appended]])
+                self.delta_days = np.concatenate([self.delta_days, days[appended]])
+                self.delta_values = np.concatenate([self.delta_values, values[:, appended]], axis=1)
+                self.live_count += int(added.sum())
+
+            if len(self.delta_ids) > max(POINTS_CUBE_DELTA_MIN, len(self.ids) // 16):
+                self._set_rows(np.concatenate([self.ids, self.delta_ids]),
+                               np.concatenate([self.child_ids, self.delta_child_ids]),
+                               np.concatenate([self.days, self.delta_days]),
+                               np.concatenate([self.values, self.delta_values], axis=1))
+                self.compactions += 1
+        self.high_water = synced_at
+
+    def refresh(self, force=False):
+        """필요할 때만 DB와 맞춤
+
+        - 쓰기 경로에서 app_cache.invalidate()로 올린 데이터 버전이 바뀌었거나
+          check_seconds가 지났으면 변경분 반영 (다른 워커의 쓰기 대비)
+        - 처음이거나 전체 무효화(복원 등) 후에는 전체 다시 읽기
+        - max_age가 지났으면 백그라운드에서 전체 다시 읽고, 그동안은 변경분 반영으로 계속 응답
+        DB 조회와 배열 생성은 잠금 밖에서 하고, 잠금은 상태 확인과 결과를 반영/바꿔 끼울 때만 잡는다
+        (느린 조회 중에도 다른 요청의 aggregate()가 기다리지 않도록).
+        """
+        versions = app_cache.versions('points', 'children')
+        while True:
+            now = time.time()
+            with self.lock:
+                full = (force or self.loaded_at is None
+                        or (versions and self.versions and versions[0] != self.versions[0]))
+                if not full:
+                    if now - self.loaded_at > self.max_age:
+                        self.reload_in_background()
+                    if not (versions is None or versions != self.versions or now - self.checked_at > self.check_seconds):
+                        return
+                    high_water, seen_versions = self.high_water, self.versions
+                    verify_count = now - self.counted_at > self.count_seconds
+
+            if full:
+                # 같은 전체 로드를 여러 요청이 동시에 하지 않도록 하나만 읽고 나머지는 기다렸다가 다시 확인
+                if not self._claim_reload():
+                    self.reload_done.wait()
+                    continue
+                try:
+                    self.load(versions=versions)
+                finally:
+                    self._release_reload()
+                return
+
+            synced_at, rows, row_count = self._fetch_changes(high_water, verify_count)
+            children = self._read_children()
+            with self.lock:
+                # 조회하는 동안 다른 요청이 먼저 맞췄거나 전체 로드가 바꿔 끼웠으면 이 결과는 버림
+                if self.high_water != high_water or self.versions != seen_versions:
+                    return
+                self._apply_changes(synced_at, rows)
+                if row_count is not None:
+                    self.counted_at = now
+                if row_count is None or row_count == self.live_count:
+                    self.__dict__.update(children)
+                    self.incremental_refreshes += 1
+                    self.checked_at = now
+                    self.versions = versions
+                    return
+            # 행 수가 맞지 않음 (다른 프로세스에서 삭제) - 전체 다시 읽기
+            force = True
+
+    def aggregate(self, by=None, start=None, end=None, grade=None, stats_only=False, nonzero=False):
+        """그룹별 합계 (refresh 후 호출)
+
+        by: None(전체 1그룹), 'date', 'month'(해당 월 1일), 'child', 'grade'(현재 학년)
+        start/end: 날짜 범위 (양끝 포함), grade/stats_only: 아동 필터
+        반환: {키: {과목별 합계, 'count': 기록 수, nonzero면 'nonzero_<과목>': 0보다 큰 기록 수}}
+        """
+        if by not in (None, 'date', 'month', 'child', 'grade'):
+            raise ValueError(f"지원하지 않는 그룹 기준입니다: {by}")
+        subjects = len(ROLLUP_SUBJECTS)
+        start_day = start.toordinal() if start is not None else None
+        end_day = end.toordinal() if end is not None else None
+
+        # 증분 갱신이 배열을 제자리에서 고치므로 합계까지 잠금 안에서 계산
+        with self.lock:
+            # 정렬 구간은 이진 탐색으로 기간을 자름 (검색값을 int32로 맞춰야 배열 변환이 없음)
+            low = int(np.searchsorted(self.days, np.int32(start_day), 'left')) if start is not None else 0
+            high = int(np.searchsorted(self.days, np.int32(end_day), 'right')) if end is not None else len(self.days)
+
+            # 기간 안에 통째로 들어가는 달은 월 부분합으로, 앞뒤 자투리 달만 행 단위로 집계 (일별 집계는 행 단위로만)
+            month_low = month_high = 0
+            if by != 'date' and self.month_cells.shape[2]:
+                month_low = int(np.searchsorted(self.month_starts[:-1], start_day, 'left')) if start is not None else 0
+                month_high = (int(np.searchsorted(self.month_starts[1:], end_day + 1, 'right')) if end is not None
+                              else self.month_cells.shape[2])
+            if month_low < month_high:
+                cube_low = int(np.searchsorted(self.days, self.month_starts[month_low], 'left'))
+                cube_high = int(np.searchsorted(self.days, self.month_starts[month_high], 'left'))
+                ranges = [(low, cube_low), (cube_high, high)]
+            else:
+                ranges = [(low, high)]
+            segments = [(self.child_ids[row_low:row_high], self.days[row_low:row_high], self.values[:, row_low:row_high])
+                        for row_low, row_high in ranges]
+
+            # 변경분 구간은 날짜를 직접 비교
+            if len(self.delta_ids):
+                in_range = np.ones(len(self.delta_ids), dtype=bool)
+                if start is not None:
+                    in_range &= self.delta_days >= start_day
+                if end is not None:
+                    in_range &= self.delta_days <= end_day
+                segments.append((self.delta_child_ids[in_range], self.delta_days[in_range],
+                                 self.delta_values[:, in_range]))
+            segments = [segment for segment in segments if len(segment[1])]
+            if not segments and month_low >= month_high:
+                return {}
+
+            # 아동별 포함 여부 표 - 삭제된 아동은 제외, 마지막 칸은 옮겨진 행(POINTS_CUBE_DEAD)과
+            # 갱신 직후 새로 생긴 아동용 제외 칸 (행을 골라 복사하지 않고 np.take(mode='clip')으로 행마다 조회)
+            child_grades = self.child_grades
+            include = np.append(self.child_known, False)
+            if grade is not None:
+                include[:-1] &= child_grades == grade
+            if stats_only:
+                include[:-1] &= self.child_in_stats
+
+            # 그룹 키 공간 (행 단위 구간과 월 부분합이 같은 키를 쓰도록 기준값을 함께 계산, 마지막 칸은 제외 행용)
+            first = min([int(days.min()) for _, days, _ in segments]
+                        + ([int(self.month_starts[month_low])] if month_low < month_high else []))
+            last = max([int(days.max()) for _, days, _ in segments]
+                       + ([int(self.month_starts[month_high]) - 1] if month_low < month_high else []))
+            if by is None:
+                sentinel = 1
+                key_of = lambda child_ids, days: np.zeros(len(days), dtype=np.int64)
+                label = lambda key: None
+            elif by == 'date':
+                sentinel = last - first + 1
+                key_of = lambda child_ids, days: days.astype(np.int64) - first
+                label = lambda key: date.fromordinal(first + key)
+            elif by == 'month':
+                # 날짜 범위의 일자별 월 번호(연*12+월-1) 표를 만들어 행마다 조회
+                month_table = np.array([day.year * 12 + day.month - 1
+                                        for day in map(date.fromordinal, range(first, last + 1))], dtype=np.int64)
+                base = int(month_table[0])
+                month_table -= base
+                sentinel = int(month_table[-1]) + 1
+                key_of = lambda child_ids, days: month_table[days - first]
+                label = lambda key: date((base + key) // 12, (base + key) % 12 + 1, 1)
+            elif by == 'child':
+                sentinel = len(child_grades)
+                key_of = lambda child_ids, days: np.minimum(child_ids, sentinel).astype(np.int64)
+                label = lambda key: key
+            else:
+                grade_table = np.append(child_grades, 0).astype(np.int64)
+                sentinel = int(grade_table.max()) + 1
+                key_of = lambda child_ids, days: np.take(grade_table, child_ids, mode='clip')
+                label = lambda key: key
+
+            # 면: 기록 수, 과목별 합계, 과목별 0보다 큰 기록 수
+            size = sentinel + 1
+            totals = np.zeros((1 + 2 * subjects, size))
+            for child_ids, days, values in segments:
+                keys = key_of(child_ids, days)
+                keep = np.take(include, child_ids, mode='clip')
+                if not keep.all():
+                    keys[~keep] = sentinel
+                totals[0] += np.bincount(keys, minlength=size)
+                for index in range(subjects):
+                    totals[1 + index] += np.bincount(keys, weights=values[index], minlength=size)
+                    if nonzero:
+                        totals[1 + subjects + index] += np.bincount(keys, weights=values[index] > 0, minlength=size)
+
+            if month_low < month_high:
+                slots = min(self.month_cells.shape[1], len(child_grades))
+                cells = self.month_cells[:, :slots, month_low:month_high]
+                included = include[:slots]
+                if by == 'month':
+                    part = (cells * included[np.newaxis, :, np.newaxis]).sum(axis=1, dtype=np.int64)
+                    keys = month_table[self.month_starts[month_low:month_high] - first]
+                else:
+                    part = cells.sum(axis=2, dtype=np.int64)
+                    part[:, ~included] = 0
+                    keys = key_of(np.arange(slots, dtype=np.int32), np.zeros(slots, dtype=np.int32))
+                for plane in range(1 + subjects + (subjects if nonzero else 0)):
+                    totals[plane] += np.bincount(keys, weights=part[plane], minlength=size)
+
+            totals[:, sentinel] = 0
+            counts = totals[0].astype(np.int64)
+            sums = totals[1:1 + subjects]
+            nonzeros = totals[1 + subjects:]
+
+        present = np.flatnonzero(counts)
+        columns = [('count', counts[present])]
+        for index, subject in enumerate(ROLLUP_SUBJECTS):
+            columns.append((subject, sums[index][present].astype(np.int64)))
+            if nonzero:
+                columns.append((f'nonzero_{subject}', nonzeros[index][present].astype(np.int64)))
+        names = [name for name, _ in columns]
+        rows = zip(*[column.tolist() for _, column in columns])
+        return {label(key): dict(zip(names, row)) for key, row in zip(present.tolist(), rows)}
+
+    def total_children(self):
+        return self.child_count
+
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.ids, self.child_ids, self.days, self.values,
+                                              self.lookup_ids, self.lookup_rows, self.month_starts, self.month_cells,
+                                              self.delta_ids, self.delta_child_ids, self.delta_days, self.delta_values,
+                                              self.child_grades, self.child_in_stats, self.child_known))
+
+    def status(self):
+        """/cache/status 표시용 상태"""
+        return {
+            'rows': self.live_count,
+            'delta_rows': len(self.delta_ids),
+            'bytes': self.nbytes(),
+            'full_loads': self.full_loads,
+            'incremental_refreshes': self.incremental_refreshes,
+            'compactions': self.compactions,
+            'last_load_seconds': self.last_load_seconds,
+            'reloading': self.reloading,
+            'loaded_at': datetime.fromtimestamp(self.loaded_at).strftime('%Y-%m-%d %H:%M:%S') if self.loaded_at else None,
+            'high_water': self.high_water.isoformat() if self.high_water else None
+        }
+
+points_cube = PointsCube(app.config['POINTS_CUBE_CHECK_SECONDS'], app.config['POINTS_CUBE_COUNT_SECONDS'],
+                         app.config['POINTS_CUBE_MAX_AGE'])
+
+def warm_points_cube():
+    """워커 시작 시 포인트 큐브를 백그라운드에서 미리 로드 (첫 대시보드/분석 요청이 전체 로드를 하지 않도록)"""
+    if points_cube.loaded_at is None:
+        points_cube.reload_in_background()
+
 @app.route('/points/statistics')
 @login_required
 def points_statistics():
@@ -1840,34 +3518,39 @@ def points_statistics():
     # 오늘 날짜
     today = datetime.utcnow().date()
     
+    return render_template('points/statistics.html', grade_stats=build_points_statistics(today), today=today)
+
+@app_cache.cached('points_statistics', depends=('points', 'children'))
+def build_points_statistics(today):
+    """학년별 오늘 포인트 평균/최고/최저 (통계 대상 아동, 포인트 큐브 집계)"""
+    child_grades = dict(db.session.query(Child.id, Child.grade).filter(Child.include_in_stats == True).all())
+    children_per_grade = {}
+    for grade in child_grades.values():
+        children_per_grade[grade] = children_per_grade.get(grade, 0) + 1
+    
+    # 오늘 포인트 기록 (아동별)
+    points_cube.refresh()
+    today_points = points_cube.aggregate('child', start=today, end=today, stats_only=True)
+    
     # 학년별 포인트 통계
     grade_stats = {}
     for grade in range(1, 7):  # 1학년~6학년
-        children = Child.query.filter_by(grade=grade, include_in_stats=True).all()
-        if not children:
+        if not children_per_grade.get(grade):
             continue
-            
-        grade_points = []
-        for child in children:
-            # 오늘 포인트 기록
-            today_points = DailyPoints.query.filter_by(
-                child_id=child.id, 
-                date=today
-            ).first()
-            
-            if today_points:
-                grade_points.append(today_points.total_points)
+        
+        grade_points = [entry['total_points'] for child_id, entry in today_points.items()
+                        if child_grades.get(child_id) == grade]
         
         if grade_points:
             grade_stats[grade] = {
                 'avg_points': round(sum(grade_points) / len(grade_points), 1),
                 'max_points': max(grade_points),
                 'min_points': min(grade_points),
-                'total_children': len(children),
+                'total_children': children_per_grade[grade],
                 'participated_children': len(grade_points)
             }
     
-    return render_template('points/statistics.html', grade_stats=grade_stats, today=today)
+    return grade_stats
 
 @app.route('/points/analysis')
 @login_required
@@ -1879,136 +3562,84 @@ def points_analysis():
     if child_id:
         # 특정 아동 분석
         child = Child.query.get_or_404(child_id)
+        analysis = build_child_points_analysis(child.id)
         
-        # 해당 아동의 전체 포인트 기록 (중복 제거 후)
-        # 날짜별로 하나의 기록만 가져오기
-        result = db.session.execute(text("""
-            SELECT id, date, korean_points, math_points, ssen_points, reading_points, total_points
+        # 디버깅: 실제 데이터 확인
+        logger.debug("%s(ID %s) 포인트 분석 - 기록 %s건, 계산된 총 포인트 %s, Child.cumulative_points %s",
+                     child.name, child_id, len(analysis['child_points']), analysis['total_points'],
+                     child.cumulative_points)
+        
+        return render_template('points/analysis.html', child=child, **analysis)
+    else:
+        # 아동 목록 표시
+        children = Child.query.filter_by(include_in_stats=True).order_by(Child.grade, Child.name).all()
+        return render_template('points/analysis.html', children=children)
+
+@app_cache.cached('points_analysis', depends=('points', 'children'))
+def build_child_points_analysis(child_id):
+    """아동별 포인트 기록, 학년 내 비교, 전체 순위 (캐시용으로 dict만 사용)"""
+    child = db.session.get(Child, child_id)
+    
+    # 해당 아동의 전체 포인트 기록 (중복 제거 후)
+    # 날짜별로 하나의 기록만 가져오기
+    result = db.session.execute(text("""
+        SELECT id, date, korean_points, math_points, ssen_points, reading_points, total_points
+        FROM daily_points 
+        WHERE child_id = :child_id 
+        AND id IN (
+            SELECT MAX(id) 
             FROM daily_points 
             WHERE child_id = :child_id 
-            AND id IN (
-                SELECT MAX(id) 
-                FROM daily_points 
-                WHERE child_id = :child_id 
-                GROUP BY date 
-            )
-            ORDER BY date DESC
-        """), {"child_id": child_id})
-        
-        # 실제 DailyPoints 객체로 변환
-        child_points = []
-        for row in result:
-            # 날짜 타입 변환 (문자열일 경우 datetime.date로 변환)
-            date_value = row[1]
-            if isinstance(date_value, str):
-                from datetime import datetime
-                date_value = datetime.strptime(date_value, '%Y-%m-%d').date()
-            
-            # DailyPoints 객체 생성
-            point_record = DailyPoints(
-                id=row[0],
-                date=date_value,
-                korean_points=row[2],
-                math_points=row[3],
-                ssen_points=row[4],
-                reading_points=row[5],
-                total_points=row[6]
-            )
-            child_points.append(point_record)
-        
-        # 총 포인트 계산 (중복 제거된 데이터로)
-        total_points = sum(record.total_points for record in child_points)
-        
-        # 디버깅: 실제 데이터 확인
-        print(f"=== {child.name} 포인트 분석 ===")
-        print(f"아동 ID: {child_id}")
-        print(f"아동 이름: {child.name}")
-        print(f"총 기록 수: {len(child_points)}")
-        print(f"계산된 총 포인트: {total_points}")
-        print(f"Child.cumulative_points: {child.cumulative_points}")
-        print("================================")
-        
-        # 같은 학년 아동들의 포인트 비교 (중복 제거 후)
-        same_grade_children = Child.query.filter_by(grade=child.grade, include_in_stats=True).all()
-        grade_comparison = []
-        
-        for grade_child in same_grade_children:
-            if grade_child.id != child_id:  # 자기 자신 제외
-                # 중복 제거된 포인트 계산
-                result = db.session.execute(text("""
-                    SELECT SUM(total_points) as total, COUNT(*) as count
-                    FROM daily_points 
-                    WHERE child_id = :child_id 
-                    AND id IN (
-                        SELECT MAX(id) 
-                        FROM daily_points 
-                        WHERE child_id = :child_id 
-                        GROUP BY date
-                    )
-                """), {"child_id": grade_child.id})
-                
-                row = result.fetchone()
-                grade_child_total = row[0] or 0
-                record_count = row[1] or 0
-                
-                grade_comparison.append({
-                    'id': grade_child.id,
-                    'name': grade_child.name,
-                    'total_points': grade_child_total,
-                    'record_count': record_count
-                })
+            GROUP BY date 
+        )
+        ORDER BY date DESC
+    """), {"child_id": child_id})
+    
+    # 템플릿은 속성 접근만 하므로 DailyPoints 객체 대신 dict로 변환 (캐시 직렬화용)
+    child_points = []
+    for row in result:
+        # 날짜 타입 변환 (문자열일 경우 datetime.date로 변환)
+        date_value = row[1]
+        if isinstance(date_value, str):
+            date_value = datetime.strptime(date_value, '%Y-%m-%d').date()
         
-        # 학년 내 순위 계산
+        child_points.append({
+            'id': row[0],
+            'date': date_value,
+            'korean_points': row[2],
+            'math_points': row[3],
+            'ssen_points': row[4],
+            'reading_points': row[5],
+            'total_points': row[6]
+        })
+    
+    # 총 포인트 계산 (중복 제거된 데이터로)
+    total_points = sum(record['total_points'] for record in child_points)
+    
+    # 전체 순위 (중복 제거 후, 쿼리 1회)
+    overall_ranking = get_points_ranking()
+    
+    # 같은 학년 아동들의 포인트 비교 - 전체 순위에서 학년만 추림
+    grade_comparison = [entry for entry in overall_ranking if entry['grade'] == child.grade]
+    
+    # 통계 제외 아동이면 순위 집계에 없으므로 비교용으로 본인 기록만 추가
+    if not any(entry['id'] == child_id for entry in grade_comparison):
         grade_comparison.append({
             'id': child.id,
             'name': child.name,
+            'grade': child.grade,
             'total_points': total_points,
-            'record_count': len(child_points)
+            'record_count': len(child_points),
+            'grade_rank': 1 + sum(1 for entry in grade_comparison if entry['total_points'] > total_points)
         })
         grade_comparison.sort(key=lambda x: x['total_points'], reverse=True)
-        
-        # 전체 학년 순위 (중복 제거 후)
-        all_children = Child.query.filter_by(include_in_stats=True).all()
-        overall_ranking = []
-        
-        for all_child in all_children:
-            # 중복 제거된 포인트 계산
-            result = db.session.execute(text("""
-                SELECT SUM(total_points) as total, COUNT(*) as count
-                FROM daily_points 
-                WHERE child_id = :child_id 
-                AND id IN (
-                    SELECT MAX(id) 
-                    FROM daily_points 
-                    WHERE child_id = :child_id 
-                    GROUP BY date
-                )
-            """), {"child_id": all_child.id})
-            
-            row = result.fetchone()
-            all_child_total = row[0] or 0
-            record_count = row[1] or 0
-            
-            overall_ranking.append({
-                'id': all_child.id,
-                'name': all_child.name,
-                'grade': all_child.grade,
-                'total_points': all_child_total,
-                'record_count': record_count
-            })
-        
-        overall_ranking.sort(key=lambda x: x['total_points'], reverse=True)
-        
-        return render_template('points/analysis.html', 
-                             child=child,
-                             child_points=child_points,
-                             total_points=total_points,
-                             grade_comparison=grade_comparison,
-                             overall_ranking=overall_ranking)
-    else:
-        # 아동 목록 표시
-        children = Child.query.filter_by(include_in_stats=True).order_by(Child.grade, Child.name).all()
-        return render_template('points/analysis.html', children=children)
+    
+    return {
+        'child_points': child_points,
+        'total_points': total_points,
+        'grade_comparison': grade_comparison,
+        'overall_ranking': overall_ranking
+    }
 
 @app.route('/points/visualization')
 @login_required
@@ -2019,216 +3650,178 @@ def points_visualization():
     
     today = datetime.utcnow().date()
     
-    # 1. 주간 트렌드 (최근 4주)
+    return render_template('points/visualization.html', today=today, **build_points_visualization(today))
+
+@app_cache.cached('points_visualization', depends=('points', 'children'))
+def build_points_visualization(today):
+    """주간 트렌드/월별 합계/과목별 분포/학년별 평균 차트 데이터 (포인트 큐브 집계)"""
+    points_cube.refresh()
+    
+    # 1. 주간 트렌드 (최근 4주) - 일 단위 집계
+    daily_totals = points_cube.aggregate('date', start=today - timedelta(days=28), end=today)
+    
     weekly_data = []
     for i in range(28, -1, -1):  # 최근 28일
-        date = today - timedelta(days=i)
-        daily_points = DailyPoints.query.filter_by(date=date).all()
-        total_points = sum(record.total_points for record in daily_points)
+        day = today - timedelta(days=i)
         weekly_data.append({
-            'date': date.strftime('%m/%d'),
-            'points': total_points
+            'date': day.strftime('%m/%d'),
+            'points': daily_totals.get(day, {}).get('total_points', 0)
         })
     
-    # 2. 월별 합계 (올해 전체)
+    # 2. 월별 합계 (올해 전체) - 월 단위 집계
+    monthly_totals = points_cube.aggregate('month', start=today.replace(month=1, day=1),
+                                           end=today.replace(month=12, day=31))
+    
     monthly_data = []
     for month in range(1, 13):
-        month_start = datetime(today.year, month, 1).date()
-        if month == 12:
-            month_end = datetime(today.year + 1, 1, 1).date() - timedelta(days=1)
-        else:
-            month_end = datetime(today.year, month + 1, 1).date() - timedelta(days=1)
-        
-        month_points = DailyPoints.query.filter(
-            DailyPoints.date >= month_start,
-            DailyPoints.date <= month_end
-        ).all()
-        total_month_points = sum(record.total_points for record in month_points)
-        
+        month_start = today.replace(month=month, day=1)
         monthly_data.append({
             'month': f'{month}월',
-            'points': total_month_points
+            'points': monthly_totals.get(month_start, {}).get('total_points', 0)
         })
     
     # 3. 과목별 분포 (전체 기간)
-    all_points = DailyPoints.query.all()
+    subject_sums = points_cube.aggregate().get(None, {})
     subject_totals = {
-        '국어': sum(record.korean_points for record in all_points),
-        '수학': sum(record.math_points for record in all_points),
-        '쎈수학': sum(record.ssen_points for record in all_points),
-        '독서': sum(record.reading_points for record in all_points)
+        '국어': subject_sums.get('korean_points', 0),
+        '수학': subject_sums.get('math_points', 0),
+        '쎈수학': subject_sums.get('ssen_points', 0),
+        '독서': subject_sums.get('reading_points', 0)
     }
     
-    # 4. 학년별 평균
+    # 4. 학년별 평균 (각 기록당 평균 포인트 = 총 포인트 / 총 기록 수, 통계 대상 아동의 현재 학년 기준)
+    grade_sums = points_cube.aggregate('grade', stats_only=True)
+    
     grade_averages = {}
     for grade_num in [1, 2, 3, 4, 5, 6]:
-        grade_str = f'{grade_num}학년'
-        grade_children = Child.query.filter_by(grade=grade_num, include_in_stats=True).all()
-        if grade_children:
-            grade_total_points = 0
-            grade_total_records = 0
-            
-            for child in grade_children:
-                child_points = DailyPoints.query.filter_by(child_id=child.id).all()
-                grade_total_points += sum(record.total_points for record in child_points)
-                grade_total_records += len(child_points)
-            
-            if grade_total_records > 0:
-                # 평균 = 총 포인트 / 총 기록 수 (각 기록당 평균 포인트)
-                grade_averages[grade_str] = round(grade_total_points / grade_total_records, 1)
-                print(f"DEBUG: {grade_str} - 총 포인트: {grade_total_points}, 총 기록: {grade_total_records}, 평균: {grade_averages[grade_str]}")
-            else:
-                grade_averages[grade_str] = 0
-                print(f"DEBUG: {grade_str} - 기록 없음")
+        grade_entry = grade_sums.get(grade_num)
+        if grade_entry:
+            grade_averages[f'{grade_num}학년'] = round(grade_entry['total_points'] / grade_entry['count'], 1)
         else:
-            grade_averages[grade_str] = 0
-            print(f"DEBUG: {grade_str} - 아동 없음")
-    
-    return render_template('points/visualization.html', 
-                         weekly_data=weekly_data,
-                         monthly_data=monthly_data,
-                         subject_totals=subject_totals,
-                         grade_averages=grade_averages,
-                         today=today,
-                         # JSON 형태로 미리 변환
-                         weekly_labels=[item['date'] for item in weekly_data],
-                         weekly_points=[item['points'] for item in weekly_data],
-                         monthly_labels=[item['month'] for item in monthly_data],
-                         monthly_points=[item['points'] for item in monthly_data],
-                         subject_labels=list(subject_totals.keys()),
-                         subject_values=list(subject_totals.values()),
-                         grade_labels=list(grade_averages.keys()),
-                         grade_values=list(grade_averages.values()))
+            grade_averages[f'{grade_num}학년'] = 0
+    
+    return {
+        'weekly_data': weekly_data,
+        'monthly_data': monthly_data,
+        'subject_totals': subject_totals,
+        'grade_averages': grade_averages,
+        # JSON 형태로 미리 변환
+        'weekly_labels': [item['date'] for item in weekly_data],
+        'weekly_points': [item['points'] for item in weekly_data],
+        'monthly_labels': [item['month'] for item in monthly_data],
+        'monthly_points': [item['points'] for item in monthly_data],
+        'subject_labels': list(subject_totals.keys()),
+        'subject_values': list(subject_totals.values()),
+        'grade_labels': list(grade_averages.keys()),
+        'grade_values': list(grade_averages.values())
+    }
 
 @app.route('/points/child/<int:child_id>')
 @login_required
 def child_point_analysis(child_id):
     """개별 아동 포인트 분석 페이지"""
-    from datetime import datetime, timedelta
-    import calendar
-    
     child = Child.query.get_or_404(child_id)
     today = datetime.utcnow().date()
     
-    # 1. 주간 포인트 트렌드 (최근 8주)
-    weekly_data = []
-    for i in range(56, -1, -1):  # 최근 8주 (56일)
-        date = today - timedelta(days=i)
-        daily_record = DailyPoints.query.filter_by(child_id=child_id, date=date).first()
-        points = daily_record.total_points if daily_record else 0
-        weekly_data.append({
-            'date': date.strftime('%m/%d'),
-            'points': points
-        })
+    # 1~3. 주간 트렌드, 월간 합계, 주/월 증감률 (기간 조회 1회)
+    series = build_child_point_series(child_id, today)
     
-    # 2. 월간 포인트 합계 (최근 6개월)
-    monthly_data = []
+    # 4. 같은 학년 비교 (포인트 순 정렬, 순위/백분위 포함)
+    grade_comparison = get_points_ranking(grade=child.grade)
+    
+    # 현재 아동의 순위 찾기 (통계 제외 아동이면 1위, 백분위 없음)
+    current_entry = next((entry for entry in grade_comparison if entry['id'] == child_id), None)
+    current_rank = current_entry['grade_rank'] if current_entry else 1
+    
+    return render_template('points/child_analysis.html',
+                         child=child,
+                         grade_comparison=grade_comparison,
+                         current_rank=current_rank,
+                         current_entry=current_entry,
+                         total_children_in_grade=len(grade_comparison),
+                         **series)
+
+@app_cache.cached('child_point_series', depends=('points',))
+def build_child_point_series(child_id, today):
+    """아동 포인트 시계열 (최근 57일 일별, 최근 6개월 월별 합계, 주/월 증감률)
+    
+    필요한 기간 전체를 한 번 조회해서 날짜별 배열(기록 없는 날은 0)을 만들고,
+    구간 합계는 누적합 배열의 차이로 계산한다.
+    월별 합계는 기존과 같이 today - 30*i 가 속한 달의 1일~말일 기준.
+    """
+    # 월간 합계 대상 달 (오늘부터 30일 간격으로 6번)
+    months = []
     for i in range(6):
         month_date = today - timedelta(days=30*i)
         month_start = month_date.replace(day=1)
-        if month_date.month == 12:
-            month_end = month_date.replace(year=month_date.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            month_end = month_date.replace(month=month_date.month + 1, day=1) - timedelta(days=1)
-        
-        month_points = DailyPoints.query.filter(
-            DailyPoints.child_id == child_id,
-            DailyPoints.date >= month_start,
-            DailyPoints.date <= month_end
-        ).all()
-        total_month_points = sum(record.total_points for record in month_points)
-        
-        monthly_data.append({
-            'month': month_date.strftime('%Y년 %m월'),
-            'points': total_month_points
-        })
+        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        months.append((month_date, month_start, month_end))
     
-    # 3. 증감률 계산
-    # 이번 주 vs 지난 주
     this_week_start = today - timedelta(days=today.weekday())
     last_week_start = this_week_start - timedelta(days=7)
+    this_month_start = today.replace(day=1)
+    last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
     
-    this_week_points = DailyPoints.query.filter(
-        DailyPoints.child_id == child_id,
-        DailyPoints.date >= this_week_start,
-        DailyPoints.date <= today
-    ).all()
-    this_week_total = sum(record.total_points for record in this_week_points)
+    # 조회 범위: 가장 이른 구간 시작 ~ 이번 달 말일 (이번 달 합계는 말일까지 포함)
+    range_start = min(today - timedelta(days=56), last_week_start, last_month_start,
+                      min(month_start for _, month_start, _ in months))
+    range_end = max(today, max(month_end for _, _, month_end in months))
     
-    last_week_points = DailyPoints.query.filter(
+    rows = db.session.query(DailyPoints.date, DailyPoints.total_points).filter(
         DailyPoints.child_id == child_id,
-        DailyPoints.date >= last_week_start,
-        DailyPoints.date < this_week_start
+        DailyPoints.date >= range_start,
+        DailyPoints.date <= range_end
     ).all()
-    last_week_total = sum(record.total_points for record in last_week_points)
     
-    weekly_change = 0
-    if last_week_total > 0:
-        weekly_change = round(((this_week_total - last_week_total) / last_week_total) * 100, 1)
+    # 날짜별 배열 (range_start 기준 일수 인덱스) 과 누적합 (cumulative[i] = 0~i-1일 합계)
+    daily = np.zeros((range_end - range_start).days + 1, dtype=np.int64)
+    if rows:
+        offsets = np.fromiter(((row.date - range_start).days for row in rows), dtype=np.int64, count=len(rows))
+        points = np.fromiter((row.total_points or 0 for row in rows), dtype=np.int64, count=len(rows))
+        np.add.at(daily, offsets, points)
+    cumulative = np.concatenate(([0], np.cumsum(daily)))
     
-    # 이번 달 vs 지난 달
-    this_month_start = today.replace(day=1)
-    last_month_end = this_month_start - timedelta(days=1)
-    last_month_start = last_month_end.replace(day=1)
+    def range_total(start, end):
+        """start~end (양끝 포함) 합계"""
+        return int(cumulative[(end - range_start).days + 1] - cumulative[(start - range_start).days])
     
-    this_month_points = DailyPoints.query.filter(
-        DailyPoints.child_id == child_id,
-        DailyPoints.date >= this_month_start,
-        DailyPoints.date <= today
-    ).all()
-    this_month_total = sum(record.total_points for record in this_month_points)
+    # 1. 주간 포인트 트렌드 (최근 8주)
+    today_offset = (today - range_start).days
+    weekly_data = [{
+        'date': (today - timedelta(days=i)).strftime('%m/%d'),
+        'points': int(daily[today_offset - i])
+    } for i in range(56, -1, -1)]
     
-    last_month_points = DailyPoints.query.filter(
-        DailyPoints.child_id == child_id,
-        DailyPoints.date >= last_month_start,
-        DailyPoints.date < this_month_start
-    ).all()
-    last_month_total = sum(record.total_points for record in last_month_points)
+    # 2. 월간 포인트 합계 (최근 6개월)
+    monthly_data = [{
+        'month': month_date.strftime('%Y년 %m월'),
+        'points': range_total(month_start, month_end)
+    } for month_date, month_start, month_end in months]
+    
+    # 3. 증감률 계산 (이번 주 vs 지난 주, 이번 달 vs 지난 달)
+    this_week_total = range_total(this_week_start, today)
+    last_week_total = range_total(last_week_start, this_week_start - timedelta(days=1))
+    this_month_total = range_total(this_month_start, today)
+    last_month_total = range_total(last_month_start, this_month_start - timedelta(days=1))
+    
+    weekly_change = 0
+    if last_week_total > 0:
+        weekly_change = round(((this_week_total - last_week_total) / last_week_total) * 100, 1)
     
     monthly_change = 0
     if last_month_total > 0:
         monthly_change = round(((this_month_total - last_month_total) / last_month_total) * 100, 1)
     
-    # 4. 같은 학년 비교
-    grade_children = Child.query.filter_by(grade=child.grade, include_in_stats=True).all()
-    grade_comparison = []
-    
-    for grade_child in grade_children:
-        child_total_points = DailyPoints.query.filter_by(child_id=grade_child.id).all()
-        total_points = sum(record.total_points for record in child_total_points)
-        record_count = len(child_total_points)
-        
-        grade_comparison.append({
-            'id': grade_child.id,
-            'name': grade_child.name,
-            'total_points': total_points,
-            'record_count': record_count,
-            'avg_points': round(total_points / record_count, 0) if record_count > 0 else 0
-        })
-    
-    # 포인트 순으로 정렬
-    grade_comparison.sort(key=lambda x: x['total_points'], reverse=True)
-    
-    # 현재 아동의 순위 찾기
-    current_rank = 1
-    for i, comp_child in enumerate(grade_comparison):
-        if comp_child['id'] == child_id:
-            current_rank = i + 1
-            break
-    
-    return render_template('points/child_analysis.html',
-                         child=child,
-                         weekly_data=weekly_data,
-                         monthly_data=monthly_data,
-                         weekly_change=weekly_change,
-                         monthly_change=monthly_change,
-                         this_week_total=this_week_total,
-                         last_week_total=last_week_total,
-                         this_month_total=this_month_total,
-                         last_month_total=last_month_total,
-                         grade_comparison=grade_comparison,
-                         current_rank=current_rank,
-                         total_children_in_grade=len(grade_comparison))
+    return {
+        'weekly_data': weekly_data,
+        'monthly_data': monthly_data,
+        'weekly_change': weekly_change,
+        'monthly_change': monthly_change,
+        'this_week_total': this_week_total,
+        'last_week_total': last_week_total,
+        'this_month_total': this_month_total,
+        'last_month_total': last_month_total
+    }
 
 @app.route('/points/grade-comparison/<int:grade>')
 @login_required
@@ -2237,55 +3830,12 @@ def grade_point_comparison(grade):
     from datetime import datetime, timedelta
     
     today = datetime.utcnow().date()
+    children_data = build_grade_point_comparison(grade, today)
     
-    # 해당 학년의 모든 아동 조회
-    grade_children = Child.query.filter_by(grade=grade, include_in_stats=True).all()
-    
-    if not grade_children:
+    if children_data is None:
         flash(f'{grade}학년에 아동이 없습니다.', 'warning')
         return redirect(url_for('points_visualization'))
     
-    # 각 아동의 포인트 데이터 수집
-    children_data = []
-    for child in grade_children:
-        # 전체 포인트
-        all_points = DailyPoints.query.filter_by(child_id=child.id).all()
-        total_points = sum(record.total_points for record in all_points)
-        
-        # 이번 주 포인트
-        this_week_start = today - timedelta(days=today.weekday())
-        this_week_points = DailyPoints.query.filter(
-            DailyPoints.child_id == child.id,
-            DailyPoints.date >= this_week_start,
-            DailyPoints.date <= today
-        ).all()
-        this_week_total = sum(record.total_points for record in this_week_points)
-        
-        # 이번 달 포인트
-        this_month_start = today.replace(day=1)
-        this_month_points = DailyPoints.query.filter(
-            DailyPoints.child_id == child.id,
-            DailyPoints.date >= this_month_start,
-            DailyPoints.date <= today
-        ).all()
-        this_month_total = sum(record.total_points for record in this_month_points)
-        
-        # 평균 포인트
-        avg_points = round(total_points / len(all_points), 1) if all_points else 0
-        
-        children_data.append({
-            'id': child.id,
-            'name': child.name,
-            'total_points': total_points,
-            'this_week': this_week_total,
-            'this_month': this_month_total,
-            'avg_points': avg_points,
-            'record_count': len(all_points)
-        })
-    
-    # 총 포인트 순으로 정렬
-    children_data.sort(key=lambda x: x['total_points'], reverse=True)
-    
     # 차트 데이터 준비
     chart_labels = [child['name'] for child in children_data]
     chart_total_points = [child['total_points'] for child in children_data]
@@ -2302,6 +3852,43 @@ def grade_point_comparison(grade):
                          chart_monthly_points=chart_monthly_points,
                          chart_avg_points=chart_avg_points)
 
+@app_cache.cached('grade_point_comparison', depends=('points', 'children'))
+def build_grade_point_comparison(grade, today):
+    """학년 아동별 누적/이번 주/이번 달/평균 포인트 (아동이 없으면 None)"""
+    # 누적 합계/기록 수/순위는 순위 쿼리에서 (포인트 순 정렬)
+    grade_ranking = get_points_ranking(grade=grade)
+    
+    if not grade_ranking:
+        return None
+    
+    # 이번 주(월~일)/이번 달(1일~말일) 아동별 포인트는 포인트 큐브에서 집계
+    this_week_start = today - timedelta(days=today.weekday())
+    this_month_start = today.replace(day=1)
+    this_month_end = (this_month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    
+    points_cube.refresh()
+    week_totals = points_cube.aggregate('child', start=this_week_start, end=this_week_start + timedelta(days=6),
+                                        grade=grade, stats_only=True)
+    month_totals = points_cube.aggregate('child', start=this_month_start, end=this_month_end,
+                                         grade=grade, stats_only=True)
+    
+    children_data = []
+    for entry in grade_ranking:
+        children_data.append({
+            'id': entry['id'],
+            'name': entry['name'],
+            'total_points': entry['total_points'],
+            'this_week': week_totals.get(entry['id'], {}).get('total_points', 0),
+            'this_month': month_totals.get(entry['id'], {}).get('total_points', 0),
+            # 평균 포인트
+            'avg_points': round(entry['total_points'] / entry['record_count'], 1) if entry['record_count'] else 0,
+            'record_count': entry['record_count'],
+            'grade_rank': entry['grade_rank'],
+            'percentile': entry['percentile']
+        })
+    
+    return children_data
+
 # 설정 라우트들
 @app.route('/settings')
 @login_required
@@ -2377,6 +3964,7 @@ def settings_users():
                 password_hash=generate_password_hash(new_password)
             )
             db.session.add(new_user)
+            deliver_notifications_to_user(new_user)
             db.session.commit()
             flash(f'{new_name} 사용자가 추가되었습니다.', 'success')
     
@@ -2400,6 +3988,7 @@ def settings_data():
             try:
                 from scripts.seed_data import main as seed_main
                 seed_main()
+                app_cache.invalidate()
                 flash('기본 시드 데이터가 성공적으로 실행되었습니다.', 'success')
             except Exception as e:
                 flash(f'시드 데이터 실행 중 오류가 발생했습니다: {e}', 'error')
@@ -2412,11 +4001,14 @@ def settings_data():
             
             try:
                 # 모든 데이터 삭제
+                PointsRollup.query.delete()
                 DailyPoints.query.delete()
                 LearningRecord.query.delete()
                 Child.query.delete()
+                NotificationRecipient.query.delete()
                 User.query.delete()
                 db.session.commit()
+                app_cache.invalidate()
                 flash('모든 데이터가 초기화되었습니다.', 'success')
             except Exception as e:
                 flash(f'데이터 초기화 중 오류가 발생했습니다: {e}', 'error')
@@ -2516,8 +4108,9 @@ def input_cumulative_points():
         if not child:
             return jsonify({'success': False, 'message': '아동을 찾을 수 없습니다.'}), 404
         
-        child.cumulative_points = cumulative_points
+        set_cumulative_points({child: cumulative_points})
         db.session.commit()
+        app_cache.invalidate('points')
         
         return jsonify({
             'success': True, 
@@ -2543,6 +4136,7 @@ def bulk_input_cumulative_points():
         
         updated_count = 0
         errors = []
+        targets = {}
         
         for item in points_data:
             child_id = item.get('child_id')
@@ -2566,7 +4160,7 @@ def bulk_input_cumulative_points():
                 errors.append(f'아동 ID {child_id}: 아동을 찾을 수 없습니다.')
                 continue
             
-            child.cumulative_points = cumulative_points
+            targets[child] = cumulative_points
             updated_count += 1
         
         if errors:
@@ -2577,7 +4171,9 @@ def bulk_input_cumulative_points():
                 'errors': errors
             }), 400
         
+        set_cumulative_points(targets)
         db.session.commit()
+        app_cache.invalidate('points')
         
         return jsonify({
             'success': True,
@@ -2639,7 +4235,7 @@ class Notification(db.Model):
     child_id = db.Column(db.Integer, db.ForeignKey('child.id'), nullable=True)  # 특정 아동 관련 알림
     
     # 상태 관리
-    is_read = db.Column(db.Boolean, default=False)
+    is_read = db.Column(db.Boolean, default=False)  # 이전 방식의 전체 읽음 표시 (사용자별 읽음은 NotificationRecipient)
     is_active = db.Column(db.Boolean, default=True)
     # is_deleted = db.Column(db.Boolean, default=False)  # 소프트 삭제 플래그
     auto_expire = db.Column(db.Boolean, default=False)  # 자동 만료 여부
@@ -2649,12 +4245,21 @@ class Notification(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     read_at = db.Column(db.DateTime, nullable=True)
+    repeat_count = db.Column(db.Integer, default=1)  # 정리 작업이 합친 같은 알림 수 (백업 성공 요약)
     
     # 관계 설정
     target_user = db.relationship('User', foreign_keys=[target_user_id], backref='received_notifications', lazy=True)
     creator = db.relationship('User', foreign_keys=[created_by], backref='created_notifications', lazy=True)
     child = db.relationship('Child', backref='notifications', lazy=True)
     
+    __table_args__ = (
+        db.Index('ix_notification_expire_date', 'expire_date'),
+        db.Index('ix_notification_type_created', 'type', 'created_at'),
+    )
+    
+    # 조회한 사용자 기준 읽음 여부 (get_user_notifications가 채움, DB 컬럼 아님)
+    user_read = False
+    
     def __repr__(self):
         return f'<Notification {self.title} ({self.type})>'
     
@@ -2692,6 +4297,26 @@ class Notification(db.Model):
         }
         return colors.get(self.type, 'primary')
 
+class NotificationRecipient(db.Model):
+    """알림 수신자별 읽음 상태 - 알림 생성 시 대상 사용자마다 한 행 (전체/역할 공지도 사용자별로 읽음 처리)"""
+    __tablename__ = 'notification_recipient'
+    notification_id = db.Column(db.Integer, db.ForeignKey('notification.id'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    is_read = db.Column(db.Boolean, nullable=False, default=False)
+    read_at = db.Column(db.DateTime, nullable=True)
+    
+    # 받은 알림함 정렬/만료 조건을 이 테이블 인덱스만으로 처리하도록 알림 값을 복사해 둠
+    priority = db.Column(db.Integer, nullable=False, default=1)
+    created_at = db.Column(db.DateTime, nullable=False)
+    expire_date = db.Column(db.DateTime, nullable=True)
+    
+    notification = db.relationship('Notification', lazy=True)
+    
+    __table_args__ = (
+        db.Index('ix_notification_recipient_inbox', 'user_id', 'priority', 'created_at', 'notification_id'),
+        db.Index('ix_notification_recipient_unread', 'user_id', 'is_read', 'priority', 'created_at', 'notification_id'),
+    )
+
 def create_backup_notification(backup_type, status, message, target_role='개발자'):
     """백업 관련 알림 생성"""
     try:
@@ -2715,7 +4340,7 @@ def create_backup_notification(backup_type, status, message, target_role='개발
             created_by=1  # 시스템 생성
         )
         
-        db.session.add(notification)
+        add_notification(notification)
         db.session.commit()
         print(f"✅ 백업 알림 생성: {title}")
         return notification
@@ -2748,7 +4373,7 @@ def create_restore_notification(status, message, target_role='개발자'):
             created_by=1  # 시스템 생성
         )
         
-        db.session.add(notification)
+        add_notification(notification)
         db.session.commit()
         print(f"✅ 복원 알림 생성: {title}")
         return notification
@@ -2759,14 +4384,145 @@ def create_restore_notification(status, message, target_role='개발자'):
         return None
 
 # ===== 알림 시스템 헬퍼 함수들 =====
+# 알림은 생성 시 대상 사용자별 NotificationRecipient 행으로 펼쳐 저장한다 (개인/역할/전체 공지, 아동 관련 알림은
+# 모든 사용자). 목록은 (사용자, 우선순위, 생성 시각) 인덱스로 한 페이지만 읽고, 읽지 않은 알림 수는
+# User.unread_notifications 카운터를 배달/읽음/삭제 시 증감해서 유지한다 (표시할 때는 정리 전 만료 알림을 뺀다).
+
+def add_notification(notification):
+    """알림을 세션에 추가하고 대상 사용자들에게 배달 (커밋은 호출한 쪽)
+
+    INSERT ... SELECT 한 번으로 수신 행을 만들고, 받은 사용자들의 읽지 않은 알림 수를 1씩 늘린다.
+    """
+    db.session.add(notification)
+    db.session.flush()
+    
+    if notification.child_id is not None or (notification.target_user_id is None and notification.target_role is None):
+        condition = db.true()  # 전체 공지, 아동 관련 알림
+    elif notification.target_user_id is not None:
+        condition = User.id == notification.target_user_id
+    else:
+        condition = User.role == notification.target_role
+    
+    recipients = NotificationRecipient.__table__
+    result = db.session.execute(recipients.insert().from_select(
+        ['notification_id', 'user_id', 'is_read', 'priority', 'created_at', 'expire_date'],
+        db.select(
+            db.literal(notification.id), User.id, db.false(), db.literal(notification.priority or 1),
+            db.literal(notification.created_at or datetime.utcnow(), db.DateTime),
+            db.literal(notification.expire_date, db.DateTime)
+        ).where(condition)
+    ))
+    db.session.execute(
+        db.update(User)
+        .where(User.id.in_(db.select(recipients.c.user_id).where(recipients.c.notification_id == notification.id)))
+        .values(unread_notifications=User.unread_notifications + 1)
+    )
+    
+    # 실시간 스트림에 연결된 수신자에게 커밋 후 전달
+    if event_broker.has_subscribers():
+        user_ids = set(db.session.execute(
+            db.select(recipients.c.user_id).where(recipients.c.notification_id == notification.id)
+        ).scalars())
+        queue_stream_event('notification', {
+            'id': notification.id,
+            'title': notification.title,
+            'message': notification.message,
+            'type': notification.type,
+            'icon': notification.icon,
+            'color': notification.color,
+            'priority': notification.priority,
+            'created_at': notification.created_at
+        }, user_ids)
+    return result.rowcount
+
+def deliver_notifications_to_user(user):
+    """새 사용자에게 아직 만료되지 않은 기존 공지/알림을 배달 (커밋은 호출한 쪽)"""
+    db.session.flush()
+    recipients = NotificationRecipient.__table__
+    db.session.execute(recipients.insert().from_select(
+        ['notification_id', 'user_id', 'is_read', 'priority', 'created_at', 'expire_date'],
+        db.select(
+            Notification.id, db.literal(user.id), db.false(), func.coalesce(Notification.priority, 1),
+            func.coalesce(Notification.created_at, datetime.utcnow()), Notification.expire_date
+        ).where(
+            db.or_(
+                Notification.target_user_id == user.id,
+                db.and_(
+                    Notification.target_user_id.is_(None),
+                    db.or_(Notification.target_role.is_(None), Notification.target_role == user.role)
+                ),
+                Notification.child_id.isnot(None)
+            ),
+            db.or_(Notification.expire_date.is_(None), Notification.expire_date > datetime.utcnow()),
+            ~db.exists().where(recipients.c.notification_id == Notification.id, recipients.c.user_id == user.id)
+        )
+    ))
+    user.unread_notifications = db.session.query(func.count()).filter(
+        NotificationRecipient.user_id == user.id, NotificationRecipient.is_read == False
+    ).scalar()
+
+def retract_notification_recipients(notification_ids):
+    """알림들의 수신 행 삭제 + 읽지 않았던 사용자의 카운터 감소 (알림 삭제 전에 호출, 커밋은 호출한 쪽)
+
+    notification_ids는 id 목록이나 id를 고르는 SELECT 모두 가능하다.
+    """
+    recipients = NotificationRecipient.__table__
+    unread = db.select(recipients.c.user_id).where(
+        recipients.c.notification_id.in_(notification_ids), recipients.c.is_read == False
+    )
+    db.session.execute(
+        db.update(User)
+        .where(User.id.in_(unread))
+        .values(unread_notifications=User.unread_notifications - (
+            db.select(func.count()).select_from(recipients)
+            .where(recipients.c.user_id == User.id, recipients.c.notification_id.in_(notification_ids),
+                   recipients.c.is_read == False)
+            .scalar_subquery()
+        )),
+        execution_options={'synchronize_session': 'fetch'}
+    )
+    return db.session.execute(recipients.delete().where(recipients.c.notification_id.in_(notification_ids))).rowcount
+
+def get_unread_notification_count(user_id, counter=None):
+    """읽지 않은 알림 수 - 카운터에서 만료됐지만 정리 작업이 아직 삭제하지 않은 알림을 뺀 값
+
+    만료 알림은 매시간 정리 작업이 삭제하면서 카운터를 줄이므로, 그 사이에 만료된 읽지 않은 행만 세서 뺀다.
+    """
+    if counter is None:
+        counter = db.session.query(User.unread_notifications).filter_by(id=user_id).scalar()
+    if not counter:
+        return 0
+    expired = db.session.query(func.count()).filter(
+        NotificationRecipient.user_id == user_id,
+        NotificationRecipient.is_read == False,
+        NotificationRecipient.expire_date <= datetime.utcnow()
+    ).scalar()
+    return max(counter - expired, 0)
+
+def recount_unread_notifications():
+    """모든 사용자의 읽지 않은 알림 수를 수신 행 기준으로 다시 계산 (카운터 어긋남 복구용)"""
+    recipients = NotificationRecipient.__table__
+    db.session.execute(
+        db.update(User).values(unread_notifications=(
+            db.select(func.count()).select_from(recipients)
+            .where(recipients.c.user_id == User.id, recipients.c.is_read == False)
+            .scalar_subquery()
+        )),
+        execution_options={'synchronize_session': 'fetch'}
+    )
+    db.session.commit()
+
+@app.cli.command('recount-notifications')
+def recount_notifications_command():
+    """사용자별 읽지 않은 알림 수 다시 계산 (flask recount-notifications)"""
+    recount_unread_notifications()
+    print("🔔 읽지 않은 알림 수 재계산 완료")
 
 def create_notification(title, message, notification_type='info', target_user_id=None, target_role=None, 
                        child_id=None, priority=1, auto_expire=False, expire_days=None):
     """새 알림 생성"""
     try:
-        print(f"DEBUG: create_notification 호출됨 - {title}")
-        print(f"DEBUG: current_user.is_authenticated = {current_user.is_authenticated}")
-        print(f"DEBUG: current_user.id = {current_user.id if current_user.is_authenticated else 'None'}")
+        logger.debug("create_notification 호출됨 - %s (current_user.id = %s)", title, current_user.get_id())
         
         expire_date = None
         if auto_expire and expire_days:
@@ -2785,11 +4541,9 @@ def create_notification(title, message, notification_type='info', target_user_id
             created_by=current_user.id if current_user.is_authenticated else 1
         )
         
-        print(f"DEBUG: Notification 객체 생성 완료")
-        db.session.add(notification)
-        print(f"DEBUG: DB에 추가 완료")
+        add_notification(notification)
         db.session.commit()
-        print(f"DEBUG: DB 커밋 완료 - 알림 ID: {notification.id}")
+        logger.debug("알림 DB 커밋 완료 - 알림 ID: %s", notification.id)
         return notification
     except Exception as e:
         db.session.rollback()
@@ -2798,70 +4552,61 @@ def create_notification(title, message, notification_type='info', target_user_id
         traceback.print_exc()
         return None
 
-def get_user_notifications(user_id, limit=10, unread_only=False):
-    """사용자별 알림 조회"""
-    user = User.query.get(user_id)
-    if not user:
-        return []
-    
-    # 조건들을 리스트로 구성
-    conditions = []
-    
-    # 1. 개인 알림 (target_user_id가 현재 사용자)
-    conditions.append(Notification.target_user_id == user_id)
-    
-    # 2. 전체 공지 (target_user_id=None, target_role=None)
-    conditions.append(
-        db.and_(
-            Notification.target_user_id.is_(None),
-            Notification.target_role.is_(None)
-        )
-    )
-    
-    # 3. 역할별 공지 (target_user_id=None, target_role=사용자 역할)
-    conditions.append(
-        db.and_(
-            Notification.target_user_id.is_(None),
-            Notification.target_role == user.role
-        )
-    )
-    
-    # 4. 아동 관련 알림 (child_id가 있는 알림 - 모든 사용자에게 표시)
-    conditions.append(Notification.child_id.isnot(None))
-    
-    # 기본 쿼리: 위의 조건들 중 하나라도 만족하는 알림
-    query = Notification.query.filter(db.or_(*conditions))
-    
-    # 만료 조건 적용
-    query = query.filter(
+def get_user_notifications(user_id, limit=10, unread_only=False, offset=0):
+    """사용자별 알림 조회 (수신자 테이블 인덱스 순서대로 필요한 만큼만 읽음)"""
+    query = db.session.query(Notification, NotificationRecipient.is_read).join(
+        NotificationRecipient, NotificationRecipient.notification_id == Notification.id
+    ).filter(
+        NotificationRecipient.user_id == user_id,
+        # 만료 조건 적용
         db.or_(
-            Notification.expire_date.is_(None),
-            Notification.expire_date > datetime.utcnow()
+            NotificationRecipient.expire_date.is_(None),
+            NotificationRecipient.expire_date > datetime.utcnow()
         )
     )
     
     # 읽지 않은 알림만 필터링 (필요시)
     if unread_only:
-        query = query.filter(Notification.is_read == False)
+        query = query.filter(NotificationRecipient.is_read == False)
     
-    # 정렬
-    query = query.order_by(Notification.priority.desc(), Notification.created_at.desc())
+    # 정렬 (ix_notification_recipient_inbox/unread 인덱스 순서)
+    query = query.order_by(
+        NotificationRecipient.priority.desc(),
+        NotificationRecipient.created_at.desc(),
+        NotificationRecipient.notification_id.desc()
+    )
     
-    # limit 적용
+    if offset:
+        query = query.offset(offset)
     if limit is not None:
         query = query.limit(limit)
     
-    return query.all()
+    notifications = []
+    for notification, is_read in query:
+        notification.user_read = is_read
+        notifications.append(notification)
+    return notifications
 
 def mark_notification_read(notification_id, user_id):
-    """알림을 읽음으로 표시"""
-    notification = Notification.query.filter_by(id=notification_id).first()
-    if notification and (notification.target_user_id == user_id or notification.target_user_id is None):
-        notification.is_read = True
-        notification.read_at = datetime.utcnow()
+    """알림을 읽음으로 표시 (해당 사용자의 수신 행만)"""
+    result = db.session.execute(
+        db.update(NotificationRecipient)
+        .where(
+            NotificationRecipient.notification_id == notification_id,
+            NotificationRecipient.user_id == user_id,
+            NotificationRecipient.is_read == False
+        )
+        .values(is_read=True, read_at=datetime.utcnow())
+    )
+    if result.rowcount:
+        db.session.execute(
+            db.update(User).where(User.id == user_id)
+            .values(unread_notifications=User.unread_notifications - result.rowcount)
+        )
         db.session.commit()
         return True
-    return False
+    # 이미 읽은 알림도 성공으로 처리
+    return db.session.get(NotificationRecipient, (notification_id, user_id)) is not None
 
 def delete_notification(notification_id, user_id):
     """알림 소프트 삭제 (개발자만 가능)"""
@@ -2871,15 +4616,10 @@ def delete_notification(notification_id, user_id):
         if not user or user.role != '개발자':
             return False, "개발자 권한이 필요합니다."
         
-        # 알림 조회
-        notification = Notification.query.filter_by(id=notification_id).first()
-        if not notification:
+        # 삭제 처리
+        if not delete_notifications(select_notification_ids(notification_ids=[notification_id])):
             return False, "알림을 찾을 수 없습니다."
         
-        # 소프트 삭제 처리
-        db.session.delete(notification)
-        db.session.commit()
-        
         return True, "알림이 삭제되었습니다."
         
     except Exception as e:
@@ -2887,28 +4627,18 @@ def delete_notification(notification_id, user_id):
         return False, f"삭제 중 오류가 발생했습니다: {str(e)}"
 
 def delete_multiple_notifications(notification_ids, user_id):
-    """여러 알림 일괄 삭제 (개발자만 가능)"""
+    """여러 알림 일괄 삭제 (개발자만 가능) - DELETE 한 번, 커밋 한 번"""
     try:
         # 사용자 권한 확인
         user = User.query.get(user_id)
         if not user or user.role != '개발자':
             return False, "개발자 권한이 필요합니다."
         
-        # 알림들 조회 및 삭제
-        notifications = Notification.query.filter(
-            Notification.id.in_(notification_ids)
-        ).all()
-        
-        if not notifications:
+        count = delete_notifications(select_notification_ids(notification_ids=notification_ids))
+        if not count:
             return False, "삭제할 알림을 찾을 수 없습니다."
         
-        # 소프트 삭제 처리
-        for notification in notifications:
-            db.session.delete(notification)
-        
-        db.session.commit()
-        
-        return True, f"{len(notifications)}개의 알림이 삭제되었습니다."
+        return True, f"{count}개의 알림이 삭제되었습니다."
         
     except Exception as e:
         db.session.rollback()
@@ -2924,30 +4654,250 @@ def create_system_notification(title, message, target_role=None, priority=1):
         priority=priority
     )
 
+# ===== 알림 일괄 처리 =====
+# 모두 읽음/선택 삭제/오래된 알림 정리를 알림 수와 관계없이 UPDATE/DELETE 문 몇 개와 커밋 한 번으로 처리한다.
+# 대상은 알림 id를 고르는 SELECT로 넘겨서 DB 안에서 바로 조건으로 쓴다.
+
+NOTIFICATION_BATCH_MAX_IDS = 5000
+NOTIFICATION_BATCH_ACTIONS = ('read', 'delete')
+
+# 정기 정리 대상이 되는 시스템 알림 타입 접두어 (자동 만료 알림도 포함)
+SYSTEM_NOTIFICATION_TYPE_PREFIXES = ('backup_', 'restore_')
+
+def select_notification_ids(notification_ids=None, type_prefix=None, older_than=None, system_only=False):
+    """일괄 처리 대상 알림 id SELECT (조건이 없으면 전체 알림)"""
+    query = db.select(Notification.id)
+    if system_only:
+        query = query.where(db.or_(
+            Notification.auto_expire == True,
+            *[Notification.type.startswith(prefix) for prefix in SYSTEM_NOTIFICATION_TYPE_PREFIXES]
+        ))
+    if notification_ids is not None:
+        query = query.where(Notification.id.in_(notification_ids))
+    if type_prefix:
+        query = query.where(Notification.type.startswith(type_prefix, autoescape=True))
+    if older_than is not None:
+        query = query.where(Notification.created_at < older_than)
+    return query
+
+def mark_notifications_read(user_id, selection=None):
+    """사용자의 읽지 않은 알림을 UPDATE 한 번으로 읽음 처리하고 카운터 감소 (selection이 없으면 전체) - 처리 건수"""
+    recipients = NotificationRecipient.__table__
+    statement = recipients.update().where(recipients.c.user_id == user_id, recipients.c.is_read == False)
+    if selection is not None:
+        statement = statement.where(recipients.c.notification_id.in_(selection))
+    count = len(db.session.execute(
+        statement.values(is_read=True, read_at=datetime.utcnow()).returning(recipients.c.notification_id)
+    ).all())
+    if count:
+        db.session.execute(
+            db.update(User).where(User.id == user_id)
+            .values(unread_notifications=User.unread_notifications - count)
+        )
+    db.session.commit()
+    return count
+
+def delete_notifications(selection):
+    """알림 일괄 삭제 - 수신 행/카운터 정리 후 DELETE 한 번, 커밋 한 번 - 삭제 건수"""
+    retract_notification_recipients(selection)
+    table = Notification.__table__
+    count = len(db.session.execute(table.delete().where(table.c.id.in_(selection)).returning(table.c.id)).all())
+    db.session.commit()
+    # 세션에 남아 있는 삭제된 알림 객체는 다시 읽도록 만료
+    db.session.expire_all()
+    return count
+
+def purge_notifications(older_than_days, type_prefix=None, system_only=False):
+    """생성된 지 older_than_days일이 지난 알림 일괄 삭제 (system_only면 자동 만료/백업/복원 알림만) - 삭제 건수"""
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    return delete_notifications(select_notification_ids(type_prefix=type_prefix, older_than=cutoff,
+                                                        system_only=system_only))
+
+def purge_notifications_job():
+    """오래된 시스템 알림 정리 스케줄 작업 (매일 23:50, NOTIFICATION_RETENTION_DAYS가 0이면 건너뜀)"""
+    with app.app_context():
+        retention_days = app.config['NOTIFICATION_RETENTION_DAYS']
+        if retention_days <= 0:
+            return
+        try:
+            count = purge_notifications(retention_days, system_only=True)
+            print(f"🧹 알림 정리: {retention_days}일 지난 시스템 알림 {count}개 삭제")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ 알림 정리 실패: {e}")
+        finally:
+            db.session.remove()
+
+@app.cli.command('purge-notifications')
+@click.option('--days', type=click.IntRange(min=0), required=True, help='이 일수보다 오래된 알림 삭제')
+@click.option('--type', 'type_prefix', default=None, help='알림 타입 접두어 (예: backup)')
+def purge_notifications_command(days, type_prefix):
+    """오래된 알림 일괄 삭제 - 직원이 작성한 알림 포함 (flask purge-notifications --days 30 --type backup)"""
+    count = purge_notifications(days, type_prefix)
+    print(f"🧹 {days}일 지난 알림 {count}개 삭제")
+
+# ===== 알림 만료/압축 정리 =====
+# 만료된 알림은 읽기 조건으로 걸러지기만 하고 테이블에 계속 쌓이므로 매시간 배치 단위로 삭제하고,
+# 실시간 백업마다 생기는 백업 성공 알림은 종류(제목)별로 가장 최근 한 건에 횟수를 합쳐 남긴다.
+
+NOTIFICATION_SWEEP_BATCH = 500
+
+def sweep_expired_notifications(batch_size=NOTIFICATION_SWEEP_BATCH):
+    """만료된 알림을 batch_size개씩 삭제 (배치마다 커밋해서 쓰기 잠금을 짧게 유지) - 삭제 건수"""
+    now = datetime.utcnow()
+    removed = 0
+    while True:
+        batch = [notification_id for (notification_id,) in
+                 db.session.query(Notification.id)
+                 .filter(Notification.expire_date <= now)
+                 .order_by(Notification.expire_date)
+                 .limit(batch_size)]
+        if not batch:
+            break
+        removed += delete_notifications(select_notification_ids(notification_ids=batch))
+        if len(batch) < batch_size:
+            break
+    return removed
+
+def collapse_backup_notifications():
+    """백업 성공 알림을 종류별로 가장 최근 한 건에 합침 (repeat_count에 누적) - 합쳐서 삭제한 건수
+
+    남는 알림은 마지막 백업의 메시지/만료일을 그대로 가지므로 계속 갱신되는 요약 행이 된다.
+    """
+    groups = db.session.query(
+        Notification.title,
+        func.max(Notification.id),
+        func.count(Notification.id),
+        func.sum(func.coalesce(Notification.repeat_count, 1))
+    ).filter(Notification.type == 'backup_success').group_by(Notification.title).having(func.count(Notification.id) > 1).all()
+    
+    removed = 0
+    for title, keep_id, _, total in groups:
+        db.session.execute(db.update(Notification).where(Notification.id == keep_id).values(repeat_count=total))
+        # 조회 이후 새로 생긴 알림(id가 더 큼)은 다음 정리 때 합침
+        removed += delete_notifications(
+            db.select(Notification.id).where(
+                Notification.type == 'backup_success',
+                Notification.title == title,
+                Notification.id < keep_id
+            )
+        )
+    return removed
+
+def sweep_notifications():
+    """만료 알림 삭제 후 남은 백업 성공 알림 합치기 - (만료 삭제 건수, 합친 건수)"""
+    expired = sweep_expired_notifications()
+    collapsed = collapse_backup_notifications()
+    return expired, collapsed
+
+def sweep_notifications_job():
+    """알림 만료/압축 정리 스케줄 작업 (매시간)"""
+    with app.app_context():
+        try:
+            expired, collapsed = sweep_notifications()
+            if expired or collapsed:
+                print(f"🧹 알림 정리: 만료 {expired}개 삭제, 백업 성공 알림 {collapsed}개 합침")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ 알림 만료 정리 실패: {e}")
+        finally:
+            db.session.remove()
+
+@app.cli.command('sweep-notifications')
+def sweep_notifications_command():
+    """만료 알림 삭제 + 백업 성공 알림 합치기 (flask sweep-notifications)"""
+    expired, collapsed = sweep_notifications()
+    print(f"🧹 알림 정리: 만료 {expired}개 삭제, 백업 성공 알림 {collapsed}개 합침")
+
+def parse_notification_batch(data):
+    """일괄 처리 요청 파싱 - ((동작, 대상 SELECT 또는 None), 오류) 반환
+
+    대상은 notification_ids 목록, type(타입 접두어)/older_than_days 조건 중 하나로 지정한다.
+    all=true(전체)는 읽음 처리에만 쓸 수 있고, 삭제는 반드시 대상을 좁혀야 한다.
+    """
+    action = data.get('action')
+    if action not in NOTIFICATION_BATCH_ACTIONS:
+        return None, f"action은 {', '.join(NOTIFICATION_BATCH_ACTIONS)} 중 하나여야 합니다."
+    
+    notification_ids = data.get('notification_ids')
+    type_prefix = data.get('type') or None
+    older_than_days = data.get('older_than_days')
+    
+    if notification_ids is not None:
+        if not isinstance(notification_ids, list) or not all(isinstance(i, int) for i in notification_ids):
+            return None, 'notification_ids는 알림 id 목록이어야 합니다.'
+        if not notification_ids:
+            return None, '처리할 알림을 선택해주세요.'
+        if len(notification_ids) > NOTIFICATION_BATCH_MAX_IDS:
+            return None, f'한 번에 최대 {NOTIFICATION_BATCH_MAX_IDS}개까지 처리할 수 있습니다.'
+    
+    older_than = None
+    if older_than_days is not None:
+        if not isinstance(older_than_days, int) or older_than_days < 0:
+            return None, 'older_than_days는 0 이상의 정수여야 합니다.'
+        older_than = datetime.utcnow() - timedelta(days=older_than_days)
+    
+    if notification_ids is None and type_prefix is None and older_than is None:
+        if action != 'read':
+            return None, '삭제할 대상(notification_ids, type 또는 older_than_days)을 지정해주세요.'
+        if data.get('all') is not True:
+            return None, '처리할 대상(notification_ids, type, older_than_days 또는 all)을 지정해주세요.'
+        # 전체 읽음 처리는 사용자 수신 행 전체 대상
+        return (action, None), None
+    
+    return (action, select_notification_ids(notification_ids, type_prefix, older_than)), None
+
+@app.route('/api/notifications/batch', methods=['POST'])
+@login_required
+def notifications_batch_api():
+    """알림 일괄 읽음/삭제 API (삭제는 개발자만)"""
+    data = request.get_json(silent=True) or {}
+    parsed, error = parse_notification_batch(data)
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+    action, selection = parsed
+    
+    try:
+        if action == 'read':
+            count = mark_notifications_read(current_user.id, selection)
+            message = f"{count}개의 알림을 읽음으로 표시했습니다."
+        else:
+            if current_user.role != '개발자':
+                return jsonify({'success': False, 'message': '개발자 권한이 필요합니다.'}), 403
+            count = delete_notifications(selection)
+            message = f"{count}개의 알림이 삭제되었습니다."
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'}), 500
+    
+    db.session.refresh(current_user)
+    return jsonify({
+        'success': True,
+        'action': action,
+        'count': count,
+        'message': message,
+        'unread_count': current_user.unread_notification_count
+    })
+
 @app.route('/notifications')
 @login_required
 def notifications():
     """알림 목록 페이지"""
-    page = request.args.get('page', 1, type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
     per_page = 20
     
-    # 모든 알림 조회
-    all_notifications = get_user_notifications(current_user.id, limit=None)
-    
-    # 페이지네이션
-    total = len(all_notifications)
-    start = (page - 1) * per_page
-    end = start + per_page
-    notifications_page = all_notifications[start:end]
+    # 한 페이지 + 1건만 조회 (다음 페이지 존재 여부 확인용)
+    rows = get_user_notifications(current_user.id, limit=per_page + 1, offset=(page - 1) * per_page)
+    notifications_page = rows[:per_page]
     
-    # 읽지 않은 알림 수
-    unread_count = len([n for n in all_notifications if not n.is_read])
+    # 읽지 않은 알림 수 (사용자 카운터 - 만료 알림 제외)
+    unread_count = current_user.unread_notification_count
     
     return render_template('notifications/list.html',
                          notifications=notifications_page,
                          page=page,
                          per_page=per_page,
-                         total=total,
+                         has_next=len(rows) > per_page,
                          unread_count=unread_count)
 
 @app.route('/notifications/<int:notification_id>/read', methods=['POST'])
@@ -2962,13 +4912,9 @@ def mark_notification_as_read(notification_id):
 @app.route('/notifications/mark-all-read', methods=['POST'])
 @login_required
 def mark_all_notifications_read():
-    """모든 알림 읽음 처리"""
-    notifications = get_user_notifications(current_user.id, limit=None, unread_only=True)
-    
-    for notification in notifications:
-        mark_notification_read(notification.id, current_user.id)
-    
-    return jsonify({'success': True, 'count': len(notifications)})
+    """모든 알림 읽음 처리 (UPDATE 한 번)"""
+    count = mark_notifications_read(current_user.id)
+    return jsonify({'success': True, 'count': count})
 
 @app.route('/notifications/<int:notification_id>/delete', methods=['POST'])
 @login_required
@@ -3096,10 +5042,12 @@ def check_duplicate_daily_points():
                 print(f"    삭제: ID {record.id} (총점: {record.total_points})")
                 db.session.delete(record)
             
-            # 누적 포인트 재계산
+            # 누적 포인트 및 집계 재계산
             update_cumulative_points(child_id)
+            rebuild_points_rollup(child_id)
         
         db.session.commit()
+        app_cache.invalidate('points')
         print("✅ 중복 기록 정리 완료")
         
     except Exception as e:
@@ -3107,33 +5055,51 @@ def check_duplicate_daily_points():
         db.session.rollback()
 
 def validate_points_integrity():
-    """포인트 데이터 무결성 검증 및 자동 수정"""
+    """포인트 데이터 무결성 검증 및 자동 수정 (누적 포인트 대사)"""
     try:
         print("🔍 포인트 데이터 무결성 검증 시작...")
-        children = Child.query.all()
-        fixed_count = 0
+        fixed = reconcile_cumulative_points()
+        for child_id, name, stored, expected in fixed:
+            print(f"⚠️ {name}의 누적 포인트 불일치 발견")
+            print(f"  DB: {stored}, 계산: {expected}")
         
-        for child in children:
-            # 해당 아동의 모든 일일 포인트 합계 계산
-            calculated_total = db.session.query(
-                db.func.sum(DailyPoints.total_points)
-            ).filter_by(child_id=child.id).scalar() or 0
-            
-            if child.cumulative_points != calculated_total:
-                print(f"⚠️ {child.name}의 누적 포인트 불일치 발견")
-                print(f"  DB: {child.cumulative_points}, 계산: {calculated_total}")
-                child.cumulative_points = calculated_total
-                fixed_count += 1
-        
-        if fixed_count > 0:
-            db.session.commit()
-            print(f"🔧 총 {fixed_count}명의 누적 포인트가 자동으로 수정되었습니다.")
+        if fixed:
+            print(f"🔧 총 {len(fixed)}명의 누적 포인트가 자동으로 수정되었습니다.")
         else:
             print("✅ 모든 포인트 데이터가 정상입니다.")
+        return fixed
             
     except Exception as e:
         print(f"❌ 포인트 무결성 검증 오류: {e}")
         db.session.rollback()
+        return None
+
+def validate_points_rollup():
+    """포인트 집계 테이블 검증 및 자동 재생성 (DailyPoints 원본 기준 대사)"""
+    try:
+        rebuilt = reconcile_points_rollup()
+        if rebuilt:
+            print(f"🔧 포인트 집계가 원본과 달라 {len(rebuilt)}명의 집계를 다시 만들었습니다: {rebuilt}")
+        else:
+            print("✅ 포인트 집계가 원본과 일치합니다.")
+        return rebuilt
+    except Exception as e:
+        print(f"❌ 포인트 집계 검증 오류: {e}")
+        db.session.rollback()
+        return None
+
+def reconcile_points_job():
+    """누적 포인트/포인트 집계 대사 스케줄 작업 (매일 23:45)"""
+    with app.app_context():
+        validate_points_integrity()
+        validate_points_rollup()
+        db.session.remove()
+
+@app.cli.command('reconcile-points')
+def reconcile_points_command():
+    """누적 포인트와 포인트 집계를 일일 포인트 기준으로 검증/수정 (flask reconcile-points)"""
+    validate_points_integrity()
+    validate_points_rollup()
 
 # ==================== 백업 시스템 함수들 ====================
 
@@ -3144,7 +5110,7 @@ def create_backup_directory():
         os.makedirs(backup_dir)
     
     # 하위 디렉토리들 생성
-    subdirs = ['daily', 'monthly', 'realtime', 'database']
+    subdirs = ['daily', 'monthly', 'realtime', 'database', 'incremental']
     for subdir in subdirs:
         subdir_path = os.path.join(backup_dir, subdir)
         if not os.path.exists(subdir_path):
@@ -3152,78 +5118,75 @@ def create_backup_directory():
     
     return backup_dir
 
+def serialize_child(child):
+    return {
+        'id': child.id,
+        'name': child.name,
+        'grade': child.grade,
+        'cumulative_points': child.cumulative_points,
+        'cumulative_points_adjustment': child.cumulative_points_adjustment,
+        'created_at': child.created_at.isoformat() if child.created_at else None
+    }
+
+def serialize_daily_points(point):
+    return {
+        'id': point.id,
+        'child_id': point.child_id,
+        'date': point.date.isoformat() if point.date else None,
+        'korean_points': point.korean_points,
+        'math_points': point.math_points,
+        'ssen_points': point.ssen_points,
+        'reading_points': point.reading_points,
+        'total_points': point.total_points,
+        'created_by': point.created_by,
+        'created_at': point.created_at.isoformat() if point.created_at else None,
+        'updated_at': point.updated_at.isoformat() if point.updated_at else None
+    }
+
+def serialize_points_history(history):
+    return {
+        'id': history.id,
+        'child_id': history.child_id,
+        'date': history.date.isoformat() if history.date else None,
+        'old_korean_points': history.old_korean_points,
+        'old_math_points': history.old_math_points,
+        'old_ssen_points': history.old_ssen_points,
+        'old_reading_points': history.old_reading_points,
+        'old_total_points': history.old_total_points,
+        'new_korean_points': history.new_korean_points,
+        'new_math_points': history.new_math_points,
+        'new_ssen_points': history.new_ssen_points,
+        'new_reading_points': history.new_reading_points,
+        'new_total_points': history.new_total_points,
+        'change_type': history.change_type,
+        'changed_by': history.changed_by,
+        'changed_at': history.changed_at.isoformat() if history.changed_at else None,
+        'change_reason': history.change_reason
+    }
+
+def serialize_user(user):
+    return {
+        'id': user.id,
+        'username': user.username,
+        'name': user.name,
+        'role': user.role,
+        'created_at': user.created_at.isoformat() if user.created_at else None
+    }
+
 def get_backup_data():
     """백업할 데이터 수집"""
     try:
         # 아동 정보
-        children = Child.query.all()
-        children_data = []
-        for child in children:
-            child_dict = {
-                'id': child.id,
-                'name': child.name,
-                'grade': child.grade,
-                'cumulative_points': child.cumulative_points,
-                'created_at': child.created_at.isoformat() if child.created_at else None
-            }
-            children_data.append(child_dict)
+        children_data = [serialize_child(child) for child in Child.query.all()]
         
         # 일일 포인트 기록
-        daily_points = DailyPoints.query.all()
-        daily_points_data = []
-        for point in daily_points:
-            point_dict = {
-                'id': point.id,
-                'child_id': point.child_id,
-                'date': point.date.isoformat() if point.date else None,
-                'korean_points': point.korean_points,
-                'math_points': point.math_points,
-                'ssen_points': point.ssen_points,
-                'reading_points': point.reading_points,
-                'total_points': point.total_points,
-                'created_by': point.created_by,
-                'created_at': point.created_at.isoformat() if point.created_at else None,
-                'updated_at': point.updated_at.isoformat() if point.updated_at else None
-            }
-            daily_points_data.append(point_dict)
+        daily_points_data = [serialize_daily_points(point) for point in DailyPoints.query.all()]
         
         # 포인트 히스토리
-        points_history = PointsHistory.query.all()
-        history_data = []
-        for history in points_history:
-            history_dict = {
-                'id': history.id,
-                'child_id': history.child_id,
-                'date': history.date.isoformat() if history.date else None,
-                'old_korean_points': history.old_korean_points,
-                'old_math_points': history.old_math_points,
-                'old_ssen_points': history.old_ssen_points,
-                'old_reading_points': history.old_reading_points,
-                'old_total_points': history.old_total_points,
-                'new_korean_points': history.new_korean_points,
-                'new_math_points': history.new_math_points,
-                'new_ssen_points': history.new_ssen_points,
-                'new_reading_points': history.new_reading_points,
-                'new_total_points': history.new_total_points,
-                'change_type': history.change_type,
-                'changed_by': history.changed_by,
-                'changed_at': history.changed_at.isoformat() if history.changed_at else None,
-                'change_reason': history.change_reason
-            }
-            history_data.append(history_dict)
+        history_data = [serialize_points_history(history) for history in PointsHistory.query.all()]
         
         # 사용자 정보
-        users = User.query.all()
-        users_data = []
-        for user in users:
-            user_dict = {
-                'id': user.id,
-                'username': user.username,
-                'name': user.name,
-                'role': user.role,
-                'created_at': user.created_at.isoformat() if user.created_at else None
-            }
-            users_data.append(user_dict)
+        users_data = [serialize_user(user) for user in User.query.all()]
         
         backup_data = {
             'backup_metadata': {
@@ -3249,31 +5212,537 @@ def get_backup_data():
     except Exception as e:
         return None, str(e)
 
-def create_json_backup(backup_data, backup_dir, backup_type='manual'):
-    """JSON 형태로 백업 생성"""
+# ===== 백업 카탈로그 =====
+# 백업을 만드는 함수들이 결과물(NDJSON 디렉토리, Excel, DB 스냅샷, 증분 파일)마다 한 행씩 기록한다.
+# 목록/상태 조회는 디렉토리를 훑지 않고 이 테이블을 인덱스로 페이지 단위 조회한다.
+# DB 복원으로 카탈로그가 백업 시점으로 되돌아갈 수 있으므로 sync_backup_catalog()로 실제 파일과 다시 맞춘다.
+
+BACKUP_CATALOG_PER_PAGE = 50
+BACKUP_CATALOG_MAX_PER_PAGE = 200
+BACKUP_CATALOG_KINDS = ('json', 'excel', 'database', 'incremental')
+
+class BackupCatalog(db.Model):
+    """백업 결과물 목록 (백업 파일 하나 또는 NDJSON 디렉토리 하나당 한 행)"""
+    id = db.Column(db.Integer, primary_key=True)
+    backup_type = db.Column(db.String(20), nullable=False)  # 'realtime', 'daily', 'monthly', 'manual', 'incremental'
+    kind = db.Column(db.String(20), nullable=False)  # 'json', 'excel', 'database', 'incremental'
+    path = db.Column(db.String(255), nullable=False)  # backups/ 기준 상대 경로
+    size_bytes = db.Column(db.BigInteger, default=0)
+    row_counts = db.Column(db.Text)  # 테이블별 행 수 (JSON)
+    checksum = db.Column(db.String(64))  # sha256 (NDJSON 디렉토리는 manifest.json의 sha256)
+    db_version = db.Column(db.String(32))  # 백업 시점 Alembic 리비전
+    snapshot_id = db.Column(db.String(100))  # 중복 제거 저장소에 보관된 경우 스냅샷 ID
+    created_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_backup_catalog_type_created', 'backup_type', 'created_at'),
+        db.Index('ix_backup_catalog_created', 'created_at'),
+        db.Index('ix_backup_catalog_path', 'path'),
+        db.Index('ix_backup_catalog_snapshot', 'snapshot_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'filename': self.path,
+            'type': self.backup_type,
+            'kind': self.kind,
+            'size_mb': round((self.size_bytes or 0) / (1024 * 1024), 2),
+            'row_counts': json.loads(self.row_counts) if self.row_counts else None,
+            'checksum': self.checksum,
+            'db_version': self.db_version,
+            'snapshot_id': self.snapshot_id,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            # 저장소에 들어간 백업은 스냅샷 복원으로, 그 외 DB 파일은 파일명으로 바로 복원 가능
+            'restore_safe': self.kind == 'database'
+        }
+
+class BackupCatalogStats(db.Model):
+    """백업 종류별 카탈로그 합계 - 카탈로그가 바뀔 때 갱신해서 상태 조회 시 전체 집계를 하지 않음"""
+    backup_type = db.Column(db.String(20), primary_key=True)
+    entry_count = db.Column(db.Integer, default=0)
+    total_bytes = db.Column(db.BigInteger, default=0)
+    last_backup_at = db.Column(db.DateTime)
+    snapshot_count = db.Column(db.Integer, default=0)  # 중복 제거 저장소 스냅샷 수
+    snapshot_bytes = db.Column(db.BigInteger, default=0)  # 스냅샷에 들어간 파일 크기 합계 (논리 크기)
+
+def refresh_backup_catalog_stats(backup_types=None):
+    """지정한 백업 종류(None이면 전체)의 합계를 카탈로그에서 다시 계산 (커밋은 호출한 쪽에서)"""
+    query = db.session.query(
+        BackupCatalog.backup_type,
+        func.count(BackupCatalog.id),
+        func.coalesce(func.sum(BackupCatalog.size_bytes), 0),
+        func.max(BackupCatalog.created_at),
+        func.count(func.distinct(BackupCatalog.snapshot_id)),
+        func.coalesce(func.sum(db.case((BackupCatalog.snapshot_id.isnot(None), BackupCatalog.size_bytes), else_=0)), 0)
+    )
+    stats_query = BackupCatalogStats.query
+    if backup_types is not None:
+        backup_types = set(backup_types)
+        query = query.filter(BackupCatalog.backup_type.in_(backup_types))
+        stats_query = stats_query.filter(BackupCatalogStats.backup_type.in_(backup_types))
+    stats_query.delete(synchronize_session=False)
+    
+    for backup_type, count, total_bytes, last_at, snapshot_count, snapshot_bytes in query.group_by(BackupCatalog.backup_type):
+        db.session.add(BackupCatalogStats(
+            backup_type=backup_type, entry_count=count, total_bytes=total_bytes, last_backup_at=last_at,
+            snapshot_count=snapshot_count, snapshot_bytes=snapshot_bytes
+        ))
+
+def get_database_version(db_path=None):
+    """Alembic 리비전 (db_path를 주면 해당 SQLite 파일 기준, 마이그레이션 전이면 None)"""
     try:
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        
-        if backup_type == 'daily':
-            filename = f"{datetime.now().strftime('%Y-%m-%d')}_{timestamp.split('_')[1]}.json"
-            filepath = os.path.join(backup_dir, 'daily', filename)
-        elif backup_type == 'monthly':
-            filename = f"{datetime.now().strftime('%Y-%m')}_archive.json"
-            filepath = os.path.join(backup_dir, 'monthly', filename)
+        if db_path:
+            connection = sqlite3.connect(db_path)
+            try:
+                row = connection.execute('SELECT version_num FROM alembic_version').fetchone()
+            finally:
+                connection.close()
         else:
-            filename = f"{timestamp}.json"
-            filepath = os.path.join(backup_dir, 'realtime', filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, ensure_ascii=False, indent=2)
+            row = db.session.execute(text('SELECT version_num FROM alembic_version')).fetchone()
+        return row[0] if row else None
+    except Exception:
+        if not db_path:
+            db.session.rollback()
+        return None
+
+def count_sqlite_rows(db_path):
+    """SQLite 백업 파일의 주요 테이블 행 수"""
+    connection = sqlite3.connect(db_path)
+    try:
+        return {
+            table_name: connection.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table_name, table in (('children', 'child'), ('daily_points', 'daily_points'),
+                                      ('points_history', 'points_history'), ('users', 'user'))
+        }
+    except sqlite3.Error:
+        return None
+    finally:
+        connection.close()
+
+def file_sha256(filepath):
+    checksum = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+def get_backup_path_size(path):
+    """파일 크기 또는 디렉토리 안 파일 크기 합계"""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, filename))
+               for root, _, filenames in os.walk(path) for filename in filenames)
+
+def get_backup_relative_path(path):
+    return os.path.relpath(path, create_backup_directory()).replace(os.sep, '/')
+
+def record_backup_catalog(backup_type, kind, path, row_counts=None, checksum=None, db_version=None, created_at=None):
+    """백업 결과물을 카탈로그에 기록
+
+    카탈로그 기록 실패로 백업 자체가 실패하지 않도록 오류는 출력만 한다.
+    """
+    try:
+        relative_path = get_backup_relative_path(path)
+        if checksum is None and not os.path.isdir(path):
+            checksum = file_sha256(path)
+        
+        # 같은 이름으로 덮어쓴 파일(월간 아카이브 등)은 이전 기록을 교체
+        BackupCatalog.query.filter(BackupCatalog.path == relative_path,
+                                   BackupCatalog.snapshot_id.is_(None)).delete(synchronize_session=False)
+        entry = BackupCatalog(
+            backup_type=backup_type,
+            kind=kind,
+            path=relative_path,
+            size_bytes=get_backup_path_size(path),
+            row_counts=json.dumps(row_counts) if row_counts is not None else None,
+            checksum=checksum,
+            db_version=db_version if db_version is not None else get_database_version(),
+            created_at=created_at or datetime.now()
+        )
+        db.session.add(entry)
+        db.session.flush()
+        refresh_backup_catalog_stats([backup_type])
+        db.session.commit()
+        return entry
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ 백업 카탈로그 기록 실패: {e}")
+        return None
+
+def query_backup_catalog(backup_type=None, kind=None, date_from=None, date_to=None):
+    """필터를 적용한 카탈로그 조회 (최신순)"""
+    query = BackupCatalog.query
+    if backup_type:
+        query = query.filter(BackupCatalog.backup_type == backup_type)
+    if kind:
+        query = query.filter(BackupCatalog.kind == kind)
+    if date_from:
+        query = query.filter(BackupCatalog.created_at >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        query = query.filter(BackupCatalog.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    return query.order_by(BackupCatalog.created_at.desc(), BackupCatalog.id.desc())
+
+def parse_backup_catalog_filters(args):
+    """요청 인자에서 카탈로그 필터 추출 (필터, 오류 메시지) 반환"""
+    filters = {
+        'backup_type': args.get('type') or None,
+        'kind': args.get('kind') or None,
+        'date_from': None,
+        'date_to': None
+    }
+    if filters['kind'] and filters['kind'] not in BACKUP_CATALOG_KINDS:
+        return filters, f"지원하지 않는 백업 종류입니다: {filters['kind']}"
+    for key in ('date_from', 'date_to'):
+        if args.get(key):
+            try:
+                filters[key] = datetime.strptime(args[key], '%Y-%m-%d').date()
+            except ValueError:
+                return filters, f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {args[key]}"
+    return filters, None
+
+def backup_catalog_summary():
+    """백업 종류별 개수와 크기 합계 (미리 계산된 합계 테이블 조회)"""
+    return {
+        stats.backup_type: {
+            'count': stats.entry_count,
+            'size_mb': round((stats.total_bytes or 0) / (1024 * 1024), 2),
+            'last_backup_at': stats.last_backup_at.strftime('%Y-%m-%d %H:%M:%S') if stats.last_backup_at else None
+        }
+        for stats in BackupCatalogStats.query.all()
+    }
+
+def get_backup_kind(name):
+    if name.endswith('.db'):
+        return 'database'
+    if name.endswith('.xlsx'):
+        return 'excel'
+    return 'json'
+
+def get_backup_type_from_name(name):
+    for backup_type in ('realtime', 'daily', 'monthly', 'manual'):
+        if backup_type in name:
+            return backup_type
+    return 'unknown'
+
+def sync_backup_catalog():
+    """실제 백업 파일/스냅샷과 카탈로그를 다시 맞춤 (추가한 행 수, 삭제한 행 수 반환)
+
+    DB 복원 후나 카탈로그 도입 전 백업을 등록할 때 사용하며, 디렉토리를 모두 훑으므로 요청 처리 중에는 부르지 않는다.
+    """
+    backup_dir = create_backup_directory()
+    found = {}
+    
+    # 1. 디스크에 남아 있는 백업 파일
+    for subdir in ('', 'realtime', 'daily', 'monthly', 'database'):
+        subdir_path = os.path.join(backup_dir, subdir)
+        for name in os.listdir(subdir_path):
+            path = os.path.join(subdir_path, name)
+            if os.path.isdir(path):
+                if not os.path.exists(os.path.join(path, 'manifest.json')):
+                    continue  # 하위 디렉토리 또는 미완성 NDJSON 백업
+            elif not name.endswith(('.json', '.xlsx', '.db')):
+                continue
+            relative_path = get_backup_relative_path(path)
+            backup_type = subdir if subdir in ('daily', 'monthly') else get_backup_type_from_name(name)
+            if backup_type == 'unknown' and subdir == 'realtime':
+                backup_type = 'realtime'
+            found[(relative_path, None)] = (backup_type, get_backup_kind(name), path, None)
+    
+    incremental_dir = get_incremental_backup_dir()
+    for entry in load_backup_manifest()['entries']:
+        path = os.path.join(incremental_dir, entry['file'])
+        if os.path.exists(path):
+            found[(get_backup_relative_path(path), None)] = ('incremental', 'incremental', path, entry)
+    
+    # 2. 중복 제거 저장소 스냅샷 (파일은 청크로만 존재하므로 매니페스트 정보 사용)
+    snapshot_subdirs = {'daily': 'daily', 'monthly': 'monthly'}
+    for manifest in list_backup_snapshots():
+        artifacts = {}
+        for file_info in manifest['files']:
+            top = file_info['path'].split('/')[0]
+            artifact = artifacts.setdefault(top, {'size': 0, 'checksum': None})
+            artifact['size'] += file_info['size']
+            if file_info['path'] == top or file_info['path'].endswith('/manifest.json'):
+                artifact['checksum'] = file_info['sha256']
+        for top, artifact in artifacts.items():
+            kind = get_backup_kind(top)
+            subdir = 'database' if kind == 'database' else snapshot_subdirs.get(manifest['backup_type'], 'realtime')
+            found[(f"{subdir}/{top}", manifest['snapshot_id'])] = (manifest['backup_type'], kind, None, (manifest, artifact))
+    
+    existing = {(entry.path, entry.snapshot_id): entry for entry in BackupCatalog.query.all()}
+    removed = 0
+    for key, entry in existing.items():
+        if key not in found:
+            db.session.delete(entry)
+            removed += 1
+    
+    added = 0
+    for key, (backup_type, kind, path, extra) in found.items():
+        if key in existing:
+            continue
+        relative_path, snapshot_id = key
+        if snapshot_id:
+            manifest, artifact = extra
+            db.session.add(BackupCatalog(
+                backup_type=backup_type, kind=kind, path=relative_path, size_bytes=artifact['size'],
+                checksum=artifact['checksum'], snapshot_id=snapshot_id,
+                created_at=datetime.fromisoformat(manifest['created_at'])
+            ))
+        else:
+            row_counts = None
+            checksum = None
+            db_version = None
+            if kind == 'incremental':
+                row_counts = extra['records_count']
+            elif kind == 'database':
+                row_counts = count_sqlite_rows(path)
+                db_version = get_database_version(path)
+            elif os.path.isdir(path):
+                with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+                    row_counts = json.load(f).get('records_count')
+                checksum = file_sha256(os.path.join(path, 'manifest.json'))
+            db.session.add(BackupCatalog(
+                backup_type=backup_type, kind=kind, path=relative_path, size_bytes=get_backup_path_size(path),
+                row_counts=json.dumps(row_counts) if row_counts is not None else None,
+                checksum=checksum or file_sha256(path), db_version=db_version,
+                created_at=datetime.fromtimestamp(os.path.getmtime(path))
+            ))
+        added += 1
+    
+    db.session.flush()
+    refresh_backup_catalog_stats()
+    db.session.commit()
+    return added, removed
+
+@app.cli.command('sync-backup-catalog')
+def sync_backup_catalog_command():
+    """백업 파일/스냅샷을 훑어서 카탈로그를 다시 맞춤 (flask sync-backup-catalog)"""
+    added, removed = sync_backup_catalog()
+    print(f"✅ 백업 카탈로그 동기화 완료: {added}개 추가, {removed}개 삭제")
+
+# ===== 스트리밍 JSON(NDJSON) 백업 =====
+# 테이블별로 yield_per 커서를 돌면서 한 줄에 한 행씩 바로 파일에 쓰므로
+# 행 수와 관계없이 메모리 사용량이 일정하다. 디렉토리마다 manifest.json에 파일별 sha256을 기록한다.
+
+BACKUP_STREAM_BATCH_SIZE = 1000
+BACKUP_COMPRESSION_EXTENSIONS = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+def get_backup_stream_tables():
+    return [
+        ('children', Child, serialize_child),
+        ('daily_points', DailyPoints, serialize_daily_points),
+        ('points_history', PointsHistory, serialize_points_history),
+        ('users', User, serialize_user)
+    ]
+
+class HashingWriter:
+    """기록되는 바이트의 sha256과 크기를 함께 계산하는 파일 래퍼"""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+    def close(self):
+        pass  # 실제 파일은 호출한 쪽에서 닫음
+
+def write_ndjson_table(filepath, query, serializer, compression):
+    """쿼리 결과를 NDJSON으로 스트리밍 저장 후 (행 수, 바이트 수, sha256) 반환
+
+    ORM 객체를 만들지 않도록 컬럼 단위로 조회한 행을 그대로 serializer에 넘긴다.
+    """
+    with open(filepath, 'wb') as raw_file:
+        hashing_file = HashingWriter(raw_file)
+        if compression == 'gzip':
+            writer = gzip.GzipFile(filename='', mode='wb', fileobj=hashing_file)
+        elif compression == 'zstd':
+            writer = zstandard.ZstdCompressor().stream_writer(hashing_file)
+        else:
+            writer = hashing_file
+        
+        rows = 0
+        lines = []
+        for row in query.yield_per(BACKUP_STREAM_BATCH_SIZE):
+            lines.append(json.dumps(serializer(row), ensure_ascii=False))
+            rows += 1
+            if len(lines) >= BACKUP_STREAM_BATCH_SIZE:
+                writer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+                lines = []
+        if lines:
+            writer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        
+        if writer is not hashing_file:
+            writer.close()
+    
+    return rows, hashing_file.size, hashing_file.sha256.hexdigest()
+
+def create_streaming_backup(backup_dir, backup_type='manual', compression=None):
+    """테이블별 NDJSON 스트리밍 백업 생성 (백업 디렉토리 경로 반환)"""
+    try:
+        if compression is None:
+            # 저장소에 넣을 파일은 청크 단위로 압축되므로 중복 제거가 되도록 원본 그대로 기록
+            compression = 'none' if app.config['BACKUP_STORE_ENABLED'] else app.config['BACKUP_COMPRESSION']
+        if compression not in BACKUP_COMPRESSION_EXTENSIONS:
+            return None, f"지원하지 않는 압축 방식입니다: {compression}"
+        if compression == 'zstd' and not BACKUP_ZSTD_AVAILABLE:
+            return None, "zstd 압축을 위한 zstandard 패키지가 설치되지 않았습니다."
         
-        return filepath, None
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        
+        if backup_type == 'daily':
+            dirname = f"{datetime.now().strftime('%Y-%m-%d')}_{timestamp.split('_')[1]}"
+            export_dir = os.path.join(backup_dir, 'daily', dirname)
+        elif backup_type == 'monthly':
+            dirname = f"{datetime.now().strftime('%Y-%m')}_archive"
+            export_dir = os.path.join(backup_dir, 'monthly', dirname)
+        else:
+            export_dir = os.path.join(backup_dir, 'realtime', timestamp)
+        os.makedirs(export_dir, exist_ok=True)
+        
+        extension = '.ndjson' + BACKUP_COMPRESSION_EXTENSIONS[compression]
+        files = {}
+        for table_name, model, serializer in get_backup_stream_tables():
+            filename = f"{table_name}{extension}"
+            rows, size, checksum = write_ndjson_table(
+                os.path.join(export_dir, filename),
+                db.session.query(*model.__table__.columns).order_by(model.id),
+                serializer,
+                compression
+            )
+            files[table_name] = {'file': filename, 'rows': rows, 'bytes': size, 'sha256': checksum}
+        
+        # 매니페스트는 마지막에 기록 (매니페스트가 없으면 미완성 백업)
+        manifest = {
+            'backup_id': os.path.basename(export_dir),
+            'backup_type': backup_type,
+            'timestamp': datetime.now().isoformat(),
+            'data_version': '1.0.0',
+            'format': 'ndjson',
+            'compression': compression,
+            'records_count': {table_name: info['rows'] for table_name, info in files.items()},
+            'files': files
+        }
+        manifest_path = os.path.join(export_dir, 'manifest.json')
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        
+        record_backup_catalog(backup_type, 'json', export_dir,
+                              row_counts=manifest['records_count'], checksum=file_sha256(manifest_path))
+        return export_dir, None
         
     except Exception as e:
         return None, str(e)
 
-def create_excel_backup(backup_data, backup_dir, backup_type='manual'):
-    """Excel 형태로 백업 생성"""
+def verify_streaming_backup(export_dir):
+    """매니페스트의 sha256과 실제 파일 비교 (불일치 파일 목록 반환)"""
+    with open(os.path.join(export_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    mismatched = []
+    for table_name, info in manifest['files'].items():
+        checksum = hashlib.sha256()
+        with open(os.path.join(export_dir, info['file']), 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                checksum.update(chunk)
+        if checksum.hexdigest() != info['sha256']:
+            mismatched.append(info['file'])
+    return mismatched
+
+# ===== 스트리밍 Excel 내보내기 =====
+# write-only 워크시트에 DB 커서에서 배치 단위로 읽은 행을 바로 기록한다.
+# 워크북 전체를 메모리에 올리지 않으므로 백업 스레드와 다운로드 요청 모두에서 사용할 수 있다.
+
+EXCEL_EXPORT_BATCH_SIZE = 2000
+
+def excel_value(value):
+    """날짜/시간은 기존 Excel 백업과 같이 ISO 문자열로 기록"""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+def write_excel_workbook(target, sheets):
+    """write-only 모드로 Excel 파일 작성
+
+    sheets는 (시트명, 헤더, 행 iterable)을 순서대로 내놓는 iterable이며,
+    각 시트를 다 쓴 다음에 다음 시트를 꺼내므로 앞 시트의 결과(행 수 등)를 뒤 시트에서 쓸 수 있다.
+    """
+    wb = Workbook(write_only=True)
+    
+    for title, headers, rows in sheets:
+        ws = wb.create_sheet(title)
+        if headers:
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = Font(bold=True)
+                cell.alignment = Alignment(horizontal='center')
+                header_cells.append(cell)
+            ws.append(header_cells)
+        for row in rows:
+            ws.append([excel_value(value) for value in row])
+    
+    wb.save(target)
+
+def iter_query_rows(query, counts=None, key=None):
+    """쿼리 결과를 배치 단위로 읽어 튜플로 반환 (counts[key]에 행 수 누적)"""
+    for row in query.yield_per(EXCEL_EXPORT_BATCH_SIZE):
+        if counts is not None:
+            counts[key] = counts.get(key, 0) + 1
+        yield tuple(row)
+
+def get_excel_backup_sheets(backup_type, counts=None):
+    """Excel 백업 시트 구성 (기존 백업 파일과 같은 시트/컬럼, counts에 시트별 행 수 기록)"""
+    if counts is None:
+        counts = {}
+    counts.update(dict.fromkeys(['children', 'daily_points', 'points_history', 'users'], 0))
+    
+    yield ('아동정보', ['ID', '이름', '학년', '누적포인트', '생성일'], iter_query_rows(
+        db.session.query(Child.id, Child.name, Child.grade, Child.cumulative_points, Child.created_at)
+                  .order_by(Child.id),
+        counts, 'children'))
+    
+    yield ('포인트기록', ['ID', '아동ID', '날짜', '국어', '수학', '쎈수학', '독서', '총점', '입력자', '생성일'], iter_query_rows(
+        db.session.query(DailyPoints.id, DailyPoints.child_id, DailyPoints.date,
+                         DailyPoints.korean_points, DailyPoints.math_points, DailyPoints.ssen_points,
+                         DailyPoints.reading_points, DailyPoints.total_points,
+                         DailyPoints.created_by, DailyPoints.created_at)
+                  .order_by(DailyPoints.id),
+        counts, 'daily_points'))
+    
+    yield ('포인트변경이력', ['ID', '아동ID', '날짜', '변경타입', '변경자', '변경일', '변경사유'], iter_query_rows(
+        db.session.query(PointsHistory.id, PointsHistory.child_id, PointsHistory.date,
+                         PointsHistory.change_type, PointsHistory.changed_by,
+                         PointsHistory.changed_at, PointsHistory.change_reason)
+                  .order_by(PointsHistory.id),
+        counts, 'points_history'))
+    
+    yield ('사용자정보', ['ID', '사용자명', '이름', '권한', '생성일'], iter_query_rows(
+        db.session.query(User.id, User.username, User.name, User.role, User.created_at)
+                  .order_by(User.id),
+        counts, 'users'))
+    
+    # 앞 시트를 모두 쓴 뒤에 평가되므로 실제 기록된 행 수가 들어감
+    yield ('백업메타데이터', ['백업ID', datetime.now().strftime('%Y-%m-%d_%H-%M-%S')], [
+        ['백업타입', backup_type],
+        ['백업시간', datetime.now().isoformat()],
+        ['데이터버전', '1.0.0'],
+        ['아동수', counts['children']],
+        ['포인트기록수', counts['daily_points']],
+        ['변경이력수', counts['points_history']],
+        ['사용자수', counts['users']]
+    ])
+
+def create_excel_backup(backup_dir, backup_type='manual'):
+    """Excel 형태로 백업 생성 (write-only 스트리밍)"""
     if not BACKUP_EXCEL_AVAILABLE:
         print("❌ Excel 백업을 위한 패키지가 설치되지 않았습니다.")
         return None, "pandas 또는 openpyxl 패키지가 설치되지 않았습니다."
@@ -3291,127 +5760,80 @@ def create_excel_backup(backup_data, backup_dir, backup_type='manual'):
             filename = f"{timestamp}.xlsx"
             filepath = os.path.join(backup_dir, 'realtime', filename)
         
-        # Excel 워크북 생성
-        wb = Workbook()
-        
-        # 아동 정보 시트
-        ws_children = wb.active
-        ws_children.title = "아동정보"
-        ws_children.append(['ID', '이름', '학년', '누적포인트', '생성일'])
-        
-        for child in backup_data['children']:
-            ws_children.append([
-                child['id'],
-                child['name'],
-                child['grade'],
-                child['cumulative_points'],
-                child['created_at']
-            ])
-        
-        # 포인트 기록 시트
-        ws_points = wb.create_sheet("포인트기록")
-        ws_points.append(['ID', '아동ID', '날짜', '국어', '수학', '쎈수학', '독서', '총점', '입력자', '생성일'])
-        
-        for point in backup_data['daily_points']:
-            ws_points.append([
-                point['id'],
-                point['child_id'],
-                point['date'],
-                point['korean_points'],
-                point['math_points'],
-                point['ssen_points'],
-                point['reading_points'],
-                point['total_points'],
-                point['created_by'],
-                point['created_at']
-            ])
-        
-        # 포인트 히스토리 시트
-        ws_history = wb.create_sheet("포인트변경이력")
-        ws_history.append(['ID', '아동ID', '날짜', '변경타입', '변경자', '변경일', '변경사유'])
-        
-        for history in backup_data['points_history']:
-            ws_history.append([
-                history['id'],
-                history['child_id'],
-                history['date'],
-                history['change_type'],
-                history['changed_by'],
-                history['changed_at'],
-                history['change_reason']
-            ])
-        
-        # 사용자 정보 시트
-        ws_users = wb.create_sheet("사용자정보")
-        ws_users.append(['ID', '사용자명', '이름', '권한', '생성일'])
-        
-        for user in backup_data['users']:
-            ws_users.append([
-                user['id'],
-                user['username'],
-                user['name'],
-                user['role'],
-                user['created_at']
-            ])
-        
-        # 메타데이터 시트
-        ws_meta = wb.create_sheet("백업메타데이터")
-        meta = backup_data['backup_metadata']
-        ws_meta.append(['백업ID', meta['backup_id']])
-        ws_meta.append(['백업타입', meta['backup_type']])
-        ws_meta.append(['백업시간', meta['timestamp']])
-        ws_meta.append(['데이터버전', meta['data_version']])
-        ws_meta.append(['아동수', meta['records_count']['children']])
-        ws_meta.append(['포인트기록수', meta['records_count']['daily_points']])
-        ws_meta.append(['변경이력수', meta['records_count']['points_history']])
-        ws_meta.append(['사용자수', meta['records_count']['users']])
-        
-        # 스타일 적용
-        for ws in [ws_children, ws_points, ws_history, ws_users, ws_meta]:
-            for row in ws.iter_rows(min_row=1, max_row=1):
-                for cell in row:
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center')
-        
-        # 파일 저장
-        wb.save(filepath)
+        counts = {}
+        write_excel_workbook(filepath, get_excel_backup_sheets(backup_type, counts))
         
+        record_backup_catalog(backup_type, 'excel', filepath, row_counts=counts)
         return filepath, None
         
     except Exception as e:
         return None, str(e)
 
+def get_period_report_sheets(start, end):
+    """기간별 리포트 Excel 시트 구성 (학습 기록 + 포인트 기록)"""
+    yield ('학습기록', ['날짜', '아동ID', '이름', '학년', '국어 점수', '국어 페이지', '수학 점수', '수학 페이지', '독서 점수', '총점'], iter_query_rows(
+        db.session.query(LearningRecord.date, Child.id, Child.name, Child.grade,
+                         LearningRecord.korean_score, LearningRecord.korean_last_page,
+                         LearningRecord.math_score, LearningRecord.math_last_page,
+                         LearningRecord.reading_score, LearningRecord.total_score)
+                  .join(Child, Child.id == LearningRecord.child_id)
+                  .filter(LearningRecord.date >= start, LearningRecord.date <= end)
+                  .order_by(LearningRecord.date, Child.grade, Child.id)))
+    
+    yield ('포인트기록', ['날짜', '아동ID', '이름', '학년', '국어', '수학', '쎈수학', '독서', '총점'], iter_query_rows(
+        db.session.query(DailyPoints.date, Child.id, Child.name, Child.grade,
+                         DailyPoints.korean_points, DailyPoints.math_points, DailyPoints.ssen_points,
+                         DailyPoints.reading_points, DailyPoints.total_points)
+                  .join(Child, Child.id == DailyPoints.child_id)
+                  .filter(DailyPoints.date >= start, DailyPoints.date <= end)
+                  .order_by(DailyPoints.date, Child.grade, Child.id)))
+
 def realtime_backup(child_id, action_type):
     """실시간 백업 실행 (포인트 입력 시)"""
     try:
+        if app.config['REALTIME_BACKUP_MODE'] == 'incremental':
+            delta_path, error = create_incremental_backup()
+            if error:
+                error_msg = f"실시간 증분 백업 생성 실패: {error}"
+                print(f"❌ {error_msg}")
+                create_backup_notification('실시간', 'failed', error_msg)
+                return False
+            
+            success_msg = f"실시간 증분 백업 완료 - {action_type}: {os.path.basename(delta_path)}"
+            print(f"✅ {success_msg}")
+            create_backup_notification('실시간', 'success', success_msg)
+            return True
+        
         # 백업 디렉토리 생성
         backup_dir = create_backup_directory()
         
-        # 백업 데이터 수집
-        backup_data, error = get_backup_data()
+        # JSON 백업 생성
+        json_path, error = create_streaming_backup(backup_dir, 'realtime')
         if error:
-            error_msg = f"실시간 백업 데이터 수집 실패: {error}"
+            error_msg = f"실시간 JSON 백업 생성 실패: {error}"
             print(f"❌ {error_msg}")
             create_backup_notification('실시간', 'failed', error_msg)
             return False
         
-        # JSON 백업 생성
-        json_path, error = create_json_backup(backup_data, backup_dir, 'realtime')
+        # Excel 백업 생성
+        excel_path, error = create_excel_backup(backup_dir, 'realtime')
         if error:
-            error_msg = f"실시간 JSON 백업 생성 실패: {error}"
+            error_msg = f"실시간 Excel 백업 생성 실패: {error}"
             print(f"❌ {error_msg}")
             create_backup_notification('실시간', 'failed', error_msg)
             return False
         
-        # Excel 백업 생성
-        excel_path, error = create_excel_backup(backup_data, backup_dir, 'realtime')
+        # 중복 제거 저장소에 스냅샷으로 보관
+        snapshot_id, error = store_backup_snapshot('realtime', [json_path, excel_path])
         if error:
-            error_msg = f"실시간 Excel 백업 생성 실패: {error}"
+            error_msg = f"실시간 백업 스냅샷 저장 실패: {error}"
             print(f"❌ {error_msg}")
             create_backup_notification('실시간', 'failed', error_msg)
             return False
         
         success_msg = f"실시간 백업 완료 - {action_type}: {os.path.basename(json_path)}, {os.path.basename(excel_path)}"
+        if snapshot_id:
+            success_msg += f" (스냅샷 {snapshot_id})"
         print(f"✅ {success_msg}")
         create_backup_notification('실시간', 'success', success_msg)
         return True
@@ -3422,13 +5844,170 @@ def realtime_backup(child_id, action_type):
         create_backup_notification('실시간', 'failed', error_msg)
         return False
 
+class RealtimeBackupWorker:
+    """실시간 백업 요청을 큐에 모아 단일 백그라운드 스레드에서 처리
+
+    첫 요청이 들어온 뒤 window초 동안 쌓인 요청은 한 번의 스냅샷으로 합친다.
+    포인트 입력 요청은 큐에 넣기만 하고 바로 반환된다.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pending_count = 0  # 현재 묶음에 모인(아직 백업 전) 요청 수
+        self.processed_count = 0
+        self.snapshot_count = 0
+        self.last_success_at = None
+        self.last_failure_at = None
+        self.last_error = None
+
+    def start(self):
+        """워커 스레드 시작 (이미 실행 중이면 무시)"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='realtime-backup-worker', daemon=True)
+                self.thread.start()
+
+    def enqueue(self, child_id, action_type):
+        """백업 요청 등록 (즉시 반환)"""
+        self.start()
+        self.queue.put((child_id, action_type))
+
+    def enqueue_many(self, child_ids, action_type):
+        """여러 아동의 백업 요청을 한 번에 등록 (같은 묶음으로 합쳐져 백업은 한 번)"""
+        self.start()
+        for child_id in child_ids:
+            self.queue.put((child_id, action_type))
+
+    def collect_batch(self):
+        """첫 요청부터 window초 동안 들어온 요청을 모아서 반환"""
+        batch = [self.queue.get()]
+        self.pending_count = 1
+        deadline = time.monotonic() + self.window
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+                self.pending_count = len(batch)
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        while True:
+            batch = self.collect_batch()
+            action_counts = {}
+            for _, action_type in batch:
+                action_counts[action_type] = action_counts.get(action_type, 0) + 1
+            child_ids = {child_id for child_id, _ in batch}
+            summary = ', '.join(f"{action} {count}건" for action, count in action_counts.items())
+            summary = f"{summary} (아동 {len(child_ids)}명)"
+
+            error = None
+            try:
+                with app.app_context():
+                    success = realtime_backup(batch[-1][0], summary)
+                    db.session.remove()
+                if not success:
+                    error = '실시간 백업 실패 (백업 알림 참고)'
+            except Exception as e:
+                print(f"❌ 실시간 백업 워커 오류: {e}")
+                success = False
+                error = str(e)
+
+            with self.lock:
+                self.pending_count = 0
+                self.processed_count += len(batch)
+                if success:
+                    self.snapshot_count += 1
+                    self.last_success_at = datetime.now()
+                else:
+                    self.last_failure_at = datetime.now()
+                    self.last_error = error
+
+    def status(self):
+        """/backup/status 표시용 상태"""
+        return {
+            'window_seconds': self.window,
+            'queue_depth': self.queue.qsize() + self.pending_count,
+            'running': self.thread is not None and self.thread.is_alive(),
+            'processed_requests': self.processed_count,
+            'snapshots': self.snapshot_count,
+            'last_success_at': self.last_success_at.strftime('%Y-%m-%d %H:%M:%S') if self.last_success_at else None,
+            'last_failure_at': self.last_failure_at.strftime('%Y-%m-%d %H:%M:%S') if self.last_failure_at else None,
+            'last_error': self.last_error
+        }
+
+realtime_backup_worker = RealtimeBackupWorker(app.config['REALTIME_BACKUP_WINDOW'])
+
+# ===== SQLite 온라인 백업 =====
+# 실행 중인 DB 파일을 shutil로 복사하면 쓰기 도중의 깨진 사본이 생길 수 있으므로
+# SQLite 백업 API로 몇 페이지씩 나눠 복사한다 (단계 사이에 다른 연결이 쓰기 가능).
+
+SQLITE_BACKUP_PAGES = 256      # 한 번에 복사할 페이지 수
+SQLITE_BACKUP_SLEEP = 0.01     # 단계 사이 대기 시간 (초)
+
+# 마지막 DB 스냅샷 결과 (/backup/status 표시용)
+last_database_backup_stats = {}
+
+def get_sqlite_database_path():
+    """현재 앱이 사용하는 SQLite DB 파일 경로 (SQLite가 아니면 None)"""
+    url = db.engine.url
+    if url.get_backend_name() != 'sqlite' or not url.database or url.database == ':memory:':
+        return None
+    return url.database
+
+def check_sqlite_integrity(db_path):
+    """PRAGMA integrity_check 결과 ('ok' 또는 첫 번째 오류 메시지)"""
+    connection = sqlite3.connect(db_path)
+    try:
+        result = connection.execute('PRAGMA integrity_check').fetchone()
+        return result[0] if result else 'no result'
+    finally:
+        connection.close()
+
+def copy_sqlite_database(source_path, target_path, method='backup'):
+    """SQLite 백업 API(또는 VACUUM INTO)로 DB 복사 후 무결성 검사와 처리량 반환
+
+    복원할 때는 source/target을 바꿔서 같은 방식으로 실행 중인 DB에 덮어쓴다.
+    """
+    start = time.perf_counter()
+    source = sqlite3.connect(source_path, timeout=30)
+    try:
+        if method == 'vacuum':
+            if os.path.exists(target_path):
+                os.remove(target_path)
+            source.execute('VACUUM INTO ?', (target_path,))
+        else:
+            target = sqlite3.connect(target_path, timeout=30)
+            try:
+                source.backup(target, pages=SQLITE_BACKUP_PAGES, sleep=SQLITE_BACKUP_SLEEP)
+            finally:
+                target.close()
+    finally:
+        source.close()
+    elapsed = time.perf_counter() - start
+    
+    size = os.path.getsize(target_path)
+    return {
+        'method': method,
+        'bytes': size,
+        'seconds': round(elapsed, 3),
+        'mb_per_second': round(size / (1024 * 1024) / elapsed, 1) if elapsed > 0 else None,
+        'integrity': check_sqlite_integrity(target_path)
+    }
+
 def create_database_backup(backup_dir, backup_type='manual'):
-    """데이터베이스 파일 백업"""
+    """데이터베이스 스냅샷 백업 (SQLite 온라인 백업 API)"""
     try:
         # 현재 DB 파일 경로
-        db_path = os.path.join(os.path.dirname(__file__), 'instance', 'child_center.db')
+        db_path = get_sqlite_database_path()
         
-        if not os.path.exists(db_path):
+        if not db_path or not os.path.exists(db_path):
             return None, "데이터베이스 파일을 찾을 수 없습니다"
         
         # 백업 파일명
@@ -3436,14 +6015,709 @@ def create_database_backup(backup_dir, backup_type='manual'):
         backup_filename = f"{datetime.now().strftime('%Y-%m-%d')}_{timestamp.split('_')[1]}_{backup_type}.db"
         backup_path = os.path.join(backup_dir, 'database', backup_filename)
         
-        # 파일 복사
-        shutil.copy2(db_path, backup_path)
+        # 임시 파일에 복사하고 무결성 검사를 통과해야 백업 파일로 확정
+        temp_path = backup_path + '.tmp'
+        stats = copy_sqlite_database(db_path, temp_path, app.config['DB_BACKUP_METHOD'])
+        if stats['integrity'] != 'ok':
+            os.remove(temp_path)
+            return None, f"백업 무결성 검사 실패: {stats['integrity']}"
+        # 행 수와 리비전은 실행 중인 DB가 아니라 만들어진 스냅샷에서 읽어야 서로 맞음
+        row_counts = count_sqlite_rows(temp_path)
+        db_version = get_database_version(temp_path)
+        os.replace(temp_path, backup_path)
+        record_backup_catalog(backup_type, 'database', backup_path, row_counts=row_counts, db_version=db_version)
+        
+        last_database_backup_stats.clear()
+        last_database_backup_stats.update(stats, file=backup_filename, finished_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        print(f"💾 DB 스냅샷 완료 ({stats['method']}): {stats['bytes'] / (1024 * 1024):.1f}MB, "
+              f"{stats['seconds']}초 ({stats['mb_per_second']}MB/s), 무결성 {stats['integrity']}")
         
         return backup_path, None
         
     except Exception as e:
         return None, str(e)
 
+# ===== 중복 제거 백업 저장소 =====
+# 백업 파일을 청크로 나눠 sha256 이름으로 한 번만 저장하고(backups/store/chunks),
+# 스냅샷은 청크 목록만 가진 매니페스트(backups/store/snapshots)로 남긴다.
+# 텍스트(NDJSON/JSON)는 줄 단위 내용 기반 경계로, 그 외(DB/Excel)는 고정 크기로 자른다.
+
+BACKUP_STORE_CHUNK_SIZE = 64 * 1024            # 고정 청크 크기 (SQLite 페이지 크기의 배수)
+BACKUP_STORE_MIN_TEXT_CHUNK = 16 * 1024
+BACKUP_STORE_MAX_TEXT_CHUNK = 256 * 1024
+BACKUP_STORE_BOUNDARY_MASK = 0x1F              # 줄 해시 하위 5비트가 0이면 청크 경계
+BACKUP_STORE_TEXT_EXTENSIONS = ('.ndjson', '.json', '.csv')
+BACKUP_STORE_GC_GRACE = timedelta(minutes=10)  # 저장 중인 청크를 지우지 않도록 최근 청크는 유지
+
+# 스냅샷 저장과 GC가 겹치지 않도록
+backup_store_lock = threading.Lock()
+
+def get_backup_store_dir(*parts):
+    store_dir = os.path.join(create_backup_directory(), 'store', *parts)
+    os.makedirs(store_dir, exist_ok=True)
+    return store_dir
+
+def get_chunk_path(chunk_hash):
+    return os.path.join(get_backup_store_dir('chunks', chunk_hash[:2]), chunk_hash)
+
+def iter_file_chunks(filepath):
+    """파일을 청크 단위로 나눠서 반환"""
+    with open(filepath, 'rb') as f:
+        if not filepath.endswith(BACKUP_STORE_TEXT_EXTENSIONS):
+            for block in iter(lambda: f.read(BACKUP_STORE_CHUNK_SIZE), b''):
+                yield block
+            return
+        
+        # 줄 내용으로 경계를 정하므로 한 행이 바뀌어도 주변 청크만 달라짐
+        lines = []
+        size = 0
+        for line in f:
+            lines.append(line)
+            size += len(line)
+            if size >= BACKUP_STORE_MAX_TEXT_CHUNK or (
+                size >= BACKUP_STORE_MIN_TEXT_CHUNK and zlib.crc32(line) & BACKUP_STORE_BOUNDARY_MASK == 0
+            ):
+                yield b''.join(lines)
+                lines = []
+                size = 0
+        if lines:
+            yield b''.join(lines)
+
+def store_file_chunks(filepath):
+    """파일을 청크 저장소에 넣고 (파일 정보, 새로 저장한 바이트 수, 새 청크 수) 반환"""
+    file_hash = hashlib.sha256()
+    chunks = []
+    size = 0
+    stored_bytes = 0
+    new_chunks = 0
+    
+    for chunk in iter_file_chunks(filepath):
+        file_hash.update(chunk)
+        size += len(chunk)
+        chunk_hash = hashlib.sha256(chunk).hexdigest()
+        chunks.append(chunk_hash)
+        
+        chunk_path = get_chunk_path(chunk_hash)
+        if os.path.exists(chunk_path):
+            # 다시 참조된 청크는 GC 유예 시간 동안 지워지지 않도록 갱신
+            os.utime(chunk_path)
+        else:
+            compressed = zlib.compress(chunk, 6)
+            temp_path = f"{chunk_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(compressed)
+            os.replace(temp_path, chunk_path)
+            stored_bytes += len(compressed)
+            new_chunks += 1
+    
+    return {'size': size, 'sha256': file_hash.hexdigest(), 'chunks': chunks}, stored_bytes, new_chunks
+
+def scan_store_usage():
+    """청크 디렉토리를 훑어서 실제 청크 수와 크기 계산"""
+    usage = {'chunks': 0, 'physical_bytes': 0}
+    for root, _, filenames in os.walk(get_backup_store_dir('chunks')):
+        for filename in filenames:
+            if filename.endswith('.tmp'):
+                continue
+            usage['chunks'] += 1
+            usage['physical_bytes'] += os.path.getsize(os.path.join(root, filename))
+    return usage
+
+def load_store_usage():
+    """저장 시/GC 시 갱신하는 청크 사용량 (없으면 한 번 훑어서 생성)"""
+    usage_path = os.path.join(get_backup_store_dir(), 'usage.json')
+    if os.path.exists(usage_path):
+        with open(usage_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    usage = scan_store_usage()
+    save_store_usage(usage)
+    return usage
+
+def save_store_usage(usage):
+    usage_path = os.path.join(get_backup_store_dir(), 'usage.json')
+    with open(usage_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(usage, f)
+    os.replace(usage_path + '.tmp', usage_path)
+
+def store_backup_snapshot(backup_type, paths):
+    """백업 결과 파일/디렉토리를 저장소 스냅샷으로 보관하고 원본은 삭제
+
+    저장소를 사용하지 않으면 (None, None)을 반환하고 원본을 그대로 둔다.
+    """
+    if not app.config['BACKUP_STORE_ENABLED']:
+        return None, None
+    
+    try:
+        with backup_store_lock:
+            files = []
+            for path in paths:
+                if os.path.isdir(path):
+                    for root, _, filenames in os.walk(path):
+                        for filename in sorted(filenames):
+                            filepath = os.path.join(root, filename)
+                            relative = os.path.relpath(filepath, os.path.dirname(path))
+                            files.append((relative, filepath))
+                else:
+                    files.append((os.path.basename(path), path))
+            
+            now = datetime.now()
+            snapshot_id = f"{backup_type}_{now.strftime('%Y-%m-%d_%H-%M-%S_%f')}"
+            manifest = {
+                'snapshot_id': snapshot_id,
+                'backup_type': backup_type,
+                'created_at': now.isoformat(),
+                'files': [],
+                'logical_bytes': 0,
+                'stored_bytes': 0
+            }
+            usage = load_store_usage()
+            for relative, filepath in files:
+                file_info, stored_bytes, new_chunks = store_file_chunks(filepath)
+                file_info['path'] = relative.replace(os.sep, '/')
+                manifest['files'].append(file_info)
+                manifest['logical_bytes'] += file_info['size']
+                manifest['stored_bytes'] += stored_bytes
+                usage['chunks'] += new_chunks
+                usage['physical_bytes'] += stored_bytes
+            
+            manifest_path = os.path.join(get_backup_store_dir('snapshots'), f"{snapshot_id}.json")
+            with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(manifest_path + '.tmp', manifest_path)
+            save_store_usage(usage)
+        
+        # 카탈로그의 원본 파일 기록을 스냅샷으로 연결
+        relative_paths = [get_backup_relative_path(path) for path in paths]
+        BackupCatalog.query.filter(BackupCatalog.path.in_(relative_paths),
+                                   BackupCatalog.snapshot_id.is_(None)) \
+                           .update({'snapshot_id': snapshot_id}, synchronize_session=False)
+        refresh_backup_catalog_stats([backup_type])
+        db.session.commit()
+        
+        # 스냅샷이 확정된 뒤에만 원본 삭제
+        for path in paths:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+        
+        print(f"📦 백업 스냅샷 저장: {snapshot_id} (논리 {manifest['logical_bytes'] / (1024 * 1024):.1f}MB, "
+              f"신규 저장 {manifest['stored_bytes'] / (1024 * 1024):.2f}MB)")
+        return snapshot_id, None
+        
+    except Exception as e:
+        return None, str(e)
+
+def list_backup_snapshots(backup_type=None):
+    """저장소 스냅샷 매니페스트 목록 (최신순)"""
+    snapshots_dir = get_backup_store_dir('snapshots')
+    snapshots = []
+    for filename in os.listdir(snapshots_dir):
+        if not filename.endswith('.json'):
+            continue
+        with open(os.path.join(snapshots_dir, filename), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if backup_type is None or manifest['backup_type'] == backup_type:
+            snapshots.append(manifest)
+    snapshots.sort(key=lambda manifest: manifest['created_at'], reverse=True)
+    return snapshots
+
+def restore_backup_snapshot_files(snapshot_id, target_dir):
+    """스냅샷의 파일들을 청크에서 다시 조립 (sha256 검증 후 생성된 파일 경로 목록 반환)"""
+    with open(os.path.join(get_backup_store_dir('snapshots'), f"{snapshot_id}.json"), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    restored = []
+    for file_info in manifest['files']:
+        filepath = os.path.join(target_dir, *file_info['path'].split('/'))
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        file_hash = hashlib.sha256()
+        with open(filepath, 'wb') as out:
+            for chunk_hash in file_info['chunks']:
+                with open(get_chunk_path(chunk_hash), 'rb') as chunk_file:
+                    chunk = zlib.decompress(chunk_file.read())
+                file_hash.update(chunk)
+                out.write(chunk)
+        if file_hash.hexdigest() != file_info['sha256']:
+            raise ValueError(f"체크섬 불일치: {file_info['path']}")
+        restored.append(filepath)
+    return restored
+
+def apply_backup_retention():
+    """백업 종류별 보관 개수를 넘는 오래된 스냅샷 삭제 (삭제한 스냅샷 ID 목록 반환)"""
+    removed = []
+    with backup_store_lock:
+        snapshots_by_type = {}
+        for manifest in list_backup_snapshots():
+            snapshots_by_type.setdefault(manifest['backup_type'], []).append(manifest)
+        
+        for backup_type, snapshots in snapshots_by_type.items():
+            keep = app.config['BACKUP_RETENTION'].get(backup_type)
+            if keep is None:
+                continue
+            for manifest in snapshots[keep:]:
+                os.remove(os.path.join(get_backup_store_dir('snapshots'), f"{manifest['snapshot_id']}.json"))
+                removed.append(manifest['snapshot_id'])
+        
+        if removed:
+            BackupCatalog.query.filter(BackupCatalog.snapshot_id.in_(removed)).delete(synchronize_session=False)
+            refresh_backup_catalog_stats(snapshots_by_type.keys())
+            db.session.commit()
+    return removed
+
+def collect_backup_garbage():
+    """어떤 스냅샷도 참조하지 않는 청크 삭제 (삭제 개수, 회수한 바이트 반환)"""
+    with backup_store_lock:
+        referenced = set()
+        for manifest in list_backup_snapshots():
+            for file_info in manifest['files']:
+                referenced.update(file_info['chunks'])
+        
+        cutoff = time.time() - BACKUP_STORE_GC_GRACE.total_seconds()
+        removed_count = 0
+        freed_bytes = 0
+        for root, _, filenames in os.walk(get_backup_store_dir('chunks')):
+            for filename in filenames:
+                if filename in referenced:
+                    continue
+                chunk_path = os.path.join(root, filename)
+                stat = os.stat(chunk_path)
+                if stat.st_mtime > cutoff:
+                    continue
+                os.remove(chunk_path)
+                removed_count += 1
+                freed_bytes += stat.st_size
+        
+        # 어차피 전체를 훑었으므로 누적 사용량도 실제 값으로 보정
+        save_store_usage(scan_store_usage())
+    return removed_count, freed_bytes
+
+def backup_store_status():
+    """저장소 요약 (논리 크기 = 스냅샷 파일 합계, 물리 크기 = 실제 청크 파일 합계)
+
+    스냅샷 매니페스트와 청크 디렉토리를 훑지 않고 카탈로그 합계 테이블과 usage.json만 읽는다.
+    """
+    stored_types = [stats for stats in BackupCatalogStats.query.all() if stats.snapshot_count]
+    by_type = {stats.backup_type: stats.snapshot_count for stats in stored_types}
+    logical_bytes = sum(stats.snapshot_bytes or 0 for stats in stored_types)
+    usage = load_store_usage()
+    physical_bytes = usage['physical_bytes']
+    
+    return {
+        'enabled': app.config['BACKUP_STORE_ENABLED'],
+        'snapshots': sum(by_type.values()),
+        'snapshots_by_type': by_type,
+        'chunks': usage['chunks'],
+        'logical_mb': round(logical_bytes / (1024 * 1024), 2),
+        'physical_mb': round(physical_bytes / (1024 * 1024), 2),
+        'dedup_ratio': round(logical_bytes / physical_bytes, 1) if physical_bytes else None,
+        'retention': app.config['BACKUP_RETENTION']
+    }
+
+def backup_retention_job():
+    """보관 정책 적용 + 청크 GC 스케줄 작업 (매일 23:30)"""
+    with app.app_context():
+        try:
+            removed = apply_backup_retention()
+            removed_chunks, freed_bytes = collect_backup_garbage()
+            print(f"🧹 백업 보관 정책 적용: 스냅샷 {len(removed)}개, 청크 {removed_chunks}개 삭제 "
+                  f"({freed_bytes / (1024 * 1024):.1f}MB 회수)")
+            added, stale = sync_backup_catalog()
+            if added or stale:
+                print(f"🗂️ 백업 카탈로그 보정: {added}개 추가, {stale}개 삭제")
+        except Exception as e:
+            error_msg = f"백업 보관 정책 적용 실패: {str(e)}"
+            print(f"❌ {error_msg}")
+            create_backup_notification('보관 정책', 'failed', error_msg)
+
+@app.cli.command('gc-backups')
+def gc_backups_command():
+    """백업 보관 정책 적용 후 참조되지 않는 청크 삭제 (flask gc-backups)"""
+    backup_retention_job()
+
+# ===== 증분(델타) 백업 =====
+# backups/incremental/manifest.json 에 전체(full) 스냅샷과 델타 파일의 체인을 기록한다.
+# 델타에는 마지막 백업 이후 updated_at이 바뀐 DailyPoints, changed_at이 새로운 PointsHistory와
+# (크기가 작은) 아동/사용자 전체 목록이 들어간다.
+# 삭제는 updated_at으로 알 수 없으므로 델타마다 두 테이블의 현재 id 목록을 연속 구간으로 기록하고(live_id_ranges),
+# 재생할 때 구간에 없는 id(삭제된 행)를 지운다.
+
+# 커밋 시각과 updated_at 기록 시각 차이로 빠지는 행이 없도록 하이워터마크를 조금 겹쳐서 조회
+# (복원 시 id 기준으로 덮어쓰므로 중복 포함은 문제 없음)
+INCREMENTAL_BACKUP_OVERLAP = timedelta(seconds=30)
+
+# 실시간 백업 워커와 스케줄러가 동시에 매니페스트를 고치지 않도록
+incremental_backup_lock = threading.Lock()
+
+def get_incremental_backup_dir():
+    return os.path.join(create_backup_directory(), 'incremental')
+
+def load_backup_manifest():
+    """증분 백업 매니페스트 로드 (없으면 빈 매니페스트)"""
+    manifest_path = os.path.join(get_incremental_backup_dir(), 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return {'entries': []}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_backup_manifest(manifest):
+    """매니페스트 저장 (임시 파일에 쓴 뒤 교체해서 중간에 깨지지 않도록)"""
+    manifest_path = os.path.join(get_incremental_backup_dir(), 'manifest.json')
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+
+def write_incremental_file(filename, backup_data):
+    filepath = os.path.join(get_incremental_backup_dir(), filename)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(backup_data, f, ensure_ascii=False)
+    return filepath
+
+def get_high_water_marks(daily_points_data, history_data, previous=None):
+    """백업에 포함된 행 기준 최신 updated_at/changed_at (없으면 이전 값 유지)"""
+    previous = previous or {}
+    points_times = [point['updated_at'] for point in daily_points_data if point['updated_at']]
+    history_times = [history['changed_at'] for history in history_data if history['changed_at']]
+    return {
+        'daily_points': max(points_times + ([previous['daily_points']] if previous.get('daily_points') else []), default=None),
+        'points_history': max(history_times + ([previous['points_history']] if previous.get('points_history') else []), default=None)
+    }
+
+def get_live_id_ranges(model):
+    """테이블의 현재 id를 연속 구간 [[시작, 끝], ...]으로 (자동 증가 id라 삭제가 적으면 구간도 적음)"""
+    rows = db.session.execute(text(f"""
+        SELECT MIN(id), MAX(id) FROM (
+            SELECT id, id - ROW_NUMBER() OVER (ORDER BY id) AS grp FROM {model.__tablename__}
+        ) AS numbered GROUP BY grp ORDER BY MIN(id)
+    """)).all()
+    return [[low, high] for low, high in rows]
+
+def drop_deleted_rows(rows, ranges):
+    """id -> 행 딕셔너리에서 구간에 없는 id(백업 시점에 삭제된 행) 제거"""
+    starts = [low for low, _ in ranges]
+    def is_live(row_id):
+        index = bisect.bisect_right(starts, row_id) - 1
+        return index >= 0 and row_id <= ranges[index][1]
+    return {row_id: row for row_id, row in rows.items() if is_live(row_id)}
+
+def get_latest_full_entry(manifest):
+    for entry in reversed(manifest['entries']):
+        if entry['kind'] == 'full':
+            return entry
+    return None
+
+def create_full_incremental_base(manifest):
+    """증분 체인의 기준이 되는 전체 스냅샷 생성"""
+    backup_data, error = get_backup_data()
+    if error:
+        return None, error
+    
+    now = datetime.now()
+    backup_id = f"full_{now.strftime('%Y-%m-%d_%H-%M-%S_%f')}"
+    high_water = get_high_water_marks(backup_data['daily_points'], backup_data['points_history'])
+    backup_data['backup_metadata'].update({
+        'backup_id': backup_id,
+        'backup_type': 'full',
+        'high_water': high_water
+    })
+    filepath = write_incremental_file(f"{backup_id}.json", backup_data)
+    
+    manifest['entries'].append({
+        'backup_id': backup_id,
+        'kind': 'full',
+        'file': os.path.basename(filepath),
+        'base_id': backup_id,
+        'parent_id': None,
+        'as_of': now.isoformat(),
+        'created_at': now.isoformat(),
+        'high_water': high_water,
+        'records_count': backup_data['backup_metadata']['records_count']
+    })
+    save_backup_manifest(manifest)
+    record_backup_catalog('incremental', 'incremental', filepath,
+                          row_counts=backup_data['backup_metadata']['records_count'])
+    return filepath, None
+
+def create_incremental_backup():
+    """마지막 백업 이후 변경분만 델타 파일로 저장 (기준 스냅샷이 없으면 전체 스냅샷 생성)"""
+    with incremental_backup_lock:
+        return _create_incremental_backup()
+
+def _create_incremental_backup():
+    try:
+        manifest = load_backup_manifest()
+        base_entry = get_latest_full_entry(manifest)
+        if base_entry is None:
+            return create_full_incremental_base(manifest)
+        
+        parent_entry = manifest['entries'][-1]
+        since = parent_entry['high_water']
+        
+        points_query = DailyPoints.query
+        if since.get('daily_points'):
+            points_query = points_query.filter(
+                DailyPoints.updated_at > datetime.fromisoformat(since['daily_points']) - INCREMENTAL_BACKUP_OVERLAP
+            )
+        history_query = PointsHistory.query
+        if since.get('points_history'):
+            history_query = history_query.filter(
+                PointsHistory.changed_at > datetime.fromisoformat(since['points_history']) - INCREMENTAL_BACKUP_OVERLAP
+            )
+        
+        daily_points_data = [serialize_daily_points(point) for point in points_query.order_by(DailyPoints.id).all()]
+        history_data = [serialize_points_history(history) for history in history_query.order_by(PointsHistory.id).all()]
+        children_data = [serialize_child(child) for child in Child.query.all()]
+        users_data = [serialize_user(user) for user in User.query.all()]
+        live_id_ranges = {
+            'daily_points': get_live_id_ranges(DailyPoints),
+            'points_history': get_live_id_ranges(PointsHistory)
+        }
+        
+        now = datetime.now()
+        backup_id = f"delta_{now.strftime('%Y-%m-%d_%H-%M-%S_%f')}"
+        high_water = get_high_water_marks(daily_points_data, history_data, previous=since)
+        records_count = {
+            'children': len(children_data),
+            'daily_points': len(daily_points_data),
+            'points_history': len(history_data),
+            'users': len(users_data)
+        }
+        backup_data = {
+            'backup_metadata': {
+                'backup_id': backup_id,
+                'backup_type': 'delta',
+                'timestamp': now.isoformat(),
+                'data_version': '1.0.0',
+                'base_id': base_entry['backup_id'],
+                'parent_id': parent_entry['backup_id'],
+                'since': since,
+                'high_water': high_water,
+                'records_count': records_count
+            },
+            'children': children_data,
+            'daily_points': daily_points_data,
+            'points_history': history_data,
+            'users': users_data,
+            'live_id_ranges': live_id_ranges
+        }
+        filepath = write_incremental_file(f"{backup_id}.json", backup_data)
+        
+        manifest['entries'].append({
+            'backup_id': backup_id,
+            'kind': 'delta',
+            'file': os.path.basename(filepath),
+            'base_id': base_entry['backup_id'],
+            'parent_id': parent_entry['backup_id'],
+            'as_of': now.isoformat(),
+            'created_at': now.isoformat(),
+            'high_water': high_water,
+            'records_count': records_count
+        })
+        save_backup_manifest(manifest)
+        record_backup_catalog('incremental', 'incremental', filepath, row_counts=records_count)
+        return filepath, None
+        
+    except Exception as e:
+        return None, str(e)
+
+def get_backup_chain(manifest, until=None):
+    """until 시점까지 복원하는 데 필요한 [기준 스냅샷, 델타...] 목록"""
+    entries = [entry for entry in manifest['entries']
+               if until is None or datetime.fromisoformat(entry['as_of']) <= until]
+    base_entry = get_latest_full_entry({'entries': entries})
+    if base_entry is None:
+        return []
+    deltas = [entry for entry in entries
+              if entry['kind'] == 'delta' and entry['base_id'] == base_entry['backup_id']]
+    return [base_entry] + deltas
+
+def replay_backup_chain(chain):
+    """기준 스냅샷에 델타를 순서대로 적용해서 전체 백업 데이터 구성"""
+    backup_dir = get_incremental_backup_dir()
+    children, users, daily_points, points_history = {}, {}, {}, {}
+    
+    for entry in chain:
+        with open(os.path.join(backup_dir, entry['file']), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # 아동/사용자는 매번 전체 목록이 들어 있으므로 통째로 교체
+        children = {child['id']: child for child in data['children']}
+        users = {user['id']: user for user in data['users']}
+        for point in data['daily_points']:
+            daily_points[point['id']] = point
+        for history in data['points_history']:
+            points_history[history['id']] = history
+        # 델타 시점에 없던 행(점수 수정/삭제, 아동 삭제로 지워진 행) 제거 - 삭제 기록 이전의 델타에는 없음
+        live_id_ranges = data.get('live_id_ranges')
+        if live_id_ranges:
+            daily_points = drop_deleted_rows(daily_points, live_id_ranges['daily_points'])
+            points_history = drop_deleted_rows(points_history, live_id_ranges['points_history'])
+    
+    # 삭제된 아동의 포인트 기록/변경 이력 제외
+    daily_points = {point_id: point for point_id, point in daily_points.items() if point['child_id'] in children}
+    points_history = {history_id: history for history_id, history in points_history.items()
+                      if history['child_id'] in children}
+    
+    last_entry = chain[-1]
+    return {
+        'backup_metadata': {
+            'backup_id': last_entry['backup_id'],
+            'backup_type': 'replay',
+            'timestamp': last_entry['as_of'],
+            'data_version': '1.0.0',
+            'high_water': last_entry['high_water'],
+            'records_count': {
+                'children': len(children),
+                'daily_points': len(daily_points),
+                'points_history': len(points_history),
+                'users': len(users)
+            }
+        },
+        'children': sorted(children.values(), key=lambda item: item['id']),
+        'daily_points': sorted(daily_points.values(), key=lambda item: item['id']),
+        'points_history': sorted(points_history.values(), key=lambda item: item['id']),
+        'users': sorted(users.values(), key=lambda item: item['id'])
+    }
+
+def compact_incremental_backups():
+    """현재 기준 스냅샷 + 델타들을 합쳐 새 전체 스냅샷 생성 (DB는 읽지 않음)"""
+    with incremental_backup_lock:
+        return _compact_incremental_backups()
+
+def _compact_incremental_backups():
+    try:
+        manifest = load_backup_manifest()
+        chain = get_backup_chain(manifest)
+        if len(chain) < 2:
+            return None, None  # 합칠 델타 없음
+        
+        backup_data = replay_backup_chain(chain)
+        last_entry = chain[-1]
+        now = datetime.now()
+        backup_id = f"full_{now.strftime('%Y-%m-%d_%H-%M-%S_%f')}"
+        backup_data['backup_metadata'].update({
+            'backup_id': backup_id,
+            'backup_type': 'full',
+            'compacted_from': [entry['backup_id'] for entry in chain]
+        })
+        filepath = write_incremental_file(f"{backup_id}.json", backup_data)
+        
+        # 합친 스냅샷은 마지막 델타 시점의 상태이므로 as_of/high_water를 그대로 이어받음
+        manifest['entries'].append({
+            'backup_id': backup_id,
+            'kind': 'full',
+            'file': os.path.basename(filepath),
+            'base_id': backup_id,
+            'parent_id': last_entry['backup_id'],
+            'as_of': last_entry['as_of'],
+            'created_at': now.isoformat(),
+            'high_water': last_entry['high_water'],
+            'records_count': backup_data['backup_metadata']['records_count'],
+            'compacted_from': [entry['backup_id'] for entry in chain]
+        })
+        save_backup_manifest(manifest)
+        record_backup_catalog('incremental', 'incremental', filepath,
+                              row_counts=backup_data['backup_metadata']['records_count'])
+        return filepath, None
+        
+    except Exception as e:
+        return None, str(e)
+
+def restore_incremental_backup(until=None):
+    """기준 스냅샷 + 델타를 재생해서 until 시점의 포인트 데이터로 DB 복원
+
+    DailyPoints/PointsHistory는 백업 시점 상태로 교체하고, 아동 정보는 id 기준으로 갱신한다.
+    사용자 계정은 비밀번호가 백업에 없으므로 건드리지 않는다.
+    """
+    try:
+        chain = get_backup_chain(load_backup_manifest(), until)
+        if not chain:
+            return None, '복원할 증분 백업이 없습니다.'
+        backup_data = replay_backup_chain(chain)
+        
+        for child_data in backup_data['children']:
+            child = db.session.get(Child, child_data['id'])
+            if child is None:
+                child = Child(id=child_data['id'])
+                db.session.add(child)
+            child.name = child_data['name']
+            child.grade = child_data['grade']
+            # 보정값이 없던 시기의 백업이면 현재 보정값 유지
+            child.cumulative_points_adjustment = child_data.get('cumulative_points_adjustment',
+                                                                child.cumulative_points_adjustment or 0)
+            if child_data['created_at']:
+                child.created_at = datetime.fromisoformat(child_data['created_at'])
+        db.session.flush()
+        
+        PointsHistory.query.delete(synchronize_session=False)
+        DailyPoints.query.delete(synchronize_session=False)
+        
+        def parse_row(row, date_fields, datetime_fields):
+            row = dict(row)
+            for field in date_fields:
+                row[field] = datetime.fromisoformat(row[field]).date() if row[field] else None
+            for field in datetime_fields:
+                row[field] = datetime.fromisoformat(row[field]) if row[field] else None
+            return row
+        
+        if backup_data['daily_points']:
+            db.session.execute(db.insert(DailyPoints), [
+                parse_row(point, ['date'], ['created_at', 'updated_at']) for point in backup_data['daily_points']
+            ])
+        if backup_data['points_history']:
+            db.session.execute(db.insert(PointsHistory), [
+                parse_row(history, ['date'], ['changed_at']) for history in backup_data['points_history']
+            ])
+        
+        # 누적 포인트는 복원된 기록으로 다시 계산 (보정값 + 일일 포인트 합계)
+        db.session.execute(text("""
+            UPDATE child SET cumulative_points = COALESCE(cumulative_points_adjustment, 0) + (
+                SELECT COALESCE(SUM(total_points), 0) FROM daily_points WHERE daily_points.child_id = child.id
+            )
+        """))
+        db.session.commit()
+        rebuild_points_rollup()
+        app_cache.invalidate()
+        
+        return backup_data['backup_metadata'], None
+        
+    except Exception as e:
+        db.session.rollback()
+        return None, str(e)
+
+def incremental_backup_status():
+    """/backup/status 표시용 증분 백업 체인 요약"""
+    manifest = load_backup_manifest()
+    chain = get_backup_chain(manifest)
+    return {
+        'entries': len(manifest['entries']),
+        'base_id': chain[0]['backup_id'] if chain else None,
+        'deltas_since_base': max(len(chain) - 1, 0),
+        'last_backup_at': manifest['entries'][-1]['created_at'] if manifest['entries'] else None
+    }
+
+def compact_incremental_backups_job():
+    """증분 백업 압축 스케줄 작업 (매일 22:30)"""
+    with app.app_context():
+        filepath, error = compact_incremental_backups()
+        if error:
+            error_msg = f"증분 백업 압축 실패: {error}"
+            print(f"❌ {error_msg}")
+            create_backup_notification('증분 압축', 'failed', error_msg)
+        elif filepath:
+            print(f"✅ 증분 백업 압축 완료: {os.path.basename(filepath)}")
+
+@app.cli.command('compact-backups')
+def compact_backups_command():
+    """증분 백업 델타를 새 전체 스냅샷으로 합침 (flask compact-backups)"""
+    filepath, error = compact_incremental_backups()
+    if error:
+        print(f"❌ 증분 백업 압축 실패: {error}")
+    elif filepath:
+        print(f"✅ 증분 백업 압축 완료: {filepath}")
+    else:
+        print("✅ 합칠 델타가 없습니다.")
+
 # 스케줄 백업 시스템
 def daily_backup():
     """일일 백업 실행 (매일 22시)"""
@@ -3455,16 +6729,8 @@ def daily_backup():
             # 백업 디렉토리 생성
             backup_dir = create_backup_directory()
             
-            # 백업 데이터 수집
-            backup_data, error = get_backup_data()
-            if error:
-                error_msg = f"일일 백업 데이터 수집 실패: {error}"
-                print(f"❌ {error_msg}")
-                create_backup_notification('일일', 'failed', error_msg)
-                return False
-            
             # JSON 백업 생성
-            json_path, error = create_json_backup(backup_data, backup_dir, 'daily')
+            json_path, error = create_streaming_backup(backup_dir, 'daily')
             if error:
                 error_msg = f"일일 JSON 백업 생성 실패: {error}"
                 print(f"❌ {error_msg}")
@@ -3472,7 +6738,7 @@ def daily_backup():
                 return False
             
             # Excel 백업 생성
-            excel_path, error = create_excel_backup(backup_data, backup_dir, 'daily')
+            excel_path, error = create_excel_backup(backup_dir, 'daily')
             if error:
                 error_msg = f"일일 Excel 백업 생성 실패: {error}"
                 print(f"❌ {error_msg}")
@@ -3487,7 +6753,17 @@ def daily_backup():
                 create_backup_notification('일일', 'failed', error_msg)
                 return False
             
+            # 중복 제거 저장소에 스냅샷으로 보관
+            snapshot_id, error = store_backup_snapshot('daily', [json_path, excel_path, db_path])
+            if error:
+                error_msg = f"일일 백업 스냅샷 저장 실패: {error}"
+                print(f"❌ {error_msg}")
+                create_backup_notification('일일', 'failed', error_msg)
+                return False
+            
             success_msg = f"일일 백업 완료: {os.path.basename(json_path)}, {os.path.basename(excel_path)}, {os.path.basename(db_path)}"
+            if snapshot_id:
+                success_msg += f" (스냅샷 {snapshot_id})"
             print(f"✅ {success_msg}")
             create_backup_notification('일일', 'success', success_msg)
             return True
@@ -3508,16 +6784,8 @@ def monthly_backup():
             # 백업 디렉토리 생성
             backup_dir = create_backup_directory()
             
-            # 백업 데이터 수집
-            backup_data, error = get_backup_data()
-            if error:
-                error_msg = f"월간 백업 데이터 수집 실패: {error}"
-                print(f"❌ {error_msg}")
-                create_backup_notification('월간', 'failed', error_msg)
-                return False
-            
             # JSON 백업 생성
-            json_path, error = create_json_backup(backup_data, backup_dir, 'monthly')
+            json_path, error = create_streaming_backup(backup_dir, 'monthly')
             if error:
                 error_msg = f"월간 JSON 백업 생성 실패: {error}"
                 print(f"❌ {error_msg}")
@@ -3525,7 +6793,7 @@ def monthly_backup():
                 return False
             
             # Excel 백업 생성
-            excel_path, error = create_excel_backup(backup_data, backup_dir, 'monthly')
+            excel_path, error = create_excel_backup(backup_dir, 'monthly')
             if error:
                 error_msg = f"월간 Excel 백업 생성 실패: {error}"
                 print(f"❌ {error_msg}")
@@ -3540,7 +6808,17 @@ def monthly_backup():
                 create_backup_notification('월간', 'failed', error_msg)
                 return False
             
+            # 중복 제거 저장소에 스냅샷으로 보관
+            snapshot_id, error = store_backup_snapshot('monthly', [json_path, excel_path, db_path])
+            if error:
+                error_msg = f"월간 백업 스냅샷 저장 실패: {error}"
+                print(f"❌ {error_msg}")
+                create_backup_notification('월간', 'failed', error_msg)
+                return False
+            
             success_msg = f"월간 백업 완료: {os.path.basename(json_path)}, {os.path.basename(excel_path)}, {os.path.basename(db_path)}"
+            if snapshot_id:
+                success_msg += f" (스냅샷 {snapshot_id})"
             print(f"✅ {success_msg}")
             create_backup_notification('월간', 'success', success_msg)
             return True
@@ -3567,9 +6845,30 @@ def run_scheduler():
         
         schedule.every().day.at("23:00").do(check_monthly_backup)
         
+        # 증분 백업 압축 (매일 22:30, 델타를 새 전체 스냅샷으로 합침)
+        schedule.every().day.at("22:30").do(compact_incremental_backups_job)
+        
+        # 백업 보관 정책 + 청크 GC (매일 23:30)
+        schedule.every().day.at("23:30").do(backup_retention_job)
+        
+        # 누적 포인트/포인트 집계 대사 (매일 23:45, 변경분 반영 중 어긋난 값 수정)
+        schedule.every().day.at("23:45").do(reconcile_points_job)
+        
+        # 오래된 시스템 알림 정리 (매일 23:50, NOTIFICATION_RETENTION_DAYS를 설정한 경우만)
+        schedule.every().day.at("23:50").do(purge_notifications_job)
+        
+        # 만료 알림 삭제 + 백업 성공 알림 합치기 (매시간)
+        schedule.every().hour.do(sweep_notifications_job)
+        
         print("✅ 스케줄 백업 시스템 시작됨")
         print("   - 일일 백업: 매일 22:00")
         print("   - 월간 백업: 매월 마지막 날 23:00")
+        print("   - 증분 백업 압축: 매일 22:30")
+        print("   - 백업 보관 정책/GC: 매일 23:30")
+        print("   - 누적 포인트/집계 대사: 매일 23:45")
+        retention_days = app.config['NOTIFICATION_RETENTION_DAYS']
+        print(f"   - 알림 정리: 매일 23:50 ({f'{retention_days}일 지난 시스템 알림' if retention_days > 0 else '사용 안 함'})")
+        print("   - 알림 만료/압축 정리: 매시간")
         
         # 스케줄러 루프 실행
         while True:
@@ -3600,16 +6899,8 @@ def backup_manual():
         # 백업 디렉토리 생성
         backup_dir = create_backup_directory()
         
-        # 백업 데이터 수집
-        backup_data, error = get_backup_data()
-        if error:
-            error_msg = f'백업 데이터 수집 실패: {error}'
-            flash(error_msg, 'error')
-            create_backup_notification('수동', 'failed', error_msg)
-            return redirect(url_for('settings_data'))
-        
         # JSON 백업 생성
-        json_path, error = create_json_backup(backup_data, backup_dir, 'manual')
+        json_path, error = create_streaming_backup(backup_dir, 'manual')
         if error:
             error_msg = f'JSON 백업 생성 실패: {error}'
             flash(error_msg, 'error')
@@ -3617,7 +6908,7 @@ def backup_manual():
             return redirect(url_for('settings_data'))
         
         # Excel 백업 생성
-        excel_path, error = create_excel_backup(backup_data, backup_dir, 'manual')
+        excel_path, error = create_excel_backup(backup_dir, 'manual')
         if error:
             error_msg = f'Excel 백업 생성 실패: {error}'
             flash(error_msg, 'error')
@@ -3632,7 +6923,17 @@ def backup_manual():
             create_backup_notification('수동', 'failed', error_msg)
             return redirect(url_for('settings_data'))
         
+        # 중복 제거 저장소에 스냅샷으로 보관
+        snapshot_id, error = store_backup_snapshot('manual', [json_path, excel_path, db_path])
+        if error:
+            error_msg = f'백업 스냅샷 저장 실패: {error}'
+            flash(error_msg, 'error')
+            create_backup_notification('수동', 'failed', error_msg)
+            return redirect(url_for('settings_data'))
+        
         success_msg = f'백업이 완료되었습니다. JSON: {os.path.basename(json_path)}, Excel: {os.path.basename(excel_path)}, DB: {os.path.basename(db_path)}'
+        if snapshot_id:
+            success_msg += f' (스냅샷 {snapshot_id})'
         flash(success_msg, 'success')
         create_backup_notification('수동', 'success', success_msg)
         return redirect(url_for('settings_data'))
@@ -3646,50 +6947,28 @@ def backup_manual():
 @app.route('/backup/list')
 @login_required
 def backup_list():
-    """백업 파일 목록 조회"""
+    """백업 파일 목록 조회 (카탈로그 기준, 종류/날짜 필터 + 페이지)"""
     if current_user.role != '개발자':
         flash('개발자만 백업 목록을 조회할 수 있습니다.', 'error')
         return redirect(url_for('settings_data'))
     
     try:
-        backup_dir = create_backup_directory()
-        
-        # 백업 파일 목록 조회
-        backups = []
-        if os.path.exists(backup_dir):
-            for filename in os.listdir(backup_dir):
-                if filename.endswith(('.json', '.xlsx', '.db')):
-                    file_path = os.path.join(backup_dir, filename)
-                    file_stat = os.stat(file_path)
-                    
-                    # 파일 타입 추출
-                    if 'realtime' in filename:
-                        backup_type = 'realtime'
-                    elif 'daily' in filename:
-                        backup_type = 'daily'
-                    elif 'monthly' in filename:
-                        backup_type = 'monthly'
-                    elif 'manual' in filename:
-                        backup_type = 'manual'
-                    else:
-                        backup_type = 'unknown'
-                    
-                    # 크기를 MB로 변환
-                    size_mb = round(file_stat.st_size / (1024 * 1024), 2)
-                    
-                    backups.append({
-                        'filename': filename,
-                        'type': backup_type,
-                        'size_mb': size_mb,
-                        'created_at': datetime.fromtimestamp(file_stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'filepath': file_path,
-                        'restore_safe': True  # 기본적으로 복구 가능으로 설정
-                    })
+        filters, error = parse_backup_catalog_filters(request.args)
+        if error:
+            flash(error, 'error')
+            filters, _ = parse_backup_catalog_filters({})
+        page = request.args.get('page', 1, type=int)
         
-        # 최신 파일부터 정렬
-        backups.sort(key=lambda x: x['created_at'], reverse=True)
+        pagination = query_backup_catalog(**filters).paginate(
+            page=page, per_page=BACKUP_CATALOG_PER_PAGE, error_out=False
+        )
         
-        return render_template('backup/list.html', backups=backups)
+        return render_template('backup/list.html',
+                             backups=[entry.to_dict() for entry in pagination.items],
+                             pagination=pagination,
+                             filters=filters,
+                             summary=backup_catalog_summary(),
+                             store_status=backup_store_status())
         
     except Exception as e:
         flash(f'백업 목록 조회 실패: {str(e)}', 'error')
@@ -3698,69 +6977,251 @@ def backup_list():
 @app.route('/backup/status')
 @login_required
 def backup_status():
-    """백업 상태 및 목록 조회 (JSON API)"""
+    """백업 상태 및 목록 조회 (JSON API, ?type=&kind=&date_from=&date_to=&page=&per_page=)"""
     if current_user.role != '개발자':
         return jsonify({'error': '개발자만 접근할 수 있습니다.'}), 403
     
     try:
-        backup_dir = create_backup_directory()
+        filters, error = parse_backup_catalog_filters(request.args)
+        if error:
+            return jsonify({'error': error}), 400
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', BACKUP_CATALOG_PER_PAGE, type=int), 1),
+                       BACKUP_CATALOG_MAX_PER_PAGE)
         
-        # 백업 파일 목록 조회 (모든 하위 디렉토리 포함)
-        backups = []
-        if os.path.exists(backup_dir):
-            # 루트 디렉토리 검색
-            for filename in os.listdir(backup_dir):
-                if filename.endswith(('.json', '.xlsx', '.db')):
-                    file_path = os.path.join(backup_dir, filename)
-                    file_stat = os.stat(file_path)
-                    
-                    # 크기를 MB로 변환
-                    size_mb = round(file_stat.st_size / (1024 * 1024), 2)
-                    
-                    backups.append({
-                        'filename': filename,
-                        'size_mb': size_mb,
-                        'created_at': datetime.fromtimestamp(file_stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S')
-                    })
-            
-            # 하위 디렉토리들 검색
-            subdirs = ['realtime', 'daily', 'monthly', 'database']
-            for subdir in subdirs:
-                subdir_path = os.path.join(backup_dir, subdir)
-                if os.path.exists(subdir_path):
-                    for filename in os.listdir(subdir_path):
-                        if filename.endswith(('.json', '.xlsx', '.db')):
-                            file_path = os.path.join(subdir_path, filename)
-                            file_stat = os.stat(file_path)
-                            
-                            # 크기를 MB로 변환
-                            size_mb = round(file_stat.st_size / (1024 * 1024), 2)
-                            
-                            backups.append({
-                                'filename': f"{subdir}/{filename}",
-                                'size_mb': size_mb,
-                                'created_at': datetime.fromtimestamp(file_stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S')
-                            })
-        
-        # 최신 파일부터 정렬
-        backups.sort(key=lambda x: x['created_at'], reverse=True)
+        pagination = query_backup_catalog(**filters).paginate(page=page, per_page=per_page, error_out=False)
         
         return jsonify({
-            'backups': backups,
-            'total_count': len(backups),
-            'backup_dir': backup_dir
+            'backups': [entry.to_dict() for entry in pagination.items],
+            'total_count': pagination.total,
+            'page': pagination.page,
+            'per_page': per_page,
+            'pages': pagination.pages,
+            'summary': backup_catalog_summary(),
+            'backup_dir': create_backup_directory(),
+            'realtime_worker': realtime_backup_worker.status(),
+            'incremental': incremental_backup_status(),
+            'database_snapshot': last_database_backup_stats or None,
+            'store': backup_store_status()
         })
         
     except Exception as e:
         return jsonify({'error': f'백업 상태 조회 실패: {str(e)}'}), 500
 
+@app.route('/cache/status')
+@login_required
+def cache_status():
+    """분석/리포트 캐시 지표 (JSON API, 히트율/항목 수/사용 바이트/축출 수, 포인트 큐브 상태)"""
+    if current_user.role != '개발자':
+        return jsonify({'error': '개발자만 접근할 수 있습니다.'}), 403
+    
+    try:
+        return jsonify({**app_cache.stats(), 'points_cube': points_cube.status()})
+    except Exception as e:
+        return jsonify({'error': f'캐시 상태 조회 실패: {str(e)}'}), 500
+
+@app.cli.command('clear-cache')
+def clear_cache_command():
+    """분석/리포트 캐시 전체 무효화 (flask clear-cache, sqlite 백엔드면 모든 워커에 반영)"""
+    app_cache.invalidate()
+    app_cache.clear()
+    print("🧹 캐시를 비웠습니다.")
+
+# ===== 요청 계측 (SQL 프로파일링/메트릭) =====
+# SQLAlchemy 커서 이벤트로 쿼리 수/SQL 시간을, Flask 시그널로 템플릿 렌더 시간/전체 지연을 요청마다 모아서
+# 라우트(endpoint)별 히스토그램에 누적한다. 값은 워커 프로세스마다 따로 쌓인다.
+
+METRICS_PREFIX = 'child_center'
+# 히스토그램 구간 - 시간(초)과 요청당 쿼리 수
+METRICS_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+SLOW_QUERY_LOG_CHARS = 2000
+
+class RequestMetrics:
+    """라우트별 요청 지표 (누적 히스토그램 + 카운터, Prometheus 텍스트 형식으로 출력)"""
+
+    HISTOGRAMS = (
+        ('request_duration_seconds', '요청 전체 처리 시간', METRICS_SECONDS_BUCKETS),
+        ('request_sql_seconds', '요청당 SQL 실행 시간 합계', METRICS_SECONDS_BUCKETS),
+        ('request_render_seconds', '요청당 템플릿 렌더 시간', METRICS_SECONDS_BUCKETS),
+        ('request_queries', '요청당 SQL 쿼리 수', METRICS_QUERY_BUCKETS)
+    )
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.histograms = {name: {} for name, _, _ in self.HISTOGRAMS}  # name -> {(endpoint, method): [구간별 개수, 합, 개수]}
+        self.requests = {}  # (endpoint, method, status) -> 개수
+        self.slow_queries = {}  # endpoint -> 개수
+
+    def observe(self, endpoint, method, status, duration, sql_seconds, render_seconds, queries):
+        values = {
+            'request_duration_seconds': duration,
+            'request_sql_seconds': sql_seconds,
+            'request_render_seconds': render_seconds,
+            'request_queries': queries
+        }
+        key = (endpoint, method)
+        with self.lock:
+            for name, _, buckets in self.HISTOGRAMS:
+                series = self.histograms[name].get(key)
+                if series is None:
+                    series = self.histograms[name][key] = [[0] * len(buckets), 0, 0]
+                value = values[name]
+                for index, bound in enumerate(buckets):
+                    if value <= bound:
+                        series[0][index] += 1
+                        break
+                series[1] += value
+                series[2] += 1
+            status_key = (endpoint, method, status)
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+
+    def count_slow_query(self, endpoint):
+        with self.lock:
+            self.slow_queries[endpoint] = self.slow_queries.get(endpoint, 0) + 1
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {name: {} for name, _, _ in self.HISTOGRAMS}
+            self.requests = {}
+            self.slow_queries = {}
+            self.started_at = time.time()
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)"""
+        def labels(**pairs):
+            # 라벨 값은 endpoint 이름/HTTP 메서드/상태 코드뿐이라 따옴표 이스케이프가 필요 없음
+            return ','.join(f'{name}="{value}"' for name, value in pairs.items())
+
+        lines = []
+        with self.lock:
+            for name, help_text, buckets in self.HISTOGRAMS:
+                metric = f'{METRICS_PREFIX}_{name}'
+                lines.append(f'# HELP {metric} {help_text}')
+                lines.append(f'# TYPE {metric} histogram')
+                for (endpoint, method), (counts, total, count) in sorted(self.histograms[name].items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(buckets, counts):
+                        cumulative += bucket_count
+                        lines.append(f'{metric}_bucket{{{labels(endpoint=endpoint, method=method, le=bound)}}} {cumulative}')
+                    lines.append(f'{metric}_bucket{{{labels(endpoint=endpoint, method=method, le="+Inf")}}} {count}')
+                    lines.append(f'{metric}_sum{{{labels(endpoint=endpoint, method=method)}}} {round(total, 6)}')
+                    lines.append(f'{metric}_count{{{labels(endpoint=endpoint, method=method)}}} {count}')
+
+            metric = f'{METRICS_PREFIX}_requests_total'
+            lines.append(f'# HELP {metric} 처리한 요청 수')
+            lines.append(f'# TYPE {metric} counter')
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'{metric}{{{labels(endpoint=endpoint, method=method, status=status)}}} {count}')
+
+            metric = f'{METRICS_PREFIX}_slow_queries_total'
+            lines.append(f'# HELP {metric} SLOW_QUERY_MS를 넘은 쿼리 수')
+            lines.append(f'# TYPE {metric} counter')
+            for endpoint, count in sorted(self.slow_queries.items()):
+                lines.append(f'{metric}{{{labels(endpoint=endpoint)}}} {count}')
+
+            started_at = self.started_at
+
+        metric = f'{METRICS_PREFIX}_stream_connections'
+        lines.append(f'# HELP {metric} 열려 있는 /stream 연결 수')
+        lines.append(f'# TYPE {metric} gauge')
+        lines.append(f'{metric} {len(event_broker.subscribers)}')
+        metric = f'{METRICS_PREFIX}_metrics_started_seconds'
+        lines.append(f'# HELP {metric} 지표 수집 시작 시각 (워커 시작 또는 초기화)')
+        lines.append(f'# TYPE {metric} gauge')
+        lines.append(f'{metric} {started_at:.0f}')
+        return '\n'.join(lines) + '\n'
+
+request_metrics = RequestMetrics(enabled=app.config['METRICS_ENABLED'])
+
+def current_request_endpoint():
+    """지표 라벨용 endpoint 이름 (라우트가 없는 요청은 'unmatched')"""
+    return request.endpoint or 'unmatched'
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    in_request = has_request_context()
+    if in_request:
+        timing = g.get('request_timing')
+        if timing is not None:
+            timing['queries'] += 1
+            timing['sql'] += elapsed
+
+    slow_query_ms = app.config['SLOW_QUERY_MS']
+    if slow_query_ms and elapsed * 1000 >= slow_query_ms:
+        endpoint = current_request_endpoint() if in_request else 'background'
+        if request_metrics.enabled:
+            request_metrics.count_slow_query(endpoint)
+        logger.warning("🐢 느린 쿼리 %.1fms [%s]: %s", elapsed * 1000, endpoint,
+                       ' '.join(statement.split())[:SLOW_QUERY_LOG_CHARS])
+
+@request_started.connect_via(app)
+def start_request_timing(sender, **extra):
+    if request_metrics.enabled:
+        g.request_timing = {'started': time.perf_counter(), 'queries': 0, 'sql': 0.0, 'render': 0.0}
+
+@before_render_template.connect_via(app)
+def start_render_timing(sender, template, context, **extra):
+    timing = g.get('request_timing')
+    if timing is not None:
+        timing['render_started'] = time.perf_counter()
+
+@template_rendered.connect_via(app)
+def finish_render_timing(sender, template, context, **extra):
+    timing = g.get('request_timing')
+    if timing is not None and 'render_started' in timing:
+        timing['render'] += time.perf_counter() - timing.pop('render_started')
+
+@request_finished.connect_via(app)
+def finish_request_timing(sender, response, **extra):
+    timing = g.pop('request_timing', None)
+    if timing is None:
+        return
+    duration = time.perf_counter() - timing['started']
+    endpoint = current_request_endpoint()
+    request_metrics.observe(endpoint, request.method, response.status_code, duration,
+                            timing['sql'], timing['render'], timing['queries'])
+    logger.debug("%s %s %s - %.1fms, 쿼리 %d개 (SQL %.1fms), 렌더 %.1fms", request.method, request.path,
+                 response.status_code, duration * 1000, timing['queries'], timing['sql'] * 1000,
+                 timing['render'] * 1000)
+
+@app.route('/metrics')
+def metrics():
+    """요청 계측 지표 (Prometheus 텍스트 형식, 개발자 로그인 또는 METRICS_TOKEN 필요, 워커별 값)"""
+    token = app.config['METRICS_TOKEN']
+    authorized = bool(token) and request.headers.get('Authorization') == f'Bearer {token}'
+    if not authorized and not (current_user.is_authenticated and current_user.role == '개발자'):
+        return jsonify({'error': '개발자만 접근할 수 있습니다.'}), 403
+    if not request_metrics.enabled:
+        return jsonify({'error': '요청 계측이 꺼져 있습니다. (METRICS_ENABLED=false)'}), 404
+
+    response = app.response_class(request_metrics.render(), mimetype='text/plain')
+    response.headers['Content-Type'] = 'text/plain; version=0.0.4; charset=utf-8'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 if __name__ == '__main__':
     # Firebase 초기화
     initialize_firebase()
     
+    # 아동 이름 검색 컬럼/색인 확인 (마이그레이션 이전부터 있던 아동의 검색 컬럼 채우기 포함)
+    with app.app_context():
+        ensure_child_search_index()
+    
     # 백업 스케줄러 시작
     start_backup_scheduler()
     
+    # 포인트 큐브 미리 로드 (디버그 리로더의 감시 프로세스 제외)
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        warm_points_cube()
+    
     # init_db() 제거 - 서버 재시작 시 데이터 초기화 방지
     app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=True)
 else:
@@ -3770,10 +7231,15 @@ else:
         initialize_firebase()
         
         db.create_all()
+        ensure_child_search_index()
         # 기본 사용자가 없으면 생성 (한 번만) - Firebase 사용 시 임시 비활성화
         # if not User.query.filter_by(username='center_head').first():
         #     # init_db() 제거 - 실제 데이터 보호
         #     pass
     
     # 배포 환경에서도 백업 스케줄러 시작
-    start_backup_scheduler()
\ No newline at end of file
+    start_backup_scheduler()
+    
+    # gunicorn 워커면 포인트 큐브 미리 로드 (시드/복원 스크립트나 flask CLI 명령에서는 생략)
+    if 'gunicorn' in os.environ.get('SERVER_SOFTWARE', ''):
+        warm_points_cube()
\ No newline at end of file
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+애플리케이션 캐시 (프로세스 내 LRU + TTL, 선택적으로 SQLite 공유 백엔드)
+
+- 값은 pickle로 직렬화해서 저장하고, 직렬화된 크기 기준으로 바이트 한도를 지킨다.
+- 캐시 키에 데이터 버전이 들어가므로 쓰기 경로에서 invalidate('points')처럼 버전만 올리면
+  이전 항목은 더 이상 조회되지 않고 LRU/TTL로 밀려난다.
+- memory 백엔드는 워커 프로세스마다 따로 존재한다 (다른 워커의 무효화는 TTL 안에 반영).
+  sqlite 백엔드는 같은 서버의 모든 워커가 한 파일을 공유하므로 무효화가 즉시 반영된다.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+# 모든 캐시 키에 들어가는 전체 버전 (invalidate()를 인자 없이 부르면 증가)
+GLOBAL_NAMESPACE = '*'
+
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 캐시 (항목 수 + 바이트 한도, 항목별 만료 시각)"""
+
+    name = 'memory'
+
+    def __init__(self, max_entries=1024, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (만료 시각, 직렬화된 값)
+        self.versions = {}
+        self.total_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """(찾음 여부, 직렬화된 값) 반환"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                self.expirations += 1
+                return False, None
+            self.entries.move_to_end(key)
+            return True, payload
+
+    def set(self, key, payload, ttl):
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.time() + ttl, payload)
+            self.total_bytes += len(payload)
+            while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, payload = self.entries.pop(key)
+        self.total_bytes -= len(payload)
+
+    def get_versions(self, namespaces):
+        with self.lock:
+            return [self.versions.get(namespace, 0) for namespace in namespaces]
+
+    def bump_versions(self, namespaces):
+        with self.lock:
+            for namespace in namespaces:
+                self.versions[namespace] = self.versions.get(namespace, 0) + 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def usage(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+class SQLiteCacheBackend:
+    """SQLite 파일 캐시 - 같은 서버의 여러 워커가 항목과 데이터 버전을 공유"""
+
+    name = 'sqlite'
+
+    def __init__(self, path, max_entries=4096, max_bytes=64 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.expirations = 0
+        self.local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entry (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            connection.execute('CREATE INDEX IF NOT EXISTS ix_cache_entry_accessed ON cache_entry (accessed_at)')
+            connection.execute('CREATE TABLE IF NOT EXISTS cache_version (namespace TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+
+    def _connect(self):
+        # 스레드마다 연결 하나 (sqlite3 연결은 스레드 간 공유 불가)
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self.local.connection = connection
+        return connection
+
+    def get(self, key):
+        connection = self._connect()
+        row = connection.execute('SELECT value, expires_at FROM cache_entry WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return False, None
+        now = time.time()
+        if row[1] <= now:
+            connection.execute('DELETE FROM cache_entry WHERE key = ?', (key,))
+            self.expirations += 1
+            return False, None
+        connection.execute('UPDATE cache_entry SET accessed_at = ? WHERE key = ?', (now, key))
+        return True, row[0]
+
+    def set(self, key, payload, ttl):
+        connection = self._connect()
+        now = time.time()
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            connection.execute(
+                'INSERT OR REPLACE INTO cache_entry (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (key, payload, len(payload), now + ttl, now)
+            )
+            # 만료 항목부터 지우고, 그래도 한도를 넘으면 가장 오래 안 쓴 항목부터 삭제
+            self.expirations += connection.execute('DELETE FROM cache_entry WHERE expires_at <= ?', (now,)).rowcount
+            count, total = connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entry').fetchone()
+            if count > self.max_entries or total > self.max_bytes:
+                removed = 0
+                for old_key, size in connection.execute(
+                    'SELECT key, size FROM cache_entry WHERE key != ? ORDER BY accessed_at', (key,)
+                ).fetchall():
+                    if count <= self.max_entries and total <= self.max_bytes:
+                        break
+                    connection.execute('DELETE FROM cache_entry WHERE key = ?', (old_key,))
+                    count -= 1
+                    total -= size
+                    removed += 1
+                self.evictions += removed
+
+    def get_versions(self, namespaces):
+        connection = self._connect()
+        placeholders = ','.join('?' * len(namespaces))
+        versions = dict(connection.execute(
+            f'SELECT namespace, version FROM cache_version WHERE namespace IN ({placeholders})', list(namespaces)
+        ).fetchall())
+        return [versions.get(namespace, 0) for namespace in namespaces]
+
+    def bump_versions(self, namespaces):
+        connection = self._connect()
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            for namespace in namespaces:
+                connection.execute("""
+                    INSERT INTO cache_version (namespace, version) VALUES (?, 1)
+                    ON CONFLICT(namespace) DO UPDATE SET version = version + 1
+                """, (namespace,))
+
+    def clear(self):
+        self._connect().execute('DELETE FROM cache_entry')
+
+    def usage(self):
+        count, total = self._connect().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entry').fetchone()
+        return {
+            'entries': count,
+            'bytes': total,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+
+def create_cache_backend(kind='memory', path=None, max_entries=1024, max_bytes=32 * 1024 * 1024):
+    """설정값으로 백엔드 생성 ('none'이면 None - 캐시 사용 안 함)"""
+    if kind == 'none':
+        return None
+    if kind == 'sqlite':
+        return SQLiteCacheBackend(path, max_entries=max_entries, max_bytes=max_bytes)
+    if kind == 'memory':
+        return MemoryCacheBackend(max_entries=max_entries, max_bytes=max_bytes)
+    raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {kind}")
+
+
+class AppCache:
+    """데이터 버전 기반 캐시 (백엔드 교체 가능, 히트/미스 지표 제공)"""
+
+    def __init__(self, backend=None, default_ttl=300):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.stats_lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'sets': 0, 'rejected': 0, 'errors': 0, 'invalidations': 0}
+
+    def configure(self, backend, default_ttl=None):
+        self.backend = backend
+        if default_ttl is not None:
+            self.default_ttl = default_ttl
+
+    def _count(self, name):
+        with self.stats_lock:
+            self.counters[name] += 1
+
+    def make_key(self, name, args, kwargs, depends):
+        """함수 이름 + 인자 + 의존 데이터 버전으로 키 생성"""
+        namespaces = [GLOBAL_NAMESPACE] + list(depends)
+        versions = self.backend.get_versions(namespaces)
+        raw = repr((name, args, sorted(kwargs.items()), list(zip(namespaces, versions))))
+        return f"{name}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+    def get_or_compute(self, name, func, args=(), kwargs=None, ttl=None, depends=()):
+        """캐시에 있으면 반환, 없으면 계산해서 저장
+
+        캐시 오류(잠금 시간 초과 등)가 나도 요청은 실패하지 않도록 직접 계산한 값을 반환한다.
+        """
+        kwargs = kwargs or {}
+        ttl = ttl() if callable(ttl) else ttl
+        ttl = self.default_ttl if ttl is None else ttl
+        if self.backend is None or ttl <= 0:
+            return func(*args, **kwargs)
+
+        try:
+            key = self.make_key(name, args, kwargs, depends)
+            found, payload = self.backend.get(key)
+            if found:
+                self._count('hits')
+                return pickle.loads(payload)
+        except Exception:
+            self._count('errors')
+            return func(*args, **kwargs)
+
+        self._count('misses')
+        value = func(*args, **kwargs)
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            # 한 항목이 한도의 1/4을 넘으면 다른 항목을 모두 밀어내므로 저장하지 않음
+            if len(payload) > self.backend.max_bytes // 4:
+                self._count('rejected')
+            else:
+                self.backend.set(key, payload, ttl)
+                self._count('sets')
+        except Exception:
+            self._count('errors')
+        return value
+
+    def cached(self, name, ttl=None, depends=()):
+        """함수 결과를 인자별로 캐시하는 데코레이터
+
+        depends의 데이터 버전이 바뀌면(invalidate) 자동으로 새로 계산된다.
+        ttl은 초 단위 숫자 또는 호출 시점에 값을 돌려주는 함수.
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.get_or_compute(name, func, args, kwargs, ttl=ttl, depends=depends)
+            wrapper.uncached = func
+            return wrapper
+        return decorator
+
+    def invalidate(self, *namespaces):
+        """데이터 버전 증가 (인자가 없으면 모든 캐시 무효화)"""
+        if self.backend is None:
+            return
+        try:
+            self.backend.bump_versions(namespaces or (GLOBAL_NAMESPACE,))
+            self._count('invalidations')
+        except Exception:
+            self._count('errors')
+
+    def versions(self, *namespaces):
+        """현재 데이터 버전 (전체 버전 포함, 캐시를 쓰지 않거나 오류면 None)
+
+        캐시 밖에서 데이터 변경 여부를 판단할 때 사용 (예: 포인트 큐브 갱신).
+        """
+        if self.backend is None:
+            return None
+        try:
+            return tuple(self.backend.get_versions([GLOBAL_NAMESPACE] + list(namespaces)))
+        except Exception:
+            self._count('errors')
+            return None
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self):
+        """히트/미스/축출 등 지표 (카운터는 현재 프로세스 기준)"""
+        with self.stats_lock:
+            counters = dict(self.counters)
+        lookups = counters['hits'] + counters['misses']
+        result = {
+            'backend': self.backend.name if self.backend else 'none',
+            'default_ttl': self.default_ttl,
+            'hit_rate': round(counters['hits'] / lookups, 3) if lookups else None,
+            **counters
+        }
+        if self.backend is not None:
+            usage = self.backend.usage()
+            result.update(usage, max_entries=self.backend.max_entries, max_bytes=self.backend.max_bytes)
+        return result
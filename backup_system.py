@@ -29,6 +29,8 @@ backup_bp = Blueprint('backup', __name__, url_prefix='/backup')
 
 # 데이터베이스 모델들은 app.py에서 import
 from app import db, Child, DailyPoints, PointsHistory, User, Notification, app
+# Excel/DB 백업은 app.py의 스트리밍·온라인 백업 구현을 함께 사용
+from app import create_excel_backup, create_database_backup
 
 def create_backup_directory():
     """백업 디렉토리 생성"""
@@ -165,137 +167,6 @@ def create_json_backup(backup_data, backup_dir, backup_type='manual'):
     except Exception as e:
         return None, str(e)
 
-def create_excel_backup(backup_data, backup_dir, backup_type='manual'):
-    """Excel 형태로 백업 생성"""
-    if not BACKUP_EXCEL_AVAILABLE:
-        print("❌ Excel 백업을 위한 패키지가 설치되지 않았습니다.")
-        return None, "pandas 또는 openpyxl 패키지가 설치되지 않았습니다."
-    
-    try:
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        
-        if backup_type == 'daily':
-            filename = f"{datetime.now().strftime('%Y-%m-%d')}_{timestamp.split('_')[1]}.xlsx"
-            filepath = os.path.join(backup_dir, 'daily', filename)
-        elif backup_type == 'monthly':
-            filename = f"{datetime.now().strftime('%Y-%m')}_archive.xlsx"
-            filepath = os.path.join(backup_dir, 'monthly', filename)
-        else:
-            filename = f"{timestamp}.xlsx"
-            filepath = os.path.join(backup_dir, 'realtime', filename)
-        
-        # Excel 워크북 생성
-        wb = Workbook()
-        
-        # 아동 정보 시트
-        ws_children = wb.active
-        ws_children.title = "아동정보"
-        ws_children.append(['ID', '이름', '학년', '누적포인트', '생성일'])
-        
-        for child in backup_data['children']:
-            ws_children.append([
-                child['id'],
-                child['name'],
-                child['grade'],
-                child['cumulative_points'],
-                child['created_at']
-            ])
-        
-        # 포인트 기록 시트
-        ws_points = wb.create_sheet("포인트기록")
-        ws_points.append(['ID', '아동ID', '날짜', '국어', '수학', '쎈수학', '독서', '총점', '입력자', '생성일'])
-        
-        for point in backup_data['daily_points']:
-            ws_points.append([
-                point['id'],
-                point['child_id'],
-                point['date'],
-                point['korean_points'],
-                point['math_points'],
-                point['ssen_points'],
-                point['reading_points'],
-                point['total_points'],
-                point['created_by'],
-                point['created_at']
-            ])
-        
-        # 포인트 히스토리 시트
-        ws_history = wb.create_sheet("포인트변경이력")
-        ws_history.append(['ID', '아동ID', '날짜', '변경타입', '변경자', '변경일', '변경사유'])
-        
-        for history in backup_data['points_history']:
-            ws_history.append([
-                history['id'],
-                history['child_id'],
-                history['date'],
-                history['change_type'],
-                history['changed_by'],
-                history['changed_at'],
-                history['change_reason']
-            ])
-        
-        # 사용자 정보 시트
-        ws_users = wb.create_sheet("사용자정보")
-        ws_users.append(['ID', '사용자명', '이름', '권한', '생성일'])
-        
-        for user in backup_data['users']:
-            ws_users.append([
-                user['id'],
-                user['username'],
-                user['name'],
-                user['role'],
-                user['created_at']
-            ])
-        
-        # 메타데이터 시트
-        ws_meta = wb.create_sheet("백업메타데이터")
-        meta = backup_data['backup_metadata']
-        ws_meta.append(['백업ID', meta['backup_id']])
-        ws_meta.append(['백업타입', meta['backup_type']])
-        ws_meta.append(['백업시간', meta['timestamp']])
-        ws_meta.append(['데이터버전', meta['data_version']])
-        ws_meta.append(['아동수', meta['records_count']['children']])
-        ws_meta.append(['포인트기록수', meta['records_count']['daily_points']])
-        ws_meta.append(['변경이력수', meta['records_count']['points_history']])
-        ws_meta.append(['사용자수', meta['records_count']['users']])
-        
-        # 스타일 적용
-        for ws in [ws_children, ws_points, ws_history, ws_users, ws_meta]:
-            for row in ws.iter_rows(min_row=1, max_row=1):
-                for cell in row:
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center')
-        
-        # 파일 저장
-        wb.save(filepath)
-        
-        return filepath, None
-        
-    except Exception as e:
-        return None, str(e)
-
-def create_database_backup(backup_dir):
-    """데이터베이스 파일 백업"""
-    try:
-        # 현재 DB 파일 경로
-        db_path = os.path.join(os.path.dirname(__file__), 'instance', 'child_center.db')
-        
-        if not os.path.exists(db_path):
-            return None, "데이터베이스 파일을 찾을 수 없습니다"
-        
-        # 백업 파일명
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        backup_filename = f"{datetime.now().strftime('%Y-%m-%d')}_{timestamp.split('_')[1]}_full.db"
-        backup_path = os.path.join(backup_dir, 'database', backup_filename)
-        
-        # 파일 복사
-        shutil.copy2(db_path, backup_path)
-        
-        return backup_path, None
-        
-    except Exception as e:
-        return None, str(e)
-
 def manual_backup():
     """수동 백업 실행"""
     try:
@@ -313,12 +184,12 @@ def manual_backup():
             return False, f"JSON 백업 생성 실패: {error}"
         
         # Excel 백업 생성
-        excel_path, error = create_excel_backup(backup_data, backup_dir, 'manual')
+        excel_path, error = create_excel_backup(backup_dir, 'manual')
         if error:
             return False, f"Excel 백업 생성 실패: {error}"
         
         # DB 백업 생성
-        db_path, error = create_database_backup(backup_dir)
+        db_path, error = create_database_backup(backup_dir, 'full')
         if error:
             return False, f"DB 백업 생성 실패: {error}"
         
@@ -354,7 +225,7 @@ def realtime_backup(child_id, action_type):
             return False
         
         # Excel 백업 생성
-        excel_path, error = create_excel_backup(backup_data, backup_dir, 'realtime')
+        excel_path, error = create_excel_backup(backup_dir, 'realtime')
         if error:
             print(f"실시간 Excel 백업 생성 실패: {error}")
             return False
@@ -0,0 +1,87 @@
+"""Add (child_id, date) unique indexes to DailyPoints and LearningRecord
+
+Revision ID: 8c1f4e2a9b37
+Revises: 251520942c74
+Create Date: 2025-09-08 21:14:02.418733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c1f4e2a9b37'
+down_revision = '251520942c74'
+branch_labels = None
+depends_on = None
+
+
+def fold_duplicates(table):
+    """같은 (child_id, date) 중복 기록을 가장 최근 기록(MAX(id)) 하나로 합침
+
+    조회 라우트들이 MAX(id) 기록을 기준으로 삼아 왔으므로 같은 기준을 유지한다.
+    중복이 정리된 아동의 ID 목록을 반환한다.
+    """
+    conn = op.get_bind()
+    affected = [row[0] for row in conn.execute(sa.text(f"""
+        SELECT DISTINCT child_id
+        FROM {table}
+        GROUP BY child_id, date
+        HAVING COUNT(*) > 1
+    """))]
+
+    if affected:
+        conn.execute(sa.text(f"""
+            DELETE FROM {table}
+            WHERE id NOT IN (
+                SELECT MAX(id)
+                FROM {table}
+                GROUP BY child_id, date
+            )
+        """))
+
+    return affected
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    # 1. 기존 중복 기록 정리
+    duplicated_children = fold_duplicates('daily_points')
+    fold_duplicates('learning_record')
+
+    # 중복이 있던 아동은 누적 포인트 재계산
+    for child_id in duplicated_children:
+        conn.execute(sa.text("""
+            UPDATE child
+            SET cumulative_points = (
+                SELECT COALESCE(SUM(total_points), 0)
+                FROM daily_points
+                WHERE daily_points.child_id = :child_id
+            )
+            WHERE id = :child_id
+        """), {"child_id": child_id})
+
+    # 2. 인덱스 생성 (앱 시작 시 db.create_all()로 이미 만들어진 인덱스는 건너뜀)
+    inspector = sa.inspect(conn)
+    for table, indexes in (
+        ('daily_points', [('uq_daily_points_child_date', ['child_id', 'date'], True),
+                          ('ix_daily_points_date', ['date'], False)]),
+        ('learning_record', [('uq_learning_record_child_date', ['child_id', 'date'], True),
+                             ('ix_learning_record_date', ['date'], False)]),
+    ):
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, columns, unique in indexes:
+                if name not in existing:
+                    batch_op.create_index(name, columns, unique=unique)
+
+
+def downgrade():
+    with op.batch_alter_table('learning_record', schema=None) as batch_op:
+        batch_op.drop_index('ix_learning_record_date')
+        batch_op.drop_index('uq_learning_record_child_date')
+
+    with op.batch_alter_table('daily_points', schema=None) as batch_op:
+        batch_op.drop_index('ix_daily_points_date')
+        batch_op.drop_index('uq_daily_points_child_date')
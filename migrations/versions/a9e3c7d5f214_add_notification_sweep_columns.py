@@ -0,0 +1,38 @@
+"""Add repeat_count and expiry/type indexes to Notification (expiry sweeper, backup notification collapsing)
+
+Revision ID: a9e3c7d5f214
+Revises: d8a4f6c2b1e7
+Create Date: 2025-09-24 08:37:12.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9e3c7d5f214'
+down_revision = 'd8a4f6c2b1e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('notification')}
+    # 앱 시작 시 db.create_all()로 이미 만들어진 인덱스는 건너뜀
+    indexes = {index['name'] for index in inspector.get_indexes('notification')}
+
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        if 'repeat_count' not in columns:
+            batch_op.add_column(sa.Column('repeat_count', sa.Integer(), nullable=True))
+        if 'ix_notification_expire_date' not in indexes:
+            batch_op.create_index('ix_notification_expire_date', ['expire_date'], unique=False)
+        if 'ix_notification_type_created' not in indexes:
+            batch_op.create_index('ix_notification_type_created', ['type', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.drop_index('ix_notification_type_created')
+        batch_op.drop_index('ix_notification_expire_date')
+        batch_op.drop_column('repeat_count')
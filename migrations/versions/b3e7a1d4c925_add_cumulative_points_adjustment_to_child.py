@@ -0,0 +1,37 @@
+"""Add cumulative_points_adjustment to Child (incremental cumulative points + reconciliation)
+
+Revision ID: b3e7a1d4c925
+Revises: f2c8d4b6a913
+Create Date: 2025-09-18 21:12:05.734190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e7a1d4c925'
+down_revision = 'f2c8d4b6a913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('child', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cumulative_points_adjustment', sa.Integer(), nullable=True))
+
+    # 현재 누적 포인트와 일일 포인트 합계의 차이를 보정값으로 저장
+    # (누적 포인트 관리 화면에서 직접 입력한 값이 대사 작업으로 덮어써지지 않도록)
+    op.get_bind().execute(sa.text("""
+        UPDATE child
+        SET cumulative_points_adjustment = COALESCE(cumulative_points, 0) - (
+            SELECT COALESCE(SUM(total_points), 0)
+            FROM daily_points
+            WHERE daily_points.child_id = child.id
+        )
+    """))
+
+
+def downgrade():
+    with op.batch_alter_table('child', schema=None) as batch_op:
+        batch_op.drop_column('cumulative_points_adjustment')
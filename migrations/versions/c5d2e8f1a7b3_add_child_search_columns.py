@@ -0,0 +1,62 @@
+"""Add normalized name search columns to Child (indexed name/choseong search)
+
+Revision ID: c5d2e8f1a7b3
+Revises: b3e7a1d4c925
+Create Date: 2025-09-20 10:41:27.118364
+
+"""
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d2e8f1a7b3'
+down_revision = 'b3e7a1d4c925'
+branch_labels = None
+depends_on = None
+
+# 마이그레이션 시점의 정규화 규칙 (app.py의 build_name_search_keys와 같음 - 이후 앱 변경에 영향받지 않도록 복사)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_FIRST, HANGUL_LAST = ord('가'), ord('힣')
+
+
+def build_name_search_keys(name):
+    normalized = ''.join(CHOSEONG[ord(char) - 0x1100] if 0x1100 <= ord(char) <= 0x1112 else char
+                         for char in unicodedata.normalize('NFC', name or '').casefold() if not char.isspace())
+    choseong = ''.join(CHOSEONG[(ord(char) - HANGUL_FIRST) // 588] if HANGUL_FIRST <= ord(char) <= HANGUL_LAST else char
+                       for char in normalized)
+    return normalized, choseong
+
+
+def upgrade():
+    with op.batch_alter_table('child', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_name', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('search_choseong', sa.String(length=100), nullable=True))
+        batch_op.create_index('ix_child_search_name', ['search_name'], unique=False)
+        batch_op.create_index('ix_child_search_choseong', ['search_choseong'], unique=False)
+
+    # 기존 아동의 검색 컬럼 채우기 (FTS 색인/트리거는 앱 시작 시 ensure_child_search_index()가 만든다)
+    connection = op.get_bind()
+    children = connection.execute(sa.text("SELECT id, name FROM child WHERE search_name IS NULL")).all()
+    if children:
+        connection.execute(
+            sa.text("UPDATE child SET search_name = :search_name, search_choseong = :search_choseong WHERE id = :id"),
+            [dict(zip(('search_name', 'search_choseong'), build_name_search_keys(name)), id=child_id)
+             for child_id, name in children]
+        )
+
+
+def downgrade():
+    connection = op.get_bind()
+    if connection.dialect.name == 'sqlite':
+        for trigger in ('child_search_fts_ai', 'child_search_fts_ad', 'child_search_fts_au'):
+            connection.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(sa.text("DROP TABLE IF EXISTS child_search_fts"))
+
+    with op.batch_alter_table('child', schema=None) as batch_op:
+        batch_op.drop_index('ix_child_search_choseong')
+        batch_op.drop_index('ix_child_search_name')
+        batch_op.drop_column('search_choseong')
+        batch_op.drop_column('search_name')
@@ -0,0 +1,103 @@
+"""Add points_rollup table (daily/weekly/monthly points totals)
+
+Revision ID: d47b2e915a60
+Revises: 8c1f4e2a9b37
+Create Date: 2025-09-09 20:41:37.902154
+
+"""
+from datetime import datetime, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd47b2e915a60'
+down_revision = '8c1f4e2a9b37'
+branch_labels = None
+depends_on = None
+
+SUBJECTS = ('korean_points', 'math_points', 'ssen_points', 'reading_points', 'total_points')
+
+
+def period_start(period_type, target_date):
+    if period_type == 'week':
+        return target_date - timedelta(days=target_date.weekday())
+    if period_type == 'month':
+        return target_date.replace(day=1)
+    return target_date
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    # 앱 시작 시 db.create_all()이 먼저 테이블을 만들었을 수 있음
+    if 'points_rollup' not in sa.inspect(conn).get_table_names():
+        op.create_table('points_rollup',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('period_type', sa.String(length=10), nullable=False),
+            sa.Column('period_start', sa.Date(), nullable=False),
+            sa.Column('child_id', sa.Integer(), nullable=False),
+            sa.Column('grade', sa.Integer(), nullable=False),
+            sa.Column('korean_points', sa.Integer(), nullable=True),
+            sa.Column('math_points', sa.Integer(), nullable=True),
+            sa.Column('ssen_points', sa.Integer(), nullable=True),
+            sa.Column('reading_points', sa.Integer(), nullable=True),
+            sa.Column('total_points', sa.Integer(), nullable=True),
+            sa.Column('record_count', sa.Integer(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['child_id'], ['child.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('points_rollup', schema=None) as batch_op:
+            batch_op.create_index('uq_points_rollup_period_child', ['period_type', 'period_start', 'child_id'], unique=True)
+            batch_op.create_index('ix_points_rollup_period_grade', ['period_type', 'grade', 'period_start'], unique=False)
+
+    rollup_table = sa.table('points_rollup',
+        sa.column('period_type', sa.String), sa.column('period_start', sa.Date),
+        sa.column('child_id', sa.Integer), sa.column('grade', sa.Integer),
+        sa.column('record_count', sa.Integer), sa.column('updated_at', sa.DateTime),
+        *[sa.column(subject, sa.Integer) for subject in SUBJECTS]
+    )
+    if conn.execute(sa.select(sa.func.count()).select_from(rollup_table)).scalar():
+        return
+
+    # 기존 DailyPoints로 초기 집계 생성
+    daily_points = sa.table('daily_points',
+        sa.column('child_id', sa.Integer), sa.column('date', sa.Date),
+        *[sa.column(subject, sa.Integer) for subject in SUBJECTS]
+    )
+    child = sa.table('child', sa.column('id', sa.Integer), sa.column('grade', sa.Integer))
+
+    rows = conn.execute(
+        sa.select(daily_points, child.c.grade).select_from(
+            daily_points.join(child, child.c.id == daily_points.c.child_id)
+        )
+    )
+
+    totals = {}
+    for row in rows:
+        for period_type in ('day', 'week', 'month'):
+            key = (period_type, period_start(period_type, row.date), row.child_id)
+            entry = totals.get(key)
+            if entry is None:
+                entry = totals[key] = dict.fromkeys(SUBJECTS, 0)
+                entry['grade'] = row.grade
+                entry['record_count'] = 0
+            for subject in SUBJECTS:
+                entry[subject] += getattr(row, subject) or 0
+            entry['record_count'] += 1
+
+    now = datetime.utcnow()
+    op.bulk_insert(rollup_table, [
+        dict(period_type=key[0], period_start=key[1], child_id=key[2], updated_at=now, **entry)
+        for key, entry in totals.items()
+    ])
+
+
+def downgrade():
+    with op.batch_alter_table('points_rollup', schema=None) as batch_op:
+        batch_op.drop_index('ix_points_rollup_period_grade')
+        batch_op.drop_index('uq_points_rollup_period_child')
+
+    op.drop_table('points_rollup')
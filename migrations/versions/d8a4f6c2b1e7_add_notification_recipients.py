@@ -0,0 +1,79 @@
+"""Add per-user notification read state and unread counter
+
+Revision ID: d8a4f6c2b1e7
+Revises: c5d2e8f1a7b3
+Create Date: 2025-09-22 19:03:48.552901
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8a4f6c2b1e7'
+down_revision = 'c5d2e8f1a7b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 앱 시작 시 db.create_all()이 먼저 테이블을 만들었을 수 있음
+    if 'notification_recipient' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table('notification_recipient',
+            sa.Column('notification_id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('is_read', sa.Boolean(), nullable=False),
+            sa.Column('read_at', sa.DateTime(), nullable=True),
+            sa.Column('priority', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('expire_date', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['notification_id'], ['notification.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('notification_id', 'user_id')
+        )
+        with op.batch_alter_table('notification_recipient', schema=None) as batch_op:
+            batch_op.create_index('ix_notification_recipient_inbox',
+                                  ['user_id', 'priority', 'created_at', 'notification_id'], unique=False)
+            batch_op.create_index('ix_notification_recipient_unread',
+                                  ['user_id', 'is_read', 'priority', 'created_at', 'notification_id'], unique=False)
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('unread_notifications', sa.Integer(), nullable=False, server_default='0'))
+
+    # 만료되지 않은 기존 알림을 이전 조회 조건(개인/전체/역할 공지, 아동 관련 알림은 모든 사용자)대로 배달
+    # 이전의 전체 읽음 표시는 각 사용자의 초기 읽음 상태로 옮긴다
+    connection = op.get_bind()
+    connection.execute(sa.text("""
+        INSERT INTO notification_recipient (notification_id, user_id, is_read, read_at, priority, created_at, expire_date)
+        SELECT n.id, u.id, COALESCE(n.is_read, :false), n.read_at, COALESCE(n.priority, 1),
+               COALESCE(n.created_at, :now), n.expire_date
+        FROM notification n
+        JOIN "user" u ON (
+            n.target_user_id = u.id
+            OR (n.target_user_id IS NULL AND (n.target_role IS NULL OR n.target_role = u.role))
+            OR n.child_id IS NOT NULL
+        )
+        WHERE (n.expire_date IS NULL OR n.expire_date > :now)
+        AND NOT EXISTS (
+            SELECT 1 FROM notification_recipient r WHERE r.notification_id = n.id AND r.user_id = u.id
+        )
+    """), {'false': False, 'now': datetime.utcnow()})
+    connection.execute(sa.text("""
+        UPDATE "user" SET unread_notifications = (
+            SELECT COUNT(*) FROM notification_recipient r
+            WHERE r.user_id = "user".id AND r.is_read = :false
+        )
+    """), {'false': False})
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('unread_notifications')
+
+    with op.batch_alter_table('notification_recipient', schema=None) as batch_op:
+        batch_op.drop_index('ix_notification_recipient_unread')
+        batch_op.drop_index('ix_notification_recipient_inbox')
+
+    op.drop_table('notification_recipient')
@@ -0,0 +1,66 @@
+"""Add backup_catalog and backup_catalog_stats tables (indexed list of backup artifacts)
+
+Revision ID: e5a9c3d71f08
+Revises: d47b2e915a60
+Create Date: 2025-09-14 19:02:51.615204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a9c3d71f08'
+down_revision = 'd47b2e915a60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 앱 시작 시 db.create_all()이 먼저 테이블을 만들었을 수 있음
+    # 기존 백업 파일은 `flask sync-backup-catalog`로 등록한다.
+    existing = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'backup_catalog_stats' not in existing:
+        op.create_table('backup_catalog_stats',
+            sa.Column('backup_type', sa.String(length=20), nullable=False),
+            sa.Column('entry_count', sa.Integer(), nullable=True),
+            sa.Column('total_bytes', sa.BigInteger(), nullable=True),
+            sa.Column('last_backup_at', sa.DateTime(), nullable=True),
+            sa.Column('snapshot_count', sa.Integer(), nullable=True),
+            sa.Column('snapshot_bytes', sa.BigInteger(), nullable=True),
+            sa.PrimaryKeyConstraint('backup_type')
+        )
+
+    if 'backup_catalog' in existing:
+        return
+
+    op.create_table('backup_catalog',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('backup_type', sa.String(length=20), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('path', sa.String(length=255), nullable=False),
+        sa.Column('size_bytes', sa.BigInteger(), nullable=True),
+        sa.Column('row_counts', sa.Text(), nullable=True),
+        sa.Column('checksum', sa.String(length=64), nullable=True),
+        sa.Column('db_version', sa.String(length=32), nullable=True),
+        sa.Column('snapshot_id', sa.String(length=100), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('backup_catalog', schema=None) as batch_op:
+        batch_op.create_index('ix_backup_catalog_type_created', ['backup_type', 'created_at'], unique=False)
+        batch_op.create_index('ix_backup_catalog_created', ['created_at'], unique=False)
+        batch_op.create_index('ix_backup_catalog_path', ['path'], unique=False)
+        batch_op.create_index('ix_backup_catalog_snapshot', ['snapshot_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('backup_catalog', schema=None) as batch_op:
+        batch_op.drop_index('ix_backup_catalog_snapshot')
+        batch_op.drop_index('ix_backup_catalog_path')
+        batch_op.drop_index('ix_backup_catalog_created')
+        batch_op.drop_index('ix_backup_catalog_type_created')
+
+    op.drop_table('backup_catalog')
+    op.drop_table('backup_catalog_stats')
@@ -0,0 +1,29 @@
+"""Add updated_at index to DailyPoints (incremental points cube refresh / delta backup)
+
+Revision ID: f2c8d4b6a913
+Revises: e5a9c3d71f08
+Create Date: 2025-09-16 20:41:37.208514
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8d4b6a913'
+down_revision = 'e5a9c3d71f08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 앱 시작 시 db.create_all()로 이미 만들어진 인덱스는 건너뜀
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('daily_points')}
+    if 'ix_daily_points_updated' not in existing:
+        with op.batch_alter_table('daily_points', schema=None) as batch_op:
+            batch_op.create_index('ix_daily_points_updated', ['updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('daily_points', schema=None) as batch_op:
+        batch_op.drop_index('ix_daily_points_updated')
@@ -18,6 +18,7 @@ from datetime import datetime
 import os
 import sys
 import shutil
+import tempfile
 from datetime import datetime
 
 def create_restore_notification(status, message):
@@ -33,17 +34,122 @@ def create_restore_notification(status, message):
     except Exception as e:
         print(f"⚠️  알림 생성 실패: {e}")
 
+def upgrade_schema_after_restore():
+    """복원된 DB를 현재 코드의 스키마로 마이그레이션 (flask db upgrade)
+
+    마이그레이션 이전에 만든 백업이면 새 컬럼/인덱스가 없으므로 create_all()로는 맞출 수 없다.
+    alembic_version이 없는 DB(마이그레이션 도입 전)는 버전을 알 수 없어 새 테이블만 만들고 안내한다.
+    """
+    try:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        sys.path.append(current_dir)
+        from app import app, db
+        from flask_migrate import upgrade
+        
+        with app.app_context():
+            # 복원 전 DB에 열려 있던 연결을 버리고 복원된 파일로 다시 연결
+            db.engine.dispose()
+            if db.inspect(db.engine).has_table('alembic_version'):
+                upgrade(directory=os.path.join(current_dir, 'migrations'))
+                print("🧬 복원된 DB 스키마를 최신 마이그레이션으로 업그레이드했습니다.")
+            else:
+                db.create_all()
+                print("⚠️  복원된 DB에 마이그레이션 버전 정보가 없어 새 테이블만 만들었습니다.")
+                print("   기존 테이블의 컬럼은 'flask db stamp <백업 당시 리비전>' 후 'flask db upgrade'로 맞추세요.")
+        return True
+    except Exception as e:
+        print(f"⚠️  스키마 업그레이드 실패: {e}")
+        return False
+
+def rebuild_rollups_after_restore():
+    """복원된 DB 기준으로 포인트 집계 테이블 재생성"""
+    try:
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        from app import app, db, rebuild_points_rollup, app_cache, ensure_child_search_index
+        
+        with app.app_context():
+            rebuild_points_rollup()
+            # 이름 검색 색인도 복원된 아동 테이블 기준으로 다시 생성
+            ensure_child_search_index(rebuild=True)
+            # 이 프로세스의 캐시 버전만 올라감 (sqlite 백엔드면 다른 워커도 보지만, 포인트 큐브 등은 서버 재시작 필요)
+            app_cache.invalidate()
+    except Exception as e:
+        print(f"⚠️  포인트 집계 재생성 실패: {e}")
+
+def sync_catalog_after_restore():
+    """복원된 DB의 백업 카탈로그를 실제 백업 파일 기준으로 다시 맞춤"""
+    try:
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        from app import app, db, sync_backup_catalog
+        
+        with app.app_context():
+            added, removed = sync_backup_catalog()
+            print(f"🗂️ 백업 카탈로그 동기화: {added}개 추가, {removed}개 삭제")
+    except Exception as e:
+        print(f"⚠️  백업 카탈로그 동기화 실패: {e}")
+
+def restore_incremental(until=None):
+    """증분 백업(기준 스냅샷 + 델타)을 재생해서 특정 시점으로 복원"""
+    try:
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        from app import app, restore_incremental_backup
+        
+        with app.app_context():
+            metadata, error = restore_incremental_backup(until)
+        
+        if error:
+            error_msg = f"증분 복원 실패: {error}"
+            print(f"❌ {error_msg}")
+            create_restore_notification('failed', error_msg)
+            return False
+        
+        success_msg = f"증분 복원 완료: {metadata['backup_id']} 시점 ({metadata['timestamp']})"
+        print(f"✅ {success_msg}")
+        counts = metadata['records_count']
+        print(f"📊 아동 {counts['children']}명, 포인트 {counts['daily_points']}건, 변경이력 {counts['points_history']}건")
+        create_restore_notification('success', success_msg)
+        return True
+        
+    except Exception as e:
+        error_msg = f"증분 복원 실패: {e}"
+        print(f"❌ {error_msg}")
+        create_restore_notification('failed', error_msg)
+        return False
+
 def restore_backup(backup_filename):
-    """백업 파일에서 데이터베이스 복원"""
-    
-    # 현재 디렉토리 확인
+    """backups/database의 백업 파일에서 데이터베이스 복원"""
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # 백업 파일 경로
     backup_path = os.path.join(current_dir, 'backups', 'database', backup_filename)
+    return restore_database_file(backup_path, backup_filename)
+
+def restore_snapshot(snapshot_id):
+    """중복 제거 저장소 스냅샷의 DB 파일을 조립해서 복원"""
+    try:
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        from app import app, restore_backup_snapshot_files
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with app.app_context():
+                restored_files = restore_backup_snapshot_files(snapshot_id, temp_dir)
+            db_files = [path for path in restored_files if path.endswith('.db')]
+            if not db_files:
+                error_msg = f"스냅샷에 DB 파일이 없습니다: {snapshot_id}"
+                print(f"❌ {error_msg}")
+                create_restore_notification('failed', error_msg)
+                return False
+            return restore_database_file(db_files[0], snapshot_id)
+        
+    except Exception as e:
+        error_msg = f"스냅샷 복원 실패: {e}"
+        print(f"❌ {error_msg}")
+        create_restore_notification('failed', error_msg)
+        return False
+
+def restore_database_file(backup_path, backup_filename):
+    """백업 DB 파일로 데이터베이스 복원 (SQLite 온라인 백업 API를 역방향으로 사용)"""
     
-    # 현재 DB 파일 경로
-    current_db = os.path.join(current_dir, 'child_center.db')
+    # 현재 디렉토리 확인
+    current_dir = os.path.dirname(os.path.abspath(__file__))
     
     # 백업 파일 존재 확인
     if not os.path.exists(backup_path):
@@ -52,20 +158,49 @@ def restore_backup(backup_filename):
         create_restore_notification('failed', error_msg)
         return False
     
-    # 현재 DB 백업 (안전을 위해)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    safety_backup = os.path.join(current_dir, f'child_center_safety_backup_{timestamp}.db')
-    
-    if os.path.exists(current_db):
-        shutil.copy2(current_db, safety_backup)
-        print(f"✅ 현재 DB를 안전 백업했습니다: {safety_backup}")
-    
-    # 복원 실행
     try:
-        shutil.copy2(backup_path, current_db)
+        sys.path.append(current_dir)
+        from app import app, get_sqlite_database_path, check_sqlite_integrity, copy_sqlite_database
+        
+        # 현재 DB 파일 경로 (앱 설정 기준)
+        with app.app_context():
+            current_db = get_sqlite_database_path()
+        if not current_db:
+            error_msg = "SQLite 데이터베이스가 아니어서 복원할 수 없습니다."
+            print(f"❌ {error_msg}")
+            create_restore_notification('failed', error_msg)
+            return False
+        
+        # 깨진 백업으로 덮어쓰지 않도록 먼저 검사
+        integrity = check_sqlite_integrity(backup_path)
+        if integrity != 'ok':
+            error_msg = f"백업 파일 무결성 검사 실패: {integrity}"
+            print(f"❌ {error_msg}")
+            create_restore_notification('failed', error_msg)
+            return False
+        
+        # 현재 DB 백업 (안전을 위해)
+        if os.path.exists(current_db):
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            safety_backup = os.path.join(current_dir, f'child_center_safety_backup_{timestamp}.db')
+            copy_sqlite_database(current_db, safety_backup)
+            print(f"✅ 현재 DB를 안전 백업했습니다: {safety_backup}")
+        
+        # 복원 실행 - 실행 중인 워커가 있어도 SQLite 잠금을 지키면서 페이지 단위로 덮어씀
+        stats = copy_sqlite_database(backup_path, current_db)
+        if stats['integrity'] != 'ok':
+            error_msg = f"복원 후 무결성 검사 실패: {stats['integrity']}"
+            print(f"❌ {error_msg}")
+            create_restore_notification('failed', error_msg)
+            return False
+        
+        upgrade_schema_after_restore()
+        rebuild_rollups_after_restore()
+        sync_catalog_after_restore()
         success_msg = f"복원 완료: {backup_filename}"
         print(f"✅ {success_msg}")
         print(f"📁 복원된 파일: {current_db}")
+        print(f"💾 {stats['bytes'] / (1024 * 1024):.1f}MB, {stats['seconds']}초 ({stats['mb_per_second']}MB/s)")
         create_restore_notification('success', success_msg)
         return True
         
@@ -97,6 +232,31 @@ def list_backups():
         print(f"{i:2d}. {filename}")
         print(f"    크기: {size:.1f} KB | 수정일: {modified.strftime('%Y-%m-%d %H:%M:%S')}")
         print()
+    
+    list_snapshots()
+
+def list_snapshots():
+    """중복 제거 저장소의 스냅샷 중 DB 파일이 있는 것 표시"""
+    try:
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        from app import app, list_backup_snapshots
+        
+        with app.app_context():
+            snapshots = [snapshot for snapshot in list_backup_snapshots()
+                         if any(file_info['path'].endswith('.db') for file_info in snapshot['files'])]
+    except Exception as e:
+        print(f"⚠️  스냅샷 목록 조회 실패: {e}")
+        return
+    
+    if not snapshots:
+        return
+    
+    print("\n📦 저장소 스냅샷 (python restore_backup.py --snapshot [스냅샷ID]):")
+    print("-" * 50)
+    for i, snapshot in enumerate(snapshots, 1):
+        print(f"{i:2d}. {snapshot['snapshot_id']}")
+        print(f"    논리 크기: {snapshot['logical_bytes'] / 1024:.1f} KB | 생성일: {snapshot['created_at'][:19].replace('T', ' ')}")
+        print()
 
 def main():
     if len(sys.argv) < 2:
@@ -105,6 +265,8 @@ def main():
         print("사용법:")
         print("  python restore_backup.py [백업파일명]")
         print("  python restore_backup.py --list")
+        print("  python restore_backup.py --snapshot [스냅샷ID]")
+        print("  python restore_backup.py --incremental [YYYY-MM-DDTHH:MM:SS]")
         print()
         
         list_backups()
@@ -114,6 +276,43 @@ def main():
         list_backups()
         return
     
+    if sys.argv[1] == '--incremental':
+        until = datetime.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else None
+        target = until.strftime('%Y-%m-%d %H:%M:%S') if until else '최신'
+        
+        print(f"⚠️  증분 백업에서 {target} 시점으로 포인트 데이터를 복원하시겠습니까?")
+        print("   현재 포인트 기록과 변경 이력이 백업 시점 상태로 덮어써집니다!")
+        confirm = input("   계속하려면 'yes'를 입력하세요: ")
+        
+        if confirm.lower() != 'yes':
+            print("❌ 복원이 취소되었습니다.")
+            return
+        
+        if restore_incremental(until):
+            print("\n🎉 복원이 완료되었습니다!")
+            print("💡 서버를 재시작하면 변경사항이 적용됩니다.")
+        else:
+            print("\n❌ 복원에 실패했습니다.")
+        return
+    
+    if sys.argv[1] == '--snapshot' and len(sys.argv) > 2:
+        snapshot_id = sys.argv[2]
+        
+        print(f"⚠️  저장소 스냅샷 '{snapshot_id}'에서 복원하시겠습니까?")
+        print("   현재 데이터가 백업으로 덮어써집니다!")
+        confirm = input("   계속하려면 'yes'를 입력하세요: ")
+        
+        if confirm.lower() != 'yes':
+            print("❌ 복원이 취소되었습니다.")
+            return
+        
+        if restore_snapshot(snapshot_id):
+            print("\n🎉 복원이 완료되었습니다!")
+            print("💡 서버를 재시작하면 변경사항이 적용됩니다.")
+        else:
+            print("\n❌ 복원에 실패했습니다.")
+        return
+    
     backup_filename = sys.argv[1]
     
     # 확인 메시지
@@ -0,0 +1,1384 @@
+#!/usr/bin/env python3
+"""
+성능 벤치마크 스크립트
+======================
+용도: 임시 SQLite DB에 대용량 시드 데이터를 넣고 주요 라우트 응답 시간을 측정
+특징: 실제 DB(instance/child_center.db)는 건드리지 않음 (임시 디렉토리 사용)
+사용법:
+  python scripts/benchmark.py indexes --rows 500000
+  python scripts/benchmark.py querycount
+  python scripts/benchmark.py charts --children 30 300 3000
+  python scripts/benchmark.py export --rows 1000000
+  python scripts/benchmark.py excel --rows 100000 1000000
+  python scripts/benchmark.py catalog --entries 1000 50000
+  python scripts/benchmark.py dashboard --children 300 --days 60
+  python scripts/benchmark.py cache --children 300 --days 60
+  python scripts/benchmark.py childseries --children 20 --days 600
+  python scripts/benchmark.py cube --children 100 10000 --years 5
+  python scripts/benchmark.py batch --children 30 300 --days 60
+  python scripts/benchmark.py cumulative --days 30 365 3650
+  python scripts/benchmark.py childhistory --children 100 --days 3650
+  python scripts/benchmark.py search --children 1000 5000
+  python scripts/benchmark.py notifications --notifications 1000 10000
+  python scripts/benchmark.py notifysweep --days 30 180 --per-day 200
+  python scripts/benchmark.py stream --children 300 --days 60 --subscribers 50
+  python scripts/benchmark.py metrics --children 300 --days 60
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# 앱 import 전에 임시 DB 경로 지정 (실제 DB 보호)
+# 메모리 측정용 하위 프로세스도 같은 DB를 쓰도록 환경변수로 전달
+_BENCH_DIR = os.environ.get('CLC_BENCH_DIR') or tempfile.mkdtemp(prefix='clc_bench_')
+os.environ['CLC_BENCH_DIR'] = _BENCH_DIR
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_BENCH_DIR, 'bench.db')}"
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from app import (
+    app, db, User, Child, DailyPoints, LearningRecord, rebuild_points_rollup,
+    get_backup_data, create_streaming_backup, create_excel_backup, BackupCatalog,
+    refresh_backup_catalog_stats, app_cache, build_child_point_series, PointsRollup, points_cube,
+    build_points_visualization, build_grade_point_comparison, build_points_statistics,
+    compute_dashboard_metrics, get_rollup_period_start, apply_points_rollup, ROLLUP_SUBJECTS,
+    get_points_ranking, realtime_backup_worker, apply_cumulative_points_deltas, reconcile_cumulative_points,
+    get_child_points_page, count_child_point_days, ensure_child_search_index, child_search_filter,
+    search_children, Notification, NotificationRecipient, get_user_notifications, recount_unread_notifications,
+    mark_notifications_read, delete_notifications, select_notification_ids, sweep_notifications,
+    event_broker, publish_dashboard_counters, format_stream_event, compute_dashboard_counters, request_metrics,
+    DASHBOARD_COUNTER_WINDOW
+)
+import app as app_module
+import sqlite3
+from sqlalchemy import func
+from app_cache import create_cache_backend
+
+BATCH_SIZE = 10000
+
+
+def seed(children_count, days, learning_ratio=0.25):
+    """벤치마크용 데이터 생성 (children_count × days 건의 DailyPoints)"""
+    random.seed(42)
+    today = datetime.utcnow().date()
+
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+
+    db.session.add(User(username='bench', name='벤치마크', role='개발자', password_hash=''))
+    db.session.commit()
+
+    db.session.execute(db.insert(Child), [
+        {'name': f'아동{i:05d}', 'grade': i % 6 + 1, 'include_in_stats': True, 'cumulative_points': 0}
+        for i in range(children_count)
+    ])
+    db.session.commit()
+
+    points_batch = []
+    records_batch = []
+    for child_id in range(1, children_count + 1):
+        for day in range(days):
+            current_date = today - timedelta(days=day)
+            created_at = datetime.combine(current_date, datetime.min.time()) + timedelta(hours=15)
+            korean, math, ssen, reading = (random.choice([0, 100, 200]) for _ in range(4))
+            points_batch.append({
+                'child_id': child_id, 'date': current_date,
+                'korean_points': korean, 'math_points': math,
+                'ssen_points': ssen, 'reading_points': reading,
+                'total_points': korean + math + ssen + reading,
+                'created_by': 1, 'created_at': created_at
+            })
+            if random.random() < learning_ratio:
+                korean_score = random.uniform(40, 100)
+                math_score = random.uniform(40, 100)
+                records_batch.append({
+                    'child_id': child_id, 'date': current_date,
+                    'korean_problems_solved': 20, 'korean_problems_correct': 15,
+                    'korean_score': korean_score, 'korean_last_page': random.randint(1, 200),
+                    'math_problems_solved': 20, 'math_problems_correct': 14,
+                    'math_score': math_score, 'math_last_page': random.randint(1, 200),
+                    'reading_completed': True, 'reading_score': random.choice([0, 100, 200]),
+                    'total_score': korean_score + math_score,
+                    'created_by': 1, 'created_at': created_at
+                })
+            if len(points_batch) >= BATCH_SIZE:
+                db.session.execute(db.insert(DailyPoints), points_batch)
+                points_batch = []
+            if len(records_batch) >= BATCH_SIZE:
+                db.session.execute(db.insert(LearningRecord), records_batch)
+                records_batch = []
+    if points_batch:
+        db.session.execute(db.insert(DailyPoints), points_batch)
+    if records_batch:
+        db.session.execute(db.insert(LearningRecord), records_batch)
+    db.session.commit()
+
+    db.session.execute(db.text("""
+        UPDATE child SET cumulative_points = (
+            SELECT COALESCE(SUM(total_points), 0) FROM daily_points WHERE daily_points.child_id = child.id
+        )
+    """))
+    db.session.commit()
+    rebuild_points_rollup()
+
+
+def login_client():
+    """벤치마크 사용자로 로그인된 테스트 클라이언트 생성"""
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = '1'
+        sess['_fresh'] = True
+    return client
+
+
+def time_route(client, url, repeat):
+    """라우트를 repeat번 호출하고 중앙값/최대값(ms) 반환"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f'{url} 응답 코드 {response.status_code}')
+    return statistics.median(timings), max(timings)
+
+
+def print_timings(title, results):
+    print(f"\n[{title}]")
+    for url, (median_ms, max_ms) in results.items():
+        print(f"  {url:<40} 중앙값 {median_ms:9.1f} ms | 최대 {max_ms:9.1f} ms")
+
+
+def bench_indexes(args):
+    """(child_id, date)/(date) 인덱스 적용 전후 주요 라우트 비교"""
+    days = max(1, args.rows // args.children)
+    print(f"시드 데이터 생성 중: 아동 {args.children}명 × {days}일 = {args.children * days:,}건")
+    with app.app_context():
+        seed(args.children, days)
+
+        child_id = args.children // 2
+        routes = [
+            f'/points/input/{child_id}',
+            f'/points/child/{child_id}',
+            f'/points/analysis?child_id={child_id}',
+            '/statistics',
+        ]
+        client = login_client()
+
+        indexes = list(DailyPoints.__table__.indexes) + list(LearningRecord.__table__.indexes)
+
+        # 마이그레이션 적용 전 상태 재현 (인덱스 제거)
+        for index in indexes:
+            index.drop(db.engine)
+        db.session.execute(db.text('ANALYZE'))
+        before = {url: time_route(client, url, args.repeat) for url in routes}
+        print_timings('마이그레이션 전 (PK 인덱스만)', before)
+
+        for index in indexes:
+            index.create(db.engine)
+        db.session.execute(db.text('ANALYZE'))
+        after = {url: time_route(client, url, args.repeat) for url in routes}
+        print_timings('마이그레이션 후 ((child_id, date) + (date) 인덱스)', after)
+
+        print("\n[개선 배율]")
+        for url in routes:
+            print(f"  {url:<40} x{before[url][0] / max(after[url][0], 0.001):.1f}")
+
+
+def count_queries(client, url):
+    """라우트 1회 호출 동안 실행된 SQL 문 수 반환"""
+    client.get(url)  # 로그인 사용자 로드 등 첫 요청 부가 쿼리 제외
+    executed = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', on_execute)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', on_execute)
+    if response.status_code != 200:
+        raise RuntimeError(f'{url} 응답 코드 {response.status_code}')
+    return len(executed)
+
+
+def bench_querycount(args):
+    """통계/리포트 페이지 SQL 실행 횟수 회귀 검사 (아동 수와 무관해야 함)"""
+    routes = ['/statistics', '/statistics/charts', '/reports/grade/1',
+              '/points/analysis?child_id=1', '/points/grade-comparison/1']
+    counts = {}
+    # 시드를 바꿔가며 같은 URL을 조회하므로 캐시를 끄고 측정
+    app_cache.configure(None)
+    with app.app_context():
+        for children_count in args.children:
+            seed(children_count, args.days, learning_ratio=1.0)
+            client = login_client()
+            counts[children_count] = {url: count_queries(client, url) for url in routes}
+
+    print(f"\n[라우트별 SQL 실행 횟수] (허용 한도 {args.limit}회)")
+    failures = []
+    for url in routes:
+        per_size = [counts[n][url] for n in args.children]
+        print(f"  {url:<40} " + ' | '.join(f"아동 {n}명: {c}회" for n, c in zip(args.children, per_size)))
+        if max(per_size) > args.limit:
+            failures.append(f'{url}: 한도 초과 ({max(per_size)}회)')
+        if len(set(per_size)) > 1:
+            failures.append(f'{url}: 아동 수에 따라 쿼리 수가 달라짐 {per_size}')
+
+    if failures:
+        print("\n❌ 쿼리 수 회귀 검사 실패")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ 쿼리 수 회귀 검사 통과")
+
+
+def bench_charts(args):
+    """아동 수 증가에 따른 /statistics/charts 응답 시간 추이"""
+    results = {}
+    with app.app_context():
+        for children_count in args.children:
+            print(f"시드 데이터 생성 중: 아동 {children_count}명 × {args.days}일")
+            seed(children_count, args.days)
+            client = login_client()
+            results[f'/statistics/charts (아동 {children_count}명)'] = time_route(client, '/statistics/charts', args.repeat)
+
+    print_timings('/statistics/charts 응답 시간', results)
+
+
+def read_peak_rss_kb():
+    """현재 프로세스의 최대 RSS(KB) - 리눅스는 /proc의 VmHWM 사용"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def reset_peak_rss():
+    """부모 프로세스에서 물려받은 최대 RSS 기록 초기화 (리눅스 전용, 실패 시 무시)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _measure_worker(func_name, args, result_queue):
+    """하위 프로세스에서 함수 실행 후 (소요 시간, 시작 시 RSS, 최대 RSS) 전달"""
+    reset_peak_rss()
+    baseline_kb = read_peak_rss_kb()
+    with app.app_context():
+        start = time.perf_counter()
+        globals()[func_name](*args)
+        elapsed = time.perf_counter() - start
+    result_queue.put((elapsed, baseline_kb, read_peak_rss_kb()))
+
+
+def measure_in_subprocess(func_name, *args):
+    """새 프로세스에서 실행해서 함수별 최대 RSS를 분리 측정"""
+    context = multiprocessing.get_context('spawn')
+    result_queue = context.Queue()
+    process = context.Process(target=_measure_worker, args=(func_name, args, result_queue))
+    process.start()
+    result = result_queue.get()
+    process.join()
+    return result
+
+
+def print_resource_results(title, results):
+    print(f"\n[{title}]")
+    for name, (elapsed, baseline_kb, peak_kb) in results.items():
+        print(f"  {name:<28} {elapsed:8.2f} s | 최대 RSS {peak_kb / 1024:8.1f} MB (시작 {baseline_kb / 1024:6.1f} MB)")
+
+
+def export_legacy_json(output_dir):
+    """기존 방식: 전체 데이터를 메모리에 올린 뒤 indent JSON 저장"""
+    backup_data, error = get_backup_data()
+    if error:
+        raise RuntimeError(error)
+    with open(os.path.join(output_dir, 'legacy.json'), 'w', encoding='utf-8') as f:
+        json.dump(backup_data, f, ensure_ascii=False, indent=2)
+
+
+def export_streaming(output_dir, compression):
+    export_dir, error = create_streaming_backup(output_dir, 'manual', compression=compression)
+    if error:
+        raise RuntimeError(error)
+
+
+def bench_export(args):
+    """기존 JSON 백업과 스트리밍 NDJSON 백업의 시간/최대 메모리 비교"""
+    days = max(1, args.rows // args.children)
+    print(f"시드 데이터 생성 중: 아동 {args.children}명 × {days}일 = {args.children * days:,}건")
+    with app.app_context():
+        seed(args.children, days)
+        db.session.remove()
+
+    output_dir = os.path.join(_BENCH_DIR, 'export')
+    os.makedirs(os.path.join(output_dir, 'realtime'), exist_ok=True)
+
+    results = {'기존 JSON (indent=2)': measure_in_subprocess('export_legacy_json', output_dir)}
+    for compression in args.compression:
+        results[f'NDJSON 스트리밍 ({compression})'] = measure_in_subprocess('export_streaming', output_dir, compression)
+    print_resource_results(f'DailyPoints {args.children * days:,}건 백업', results)
+
+
+def export_legacy_excel(output_dir):
+    """기존 방식: 전체 데이터를 메모리에 올린 뒤 일반 Workbook에 모든 행 추가"""
+    from openpyxl import Workbook
+
+    backup_data, error = get_backup_data()
+    if error:
+        raise RuntimeError(error)
+    wb = Workbook()
+    sheets = [('아동정보', 'children'), ('포인트기록', 'daily_points'),
+              ('포인트변경이력', 'points_history'), ('사용자정보', 'users')]
+    for index, (title, key) in enumerate(sheets):
+        ws = wb.active if index == 0 else wb.create_sheet(title)
+        ws.title = title
+        for item in backup_data[key]:
+            ws.append(list(item.values()))
+    wb.save(os.path.join(output_dir, 'legacy.xlsx'))
+
+
+def export_streaming_excel(output_dir):
+    filepath, error = create_excel_backup(output_dir, 'manual')
+    if error:
+        raise RuntimeError(error)
+
+
+def bench_excel(args):
+    """기존 Excel 백업과 write-only 스트리밍 Excel 백업의 시간/최대 메모리 비교"""
+    output_dir = os.path.join(_BENCH_DIR, 'excel')
+    os.makedirs(os.path.join(output_dir, 'realtime'), exist_ok=True)
+
+    for rows in args.rows:
+        days = max(1, rows // args.children)
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {days}일 = {args.children * days:,}건")
+        with app.app_context():
+            seed(args.children, days)
+            db.session.remove()
+
+        results = {
+            '기존 Workbook': measure_in_subprocess('export_legacy_excel', output_dir),
+            'write-only 스트리밍': measure_in_subprocess('export_streaming_excel', output_dir)
+        }
+        print_resource_results(f'DailyPoints {args.children * days:,}건 Excel 백업', results)
+
+
+def seed_backup_catalog(entries):
+    """카탈로그에 entries건의 가짜 백업 기록 생성 (최근 항목일수록 최신 시각)"""
+    db.session.query(BackupCatalog).delete()
+    now = datetime.now()
+    backup_types = ['realtime', 'daily', 'monthly', 'manual', 'incremental']
+    batch = []
+    for i in range(entries):
+        backup_type = backup_types[i % len(backup_types)]
+        batch.append({
+            'backup_type': backup_type, 'kind': 'json', 'path': f'{backup_type}/bench_{i:06d}',
+            'size_bytes': 1024 * 1024, 'row_counts': '{"daily_points": 1000}', 'checksum': '0' * 64,
+            'created_at': now - timedelta(minutes=entries - i)
+        })
+        if len(batch) >= BATCH_SIZE:
+            db.session.execute(db.insert(BackupCatalog), batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(BackupCatalog), batch)
+    refresh_backup_catalog_stats()
+    db.session.commit()
+
+
+def bench_catalog(args):
+    """카탈로그 건수 증가에 따른 /backup/status, /backup/list 응답 시간 추이"""
+    results = {}
+    with app.app_context():
+        seed(10, 10)
+        client = login_client()
+        week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        for entries in args.entries:
+            seed_backup_catalog(entries)
+            for url in ('/backup/status', f'/backup/status?type=daily&date_from={week_ago}&page=3', '/backup/list'):
+                results[f'{url} ({entries:,}건)'] = time_route(client, url, args.repeat)
+
+    print_timings('백업 카탈로그 조회 응답 시간', results)
+
+
+def bench_dashboard(args):
+    """대시보드 응답 시간 분포(p50/p95)와 SQL 실행 횟수 - 캐시 사용/미사용 비교"""
+    with app.app_context():
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {args.days}일")
+        seed(args.children, args.days)
+        client = login_client()
+
+        print("\n[/dashboard 응답 시간]")
+        for label, ttl in (('캐시 없음 (TTL 0)', 0), (f'캐시 사용 (TTL {args.ttl}초)', args.ttl)):
+            app.config['DASHBOARD_CACHE_TTL'] = ttl
+            query_count = count_queries(client, '/dashboard')
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                client.get('/dashboard')
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"  {label:<20} p50 {statistics.median(timings):7.1f} ms | p95 {p95:7.1f} ms | SQL {query_count}회")
+
+
+def bench_cache(args):
+    """분석/리포트 라우트 캐시 미스(무효화 직후)/히트 응답 시간과 백엔드별 지표"""
+    with app.app_context():
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {args.days}일")
+        seed(args.children, args.days)
+        client = login_client()
+        today = datetime.utcnow().date()
+        urls = [
+            '/dashboard',
+            '/statistics',
+            '/reports/grade/3',
+            f"/reports/period?start_date={today - timedelta(days=30)}&end_date={today}",
+            '/points/analysis?child_id=1',
+            '/points/visualization',
+            '/points/grade-comparison/3'
+        ]
+
+        for kind in args.backends:
+            backend = create_cache_backend(kind, path=os.path.join(_BENCH_DIR, 'app_cache.db'))
+            app_cache.configure(backend)
+            app_cache.clear()
+            print(f"\n[{kind} 백엔드]")
+            for url in urls:
+                cold, warm = [], []
+                for _ in range(args.repeat):
+                    # 쓰기 경로와 같은 방식으로 무효화한 직후(미스)와 바로 다음 요청(히트) 비교
+                    app_cache.invalidate('points', 'learning')
+                    for timings in (cold, warm):
+                        start = time.perf_counter()
+                        response = client.get(url)
+                        timings.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    print(f"  ⚠️ {url} 응답 코드 {response.status_code}")
+                print(f"  {url.split('?')[0]:<28} 미스 {statistics.median(cold):8.1f} ms | "
+                      f"히트 {statistics.median(warm):7.1f} ms")
+            stats = app_cache.stats()
+            print(f"  히트율 {stats['hit_rate']} | 항목 {stats['entries']}개 {stats['bytes'] / 1024:.1f} KB | "
+                  f"축출 {stats['evictions']} | 거부 {stats['rejected']} | 오류 {stats['errors']}")
+
+
+def legacy_child_point_series(child_id, today):
+    """기존 child_point_analysis의 주간/월간/증감률 계산 (날짜별·구간별 개별 조회) - 비교 기준"""
+    weekly_data = []
+    for i in range(56, -1, -1):
+        date = today - timedelta(days=i)
+        daily_record = DailyPoints.query.filter_by(child_id=child_id, date=date).first()
+        points = daily_record.total_points if daily_record else 0
+        weekly_data.append({'date': date.strftime('%m/%d'), 'points': points})
+
+    monthly_data = []
+    for i in range(6):
+        month_date = today - timedelta(days=30*i)
+        month_start = month_date.replace(day=1)
+        if month_date.month == 12:
+            month_end = month_date.replace(year=month_date.year + 1, month=1, day=1) - timedelta(days=1)
+        else:
+            month_end = month_date.replace(month=month_date.month + 1, day=1) - timedelta(days=1)
+        month_points = DailyPoints.query.filter(
+            DailyPoints.child_id == child_id,
+            DailyPoints.date >= month_start,
+            DailyPoints.date <= month_end
+        ).all()
+        monthly_data.append({
+            'month': month_date.strftime('%Y년 %m월'),
+            'points': sum(record.total_points for record in month_points)
+        })
+
+    def range_total(start, end_exclusive=None, end_inclusive=None):
+        query = DailyPoints.query.filter(DailyPoints.child_id == child_id, DailyPoints.date >= start)
+        if end_exclusive is not None:
+            query = query.filter(DailyPoints.date < end_exclusive)
+        else:
+            query = query.filter(DailyPoints.date <= end_inclusive)
+        return sum(record.total_points for record in query.all())
+
+    this_week_start = today - timedelta(days=today.weekday())
+    last_week_start = this_week_start - timedelta(days=7)
+    this_week_total = range_total(this_week_start, end_inclusive=today)
+    last_week_total = range_total(last_week_start, end_exclusive=this_week_start)
+    weekly_change = 0
+    if last_week_total > 0:
+        weekly_change = round(((this_week_total - last_week_total) / last_week_total) * 100, 1)
+
+    this_month_start = today.replace(day=1)
+    last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
+    this_month_total = range_total(this_month_start, end_inclusive=today)
+    last_month_total = range_total(last_month_start, end_exclusive=this_month_start)
+    monthly_change = 0
+    if last_month_total > 0:
+        monthly_change = round(((this_month_total - last_month_total) / last_month_total) * 100, 1)
+
+    return {
+        'weekly_data': weekly_data,
+        'monthly_data': monthly_data,
+        'weekly_change': weekly_change,
+        'monthly_change': monthly_change,
+        'this_week_total': this_week_total,
+        'last_week_total': last_week_total,
+        'this_month_total': this_month_total,
+        'last_month_total': last_month_total
+    }
+
+
+def measure_calls(func, *args):
+    """함수 1회 호출의 (결과, 소요 ms, SQL 실행 횟수)"""
+    executed = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', on_execute)
+    try:
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', on_execute)
+    return result, elapsed, len(executed)
+
+
+def bench_childseries(args):
+    """아동 포인트 시계열: 기존 개별 조회 결과와 기간 조회+누적합 결과가 같은지 검사하고 속도 비교"""
+    # 같은 인자로 여러 번 비교하므로 캐시를 끄고 측정
+    app_cache.configure(None)
+    with app.app_context():
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {args.days}일")
+        seed(args.children, args.days)
+        today = datetime.utcnow().date()
+
+        # 기록 없는 날(0 채움)과 이번 달 남은 날짜(미래 날짜) 기록도 포함되도록 데이터 조정
+        db.session.execute(db.text("DELETE FROM daily_points WHERE abs(random()) % 10 < 3"))
+        db.session.execute(db.insert(DailyPoints), [
+            {'child_id': child_id, 'date': today + timedelta(days=offset), 'total_points': 100 * offset,
+             'korean_points': 0, 'math_points': 0, 'ssen_points': 0, 'reading_points': 0, 'created_by': 1}
+            for child_id in range(1, args.children + 1) for offset in (1, 20)
+        ])
+        db.session.commit()
+
+        # 월말/월초/연말/윤년 경계가 모두 들어가도록 시드 기간 안의 모든 날짜를 기준일로 사용
+        check_days = [today - timedelta(days=offset) for offset in range(0, args.days - 180)]
+        child_ids = random.sample(range(1, args.children + 1), min(args.sample, args.children))
+
+        mismatches = []
+        legacy_times, legacy_queries, new_times, new_queries = [], [], [], []
+        for child_id in child_ids:
+            for check_day in check_days:
+                expected, elapsed, queries = measure_calls(legacy_child_point_series, child_id, check_day)
+                legacy_times.append(elapsed)
+                legacy_queries.append(queries)
+                actual, elapsed, queries = measure_calls(build_child_point_series, child_id, check_day)
+                new_times.append(elapsed)
+                new_queries.append(queries)
+                if actual != expected:
+                    mismatches.append((child_id, check_day))
+
+        print(f"\n[아동 포인트 시계열] 아동 {len(child_ids)}명 × 기준일 {len(check_days)}일")
+        print(f"  기존 개별 조회        평균 {statistics.mean(legacy_times):7.2f} ms | SQL {max(legacy_queries)}회")
+        print(f"  기간 조회 + 누적합    평균 {statistics.mean(new_times):7.2f} ms | SQL {max(new_queries)}회")
+
+        if mismatches:
+            print(f"\n❌ 결과 불일치 {len(mismatches)}건")
+            for child_id, check_day in mismatches[:10]:
+                print(f"  - 아동 {child_id}, 기준일 {check_day}")
+            sys.exit(1)
+        print("\n✅ 기존 계산 결과와 모두 일치")
+
+
+def seed_history(children_count, days):
+    """장기 이력용 빠른 시드 (sqlite3 직접 입력, 결석일 15%, 집계 테이블은 SQL로 생성)"""
+    random.seed(7)
+    today = datetime.utcnow().date()
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    db.session.add(User(username='bench', name='벤치마크', role='개발자', password_hash=''))
+    db.session.commit()
+    db.session.execute(db.insert(Child), [
+        {'name': f'아동{i:05d}', 'grade': i % 6 + 1, 'include_in_stats': i % 10 != 9, 'cumulative_points': 0}
+        for i in range(children_count)
+    ])
+    db.session.commit()
+    db.session.remove()
+
+    stamp = (datetime.utcnow() - timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S.%f')
+    dates = [(today - timedelta(days=day)).isoformat() for day in range(days)]
+    choices = (0, 100, 200)
+
+    def rows():
+        for child_id in range(1, children_count + 1):
+            for day in dates:
+                if random.random() < 0.15:
+                    continue
+                korean, math, ssen, reading = (random.choice(choices) for _ in range(4))
+                yield (child_id, day, korean, math, ssen, reading, korean + math + ssen + reading, 1, stamp, stamp)
+
+    connection = sqlite3.connect(db.engine.url.database)
+    connection.execute('PRAGMA synchronous=OFF')
+    with connection:
+        connection.executemany("""
+            INSERT INTO daily_points (child_id, date, korean_points, math_points, ssen_points, reading_points,
+                                      total_points, created_by, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows())
+        # rebuild_points_rollup과 같은 결과를 기간 단위별 SQL 한 번씩으로 생성 (대용량에서 파이썬 루프 대신)
+        for period_type, period_expr in (
+            ('day', 'p.date'),
+            ('week', "date(p.date, '-' || ((CAST(strftime('%w', p.date) AS INTEGER) + 6) % 7) || ' days')"),
+            ('month', "date(p.date, 'start of month')")
+        ):
+            connection.execute(f"""
+                INSERT INTO points_rollup (period_type, period_start, child_id, grade, korean_points, math_points,
+                                           ssen_points, reading_points, total_points, record_count, updated_at)
+                SELECT '{period_type}', {period_expr}, p.child_id, c.grade, SUM(p.korean_points), SUM(p.math_points),
+                       SUM(p.ssen_points), SUM(p.reading_points), SUM(p.total_points), COUNT(*), '{stamp}'
+                FROM daily_points p JOIN child c ON c.id = p.child_id
+                GROUP BY p.child_id, {period_expr}
+            """)
+    connection.close()
+
+
+def legacy_points_visualization(today):
+    """집계 테이블(SQL GROUP BY) 기반 시각화 데이터 - 비교 기준"""
+    trend_start = today - timedelta(days=28)
+    daily_totals = dict(db.session.query(
+        PointsRollup.period_start, func.sum(PointsRollup.total_points)
+    ).filter(
+        PointsRollup.period_type == 'day',
+        PointsRollup.period_start >= trend_start,
+        PointsRollup.period_start <= today
+    ).group_by(PointsRollup.period_start).all())
+    weekly_data = [{'date': (today - timedelta(days=i)).strftime('%m/%d'),
+                    'points': daily_totals.get(today - timedelta(days=i)) or 0} for i in range(28, -1, -1)]
+
+    monthly_totals = dict(db.session.query(
+        PointsRollup.period_start, func.sum(PointsRollup.total_points)
+    ).filter(
+        PointsRollup.period_type == 'month',
+        PointsRollup.period_start >= today.replace(month=1, day=1),
+        PointsRollup.period_start <= today.replace(month=12, day=1)
+    ).group_by(PointsRollup.period_start).all())
+    monthly_data = [{'month': f'{month}월', 'points': monthly_totals.get(today.replace(month=month, day=1)) or 0}
+                    for month in range(1, 13)]
+
+    subject_sums = db.session.query(
+        func.sum(PointsRollup.korean_points), func.sum(PointsRollup.math_points),
+        func.sum(PointsRollup.ssen_points), func.sum(PointsRollup.reading_points)
+    ).filter(PointsRollup.period_type == 'month').one()
+    subject_totals = dict(zip(['국어', '수학', '쎈수학', '독서'], (value or 0 for value in subject_sums)))
+
+    grade_sums = {grade: (total or 0, count or 0) for grade, total, count in db.session.query(
+        PointsRollup.grade, func.sum(PointsRollup.total_points), func.sum(PointsRollup.record_count)
+    ).join(Child, Child.id == PointsRollup.child_id).filter(
+        PointsRollup.period_type == 'month', Child.include_in_stats == True
+    ).group_by(PointsRollup.grade).all()}
+    grade_averages = {}
+    for grade_num in range(1, 7):
+        total, count = grade_sums.get(grade_num, (0, 0))
+        grade_averages[f'{grade_num}학년'] = round(total / count, 1) if count > 0 else 0
+    return weekly_data, monthly_data, subject_totals, grade_averages
+
+
+def legacy_grade_period_totals(grade, today):
+    """순위 쿼리 + 집계 테이블 기반 학년 아동별 이번 주/이번 달 포인트 - 비교 기준"""
+    this_week_start = today - timedelta(days=today.weekday())
+    child_ids = [entry['id'] for entry in get_points_ranking(grade=grade)]
+    rows = db.session.query(
+        PointsRollup.child_id, PointsRollup.period_type, func.sum(PointsRollup.total_points)
+    ).filter(
+        PointsRollup.child_id.in_(child_ids),
+        db.or_(
+            db.and_(PointsRollup.period_type == 'week', PointsRollup.period_start == this_week_start),
+            db.and_(PointsRollup.period_type == 'month', PointsRollup.period_start == today.replace(day=1))
+        )
+    ).group_by(PointsRollup.child_id, PointsRollup.period_type).all()
+    totals = {(child_id, period_type): total or 0 for child_id, period_type, total in rows}
+    return {child_id: (totals.get((child_id, 'week'), 0), totals.get((child_id, 'month'), 0)) for child_id in child_ids}
+
+
+def legacy_points_statistics(today):
+    """아동별 오늘 기록 개별 조회 기반 학년별 통계 - 비교 기준"""
+    grade_stats = {}
+    for grade in range(1, 7):
+        children = Child.query.filter_by(grade=grade, include_in_stats=True).all()
+        if not children:
+            continue
+        grade_points = []
+        for child in children:
+            today_points = DailyPoints.query.filter_by(child_id=child.id, date=today).first()
+            if today_points:
+                grade_points.append(today_points.total_points)
+        if grade_points:
+            grade_stats[grade] = {
+                'avg_points': round(sum(grade_points) / len(grade_points), 1),
+                'max_points': max(grade_points),
+                'min_points': min(grade_points),
+                'total_children': len(children),
+                'participated_children': len(grade_points)
+            }
+    return grade_stats
+
+
+def legacy_dashboard_metrics(today):
+    """집계 테이블 조건부 합계 + DailyPoints AVG 기반 대시보드 지표 (최근 기록 조회 포함) - 비교 기준"""
+    week_start = get_rollup_period_start('week', today)
+    is_today = db.and_(PointsRollup.period_type == 'day', PointsRollup.period_start == today)
+    is_week = db.and_(PointsRollup.period_type == 'week', PointsRollup.period_start == week_start)
+    today_children, weekly_total, weekly_count, participants, total_children = db.session.query(
+        func.count(db.case((is_today, PointsRollup.id))),
+        func.sum(db.case((is_week, PointsRollup.total_points))),
+        func.sum(db.case((is_week, PointsRollup.record_count))),
+        func.count(db.case((is_week, PointsRollup.id))),
+        db.select(func.count(Child.id)).scalar_subquery()
+    ).filter(db.or_(is_today, is_week), PointsRollup.record_count > 0).one()
+    averages = db.session.query(*[
+        func.avg(db.case((column > 0, column))) for column in
+        (DailyPoints.korean_points, DailyPoints.math_points, DailyPoints.ssen_points, DailyPoints.reading_points)
+    ]).filter(DailyPoints.date >= week_start, DailyPoints.date <= week_start + timedelta(days=6)).one()
+    participation_rate = int(round((participants / total_children) * 100, 0)) if total_children else 0
+    # 최근 기록 조회는 양쪽이 같으므로 시간 비교를 위해 그대로 포함
+    db.session.query(DailyPoints.date, DailyPoints.total_points, Child.id, Child.name).join(Child).order_by(
+        DailyPoints.created_at.desc()).limit(10).all()
+    return (today_children, weekly_total or 0, weekly_count or 0, participation_rate, total_children,
+            tuple(round(avg, 0) if avg else 0 for avg in averages))
+
+
+def timed(func, *args, repeat=3):
+    """여러 번 실행해서 (마지막 결과, 중앙값 ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(timings)
+
+
+def bench_cube(args):
+    """포인트 큐브: 로드/증분 갱신 비용과 SQL 집계 대비 그룹별 집계 시간, 결과 일치 검사"""
+    app_cache.configure(None)
+    days = args.years * 365
+    failures = []
+    for children_count in args.children:
+        with app.app_context():
+            print(f"\n시드 데이터 생성 중: 아동 {children_count:,}명 × {days}일")
+            started = time.perf_counter()
+            seed_history(children_count, days)
+            print(f"  시드 완료 {time.perf_counter() - started:.1f}초")
+            today = datetime.utcnow().date()
+
+            reset_peak_rss()
+            rss_before = read_peak_rss_kb()
+            started = time.perf_counter()
+            points_cube.load()
+            load_seconds = time.perf_counter() - started
+            rss_after = read_peak_rss_kb()
+
+            # 100건 수정 후 증분 갱신 (집계 테이블은 포인트 입력과 같은 방식으로 반영,
+            # 캐시를 껐으므로 데이터 버전 대신 확인 간격이 지난 것으로 처리)
+            for point in DailyPoints.query.order_by(func.random()).limit(100):
+                old_points = {subject: getattr(point, subject) for subject in ROLLUP_SUBJECTS}
+                point.korean_points = 200 - point.korean_points
+                point.total_points = point.korean_points + point.math_points + point.ssen_points + point.reading_points
+                apply_points_rollup(point.child_id, point.child.grade, point.date, old_points,
+                                    {subject: getattr(point, subject) for subject in ROLLUP_SUBJECTS})
+            db.session.commit()
+            points_cube.checked_at -= points_cube.check_seconds + 1
+            started = time.perf_counter()
+            points_cube.refresh()
+            refresh_ms = (time.perf_counter() - started) * 1000
+
+            print(f"[아동 {children_count:,}명 × {args.years}년 = {points_cube.live_count:,}건]")
+            print(f"  큐브 전체 로드        {load_seconds:8.2f} s | 배열 {points_cube.nbytes() / (1024 * 1024):7.1f} MB | "
+                  f"최대 RSS 증가 {(rss_after - rss_before) / 1024:7.1f} MB")
+            print(f"  100건 수정 후 증분 갱신 {refresh_ms:7.1f} ms")
+
+            grade = 3
+            pairs = [
+                ('시각화', lambda: legacy_points_visualization(today), lambda: build_points_visualization.uncached(today),
+                 lambda new: (new['weekly_data'], new['monthly_data'], new['subject_totals'], new['grade_averages'])),
+                ('학년 비교 (주/월)', lambda: legacy_grade_period_totals(grade, today),
+                 lambda: build_grade_point_comparison.uncached(grade, today),
+                 lambda new: {entry['id']: (entry['this_week'], entry['this_month']) for entry in new}),
+                ('포인트 통계', lambda: legacy_points_statistics(today), lambda: build_points_statistics.uncached(today),
+                 lambda new: new),
+                ('대시보드', lambda: legacy_dashboard_metrics(today), lambda: compute_dashboard_metrics(today),
+                 lambda new: (new['today_points_children'], new['weekly_total_points'], new['weekly_points_count'],
+                              new['participation_rate'], new['total_children'],
+                              (new['weekly_korean_avg'], new['weekly_math_avg'], new['weekly_ssen_avg'],
+                               new['weekly_reading_avg'])))
+            ]
+            for label, legacy, current, project in pairs:
+                expected, legacy_ms = timed(legacy)
+                actual, cube_ms = timed(current)
+                same = project(actual) == expected
+                if not same:
+                    failures.append(f'아동 {children_count}명 {label}')
+                print(f"  {label:<14} SQL {legacy_ms:9.1f} ms | 큐브 {cube_ms:8.1f} ms | {'일치' if same else '불일치'}")
+
+    if failures:
+        print("\n❌ 결과 불일치")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ 큐브 집계 결과가 SQL 집계와 모두 일치")
+
+
+def bench_batch(args):
+    """반 전체 하루치 포인트 입력 - 아동별 입력 폼 반복 vs /api/points/batch 한 번 (시간/SQL 수/백업 요청 수)"""
+    # 실제 백업 대신 호출 횟수만 세고, 묶음 대기 시간을 줄여 측정 후 바로 집계
+    backups = []
+    app_module.realtime_backup = lambda child_id, summary: backups.append(summary) or True
+    realtime_backup_worker.window = 0.2
+
+    executed = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    with app.app_context():
+        for children_count in args.children:
+            print(f"시드 데이터 생성 중: 아동 {children_count}명 × {args.days}일")
+            seed(children_count, args.days, learning_ratio=0)
+            client = login_client()
+            client.get('/points')  # 로그인 사용자 로드 등 첫 요청 부가 쿼리 제외
+            child_ids = [child_id for (child_id,) in db.session.query(Child.id).order_by(Child.id)]
+            db.session.remove()
+            print(f"\n[아동 {children_count}명 하루치 입력 (기존 기록 수정)]")
+
+            # 두 방식이 모두 기존 기록을 수정하도록 서로 다른 값으로 입력
+            for label, values, use_batch in (('아동별 입력 폼', 100, False), ('일괄 입력 API', 200, True)):
+                points = dict.fromkeys(('korean_points', 'math_points', 'ssen_points', 'reading_points'), values)
+                backups.clear()
+                executed.clear()
+                event.listen(db.engine, 'before_cursor_execute', on_execute)
+                start = time.perf_counter()
+                try:
+                    if not use_batch:
+                        for child_id in child_ids:
+                            client.post(f'/points/input/{child_id}', data=points)
+                    else:
+                        response = client.post('/api/points/batch', json={
+                            'records': [{'child_id': child_id, **points} for child_id in child_ids]
+                        })
+                        if response.status_code != 200:
+                            raise RuntimeError(f"/api/points/batch 응답 코드 {response.status_code}")
+                finally:
+                    elapsed = (time.perf_counter() - start) * 1000
+                    event.remove(db.engine, 'before_cursor_execute', on_execute)
+                time.sleep(realtime_backup_worker.window + 0.5)
+                print(f"  {label:<12} {elapsed:9.1f} ms | SQL {len(executed):5d}회 | 백업 {len(backups)}회")
+
+            mismatched = db.session.query(func.count(Child.id)).filter(
+                Child.cumulative_points != db.session.query(func.coalesce(func.sum(DailyPoints.total_points), 0))
+                .filter(DailyPoints.child_id == Child.id).scalar_subquery()
+            ).scalar()
+            print(f"  누적 포인트 불일치 {mismatched}명")
+
+
+def legacy_update_cumulative_points(child_id):
+    """기존 방식 - 저장할 때마다 아동의 일일 포인트 전체 합계를 다시 구함"""
+    total = db.session.query(func.sum(DailyPoints.total_points)).filter_by(child_id=child_id).scalar() or 0
+    db.session.get(Child, child_id).cumulative_points = total
+    db.session.flush()
+
+
+def bench_cumulative(args):
+    """이력 길이별 누적 포인트 갱신 비용 (전체 합계 재계산 vs 변경분 반영) + 전체 대사 시간"""
+    with app.app_context():
+        for days in args.days:
+            print(f"시드 데이터 생성 중: 아동 {args.children}명 × {days}일")
+            seed(args.children, days, learning_ratio=0)
+            child_ids = [child_id for (child_id,) in db.session.query(Child.id).order_by(Child.id)]
+            print(f"\n[아동별 기록 {days:,}일]")
+            for label, update in (('전체 합계 재계산', legacy_update_cumulative_points),
+                                  ('변경분 반영', lambda child_id: apply_cumulative_points_deltas({child_id: 100}))):
+                timings = []
+                for child_id in child_ids:
+                    start = time.perf_counter()
+                    update(child_id)
+                    timings.append((time.perf_counter() - start) * 1000)
+                db.session.rollback()
+                print(f"  {label:<12} 1건당 중앙값 {statistics.median(timings):7.2f} ms")
+            start = time.perf_counter()
+            fixed = reconcile_cumulative_points()
+            print(f"  전체 대사 (GROUP BY 1회) {(time.perf_counter() - start) * 1000:9.1f} ms | 수정 {len(fixed)}명")
+
+
+def legacy_child_points_page(child_id, page, per_page=20):
+    """기존 child_detail 방식 - COUNT(DISTINCT date) + MAX(id) 중복 제거 서브쿼리 + OFFSET + ORM 객체 생성"""
+    total = db.session.execute(db.text(
+        "SELECT COUNT(DISTINCT date) FROM daily_points WHERE child_id = :child_id"
+    ), {'child_id': child_id}).scalar()
+    result = db.session.execute(db.text("""
+        SELECT id, date, korean_points, math_points, ssen_points, reading_points, total_points, created_at
+        FROM daily_points
+        WHERE child_id = :child_id
+        AND id IN (SELECT MAX(id) FROM daily_points WHERE child_id = :child_id GROUP BY date)
+        ORDER BY date DESC
+        LIMIT :per_page OFFSET :offset
+    """), {'child_id': child_id, 'per_page': per_page, 'offset': (page - 1) * per_page})
+    records = []
+    for row in result:
+        record = DailyPoints(id=row[0], date=datetime.strptime(row[1], '%Y-%m-%d').date(), korean_points=row[2],
+                             math_points=row[3], ssen_points=row[4], reading_points=row[5], total_points=row[6])
+        record.created_at = datetime.strptime(row[7], '%Y-%m-%d %H:%M:%S.%f')
+        records.append(record)
+    return total, records
+
+
+def bench_childhistory(args):
+    """아동 상세 포인트 기록 페이지 - OFFSET 페이지네이션 vs 날짜 커서(키셋) 페이지네이션"""
+    with app.app_context():
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {args.days}일")
+        seed(args.children, args.days, learning_ratio=0)
+        child_id = args.children // 2
+        dates = [day for (day,) in db.session.query(DailyPoints.date).filter_by(child_id=child_id)
+                 .order_by(DailyPoints.date.desc())]
+        pages = (len(dates) + 19) // 20
+        print(f"\n[아동 1명 {len(dates):,}일 기록, {pages}페이지]")
+        for page in sorted({1, pages // 2, pages}):
+            legacy_ms = timed(legacy_child_points_page, child_id, page)[1]
+            before = dates[(page - 1) * 20 - 1] if page > 1 else None
+
+            def keyset_page():
+                # 기록 일수는 캐시되므로 매번 무효화해서 캐시 미스 기준으로 비교
+                app_cache.invalidate('points')
+                return get_child_points_page(child_id, before), count_child_point_days(child_id)
+
+            keyset_ms = timed(keyset_page)[1]
+            legacy_dates = [record.date for record in legacy_child_points_page(child_id, page)[1]]
+            same = legacy_dates == [row.date for row in get_child_points_page(child_id, before)[0]]
+            print(f"  {page:4d}페이지  OFFSET {legacy_ms:8.2f} ms | 키셋 {keyset_ms:8.2f} ms | {'일치' if same else '불일치'}")
+
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN_SYLLABLES = '민서준지하윤우도현예은유진수아연시원채주희건태'
+
+
+def seed_child_names(children_count):
+    """이름 검색용 아동 시드 (성 + 이름 두 글자, 기록 없음)"""
+    random.seed(42)
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    # 일괄 INSERT는 모델 validator를 거치지 않으므로 검색 컬럼은 아래에서 채움
+    db.session.execute(db.insert(Child), [
+        {'name': random.choice(SURNAMES) + ''.join(random.choices(GIVEN_SYLLABLES, k=2)),
+         'grade': i % 6 + 1, 'include_in_stats': True, 'cumulative_points': 0}
+        for i in range(children_count)
+    ])
+    db.session.commit()
+    # drop_all로 child 테이블이 다시 만들어졌으므로 FTS 색인/트리거도 다시 생성
+    ensure_child_search_index(rebuild=True)
+
+
+def bench_search(args):
+    """아동 이름 검색 - 기존 name LIKE '%검색어%' 전체 스캔 vs 정규화/초성 인덱스 + FTS trigram"""
+    queries = ('김', '민준', '서윤', '김민준', '이서', 'ㄱㅁㅈ', 'ㅅㅇ')
+    with app.app_context():
+        for children_count in args.children:
+            print(f"시드 데이터 생성 중: 아동 {children_count:,}명")
+            seed_child_names(children_count)
+            print(f"\n[아동 {children_count:,}명, FTS {'사용' if app_module.child_search_fts_enabled else '미사용'}]")
+            for term in queries:
+                new_ms = timed(lambda: db.session.query(Child.id).filter(child_search_filter(term)).all())[1]
+                typeahead_ms = timed(search_children, term)[1]
+                new_ids = {child_id for (child_id,) in db.session.query(Child.id).filter(child_search_filter(term))}
+                if any('ㄱ' <= char <= 'ㅎ' for char in term):
+                    # 기존 검색은 초성을 지원하지 않음
+                    legacy_text, same = '       지원 안 함', '초성'
+                else:
+                    legacy_ms = timed(lambda: db.session.query(Child.id).filter(Child.name.contains(term)).all())[1]
+                    legacy_ids = {child_id for (child_id,) in db.session.query(Child.id).filter(Child.name.contains(term))}
+                    legacy_text = f"LIKE {legacy_ms:8.2f} ms"
+                    same = '일치' if legacy_ids == new_ids else '불일치'
+                print(f"  {term:<4} {legacy_text} | 인덱스/FTS {new_ms:8.2f} ms | 자동완성 {typeahead_ms:6.2f} ms"
+                      f" | {len(new_ids):6,}명 {same}")
+
+
+def seed_notifications(notifications_count, users_count=10):
+    """알림 벤치마크용 시드 (역할별/전체/개인 알림을 섞고 수신 행은 앱과 같은 조건으로 펼침)"""
+    random.seed(42)
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+
+    roles = ('개발자', '센터장', '교사')
+    db.session.execute(db.insert(User), [
+        {'username': f'user{i}', 'name': f'사용자{i}', 'role': roles[i % len(roles)], 'password_hash': ''}
+        for i in range(users_count)
+    ])
+    start = datetime.utcnow() - timedelta(days=365)
+    rows = []
+    for i in range(notifications_count):
+        target = random.random()
+        rows.append({
+            'title': f'알림{i}', 'message': '벤치마크 알림', 'type': 'backup_success' if target < 0.6 else 'info',
+            'priority': random.randint(1, 4), 'created_by': 1, 'is_read': False,
+            'created_at': start + timedelta(minutes=i),
+            'target_role': '개발자' if target < 0.6 else (random.choice(roles) if target < 0.8 else None),
+            'target_user_id': random.randint(1, users_count) if target >= 0.95 else None,
+        })
+    for offset in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(db.insert(Notification), rows[offset:offset + BATCH_SIZE])
+    db.session.execute(db.text("""
+        INSERT INTO notification_recipient (notification_id, user_id, is_read, priority, created_at, expire_date)
+        SELECT n.id, u.id, 0, n.priority, n.created_at, n.expire_date
+        FROM notification n JOIN user u ON (
+            n.target_user_id = u.id
+            OR (n.target_user_id IS NULL AND (n.target_role IS NULL OR n.target_role = u.role))
+            OR n.child_id IS NOT NULL
+        )
+    """))
+    # 사용자마다 절반 정도 읽은 상태
+    db.session.execute(db.text("UPDATE notification_recipient SET is_read = 1 WHERE notification_id % 2 = 0"))
+    db.session.commit()
+    recount_unread_notifications()
+
+
+def legacy_notifications_page(user, page, per_page=20):
+    """기존 /notifications 방식 - 조건에 맞는 알림 전체를 읽어 Python에서 자르고 읽지 않은 수를 셈"""
+    query = Notification.query.filter(db.or_(
+        Notification.target_user_id == user.id,
+        db.and_(Notification.target_user_id.is_(None), Notification.target_role.is_(None)),
+        db.and_(Notification.target_user_id.is_(None), Notification.target_role == user.role),
+        Notification.child_id.isnot(None),
+    )).filter(db.or_(Notification.expire_date.is_(None), Notification.expire_date > datetime.utcnow()))
+    all_notifications = query.order_by(Notification.priority.desc(), Notification.created_at.desc()).all()
+    unread_count = len([n for n in all_notifications if not n.is_read])
+    return all_notifications[(page - 1) * per_page:page * per_page], unread_count
+
+
+def legacy_mark_all_read(user):
+    """기존 모두 읽음 방식 - 읽지 않은 알림 전체 조회 후 알림마다 SELECT + UPDATE + COMMIT"""
+    unread = get_user_notifications(user.id, limit=None, unread_only=True)
+    for notification in unread:
+        recipient = db.session.get(NotificationRecipient, (notification.id, user.id))
+        recipient.is_read = True
+        recipient.read_at = datetime.utcnow()
+        user.unread_notifications -= 1
+        db.session.commit()
+    return len(unread)
+
+
+def legacy_delete_notifications(notification_ids):
+    """기존 선택 삭제 방식 - 알림 전체를 ORM 객체로 읽어 한 건씩 삭제 (수신 행도 한 건씩)"""
+    notifications = Notification.query.filter(Notification.id.in_(notification_ids)).all()
+    for notification in notifications:
+        NotificationRecipient.query.filter_by(notification_id=notification.id).delete()
+        db.session.delete(notification)
+    db.session.commit()
+    return len(notifications)
+
+
+def bench_notifications(args):
+    """알림 목록/배지 - 전체 조회 후 Python 페이지네이션 vs 수신자 인덱스 + 읽지 않은 알림 카운터"""
+    with app.app_context():
+        for notifications_count in args.notifications:
+            print(f"시드 데이터 생성 중: 알림 {notifications_count:,}건")
+            seed_notifications(notifications_count)
+            user = User.query.filter_by(role='개발자').first()
+            inbox = NotificationRecipient.query.filter_by(user_id=user.id).count()
+            print(f"\n[알림 {notifications_count:,}건, 개발자 1명의 받은 알림 {inbox:,}건]")
+            for page in (1, 10):
+                legacy_ms = timed(legacy_notifications_page, user, page)[1]
+
+                def new_page():
+                    db.session.expire(user)
+                    return get_user_notifications(user.id, limit=21, offset=(page - 1) * 20), user.unread_notifications
+
+                new_ms = timed(new_page)[1]
+                legacy_ids = [n.id for n in legacy_notifications_page(user, page)[0]]
+                same = legacy_ids == [n.id for n in new_page()[0][:20]]
+                print(f"  {page:2d}페이지  전체 조회 {legacy_ms:9.2f} ms | 인덱스 페이지 {new_ms:7.2f} ms |"
+                      f" 배지 {user.unread_notifications:,}건 | {'일치' if same else '불일치'}")
+
+            # 모두 읽음: 같은 역할의 두 사용자(받은 알림이 같음)에 각각 기존/새 방식 적용
+            legacy_user, new_user = User.query.filter_by(role='개발자').order_by(User.id).limit(2).all()
+            start = time.perf_counter()
+            legacy_count = legacy_mark_all_read(legacy_user)
+            legacy_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            new_count = mark_notifications_read(new_user.id)
+            new_ms = (time.perf_counter() - start) * 1000
+            print(f"  모두 읽음    알림별 커밋 {legacy_ms:9.1f} ms | UPDATE 1회 {new_ms:7.2f} ms | {legacy_count:,}/{new_count:,}건")
+
+            # 백업 알림 정리: 절반씩 기존/새 방식으로 삭제
+            backup_ids = [notification_id for (notification_id,) in
+                          db.session.query(Notification.id).filter(Notification.type.startswith('backup'))]
+            start = time.perf_counter()
+            legacy_count = legacy_delete_notifications(backup_ids[::2])
+            legacy_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            new_count = delete_notifications(select_notification_ids(notification_ids=backup_ids[1::2]))
+            new_ms = (time.perf_counter() - start) * 1000
+            print(f"  백업 알림 삭제 한 건씩 {legacy_ms:11.1f} ms | DELETE 1회 {new_ms:7.2f} ms | {legacy_count:,}/{new_count:,}건")
+
+
+def seed_backup_notifications(days, per_day, users_count=5):
+    """운영 기간 시뮬레이션 - 하루 per_day건의 실시간 백업 성공 알림(7일 후 만료)이 days일 동안 쌓인 상태"""
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+
+    db.session.execute(db.insert(User), [
+        {'username': f'user{i}', 'name': f'사용자{i}', 'role': '개발자', 'password_hash': ''}
+        for i in range(users_count)
+    ])
+    now = datetime.utcnow()
+    rows = []
+    # 오래된 것부터 넣어서 id 순서가 생성 시각 순서와 같도록
+    for day in reversed(range(days)):
+        for i in reversed(range(per_day)):
+            created_at = now - timedelta(days=day, seconds=i * (86400 // per_day))
+            rows.append({
+                'title': '실시간 백업 완료', 'message': f'백업 {day}-{i}', 'type': 'backup_success', 'priority': 2,
+                'target_role': '개발자', 'auto_expire': True, 'expire_date': created_at + timedelta(days=7),
+                'created_by': 1, 'created_at': created_at, 'is_read': False,
+            })
+    for offset in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(db.insert(Notification), rows[offset:offset + BATCH_SIZE])
+    db.session.execute(db.text("""
+        INSERT INTO notification_recipient (notification_id, user_id, is_read, priority, created_at, expire_date)
+        SELECT n.id, u.id, 0, n.priority, n.created_at, n.expire_date FROM notification n JOIN user u ON n.target_role = u.role
+    """))
+    db.session.commit()
+    recount_unread_notifications()
+
+
+def bench_notifysweep(args):
+    """운영 기간별 알림 목록 응답 시간 - 만료/압축 정리 작업 전후"""
+    with app.app_context():
+        for days in args.days:
+            print(f"시드 데이터 생성 중: {days}일 × 하루 {args.per_day}건")
+            seed_backup_notifications(days, args.per_day)
+            user = User.query.first()
+            print(f"\n[{days}일 운영]")
+            for label in ('정리 전', '정리 후'):
+                if label == '정리 후':
+                    start = time.perf_counter()
+                    expired, collapsed = sweep_notifications()
+                    print(f"  정리 작업 {(time.perf_counter() - start) * 1000:9.1f} ms | 만료 {expired:,}건 삭제, {collapsed:,}건 합침")
+                page_ms = timed(get_user_notifications, user.id, 21)[1]
+                db.session.expire(user)
+                print(f"  {label}  알림 {Notification.query.count():7,}건 | 수신 행 {NotificationRecipient.query.count():8,}건 |"
+                      f" 목록 {page_ms:7.2f} ms | 배지 {user.unread_notifications:,}")
+
+
+def bench_stream(args):
+    """포인트 입력 후 대시보드 반영 - 페이지 새로고침(캐시 미스) vs /stream 카운터 이벤트 발행"""
+    with app.app_context():
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {args.days}일")
+        seed(args.children, args.days)
+        client = login_client()
+        client.get('/dashboard')
+
+        reload_timings, reload_bytes = [], 0
+        for _ in range(args.repeat):
+            # 포인트 입력 직후처럼 데이터 버전을 올려 캐시 미스 상태에서 새로고침
+            app_cache.invalidate('points')
+            start = time.perf_counter()
+            response = client.get('/dashboard')
+            reload_timings.append((time.perf_counter() - start) * 1000)
+            reload_bytes = len(response.data)
+
+        # 벤치마크에서는 연결 수 한도를 구독자 수에 맞춤
+        event_broker.max_subscribers = max(event_broker.max_subscribers, args.subscribers)
+        subscribers = [event_broker.subscribe(1) for _ in range(args.subscribers)]
+        request_timings, delivery_timings = [], []
+        for _ in range(args.repeat):
+            app_cache.invalidate('points')
+            start = time.perf_counter()
+            publish_dashboard_counters()
+            request_timings.append((time.perf_counter() - start) * 1000)
+            # 백그라운드 발행 스레드가 묶음 대기 후 계산해서 마지막 구독자에게 도착할 때까지
+            subscribers[-1].get(timeout=30)
+            delivery_timings.append((time.perf_counter() - start) * 1000 - DASHBOARD_COUNTER_WINDOW * 1000)
+            for subscriber in subscribers:
+                while not subscriber.empty():
+                    subscriber.get_nowait()
+        event_bytes = len(format_stream_event(
+            'counters', compute_dashboard_counters(datetime.utcnow().date())).encode('utf-8'))
+        for subscriber in subscribers:
+            event_broker.unsubscribe(subscriber)
+
+        print(f"\n[아동 {args.children}명, 연결 {args.subscribers}개]")
+        print(f"  새로고침 1회        {statistics.median(reload_timings):8.1f} ms | {reload_bytes:8,} bytes"
+              f" (연결 {args.subscribers}개면 {args.subscribers}번)")
+        print(f"  저장 요청 추가 시간  {statistics.median(request_timings):8.3f} ms")
+        print(f"  백그라운드 계산/전달 {statistics.median(delivery_timings):8.1f} ms | {event_bytes:8,} bytes"
+              f" (묶음 대기 {DASHBOARD_COUNTER_WINDOW}초 제외, 연결 {args.subscribers}개 전체)")
+
+
+METRICS_ROUTES = ('/dashboard', '/children', '/reports/period', '/points/analysis', '/notifications')
+
+
+def bench_metrics(args):
+    """요청 계측 켜기/끄기 응답 시간 비교와 라우트별 쿼리 수/SQL/렌더 시간 요약"""
+    with app.app_context():
+        print(f"시드 데이터 생성 중: 아동 {args.children}명 × {args.days}일")
+        seed(args.children, args.days)
+        client = login_client()
+        for url in METRICS_ROUTES:
+            client.get(url)
+
+        # 켜기/끄기를 요청마다 번갈아 실행해서 시간대별 잡음이 양쪽에 똑같이 섞이게 함
+        request_metrics.reset()
+        print(f"\n[요청 계측 오버헤드 - 중앙값, 각 {args.repeat}회 번갈아 실행]")
+        for url in METRICS_ROUTES:
+            timings = {False: [], True: []}
+            for index in range(args.repeat * 2):
+                enabled = index % 2 == 1
+                request_metrics.enabled = enabled
+                start = time.perf_counter()
+                client.get(url)
+                timings[enabled].append((time.perf_counter() - start) * 1000)
+            off_ms, on_ms = statistics.median(timings[False]), statistics.median(timings[True])
+            print(f"  {url:<24} 끔 {off_ms:7.2f} ms | 켬 {on_ms:7.2f} ms | 차이 {on_ms - off_ms:+6.2f} ms")
+        request_metrics.enabled = True
+
+        print("\n[라우트별 평균 (계측 결과)]")
+        histograms = request_metrics.histograms
+        for (endpoint, method), (_, total, count) in sorted(histograms['request_duration_seconds'].items()):
+            queries = histograms['request_queries'][(endpoint, method)][1] / count
+            sql_ms = histograms['request_sql_seconds'][(endpoint, method)][1] / count * 1000
+            render_ms = histograms['request_render_seconds'][(endpoint, method)][1] / count * 1000
+            print(f"  {endpoint:<24} 전체 {total / count * 1000:7.2f} ms | 쿼리 {queries:5.1f}개 | "
+                  f"SQL {sql_ms:7.2f} ms | 렌더 {render_ms:7.2f} ms")
+        print(f"\n/metrics 출력 {len(request_metrics.render().encode('utf-8')):,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='지역아동센터 학습관리 시스템 성능 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    indexes_parser = subparsers.add_parser('indexes', help='인덱스 마이그레이션 전후 라우트 응답 시간 비교')
+    indexes_parser.add_argument('--rows', type=int, default=500000, help='DailyPoints 시드 건수')
+    indexes_parser.add_argument('--children', type=int, default=500, help='아동 수')
+    indexes_parser.add_argument('--repeat', type=int, default=5, help='라우트별 반복 횟수')
+    indexes_parser.set_defaults(func=bench_indexes)
+
+    querycount_parser = subparsers.add_parser('querycount', help='통계/리포트 페이지 SQL 실행 횟수 회귀 검사')
+    querycount_parser.add_argument('--children', type=int, nargs='+', default=[12, 120], help='비교할 아동 수 목록')
+    querycount_parser.add_argument('--days', type=int, default=30, help='아동별 기록 일수')
+    querycount_parser.add_argument('--limit', type=int, default=10, help='라우트별 허용 SQL 실행 횟수')
+    querycount_parser.set_defaults(func=bench_querycount)
+
+    charts_parser = subparsers.add_parser('charts', help='아동 수별 /statistics/charts 응답 시간 비교')
+    charts_parser.add_argument('--children', type=int, nargs='+', default=[30, 300, 3000], help='비교할 아동 수 목록')
+    charts_parser.add_argument('--days', type=int, default=30, help='아동별 기록 일수')
+    charts_parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    charts_parser.set_defaults(func=bench_charts)
+
+    export_parser = subparsers.add_parser('export', help='기존 JSON 백업과 스트리밍 NDJSON 백업 비교')
+    export_parser.add_argument('--rows', type=int, default=1000000, help='DailyPoints 시드 건수')
+    export_parser.add_argument('--children', type=int, default=1000, help='아동 수')
+    export_parser.add_argument('--compression', nargs='+', default=['none', 'gzip'], help='비교할 압축 방식 (none/gzip/zstd)')
+    export_parser.set_defaults(func=bench_export)
+
+    excel_parser = subparsers.add_parser('excel', help='기존 Excel 백업과 write-only 스트리밍 Excel 백업 비교')
+    excel_parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000], help='DailyPoints 시드 건수 목록')
+    excel_parser.add_argument('--children', type=int, default=1000, help='아동 수')
+    excel_parser.set_defaults(func=bench_excel)
+
+    catalog_parser = subparsers.add_parser('catalog', help='백업 카탈로그 건수별 목록/상태 조회 응답 시간 비교')
+    catalog_parser.add_argument('--entries', type=int, nargs='+', default=[1000, 50000], help='카탈로그 기록 건수 목록')
+    catalog_parser.add_argument('--repeat', type=int, default=5, help='라우트별 반복 횟수')
+    catalog_parser.set_defaults(func=bench_catalog)
+
+    dashboard_parser = subparsers.add_parser('dashboard', help='대시보드 p50/p95 응답 시간 (캐시 사용/미사용)')
+    dashboard_parser.add_argument('--children', type=int, default=300, help='아동 수')
+    dashboard_parser.add_argument('--days', type=int, default=60, help='아동별 기록 일수')
+    dashboard_parser.add_argument('--ttl', type=int, default=30, help='캐시 TTL (초)')
+    dashboard_parser.add_argument('--repeat', type=int, default=100, help='반복 횟수')
+    dashboard_parser.set_defaults(func=bench_dashboard)
+
+    cache_parser = subparsers.add_parser('cache', help='분석/리포트 캐시 미스/히트 응답 시간 (memory/sqlite 백엔드)')
+    cache_parser.add_argument('--children', type=int, default=300, help='아동 수')
+    cache_parser.add_argument('--days', type=int, default=60, help='아동별 기록 일수')
+    cache_parser.add_argument('--backends', nargs='+', default=['memory', 'sqlite'], help='비교할 캐시 백엔드')
+    cache_parser.add_argument('--repeat', type=int, default=5, help='라우트별 반복 횟수')
+    cache_parser.set_defaults(func=bench_cache)
+
+    childseries_parser = subparsers.add_parser('childseries', help='아동 포인트 시계열 기존 계산과 결과 비교 및 속도 측정')
+    childseries_parser.add_argument('--children', type=int, default=20, help='아동 수')
+    childseries_parser.add_argument('--days', type=int, default=600, help='아동별 기록 일수 (180일 이상)')
+    childseries_parser.add_argument('--sample', type=int, default=3, help='비교할 아동 수')
+    childseries_parser.set_defaults(func=bench_childseries)
+
+    cube_parser = subparsers.add_parser('cube', help='포인트 큐브 로드/증분 갱신/그룹별 집계와 SQL 집계 비교')
+    cube_parser.add_argument('--children', type=int, nargs='+', default=[100, 10000], help='아동 수 목록')
+    cube_parser.add_argument('--years', type=int, default=5, help='이력 기간 (년)')
+    cube_parser.set_defaults(func=bench_cube)
+
+    batch_parser = subparsers.add_parser('batch', help='아동별 포인트 입력 폼 반복과 일괄 입력 API 비교')
+    batch_parser.add_argument('--children', type=int, nargs='+', default=[30, 300], help='아동 수 목록')
+    batch_parser.add_argument('--days', type=int, default=60, help='아동별 기록 일수')
+    batch_parser.set_defaults(func=bench_batch)
+
+    cumulative_parser = subparsers.add_parser('cumulative', help='이력 길이별 누적 포인트 갱신 비용과 전체 대사 시간')
+    cumulative_parser.add_argument('--children', type=int, default=100, help='아동 수')
+    cumulative_parser.add_argument('--days', type=int, nargs='+', default=[30, 365, 3650], help='아동별 기록 일수 목록')
+    cumulative_parser.set_defaults(func=bench_cumulative)
+
+    childhistory_parser = subparsers.add_parser('childhistory', help='아동 상세 포인트 기록 OFFSET/키셋 페이지네이션 비교')
+    childhistory_parser.add_argument('--children', type=int, default=100, help='아동 수')
+    childhistory_parser.add_argument('--days', type=int, default=3650, help='아동별 기록 일수')
+    childhistory_parser.set_defaults(func=bench_childhistory)
+
+    search_parser = subparsers.add_parser('search', help='아동 이름 검색 LIKE 전체 스캔과 정규화/초성/FTS 검색 비교')
+    search_parser.add_argument('--children', type=int, nargs='+', default=[1000, 5000], help='아동 수 목록')
+    search_parser.set_defaults(func=bench_search)
+
+    notifications_parser = subparsers.add_parser('notifications', help='알림 목록 전체 조회와 수신자 인덱스 페이지/카운터 비교')
+    notifications_parser.add_argument('--notifications', type=int, nargs='+', default=[1000, 10000], help='알림 건수 목록')
+    notifications_parser.set_defaults(func=bench_notifications)
+
+    notifysweep_parser = subparsers.add_parser('notifysweep', help='운영 기간별 알림 목록 응답 시간 (만료/압축 정리 전후)')
+    notifysweep_parser.add_argument('--days', type=int, nargs='+', default=[30, 180], help='운영 일수 목록')
+    notifysweep_parser.add_argument('--per-day', type=int, default=200, help='하루 실시간 백업 알림 수')
+    notifysweep_parser.set_defaults(func=bench_notifysweep)
+
+    stream_parser = subparsers.add_parser('stream', help='대시보드 새로고침과 /stream 카운터 이벤트 비용 비교')
+    stream_parser.add_argument('--children', type=int, default=300, help='아동 수')
+    stream_parser.add_argument('--days', type=int, default=60, help='아동별 기록 일수')
+    stream_parser.add_argument('--subscribers', type=int, default=50, help='연결된 클라이언트 수')
+    stream_parser.add_argument('--repeat', type=int, default=10, help='반복 횟수')
+    stream_parser.set_defaults(func=bench_stream)
+
+    metrics_parser = subparsers.add_parser('metrics', help='요청 계측(/metrics) 켜기/끄기 응답 시간과 라우트별 지표 요약')
+    metrics_parser.add_argument('--children', type=int, default=300, help='아동 수')
+    metrics_parser.add_argument('--days', type=int, default=60, help='아동별 기록 일수')
+    metrics_parser.add_argument('--repeat', type=int, default=50, help='라우트별 반복 횟수')
+    metrics_parser.set_defaults(func=bench_metrics)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,7 +12,7 @@ import random
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import app, db, User, Child, DailyPoints
+from app import app, db, User, Child, DailyPoints, rebuild_points_rollup
 from werkzeug.security import generate_password_hash
 
 def seed_initial_data():
@@ -100,6 +100,7 @@ def seed_initial_data():
             
             # 변경사항 저장
             db.session.commit()
+            rebuild_points_rollup()
             print("✅ 초기 데이터 시딩이 완료되었습니다!")
             print(f"생성된 사용자: {len(default_users)}명")
             print(f"생성된 아동: {len(test_children)}명")
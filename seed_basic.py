@@ -12,7 +12,7 @@
 사용법: python seed_basic.py
 """
 
-from app import app, db, User, Child, LearningRecord, DailyPoints
+from app import app, db, User, Child, LearningRecord, DailyPoints, rebuild_points_rollup
 from datetime import date, timedelta
 from werkzeug.security import generate_password_hash
 
@@ -177,6 +177,7 @@ def seed_sample_points(children):
             print(f"  {child.name}({child.grade}학년) 포인트 기록 생성 완료")
         
         db.session.commit()
+        rebuild_points_rollup()
         print("✅ 샘플 포인트 데이터 생성 완료")
     else:
         print("ℹ️ 포인트 기록이 이미 존재합니다")
@@ -13,7 +13,7 @@
 사용법: python seed_production.py
 """
 
-from app import app, db, User, Child, LearningRecord, DailyPoints
+from app import app, db, User, Child, LearningRecord, DailyPoints, PointsRollup, rebuild_points_rollup
 from datetime import date, timedelta
 from werkzeug.security import generate_password_hash
 
@@ -79,6 +79,7 @@ def input_real_children():
         print("⚠️ 기존 아동 데이터가 발견되었습니다.")
         response = input("모든 아동 데이터를 삭제하고 새로 입력하시겠습니까? (y/N): ")
         if response.lower() == 'y':
+            PointsRollup.query.delete()
             Child.query.delete()
             LearningRecord.query.delete()
             DailyPoints.query.delete()
@@ -260,6 +261,7 @@ def main():
                 
                 # 5. 최종 저장
                 db.session.commit()
+                rebuild_points_rollup()
                 
                 print("\n🎉 데이터베이스 시드 완료!")
                 print("\n📊 현재 데이터베이스 현황:")
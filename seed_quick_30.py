@@ -12,7 +12,7 @@
 사용법: python seed_quick_30.py
 """
 
-from app import app, db, Child, LearningRecord, DailyPoints
+from app import app, db, Child, LearningRecord, DailyPoints, rebuild_points_rollup
 from datetime import date, timedelta
 import random
 
@@ -124,6 +124,7 @@ for child in children:
             db.session.add(daily_point)
 
 db.session.commit()
+rebuild_points_rollup()
 print('✅ 학습 기록 및 포인트 데이터 생성 완료!')
 
 # 최종 결과 출력